@@ -1,23 +1,39 @@
 from __future__ import annotations
 
+from decimal import Decimal
 from functools import lru_cache
 
 from fastapi import Depends, Header, HTTPException
 
+from app.application.dto.auth import AccessTokenPayload
+from app.application.dto.entitlements import UserEntitlementsOutput
+from app.application.ports.catalog_query_port import CatalogQueryPort
+from app.application.ports.password_hasher_port import PasswordHasherPort
+from app.application.use_cases.catalog_snapshot import CatalogSnapshotProvider
 from app.application.use_cases.create_checkout_session import CreateCheckoutSessionUseCase
 from app.application.use_cases.get_me import GetMeUseCase
-from app.application.use_cases.get_user_entitlements import GetUserEntitlementsUseCase
+from app.application.use_cases.get_user_entitlements import GetUserEntitlementsUseCase, PlanGrants
 from app.application.use_cases.forgot_password import ForgotPasswordUseCase
 from app.application.use_cases.allocate import AllocateUseCase
-from app.application.use_cases.radar_pools import RadarPoolsUseCase
+from app.application.use_cases.radar_pools import RadarListing, RadarListingKey, RadarPoolsUseCase
+from app.application.use_cases.search_tokens import SearchTokensUseCase
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
 from app.application.use_cases.estimate_fees import EstimateFeesUseCase
+from app.application.use_cases.export_pool_price import ExportPoolPriceUseCase
+from app.application.use_cases.export_pool_volume_history import ExportPoolVolumeHistoryUseCase
 from app.application.use_cases.get_liquidity_distribution import GetLiquidityDistributionUseCase
+from app.application.use_cases.get_liquidity_distribution_batch import (
+    GetLiquidityDistributionBatchUseCase,
+)
 from app.application.use_cases.get_liquidity_distribution_default_range import (
     GetLiquidityDistributionDefaultRangeUseCase,
 )
 from app.application.use_cases.get_pool_by_address import GetPoolByAddressUseCase
 from app.application.use_cases.get_pool_price import GetPoolPriceUseCase
-from app.application.use_cases.get_pool_volume_history import GetPoolVolumeHistoryUseCase
+from app.application.use_cases.get_pool_volume_history import (
+    GetPoolVolumeHistoryUseCase,
+    PremiumCacheKey,
+)
 from app.application.use_cases.list_exchange_network_pools import (
     ListExchangeNetworkPoolsUseCase,
 )
@@ -46,8 +62,11 @@ from app.infrastructure.db.engine import get_engine
 from app.infrastructure.db.repositories.allocation_pool_repository import (
     SqlAllocationPoolRepository,
 )
+from app.infrastructure.db.catalog_snapshot_refresher import CatalogSnapshotRefresher
 from app.infrastructure.db.repositories.catalog_query_repository import SqlCatalogQueryRepository
+from app.infrastructure.db.repositories.catalog_snapshot_repository import SqlCatalogSnapshotRepository
 from app.infrastructure.db.repositories.radar_pools_repository import SqlRadarPoolsRepository
+from app.infrastructure.db.repositories.token_search_repository import SqlTokenSearchRepository
 from app.infrastructure.db.repositories.estimated_fees_repository import SqlEstimatedFeesRepository
 from app.infrastructure.db.repositories.liquidity_distribution_repository import (
     SqlLiquidityDistributionRepository,
@@ -66,8 +85,14 @@ from app.infrastructure.db.repositories.simulate_apr_v2_repository import SqlSim
 from app.infrastructure.db.repositories.tick_snapshot_on_demand_repository import (
     SqlTickSnapshotOnDemandRepository,
 )
+from app.infrastructure.security.bounded_password_hasher import BoundedPasswordHasher, PasswordHashingStats
+from app.domain.entities.liquidity_distribution import TickLiquidity
+from app.domain.entities.pool_volume_history import PoolVolumeHistorySummaryPremium
 from app.domain.entities.user import User
 from app.domain.exceptions import FeatureAccessDeniedError
+from app.domain.services.entitlements import feature_bit_enabled
+from app.shared.cache import CacheStats, LruCache, StaleWhileRevalidateCache, TimeSeriesCache
+from app.shared.rate_limit import TokenBucketLimiter
 from app.shared.config import get_settings
 
 
@@ -86,6 +111,7 @@ def _get_price_service() -> PriceService:
         api_base=settings.coingecko_api_base,
         timeout_seconds=settings.coingecko_timeout_seconds,
         cache_ttl_seconds=settings.coingecko_cache_ttl_seconds,
+        max_addresses_per_request=settings.coingecko_max_addresses_per_request,
     )
     return PriceService(overrides=overrides, coingecko=coingecko)
 
@@ -106,15 +132,108 @@ def _get_univ3_subgraph_client() -> Univ3SubgraphClient:
     )
 
 
+@lru_cache(maxsize=1)
+def _get_liquidity_history_cache() -> LruCache[tuple[int, int], list[TickLiquidity]]:
+    settings = get_settings()
+    return LruCache(max_entries=settings.liquidity_history_cache_max_entries)
+
+
+@lru_cache(maxsize=1)
+def _get_pool_price_series_cache() -> TimeSeriesCache[tuple[int, int, str], Decimal]:
+    settings = get_settings()
+    return TimeSeriesCache(
+        max_series=settings.pool_price_cache_max_pools,
+        max_bytes=settings.pool_price_cache_max_mb * 1024 * 1024,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_premium_summary_cache() -> LruCache[PremiumCacheKey, PoolVolumeHistorySummaryPremium]:
+    settings = get_settings()
+    return LruCache(max_entries=settings.premium_summary_cache_max_entries)
+
+
+@lru_cache(maxsize=1)
+def _get_radar_listing_cache() -> StaleWhileRevalidateCache[RadarListingKey, RadarListing]:
+    settings = get_settings()
+    return StaleWhileRevalidateCache(
+        max_entries=settings.radar_cache_max_entries,
+        ttl_seconds=settings.radar_cache_ttl_seconds,
+        stale_seconds=settings.radar_cache_stale_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_token_search_index_provider() -> TokenSearchIndexProvider:
+    settings = get_settings()
+    return TokenSearchIndexProvider(
+        token_search_port=SqlTokenSearchRepository(_get_db_engine()),
+        cache=StaleWhileRevalidateCache(
+            max_entries=1,
+            ttl_seconds=settings.token_search_index_ttl_seconds,
+            stale_seconds=settings.token_search_index_stale_seconds,
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
 def _get_accounts_repository() -> SqlAccountsRepository:
     return SqlAccountsRepository(_get_db_engine())
 
 
 @lru_cache(maxsize=1)
-def _get_password_hasher() -> "PasswordHasher":
+def _get_user_cache() -> LruCache[str, User]:
+    settings = get_settings()
+    return LruCache(
+        max_entries=settings.user_cache_max_entries,
+        ttl_seconds=settings.user_cache_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_entitlements_cache() -> LruCache[str, UserEntitlementsOutput]:
+    settings = get_settings()
+    return LruCache(
+        max_entries=settings.entitlements_cache_max_entries,
+        ttl_seconds=settings.entitlements_cache_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_plan_grants_cache() -> LruCache[str, PlanGrants]:
+    settings = get_settings()
+    return LruCache(max_entries=64, ttl_seconds=settings.plan_grants_cache_ttl_seconds)
+
+
+def get_cache_stats() -> dict[str, CacheStats]:
+    return {
+        "user": _get_user_cache().stats(),
+        "entitlements": _get_entitlements_cache().stats(),
+        "plan_grants": _get_plan_grants_cache().stats(),
+        "liquidity_history": _get_liquidity_history_cache().stats(),
+        "premium_summary": _get_premium_summary_cache().stats(),
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_password_hasher() -> PasswordHasherPort:
     from app.infrastructure.security.password_hasher import PasswordHasher
 
-    return PasswordHasher()
+    settings = get_settings()
+    if settings.password_hash_workers <= 0:
+        return PasswordHasher()
+    return BoundedPasswordHasher(
+        inner=PasswordHasher(),
+        max_workers=settings.password_hash_workers,
+        max_queue=max(settings.password_hash_max_queue, 0),
+    )
+
+
+def get_password_hashing_stats() -> PasswordHashingStats | None:
+    password_hasher = _get_password_hasher()
+    if not isinstance(password_hasher, BoundedPasswordHasher):
+        return None
+    return password_hasher.stats()
 
 
 @lru_cache(maxsize=1)
@@ -182,8 +301,35 @@ def get_allocate_use_case() -> AllocateUseCase:
     return AllocateUseCase(pool_port=pool_port, price_port=price_port)
 
 
-def _get_catalog_query_repository() -> SqlCatalogQueryRepository:
+@lru_cache(maxsize=1)
+def _get_catalog_snapshot_provider() -> CatalogSnapshotProvider:
     settings = get_settings()
+    return CatalogSnapshotProvider(
+        snapshot_port=SqlCatalogSnapshotRepository(
+            engine=_get_db_engine(),
+            min_tvl_usd=settings.pool_min_tvl_usd,
+        )
+    )
+
+
+def start_catalog_snapshot_refresher() -> CatalogSnapshotRefresher | None:
+    settings = get_settings()
+    if not settings.postgres_dsn or settings.catalog_snapshot_refresh_seconds <= 0:
+        return None
+    refresher = CatalogSnapshotRefresher(
+        engine=_get_db_engine(),
+        provider=_get_catalog_snapshot_provider(),
+        interval_seconds=settings.catalog_snapshot_refresh_seconds,
+        min_interval_seconds=settings.catalog_snapshot_min_refresh_seconds,
+    )
+    refresher.start()
+    return refresher
+
+
+def _get_catalog_query_port() -> CatalogQueryPort:
+    settings = get_settings()
+    if settings.catalog_snapshot_refresh_seconds > 0:
+        return _get_catalog_snapshot_provider().current()
     return SqlCatalogQueryRepository(
         engine=_get_db_engine(),
         min_tvl_usd=settings.pool_min_tvl_usd,
@@ -191,32 +337,63 @@ def _get_catalog_query_repository() -> SqlCatalogQueryRepository:
 
 
 def get_list_exchanges_use_case() -> ListExchangesUseCase:
-    return ListExchangesUseCase(catalog_port=_get_catalog_query_repository())
+    return ListExchangesUseCase(catalog_port=_get_catalog_query_port())
 
 
 def get_list_exchange_networks_use_case() -> ListExchangeNetworksUseCase:
-    return ListExchangeNetworksUseCase(catalog_port=_get_catalog_query_repository())
+    return ListExchangeNetworksUseCase(catalog_port=_get_catalog_query_port())
 
 
 def get_list_exchange_network_tokens_use_case() -> ListExchangeNetworkTokensUseCase:
-    return ListExchangeNetworkTokensUseCase(catalog_port=_get_catalog_query_repository())
+    return ListExchangeNetworkTokensUseCase(
+        catalog_port=_get_catalog_query_port(),
+        token_index_provider=_get_token_search_index_provider(),
+    )
 
 
 def get_list_exchange_network_pools_use_case() -> ListExchangeNetworkPoolsUseCase:
-    return ListExchangeNetworkPoolsUseCase(catalog_port=_get_catalog_query_repository())
+    return ListExchangeNetworkPoolsUseCase(
+        catalog_port=_get_catalog_query_port(),
+        token_index_provider=_get_token_search_index_provider(),
+    )
+
+
+def get_search_tokens_use_case() -> SearchTokensUseCase:
+    return SearchTokensUseCase(token_index_provider=_get_token_search_index_provider())
 
 
 def get_pool_by_address_use_case() -> GetPoolByAddressUseCase:
-    return GetPoolByAddressUseCase(catalog_port=_get_catalog_query_repository())
+    return GetPoolByAddressUseCase(catalog_port=_get_catalog_query_port())
+
+
+def get_export_pool_price_use_case() -> ExportPoolPriceUseCase:
+    return ExportPoolPriceUseCase(pool_price_port=SqlPoolPriceRepository(_get_db_engine()))
 
 
 def get_pool_price_use_case() -> GetPoolPriceUseCase:
-    return GetPoolPriceUseCase(pool_price_port=SqlPoolPriceRepository(_get_db_engine()))
+    return GetPoolPriceUseCase(
+        pool_price_port=SqlPoolPriceRepository(
+            _get_db_engine(),
+            series_cache=_get_pool_price_series_cache(),
+            tail_overlap_seconds=get_settings().pool_price_cache_tail_overlap_seconds,
+        )
+    )
 
 
 def get_liquidity_distribution_use_case() -> GetLiquidityDistributionUseCase:
     settings = get_settings()
     return GetLiquidityDistributionUseCase(
+        distribution_port=SqlLiquidityDistributionRepository(
+            _get_db_engine(),
+            min_tvl_usd=settings.pool_min_tvl_usd,
+        ),
+        history_cache=_get_liquidity_history_cache(),
+    )
+
+
+def get_liquidity_distribution_batch_use_case() -> GetLiquidityDistributionBatchUseCase:
+    settings = get_settings()
+    return GetLiquidityDistributionBatchUseCase(
         distribution_port=SqlLiquidityDistributionRepository(
             _get_db_engine(),
             min_tvl_usd=settings.pool_min_tvl_usd,
@@ -243,7 +420,11 @@ def get_estimate_fees_use_case() -> EstimateFeesUseCase:
 
 
 def get_radar_pools_use_case() -> RadarPoolsUseCase:
-    return RadarPoolsUseCase(radar_pools_port=SqlRadarPoolsRepository(_get_db_engine()))
+    return RadarPoolsUseCase(
+        radar_pools_port=SqlRadarPoolsRepository(_get_db_engine()),
+        token_index_provider=_get_token_search_index_provider(),
+        listing_cache=_get_radar_listing_cache(),
+    )
 
 
 def get_simulate_apr_use_case() -> SimulateAprUseCase:
@@ -266,10 +447,23 @@ def get_simulate_apr_v2_use_case() -> SimulateAprV2UseCase:
 
 def get_pool_volume_history_use_case() -> GetPoolVolumeHistoryUseCase:
     return GetPoolVolumeHistoryUseCase(
+        pool_volume_history_port=SqlPoolVolumeHistoryRepository(_get_db_engine()),
+        premium_cache=_get_premium_summary_cache(),
+    )
+
+
+def get_export_pool_volume_history_use_case() -> ExportPoolVolumeHistoryUseCase:
+    return ExportPoolVolumeHistoryUseCase(
         pool_volume_history_port=SqlPoolVolumeHistoryRepository(_get_db_engine())
     )
 
 
+def _get_access_token_entitlements_use_case() -> GetUserEntitlementsUseCase | None:
+    if not get_settings().jwt_entitlement_claims:
+        return None
+    return get_get_user_entitlements_use_case()
+
+
 def get_register_user_use_case() -> RegisterUserUseCase:
     return RegisterUserUseCase(
         auth_port=_get_accounts_repository(),
@@ -282,6 +476,7 @@ def get_login_local_use_case() -> LoginLocalUseCase:
         auth_port=_get_accounts_repository(),
         password_hasher=_get_password_hasher(),
         token_port=_get_token_service(),
+        get_user_entitlements_use_case=_get_access_token_entitlements_use_case(),
     )
 
 
@@ -290,6 +485,7 @@ def get_login_google_use_case() -> LoginGoogleUseCase:
         auth_port=_get_accounts_repository(),
         google_oauth_port=_get_google_oauth_client(),
         token_port=_get_token_service(),
+        get_user_entitlements_use_case=_get_access_token_entitlements_use_case(),
     )
 
 
@@ -297,6 +493,7 @@ def get_refresh_session_use_case() -> RefreshSessionUseCase:
     return RefreshSessionUseCase(
         auth_port=_get_accounts_repository(),
         token_port=_get_token_service(),
+        get_user_entitlements_use_case=_get_access_token_entitlements_use_case(),
     )
 
 
@@ -304,11 +501,16 @@ def get_logout_session_use_case() -> LogoutSessionUseCase:
     return LogoutSessionUseCase(
         auth_port=_get_accounts_repository(),
         token_port=_get_token_service(),
+        user_cache=_get_user_cache(),
     )
 
 
 def get_get_user_entitlements_use_case() -> GetUserEntitlementsUseCase:
-    return GetUserEntitlementsUseCase(entitlements_port=_get_accounts_repository())
+    return GetUserEntitlementsUseCase(
+        entitlements_port=_get_accounts_repository(),
+        entitlements_cache=_get_entitlements_cache(),
+        plan_grants_cache=_get_plan_grants_cache(),
+    )
 
 
 def get_get_me_use_case() -> GetMeUseCase:
@@ -328,6 +530,8 @@ def get_process_stripe_webhook_use_case() -> ProcessStripeWebhookUseCase:
         auth_port=_get_accounts_repository(),
         entitlements_port=_get_accounts_repository(),
         stripe_port=_get_stripe_client(),
+        entitlements_cache=_get_entitlements_cache(),
+        user_cache=_get_user_cache(),
     )
 
 
@@ -348,12 +552,13 @@ def get_reset_password_use_case() -> ResetPasswordUseCase:
         auth_port=_get_accounts_repository(),
         token_port=_get_token_service(),
         password_hasher=_get_password_hasher(),
+        user_cache=_get_user_cache(),
     )
 
 
-def get_current_user(
+def get_access_token_payload(
     authorization: str = Header(...),
-) -> User:
+) -> AccessTokenPayload:
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid authorization header.")
     token = authorization.replace("Bearer ", "", 1).strip()
@@ -361,16 +566,38 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Missing access token.")
 
     token_service = _get_token_service()
-    auth_port = _get_accounts_repository()
 
     try:
-        payload = token_service.decode_access_token(token=token)
+        return token_service.decode_access_token(token=token)
     except ValueError as exc:
         raise HTTPException(status_code=401, detail=str(exc)) from exc
 
-    user = auth_port.get_user_by_id(user_id=payload.user_id)
+
+def decode_access_token_or_none(token: str) -> AccessTokenPayload | None:
+    try:
+        return _get_token_service().decode_access_token(token=token)
+    except (HTTPException, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> TokenBucketLimiter:
+    return TokenBucketLimiter(max_keys=get_settings().rate_limit_max_keys)
+
+
+def get_current_user(
+    payload: AccessTokenPayload = Depends(get_access_token_payload),
+) -> User:
+    # Cache curto por user_id; reset de senha e logout removem a entrada. Usuarios
+    # inativos nao entram no cache, entao desativacoes valem em ate USER_CACHE_TTL_SECONDS.
+    user_cache = _get_user_cache()
+    user = user_cache.get(payload.user_id)
     if user is None:
-        raise HTTPException(status_code=401, detail="User not found.")
+        user = _get_accounts_repository().get_user_by_id(user_id=payload.user_id)
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found.")
+        if user.is_active:
+            user_cache.set(user.id, user)
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User is inactive.")
     return user
@@ -379,10 +606,18 @@ def get_current_user(
 def require_feature(feature_code: str):
     def _dependency(
         user: User = Depends(get_current_user),
+        payload: AccessTokenPayload = Depends(get_access_token_payload),
         entitlements_use_case: GetUserEntitlementsUseCase = Depends(get_get_user_entitlements_use_case),
     ) -> User:
-        entitlements = entitlements_use_case.execute(user_id=user.id)
-        if not entitlements.boolean_features.get(feature_code, False):
+        allowed = None
+        # Claims do token valem enquanto a epoca bater com a do usuario; webhooks
+        # de assinatura incrementam a epoca e o token volta a consultar o banco.
+        if payload.claims is not None and payload.claims.entitlements_epoch == user.entitlements_epoch:
+            allowed = feature_bit_enabled(payload.claims.feature_bits, feature_code)
+        if allowed is None:
+            entitlements = entitlements_use_case.execute(user_id=user.id)
+            allowed = entitlements.boolean_features.get(feature_code, False)
+        if not allowed:
             raise HTTPException(
                 status_code=403,
                 detail=str(FeatureAccessDeniedError(f"Feature '{feature_code}' is required.")),
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response
+
+
+REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def build_etag(*parts: object) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _strip_weak(etag)
+    return any(_strip_weak(candidate) == target for candidate in if_none_match.split(","))
+
+
+def set_cache_headers(response: Response, *, etag: str, cache_control: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(*, etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.application.dto.auth import AccessTokenPayload
+from app.shared.rate_limit import (
+    RateLimitRule,
+    TokenBucketLimiter,
+    TrustedProxies,
+    match_rate_limit_rule,
+    resolve_client_ip,
+)
+
+
+class RateLimitMiddleware:
+    # Roda antes do roteamento: toda requisicao paga no bucket do IP e, com
+    # token valido, tambem no do usuario (JWT so HMAC, sem banco; limite por
+    # minuto da claim do plano). Rejeita se qualquer um estiver vazio.
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limiter: TokenBucketLimiter,
+        rules: tuple[RateLimitRule, ...],
+        decode_access_token: Callable[[str], AccessTokenPayload | None],
+        user_per_minute: float,
+        ip_per_minute: float,
+        trusted_proxies: TrustedProxies = (),
+    ):
+        self.app = app
+        self._limiter = limiter
+        self._rules = rules
+        self._decode_access_token = decode_access_token
+        self._user_per_minute = user_per_minute
+        self._ip_per_minute = ip_per_minute
+        self._trusted_proxies = trusted_proxies
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rule = match_rate_limit_rule(self._rules, method=scope["method"], path=scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self._limiter.acquire_all(self._limits(scope), cost=rule.cost)
+        if retry_after > 0:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded."},
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _limits(self, scope: Scope) -> list[tuple[str, float]]:
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        client = scope.get("client")
+        ip = resolve_client_ip(
+            peer=client[0] if client else None,
+            forwarded_for=headers.get("x-forwarded-for", ""),
+            trusted_proxies=self._trusted_proxies,
+        )
+        limits = [(f"ip:{ip}", self._ip_per_minute)]
+
+        authorization = headers.get("authorization", "")
+        if authorization.startswith("Bearer "):
+            payload = self._decode_access_token(authorization.replace("Bearer ", "", 1).strip())
+            if payload is not None:
+                per_minute = self._user_per_minute
+                if payload.claims is not None and payload.claims.requests_per_minute is not None:
+                    per_minute = payload.claims.requests_per_minute
+                limits.append((f"user:{payload.user_id}", per_minute))
+        return limits
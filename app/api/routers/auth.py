@@ -44,6 +44,7 @@ from app.domain.exceptions import (
     EmailAlreadyExistsError,
     GoogleTokenValidationError,
     InvalidCredentialsError,
+    PasswordHashingBusyError,
     PasswordResetTokenInvalidError,
     RefreshSessionInvalidError,
     UserInactiveError,
@@ -54,6 +55,7 @@ from app.shared.config import get_settings
 router = APIRouter()
 
 REFRESH_COOKIE_NAME = "refresh_token"
+PASSWORD_HASHING_RETRY_AFTER_SECONDS = 1
 
 
 def _set_refresh_cookie(
@@ -93,6 +95,14 @@ def _cookie_max_age_seconds(refresh_expires_at: datetime) -> int:
     return max(int((refresh_expires_at - now).total_seconds()), 0)
 
 
+def _password_hashing_busy(exc: PasswordHashingBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=str(exc),
+        headers={"Retry-After": str(PASSWORD_HASHING_RETRY_AFTER_SECONDS)},
+    )
+
+
 @router.post("/v1/auth/register", response_model=RegisterResponse)
 def register_user(
     req: RegisterRequest,
@@ -108,6 +118,8 @@ def register_user(
         )
     except EmailAlreadyExistsError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except PasswordHashingBusyError as exc:
+        raise _password_hashing_busy(exc) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -141,6 +153,8 @@ def login_local(
         )
     except InvalidCredentialsError as exc:
         raise HTTPException(status_code=401, detail=str(exc)) from exc
+    except PasswordHashingBusyError as exc:
+        raise _password_hashing_busy(exc) from exc
     except UserInactiveError as exc:
         raise HTTPException(status_code=403, detail=str(exc)) from exc
 
@@ -285,6 +299,8 @@ def reset_password(
         )
     except PasswordResetTokenInvalidError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except PasswordHashingBusyError as exc:
+        raise _password_hashing_busy(exc) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     return GenericMessageResponse(message=output.message)
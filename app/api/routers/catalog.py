@@ -9,6 +9,7 @@ from app.api.deps import (
     get_list_exchange_networks_use_case,
     get_list_exchanges_use_case,
     get_pool_by_address_use_case,
+    get_search_tokens_use_case,
 )
 from app.api.schemas.catalog import (
     ExchangeResponse,
@@ -16,12 +17,14 @@ from app.api.schemas.catalog import (
     PoolDetailResponse,
     PoolSummaryResponse,
     TokenResponse,
+    TokenSuggestionResponse,
 )
 from app.application.dto.catalog import (
     GetPoolByAddressInput,
     ListExchangeNetworkPoolsInput,
     ListExchangeNetworkTokensInput,
     ListExchangeNetworksInput,
+    SearchTokensInput,
 )
 from app.application.use_cases.get_pool_by_address import GetPoolByAddressUseCase
 from app.application.use_cases.list_exchange_network_pools import (
@@ -32,7 +35,8 @@ from app.application.use_cases.list_exchange_network_tokens import (
 )
 from app.application.use_cases.list_exchange_networks import ListExchangeNetworksUseCase
 from app.application.use_cases.list_exchanges import ListExchangesUseCase
-from app.domain.exceptions import PoolNotFoundError
+from app.application.use_cases.search_tokens import SearchTokensUseCase
+from app.domain.exceptions import PoolNotFoundError, TokenSearchInputError
 
 router = APIRouter()
 
@@ -108,6 +112,32 @@ def list_exchange_network_pools(
     return [PoolSummaryResponse(pool_address=row.pool_address, fee_tier=row.fee_tier) for row in rows]
 
 
+@router.get("/v1/tokens/search", response_model=list[TokenSuggestionResponse])
+def search_tokens(
+    q: str,
+    limit: int = 10,
+    network_id: int | None = None,
+    exchange_id: int | None = None,
+    _token: str = Depends(require_jwt),
+    use_case: SearchTokensUseCase = Depends(get_search_tokens_use_case),
+):
+    try:
+        rows = use_case.execute(
+            SearchTokensInput(
+                query=q,
+                limit=limit,
+                network_id=network_id,
+                exchange_id=exchange_id,
+            )
+        )
+    except TokenSearchInputError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return [
+        TokenSuggestionResponse(term=row.term, kind=row.kind, pool_count=row.pool_count)
+        for row in rows
+    ]
+
+
 @router.get("/v1/pools/by-address/{pool_address}", response_model=PoolDetailResponse)
 def get_pool_by_address(
     pool_address: str,
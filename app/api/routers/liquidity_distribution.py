@@ -2,14 +2,26 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 
 from app.api.auth import require_jwt
 from app.api.deps import (
+    get_liquidity_distribution_batch_use_case,
     get_liquidity_distribution_default_range_use_case,
     get_liquidity_distribution_use_case,
 )
+from app.api.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    build_etag,
+    etag_matches,
+    not_modified,
+    set_cache_headers,
+)
 from app.api.schemas.liquidity_distribution import (
+    LiquidityDistributionBatchItemResponse,
+    LiquidityDistributionBatchRequest,
+    LiquidityDistributionBatchResponse,
     LiquidityDistributionDefaultRangeRequest,
     LiquidityDistributionDefaultRangeResponse,
     LiquidityDistributionPointResponse,
@@ -17,14 +29,24 @@ from app.api.schemas.liquidity_distribution import (
     LiquidityDistributionRequest,
     LiquidityDistributionResponse,
 )
-from app.application.dto.liquidity_distribution import GetLiquidityDistributionInput
+from app.application.dto.liquidity_distribution import (
+    GetLiquidityDistributionBatchInput,
+    GetLiquidityDistributionInput,
+    GetLiquidityDistributionOutput,
+)
 from app.application.dto.liquidity_distribution_default_range import (
     GetLiquidityDistributionDefaultRangeInput,
 )
 from app.application.use_cases.get_liquidity_distribution_default_range import (
     GetLiquidityDistributionDefaultRangeUseCase,
 )
-from app.application.use_cases.get_liquidity_distribution import GetLiquidityDistributionUseCase
+from app.application.use_cases.get_liquidity_distribution import (
+    PINNED_VERSION_PREFIX,
+    GetLiquidityDistributionUseCase,
+)
+from app.application.use_cases.get_liquidity_distribution_batch import (
+    GetLiquidityDistributionBatchUseCase,
+)
 from app.domain.exceptions import (
     LiquidityDistributionInputError,
     LiquidityDistributionNotFoundError,
@@ -34,34 +56,24 @@ from app.domain.exceptions import (
 router = APIRouter()
 
 
-@router.post("/v1/liquidity-distribution", response_model=LiquidityDistributionResponse)
-def get_liquidity_distribution(
-    req: LiquidityDistributionRequest,
-    _token: str = Depends(require_jwt),
-    use_case: GetLiquidityDistributionUseCase = Depends(get_liquidity_distribution_use_case),
-):
-    try:
-        result = use_case.execute(
-            GetLiquidityDistributionInput(
-                pool_id=req.pool_id,
-                chain_id=req.chain_id,
-                dex_id=req.dex_id,
-                snapshot_date=req.snapshot_date,
-                current_tick=req.current_tick,
-                center_tick=req.center_tick,
-                tick_range=req.tick_range,
-                range_min=req.range_min,
-                range_max=req.range_max,
-                swapped_pair=req.swapped_pair,
-            )
-        )
-    except PoolNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except LiquidityDistributionNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    except LiquidityDistributionInputError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+def _to_distribution_input(req: LiquidityDistributionRequest) -> GetLiquidityDistributionInput:
+    return GetLiquidityDistributionInput(
+        pool_id=req.pool_id,
+        chain_id=req.chain_id,
+        dex_id=req.dex_id,
+        snapshot_date=req.snapshot_date,
+        current_tick=req.current_tick,
+        center_tick=req.center_tick,
+        tick_range=req.tick_range,
+        range_min=req.range_min,
+        range_max=req.range_max,
+        swapped_pair=req.swapped_pair,
+        block_number=req.block_number,
+        timestamp=req.timestamp,
+    )
+
 
+def _to_distribution_response(result: GetLiquidityDistributionOutput) -> LiquidityDistributionResponse:
     return LiquidityDistributionResponse(
         pool=LiquidityDistributionPoolResponse(
             token0=result.token0,
@@ -76,6 +88,70 @@ def get_liquidity_distribution(
             )
             for item in result.data
         ],
+        block_number=result.block_number,
+    )
+
+
+@router.post("/v1/liquidity-distribution", response_model=LiquidityDistributionResponse)
+def get_liquidity_distribution(
+    req: LiquidityDistributionRequest,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    _token: str = Depends(require_jwt),
+    use_case: GetLiquidityDistributionUseCase = Depends(get_liquidity_distribution_use_case),
+):
+    command = _to_distribution_input(req)
+    try:
+        use_case.validate(command)
+        version = use_case.get_version(command)
+        etag = None
+        cache_control = REVALIDATE_CACHE_CONTROL
+        if version is not None:
+            etag = build_etag("liquidity-distribution", version, command)
+            if version.startswith(PINNED_VERSION_PREFIX):
+                cache_control = IMMUTABLE_CACHE_CONTROL
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag=etag, cache_control=cache_control)
+        result = use_case.execute(command)
+    except PoolNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except LiquidityDistributionNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except LiquidityDistributionInputError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if etag is not None:
+        set_cache_headers(response, etag=etag, cache_control=cache_control)
+    return _to_distribution_response(result)
+
+
+@router.post("/v1/liquidity-distribution/batch", response_model=LiquidityDistributionBatchResponse)
+def get_liquidity_distribution_batch(
+    req: LiquidityDistributionBatchRequest,
+    _token: str = Depends(require_jwt),
+    use_case: GetLiquidityDistributionBatchUseCase = Depends(get_liquidity_distribution_batch_use_case),
+):
+    try:
+        result = use_case.execute(
+            GetLiquidityDistributionBatchInput(
+                items=[_to_distribution_input(item) for item in req.items],
+            )
+        )
+    except LiquidityDistributionInputError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return LiquidityDistributionBatchResponse(
+        items=[
+            LiquidityDistributionBatchItemResponse(
+                pool_id=item.pool_id,
+                chain_id=item.chain_id,
+                dex_id=item.dex_id,
+                distribution=_to_distribution_response(item.result) if item.result is not None else None,
+                error_code=item.error_code,
+                error=item.error,
+            )
+            for item in result.items
+        ]
     )
 
 
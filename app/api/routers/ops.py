@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_cache_stats, get_password_hashing_stats, require_feature
+from app.api.schemas.ops import CacheStatsResponse, PasswordHashingStatsResponse
+from app.domain.services.entitlements import OPS_ADMIN_FEATURE
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/v1/ops/caches",
+    response_model=list[CacheStatsResponse],
+    dependencies=[Depends(require_feature(OPS_ADMIN_FEATURE))],
+)
+def get_caches():
+    # Contadores desde o start deste processo (cada worker tem os seus).
+    return [
+        CacheStatsResponse(
+            name=name,
+            entries=stats.entries,
+            max_entries=stats.max_entries,
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_rate=stats.hit_rate,
+        )
+        for name, stats in get_cache_stats().items()
+    ]
+
+
+@router.get(
+    "/v1/ops/password-hashing",
+    response_model=PasswordHashingStatsResponse,
+    dependencies=[Depends(require_feature(OPS_ADMIN_FEATURE))],
+)
+def get_password_hashing():
+    stats = get_password_hashing_stats()
+    if stats is None:
+        return PasswordHashingStatsResponse(enabled=False)
+    # Espera na fila = tempo entre o submit e o inicio do hash (ultimas 1024 chamadas).
+    return PasswordHashingStatsResponse(
+        enabled=True,
+        workers=stats.workers,
+        max_queue=stats.max_queue,
+        in_flight=stats.in_flight,
+        completed=stats.completed,
+        rejected=stats.rejected,
+        queue_wait_avg_ms=stats.queue_wait_avg_ms,
+        queue_wait_p95_ms=stats.queue_wait_p95_ms,
+        queue_wait_max_ms=stats.queue_wait_max_ms,
+    )
@@ -3,16 +3,26 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from app.api.auth import require_jwt
-from app.api.deps import get_pool_price_use_case
+from app.api.deps import get_export_pool_price_use_case, get_pool_price_use_case
+from app.api.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    build_etag,
+    etag_matches,
+    not_modified,
+    set_cache_headers,
+)
+from app.api.streaming import EXPORT_FORMAT_PATTERN, export_response
 from app.api.schemas.pool_price import (
+    PoolPriceCandleResponse,
     PoolPricePointResponse,
     PoolPriceResponse,
     PoolPriceStatsResponse,
 )
-from app.application.dto.pool_price import GetPoolPriceInput
+from app.application.dto.pool_price import ExportPoolPriceInput, GetPoolPriceInput
+from app.application.use_cases.export_pool_price import ExportPoolPriceUseCase
 from app.application.use_cases.get_pool_price import GetPoolPriceUseCase
 from app.domain.exceptions import PoolNotFoundError, PoolPriceInputError, PoolPriceNotFoundError
 
@@ -25,6 +35,7 @@ def _dec_to_str_or_none(value: Decimal | None) -> str | None:
 
 @router.get("/v1/pool-price", response_model=PoolPriceResponse)
 def get_pool_price(
+    response: Response,
     pool_address: str,
     chain_id: int,
     dex_id: int,
@@ -32,21 +43,32 @@ def get_pool_price(
     start: datetime | None = None,
     end: datetime | None = None,
     swapped_pair: bool = False,
+    resolution: str | None = None,
+    max_points: int | None = None,
+    if_none_match: str | None = Header(default=None),
     _token: str = Depends(require_jwt),
     use_case: GetPoolPriceUseCase = Depends(get_pool_price_use_case),
 ):
+    command = GetPoolPriceInput(
+        pool_address=pool_address,
+        chain_id=chain_id,
+        dex_id=dex_id,
+        days=days,
+        start=start,
+        end=end,
+        swapped_pair=swapped_pair,
+        resolution=resolution,
+        max_points=max_points,
+    )
     try:
-        result = use_case.execute(
-            GetPoolPriceInput(
-                pool_address=pool_address,
-                chain_id=chain_id,
-                dex_id=dex_id,
-                days=days,
-                start=start,
-                end=end,
-                swapped_pair=swapped_pair,
-            )
-        )
+        use_case.validate(command)
+        version = use_case.get_version(command)
+        etag = None
+        if version is not None:
+            etag = build_etag("pool-price", version, command)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
+        result = use_case.execute(command)
     except PoolNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except PoolPriceNotFoundError as exc:
@@ -54,6 +76,8 @@ def get_pool_price(
     except PoolPriceInputError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    if etag is not None:
+        set_cache_headers(response, etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
     return PoolPriceResponse(
         pool_address=result.pool_address,
         days=result.days,
@@ -70,4 +94,57 @@ def get_pool_price(
             )
             for row in result.series
         ],
+        resolution=result.resolution,
+        candles=(
+            [
+                PoolPriceCandleResponse(
+                    timestamp=candle.timestamp.isoformat(),
+                    open=str(candle.open),
+                    high=str(candle.high),
+                    low=str(candle.low),
+                    close=str(candle.close),
+                )
+                for candle in result.candles
+            ]
+            if result.resolution is not None
+            else None
+        ),
+    )
+
+
+@router.get("/v1/pool-price/export")
+def export_pool_price(
+    pool_address: str,
+    chain_id: int,
+    dex_id: int,
+    days: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    swapped_pair: bool = False,
+    export_format: str = Query(default="ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    _token: str = Depends(require_jwt),
+    use_case: ExportPoolPriceUseCase = Depends(get_export_pool_price_use_case),
+):
+    try:
+        points = use_case.execute(
+            ExportPoolPriceInput(
+                pool_address=pool_address,
+                chain_id=chain_id,
+                dex_id=dex_id,
+                days=days,
+                start=start,
+                end=end,
+                swapped_pair=swapped_pair,
+            )
+        )
+    except PoolNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PoolPriceInputError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return export_response(
+        ({"timestamp": point.timestamp, "price": point.price} for point in points),
+        fields=["timestamp", "price"],
+        export_format=export_format,
+        filename=f"pool-price-{pool_address.lower()}",
     )
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from app.api.auth import require_jwt
-from app.api.deps import get_pool_volume_history_use_case
+from app.api.deps import (
+    get_export_pool_volume_history_use_case,
+    get_pool_volume_history_use_case,
+)
+from app.api.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    build_etag,
+    etag_matches,
+    not_modified,
+    set_cache_headers,
+)
+from app.api.streaming import EXPORT_FORMAT_PATTERN, export_response
 from app.api.schemas.pool_volume_history import (
     PoolVolumeHistoryPointResponse,
     PoolVolumeHistorySummaryResponse,
     PoolVolumeHistoryWithSummaryResponse,
 )
-from app.application.dto.pool_volume_history import GetPoolVolumeHistoryInput
+from app.application.dto.pool_volume_history import (
+    ExportPoolVolumeHistoryInput,
+    GetPoolVolumeHistoryInput,
+)
+from app.application.use_cases.export_pool_volume_history import ExportPoolVolumeHistoryUseCase
 from app.application.use_cases.get_pool_volume_history import GetPoolVolumeHistoryUseCase
 from app.domain.exceptions import PoolVolumeHistoryInputError
 
@@ -21,6 +36,7 @@ router = APIRouter()
     response_model=PoolVolumeHistoryWithSummaryResponse,
 )
 def get_pool_volume_history(
+    response: Response,
     pool_address: str,
     days: int,
     chain_id: int | None = Query(default=None, alias="chainId"),
@@ -29,25 +45,34 @@ def get_pool_volume_history(
     exchange: str = Query(default="coingecko-derived"),
     symbol0: str | None = Query(default=None),
     symbol1: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     _token: str = Depends(require_jwt),
     use_case: GetPoolVolumeHistoryUseCase = Depends(get_pool_volume_history_use_case),
 ):
+    command = GetPoolVolumeHistoryInput(
+        pool_address=pool_address,
+        days=days,
+        chain_id=chain_id,
+        dex_id=dex_id,
+        include_premium=include_premium,
+        exchange=exchange,
+        symbol0=symbol0,
+        symbol1=symbol1,
+    )
     try:
-        output = use_case.execute(
-            GetPoolVolumeHistoryInput(
-                pool_address=pool_address,
-                days=days,
-                chain_id=chain_id,
-                dex_id=dex_id,
-                include_premium=include_premium,
-                exchange=exchange,
-                symbol0=symbol0,
-                symbol1=symbol1,
-            )
-        )
+        use_case.validate(command)
+        version = use_case.get_version(command)
+        etag = None
+        if version is not None:
+            etag = build_etag("pool-volume-history", version, command)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
+        output = use_case.execute(command)
     except PoolVolumeHistoryInputError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    if etag is not None:
+        set_cache_headers(response, etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
     volume_history = [
         PoolVolumeHistoryPointResponse(
             time=row.time,
@@ -69,3 +94,43 @@ def get_pool_volume_history(
             geometric_mean_price=output.summary.geometric_mean_price,
         ),
     )
+
+
+@router.get("/v1/pools/{pool_address}/volume-history/export")
+def export_pool_volume_history(
+    pool_address: str,
+    days: int,
+    chain_id: int | None = Query(default=None, alias="chainId"),
+    dex_id: int | None = Query(default=None, alias="dexId"),
+    export_format: str = Query(default="ndjson", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    _token: str = Depends(require_jwt),
+    use_case: ExportPoolVolumeHistoryUseCase = Depends(get_export_pool_volume_history_use_case),
+):
+    try:
+        points = use_case.execute(
+            ExportPoolVolumeHistoryInput(
+                pool_address=pool_address,
+                days=days,
+                chain_id=chain_id,
+                dex_id=dex_id,
+            )
+        )
+    except PoolVolumeHistoryInputError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return export_response(
+        (
+            {
+                "hour_start": point.hour_start,
+                "chain_id": point.chain_id,
+                "dex_id": point.dex_id,
+                "volume_usd": point.volume_usd,
+                "fees_usd": point.fees_usd,
+                "tvl_usd": point.tvl_usd,
+            }
+            for point in points
+        ),
+        fields=["hour_start", "chain_id", "dex_id", "volume_usd", "fees_usd", "tvl_usd"],
+        export_format=export_format,
+        filename=f"pool-volume-{pool_address.lower()}",
+    )
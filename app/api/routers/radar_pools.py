@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 
 from app.api.auth import require_jwt
 from app.api.deps import get_radar_pools_use_case
+from app.api.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    build_etag,
+    etag_matches,
+    not_modified,
+    set_cache_headers,
+)
 from app.api.schemas.radar_pools import RadarPoolResponseItem, RadarPoolsResponse
 from app.application.dto.radar_pools import RadarPoolsInput
 from app.application.use_cases.radar_pools import RadarPoolsUseCase
@@ -14,6 +21,7 @@ router = APIRouter()
 
 @router.get("/v1/radar/pools", response_model=RadarPoolsResponse)
 def radar_pools(
+    response: Response,
     network_id: int | None = None,
     exchange_id: int | None = None,
     token_symbol: str | None = None,
@@ -22,25 +30,35 @@ def radar_pools(
     page_size: int = 10,
     order_by: str = "average_apr",
     order_dir: str = "desc",
+    if_none_match: str | None = Header(default=None),
     _token: str = Depends(require_jwt),
     use_case: RadarPoolsUseCase = Depends(get_radar_pools_use_case),
 ):
+    command = RadarPoolsInput(
+        network_id=network_id,
+        exchange_id=exchange_id,
+        token_symbol=token_symbol,
+        timeframe_days=timeframe_days,
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        order_dir=order_dir,
+    )
     try:
-        result = use_case.execute(
-            RadarPoolsInput(
-                network_id=network_id,
-                exchange_id=exchange_id,
-                token_symbol=token_symbol,
-                timeframe_days=timeframe_days,
-                page=page,
-                page_size=page_size,
-                order_by=order_by,
-                order_dir=order_dir,
-            )
-        )
+        use_case.validate(command)
+        version = use_case.get_version(command)
+        if version is not None:
+            etag = build_etag("radar-pools", version, command)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
+        result = use_case.execute(command, version=version)
     except RadarPoolsInputError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    # ETag da versao efetivamente servida (pode ser a anterior enquanto o cache recarrega).
+    if result.version is not None:
+        etag = build_etag("radar-pools", result.version, command)
+        set_cache_headers(response, etag=etag, cache_control=REVALIDATE_CACHE_CONTROL)
     return RadarPoolsResponse(
         page=result.page,
         page_size=result.page_size,
@@ -22,6 +22,12 @@ class TokenResponse(BaseModel):
     icon_url: str | None = None
 
 
+class TokenSuggestionResponse(BaseModel):
+    term: str
+    kind: str
+    pool_count: int
+
+
 class PoolSummaryResponse(BaseModel):
     pool_address: str
     fee_tier: int
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,14 @@ class LiquidityDistributionRequest(BaseModel):
         False,
         description="Quando true, interpreta entrada e retorna saida no par invertido.",
     )
+    block_number: int | None = Field(
+        None,
+        description="Reconstroi a distribuicao no bloco informado (historico).",
+    )
+    timestamp: datetime | None = Field(
+        None,
+        description="Reconstroi a distribuicao no ultimo snapshot ate este instante (UTC).",
+    )
 
 
 class LiquidityDistributionPoolResponse(BaseModel):
@@ -42,6 +50,29 @@ class LiquidityDistributionResponse(BaseModel):
     pool: LiquidityDistributionPoolResponse
     current_tick: int
     data: list[LiquidityDistributionPointResponse]
+    block_number: int | None = None
+
+
+class LiquidityDistributionBatchRequest(BaseModel):
+    items: list[LiquidityDistributionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Ate 20 pools por chamada, mesmos campos de /v1/liquidity-distribution.",
+    )
+
+
+class LiquidityDistributionBatchItemResponse(BaseModel):
+    pool_id: int | str
+    chain_id: int | None
+    dex_id: int | None
+    distribution: LiquidityDistributionResponse | None = None
+    error_code: str | None = None
+    error: str | None = None
+
+
+class LiquidityDistributionBatchResponse(BaseModel):
+    items: list[LiquidityDistributionBatchItemResponse]
 
 
 class LiquidityDistributionDefaultRangeRequest(BaseModel):
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    name: str
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    hit_rate: float | None
+
+
+class PasswordHashingStatsResponse(BaseModel):
+    enabled: bool
+    workers: int | None = None
+    max_queue: int | None = None
+    in_flight: int | None = None
+    completed: int | None = None
+    rejected: int | None = None
+    queue_wait_avg_ms: float | None = None
+    queue_wait_p95_ms: float | None = None
+    queue_wait_max_ms: float | None = None
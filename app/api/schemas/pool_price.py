@@ -15,8 +15,18 @@ class PoolPricePointResponse(BaseModel):
     price: str
 
 
+class PoolPriceCandleResponse(BaseModel):
+    timestamp: str
+    open: str
+    high: str
+    low: str
+    close: str
+
+
 class PoolPriceResponse(BaseModel):
     pool_address: str
     days: int
     stats: PoolPriceStatsResponse
     series: list[PoolPricePointResponse]
+    resolution: str | None = None
+    candles: list[PoolPriceCandleResponse] | None = None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+import csv
+from datetime import datetime
+from decimal import Decimal
+import io
+from itertools import chain
+import json
+
+from fastapi.responses import StreamingResponse
+
+
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+_CHUNK_BYTES = 64 * 1024
+_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _serialize(value: object) -> object:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_line(record: Mapping[str, object]) -> str:
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _ndjson_chunks(rows: Iterable[Mapping[str, object]], fields: list[str]) -> Iterator[bytes]:
+    buffer: list[str] = []
+    size = 0
+    count = 0
+    try:
+        for row in rows:
+            line = _ndjson_line({field: _serialize(row[field]) for field in fields})
+            buffer.append(line)
+            size += len(line)
+            count += 1
+            if size >= _CHUNK_BYTES:
+                yield "".join(buffer).encode("utf-8")
+                buffer = []
+                size = 0
+    except Exception:
+        # Falha no meio do stream (o 200 ja foi enviado): registro final de
+        # erro e o raise aborta a conexao, para o arquivo nao parecer completo.
+        buffer.append(_ndjson_line({"export": "error", "rows": count}))
+        yield "".join(buffer).encode("utf-8")
+        raise
+    buffer.append(_ndjson_line({"export": "complete", "rows": count}))
+    yield "".join(buffer).encode("utf-8")
+
+
+def _csv_chunks(rows: Iterable[Mapping[str, object]], fields: list[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    count = 0
+    try:
+        for row in rows:
+            writer.writerow(["" if row[field] is None else _serialize(row[field]) for field in fields])
+            count += 1
+            if buffer.tell() >= _CHUNK_BYTES:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate(0)
+    except Exception:
+        # Mesmo contrato do NDJSON, como linha de comentario no fim do CSV.
+        buffer.write(f"# export=error rows={count}\n")
+        yield buffer.getvalue().encode("utf-8")
+        raise
+    buffer.write(f"# export=complete rows={count}\n")
+    yield buffer.getvalue().encode("utf-8")
+
+
+def _prefetch(rows: Iterable[Mapping[str, object]]) -> Iterator[Mapping[str, object]]:
+    # Executa a consulta e busca o primeiro bloco ainda dentro do handler:
+    # erro de banco nesse ponto vira 5xx em vez de um 200 truncado.
+    iterator = iter(rows)
+    for first in iterator:
+        return chain((first,), iterator)
+    return iter(())
+
+
+def export_response(
+    rows: Iterable[Mapping[str, object]],
+    *,
+    fields: list[str],
+    export_format: str,
+    filename: str,
+) -> StreamingResponse:
+    rows = _prefetch(rows)
+    chunks = _csv_chunks(rows, fields) if export_format == "csv" else _ndjson_chunks(rows, fields)
+    extension = "csv" if export_format == "csv" else "ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+    )
@@ -61,9 +61,18 @@ class AuthTokensOutput:
     refresh_expires_at: datetime
 
 
+@dataclass(frozen=True)
+class AccessTokenClaims:
+    plan_code: str
+    feature_bits: int
+    entitlements_epoch: int
+    requests_per_minute: int | None = None
+
+
 @dataclass(frozen=True)
 class AccessTokenPayload:
     user_id: str
+    claims: AccessTokenClaims | None = None
 
 
 @dataclass(frozen=True)
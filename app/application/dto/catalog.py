@@ -28,3 +28,11 @@ class GetPoolByAddressInput:
     pool_address: str
     chain_id: int
     exchange_id: int
+
+
+@dataclass(frozen=True)
+class SearchTokensInput:
+    query: str
+    limit: int = 10
+    network_id: int | None = None
+    exchange_id: int | None = None
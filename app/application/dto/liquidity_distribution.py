@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 
 
@@ -17,6 +17,8 @@ class GetLiquidityDistributionInput:
     range_min: Decimal | None = None
     range_max: Decimal | None = None
     swapped_pair: bool = False
+    block_number: int | None = None
+    timestamp: datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -32,3 +34,24 @@ class GetLiquidityDistributionOutput:
     token1: str
     current_tick: int
     data: list[LiquidityDistributionPointOutput]
+    block_number: int | None = None
+
+
+@dataclass(frozen=True)
+class GetLiquidityDistributionBatchInput:
+    items: list[GetLiquidityDistributionInput]
+
+
+@dataclass(frozen=True)
+class LiquidityDistributionBatchItemOutput:
+    pool_id: int | str
+    chain_id: int | None
+    dex_id: int | None
+    result: GetLiquidityDistributionOutput | None = None
+    error_code: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class GetLiquidityDistributionBatchOutput:
+    items: list[LiquidityDistributionBatchItemOutput]
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
-from app.domain.entities.pool_price import PoolPricePoint
+from app.domain.entities.pool_price import PoolPriceCandle, PoolPricePoint
 
 
 @dataclass(frozen=True)
@@ -16,6 +16,8 @@ class GetPoolPriceInput:
     start: datetime | None = None
     end: datetime | None = None
     swapped_pair: bool = False
+    resolution: str | None = None
+    max_points: int | None = None
 
 
 @dataclass(frozen=True)
@@ -27,3 +29,23 @@ class GetPoolPriceOutput:
     avg_price: Decimal | None
     current_price: Decimal | None
     series: list[PoolPricePoint]
+    resolution: str | None = None
+    candles: list[PoolPriceCandle] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ExportPoolPriceInput:
+    pool_address: str
+    chain_id: int
+    dex_id: int
+    days: int | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    swapped_pair: bool = False
+
+
+@dataclass(frozen=True)
+class ExportPoolPricePoint:
+    timestamp: datetime
+    # None quando o preco original (<= 0) nao pode ser invertido.
+    price: Decimal | None
@@ -39,3 +39,11 @@ class PoolVolumeHistorySummaryOutput:
 class GetPoolVolumeHistoryOutput:
     volume_history: list[PoolVolumeHistoryPointOutput]
     summary: PoolVolumeHistorySummaryOutput
+
+
+@dataclass(frozen=True)
+class ExportPoolVolumeHistoryInput:
+    pool_address: str
+    days: int
+    chain_id: int | None
+    dex_id: int | None
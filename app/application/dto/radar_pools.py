@@ -48,3 +48,4 @@ class RadarPoolsOutput:
     page_size: int
     total: int
     data: list[RadarPoolOutputItem]
+    version: str | None = None
@@ -42,6 +42,9 @@ class AuthPort(Protocol):
     def update_user_stripe_customer_id(self, *, user_id: str, stripe_customer_id: str) -> None:
         ...
 
+    def increment_user_entitlements_epoch(self, *, user_id: str) -> int:
+        ...
+
     def create_identity(
         self,
         *,
@@ -17,17 +17,17 @@ class CatalogQueryPort(Protocol):
         *,
         exchange_id: int,
         network_id: int,
-        token_address: str | None = None,
+        pool_addresses: list[str] | None = None,
+        exclude_token: str | None = None,
     ) -> list[Token]:
         ...
 
-    def list_pools_by_exchange_network_tokens(
+    def list_pools_by_exchange_network_addresses(
         self,
         *,
         exchange_id: int,
         network_id: int,
-        token0_address: str,
-        token1_address: str,
+        pool_addresses: list[str],
     ) -> list[PoolSummary]:
         ...
 
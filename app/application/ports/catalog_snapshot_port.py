@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.domain.services.catalog_snapshot import CatalogSnapshot
+
+
+class CatalogSnapshotPort(Protocol):
+    def load_catalog_snapshot(self) -> CatalogSnapshot:
+        ...
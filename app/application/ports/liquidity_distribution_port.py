@@ -3,7 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Protocol
 
-from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.domain.entities.liquidity_distribution import (
+    LiquidityDistributionBlockSnapshot,
+    LiquidityDistributionPool,
+    TickLiquidity,
+)
 
 
 class LiquidityDistributionPort(Protocol):
@@ -22,5 +26,59 @@ class LiquidityDistributionPort(Protocol):
     def get_latest_period_start(self, *, pool_id: int) -> datetime | None:
         ...
 
+    def get_latest_block_number(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        ...
+
+    def get_tick_history_complete_block(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        ...
+
     def get_ticks_by_period(self, *, pool_id: int, period_start: datetime) -> list[TickLiquidity]:
         ...
+
+    def get_pools_by_refs(
+        self,
+        *,
+        pool_ids: list[int],
+        pool_addresses: list[str],
+    ) -> list[LiquidityDistributionPool]:
+        ...
+
+    def get_ticks_for_pools(
+        self,
+        *,
+        pools: list[LiquidityDistributionPool],
+    ) -> dict[int, list[TickLiquidity]]:
+        ...
+
+    def get_pool_snapshot_at(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int | None = None,
+        timestamp: int | None = None,
+    ) -> LiquidityDistributionBlockSnapshot | None:
+        ...
+
+    def get_ticks_at_block(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int,
+    ) -> list[TickLiquidity]:
+        ...
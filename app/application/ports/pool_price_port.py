@@ -1,62 +1,43 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Protocol
 
-from app.domain.entities.pool_price import PoolCurrentPrice, PoolPricePoint, PoolPriceStats
+from app.domain.entities.pool_price import PoolPricePoint, PoolPriceWindow
 
 
 class PoolPricePort(Protocol):
+    # Usado pelo export: o stream de pontos comeca antes de qualquer linha e nao
+    # distingue pool inexistente (404) de janela vazia. A janela de
+    # get_price_window ja traz a pool na mesma consulta.
     def pool_exists(self, *, pool_address: str, chain_id: int, dex_id: int) -> bool:
         ...
 
-    def get_series(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        days: int,
-    ) -> list[PoolPricePoint]:
-        ...
-
-    def get_series_range(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> list[PoolPricePoint]:
-        ...
-
-    def get_stats(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        days: int,
-    ) -> PoolPriceStats:
+    def get_latest_block_number(self, *, pool_address: str, chain_id: int, dex_id: int) -> int | None:
         ...
 
-    def get_stats_range(
+    def get_price_window(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> PoolPriceStats:
+        days: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bucket_seconds: int | None = None,
+    ) -> PoolPriceWindow | None:
         ...
 
-    def get_latest_price(
+    def iter_price_points(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-    ) -> PoolCurrentPrice | None:
+        days: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[PoolPricePoint]:
         ...
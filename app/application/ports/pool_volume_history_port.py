@@ -1,41 +1,49 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import Protocol
 
-from app.domain.entities.pool_volume_history import (
-    PoolVolumeHistoryPoint,
-    PoolVolumeHistorySummaryBase,
-    PoolVolumeHistorySummaryPremium,
-)
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
+from app.domain.entities.pool_volume_history import PoolHourlyVolumePoint, PoolVolumeHistoryWindow
 
 
 class PoolVolumeHistoryPort(Protocol):
-    def list_daily_volume_history(
+    def get_latest_hour_start(
         self,
         *,
         pool_address: str,
-        days: int,
         chain_id: int | None,
         dex_id: int | None,
-    ) -> list[PoolVolumeHistoryPoint]:
+    ) -> datetime | None:
         ...
 
-    def get_summary_base(
+    def get_volume_history_window(
         self,
         *,
         pool_address: str,
         days: int,
         chain_id: int | None,
         dex_id: int | None,
-    ) -> PoolVolumeHistorySummaryBase:
+    ) -> PoolVolumeHistoryWindow:
         ...
 
-    def get_summary_premium(
+    def list_daily_ohlc(
         self,
         *,
         exchange: str,
-        symbol0: str,
-        symbol1: str | None,
+        symbols: list[str],
+        start_day: date,
+        end_day: date,
+    ) -> dict[str, CryptoOhlcDailySeries]:
+        ...
+
+    def iter_hourly_volume(
+        self,
+        *,
+        pool_address: str,
         days: int,
-    ) -> PoolVolumeHistorySummaryPremium:
+        chain_id: int | None,
+        dex_id: int | None,
+    ) -> Iterator[PoolHourlyVolumePoint]:
         ...
@@ -3,16 +3,37 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Protocol
 
-from app.domain.entities.radar_pools import RadarPoolAggregate
+from app.domain.entities.radar_pools import RadarPoolItem
+from app.domain.entities.token_search import PoolKey
 
 
 class RadarPoolsPort(Protocol):
-    def list_pools(
+    def get_latest_hour_start(self) -> datetime | None:
+        ...
+
+    def get_aggregates_refreshed_at(self, *, timeframe_days: int) -> datetime | None:
+        ...
+
+    def count_pools(
+        self,
+        *,
+        timeframe_days: int,
+        network_id: int | None,
+        exchange_id: int | None,
+        pool_keys: frozenset[PoolKey] | None,
+    ) -> int:
+        ...
+
+    def list_pools_page(
         self,
         *,
-        start_dt: datetime,
+        timeframe_days: int,
         network_id: int | None,
         exchange_id: int | None,
-        token_symbol: str | None,
-    ) -> list[RadarPoolAggregate]:
+        pool_keys: frozenset[PoolKey] | None,
+        order_by: str,
+        order_dir: str,
+        limit: int | None,
+        offset: int,
+    ) -> list[RadarPoolItem]:
         ...
@@ -5,11 +5,10 @@ from typing import Protocol
 
 
 class TokenPricePort(Protocol):
-    def get_pair_prices(
+    def get_prices_usd(
         self,
         *,
-        token0_address: str,
-        token1_address: str,
+        token_addresses: list[str],
         network: str,
-    ) -> tuple[Decimal, Decimal]:
+    ) -> dict[str, Decimal]:
         ...
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.domain.entities.token_search import PoolTokenPair
+
+
+class TokenSearchPort(Protocol):
+    def list_pool_tokens(self) -> list[PoolTokenPair]:
+        ...
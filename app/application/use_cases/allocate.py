@@ -3,7 +3,7 @@ from __future__ import annotations
 from app.application.dto.allocate import AllocateInput, AllocateOutput
 from app.application.ports.allocation_pool_port import AllocationPoolPort
 from app.application.ports.token_price_port import TokenPricePort
-from app.domain.exceptions import AllocationInputError, PoolNotFoundError
+from app.domain.exceptions import AllocationInputError, PoolNotFoundError, PriceLookupDomainError
 from app.domain.services.pair_orientation import ui_price_range_to_canonical
 from app.domain.services.allocation import split_deposit_full_range_equal_value, split_deposit_range
 
@@ -22,11 +22,14 @@ class AllocateUseCase:
         if pool is None:
             raise PoolNotFoundError("Pool not found.")
 
-        price0, price1 = self._price_port.get_pair_prices(
-            token0_address=pool.token0_address,
-            token1_address=pool.token1_address,
+        prices = self._price_port.get_prices_usd(
+            token_addresses=[pool.token0_address, pool.token1_address],
             network=pool.network,
         )
+        price0 = prices.get(pool.token0_address)
+        price1 = prices.get(pool.token1_address)
+        if price0 is None or price1 is None:
+            raise PriceLookupDomainError("Price not found for token.")
 
         if command.full_range:
             amounts = split_deposit_full_range_equal_value(
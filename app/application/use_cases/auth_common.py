@@ -3,10 +3,13 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from app.application.dto.auth import AuthTokensOutput, AuthUserOutput
+from app.application.dto.auth import AccessTokenClaims, AuthTokensOutput, AuthUserOutput
 from app.application.ports.auth_port import AuthPort
 from app.application.ports.token_port import TokenPort
 from app.domain.entities.user import User
+from app.domain.services.entitlements import REQUESTS_PER_MINUTE_LIMIT, encode_feature_bits
+
+from .get_user_entitlements import GetUserEntitlementsUseCase
 
 
 def utcnow() -> datetime:
@@ -27,6 +30,24 @@ def build_auth_user_output(user: User) -> AuthUserOutput:
     )
 
 
+def build_access_token_claims(
+    *,
+    user: User,
+    get_user_entitlements_use_case: GetUserEntitlementsUseCase | None,
+) -> AccessTokenClaims | None:
+    if get_user_entitlements_use_case is None:
+        return None
+    # Sem cache por usuario: a epoca lida junto com o usuario tem que valer para
+    # o plano gravado no token.
+    entitlements = get_user_entitlements_use_case.execute(user_id=user.id, use_cache=False)
+    return AccessTokenClaims(
+        plan_code=entitlements.plan_code,
+        feature_bits=encode_feature_bits(entitlements.boolean_features),
+        entitlements_epoch=user.entitlements_epoch,
+        requests_per_minute=entitlements.limits.get(REQUESTS_PER_MINUTE_LIMIT),
+    )
+
+
 def issue_tokens(
     *,
     user: User,
@@ -34,9 +55,14 @@ def issue_tokens(
     token_port: TokenPort,
     user_agent: str | None,
     ip: str | None,
+    get_user_entitlements_use_case: GetUserEntitlementsUseCase | None = None,
 ) -> AuthTokensOutput:
     now = utcnow()
-    access_token, access_expires_at = token_port.create_access_token(user_id=user.id, now=now)
+    claims = build_access_token_claims(
+        user=user,
+        get_user_entitlements_use_case=get_user_entitlements_use_case,
+    )
+    access_token, access_expires_at = token_port.create_access_token(user_id=user.id, now=now, claims=claims)
     refresh_token = token_port.generate_refresh_token()
     refresh_hash = token_port.hash_refresh_token(refresh_token=refresh_token)
     refresh_expires_at = token_port.refresh_token_expires_at(now=now)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from app.application.ports.catalog_snapshot_port import CatalogSnapshotPort
+from app.domain.services.catalog_snapshot import CatalogSnapshot
+
+
+class CatalogSnapshotProvider:
+    def __init__(self, *, snapshot_port: CatalogSnapshotPort):
+        self._snapshot_port = snapshot_port
+        self._snapshot: CatalogSnapshot | None = None
+        self._lock = Lock()
+
+    def current(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        # Primeira requisicao antes do carregamento do startup: carrega uma unica vez.
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._snapshot_port.load_catalog_snapshot()
+            return self._snapshot
+
+    def refresh(self) -> CatalogSnapshot:
+        # A foto nova e montada fora do lock; leitores seguem com a anterior ate a troca.
+        snapshot = self._snapshot_port.load_catalog_snapshot()
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from app.application.dto.pool_price import ExportPoolPriceInput, ExportPoolPricePoint
+from app.application.ports.pool_price_port import PoolPricePort
+from app.domain.entities.pool_price import PoolPricePoint
+from app.domain.exceptions import PoolNotFoundError, PoolPriceInputError
+from app.domain.services.pair_orientation import invert_decimal_price
+
+
+MAX_EXPORT_DAYS = 366
+
+
+class ExportPoolPriceUseCase:
+    def __init__(self, *, pool_price_port: PoolPricePort):
+        self._pool_price_port = pool_price_port
+
+    def execute(self, command: ExportPoolPriceInput) -> Iterator[PoolPricePoint | ExportPoolPricePoint]:
+        if (command.start is None) != (command.end is None):
+            raise PoolPriceInputError("start and end must be provided together.")
+        if command.start is not None and command.end is not None:
+            if command.days is not None:
+                raise PoolPriceInputError("Use either days or start/end.")
+            if command.start >= command.end:
+                raise PoolPriceInputError("start must be earlier than end.")
+            if (command.end - command.start).total_seconds() > MAX_EXPORT_DAYS * 86400:
+                raise PoolPriceInputError(f"start/end range must be at most {MAX_EXPORT_DAYS} days.")
+        else:
+            if command.days is None:
+                raise PoolPriceInputError("days is required when start/end is not provided.")
+            if command.days <= 0 or command.days > MAX_EXPORT_DAYS:
+                raise PoolPriceInputError(f"days must be between 1 and {MAX_EXPORT_DAYS}.")
+        if command.chain_id <= 0 or command.dex_id <= 0:
+            raise PoolPriceInputError("chain_id and dex_id must be positive integers.")
+
+        if not self._pool_price_port.pool_exists(
+            pool_address=command.pool_address,
+            chain_id=command.chain_id,
+            dex_id=command.dex_id,
+        ):
+            raise PoolNotFoundError("Pool not found.")
+
+        points = self._pool_price_port.iter_price_points(
+            pool_address=command.pool_address,
+            chain_id=command.chain_id,
+            dex_id=command.dex_id,
+            days=command.days,
+            start=command.start,
+            end=command.end,
+        )
+        if not command.swapped_pair:
+            return points
+        return _invert_points(points)
+
+
+def _invert_points(points: Iterator[PoolPricePoint]) -> Iterator[ExportPoolPricePoint]:
+    for point in points:
+        # O stream ja comecou: nao ha como responder 400 aqui, entao o ponto
+        # sai com preco nulo em vez de sumir do export.
+        if point.price <= 0:
+            yield ExportPoolPricePoint(timestamp=point.timestamp, price=None)
+            continue
+        yield ExportPoolPricePoint(
+            timestamp=point.timestamp,
+            price=invert_decimal_price(point.price, field_name="series.price"),
+        )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from app.application.dto.pool_volume_history import ExportPoolVolumeHistoryInput
+from app.application.ports.pool_volume_history_port import PoolVolumeHistoryPort
+from app.domain.entities.pool_volume_history import PoolHourlyVolumePoint
+from app.domain.exceptions import PoolVolumeHistoryInputError
+
+
+class ExportPoolVolumeHistoryUseCase:
+    def __init__(self, *, pool_volume_history_port: PoolVolumeHistoryPort):
+        self._pool_volume_history_port = pool_volume_history_port
+
+    def execute(self, command: ExportPoolVolumeHistoryInput) -> Iterator[PoolHourlyVolumePoint]:
+        if not command.pool_address or not command.pool_address.lower().startswith("0x"):
+            raise PoolVolumeHistoryInputError("pool_address must start with 0x.")
+        if command.days < 1 or command.days > 365:
+            raise PoolVolumeHistoryInputError("days must be between 1 and 365.")
+        if command.chain_id is not None and command.chain_id <= 0:
+            raise PoolVolumeHistoryInputError("chain_id must be a positive integer when provided.")
+        if command.dex_id is not None and command.dex_id <= 0:
+            raise PoolVolumeHistoryInputError("dex_id must be a positive integer when provided.")
+
+        return self._pool_volume_history_port.iter_hourly_volume(
+            pool_address=command.pool_address.lower(),
+            days=command.days,
+            chain_id=command.chain_id,
+            dex_id=command.dex_id,
+        )
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import timezone
+
 from app.application.dto.liquidity_distribution import (
     GetLiquidityDistributionInput,
     GetLiquidityDistributionOutput,
@@ -9,6 +12,8 @@ from app.application.ports.liquidity_distribution_port import LiquidityDistribut
 from app.application.use_cases.liquidity_distribution_pool_resolver import (
     resolve_liquidity_distribution_pool,
 )
+from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.shared.cache import LruCache
 from app.domain.exceptions import (
     LiquidityDistributionInputError,
     LiquidityDistributionNotFoundError,
@@ -17,13 +22,50 @@ from app.domain.services.pair_orientation import invert_float_price
 from app.domain.services.liquidity_distribution import build_liquidity_distribution
 
 
+PINNED_VERSION_PREFIX = "pinned:"
+
+
 class GetLiquidityDistributionUseCase:
-    def __init__(self, *, distribution_port: LiquidityDistributionPort):
+    def __init__(
+        self,
+        *,
+        distribution_port: LiquidityDistributionPort,
+        history_cache: LruCache[tuple[int, int], list[TickLiquidity]] | None = None,
+    ):
         self._distribution_port = distribution_port
+        self._history_cache = history_cache
 
-    def execute(self, command: GetLiquidityDistributionInput) -> GetLiquidityDistributionOutput:
+    def validate(self, command: GetLiquidityDistributionInput) -> None:
         if command.tick_range < 1:
             raise LiquidityDistributionInputError("tick_range must be >= 1.")
+        if command.block_number is not None and command.timestamp is not None:
+            raise LiquidityDistributionInputError("Use either block_number or timestamp.")
+        if command.block_number is not None and command.block_number <= 0:
+            raise LiquidityDistributionInputError("block_number must be a positive integer.")
+
+    def get_version(self, command: GetLiquidityDistributionInput) -> str | None:
+        latest_block = self._distribution_port.get_latest_block_number(
+            pool_id=command.pool_id,
+            chain_id=command.chain_id,
+            dex_id=command.dex_id,
+        )
+        if latest_block is None:
+            return None
+        # So fixa o bloco quando a ingestao ja gravou todos os ticks dele: ate
+        # la o on-demand do simulate pode inserir ticks com block_number <=
+        # bloco e mudar a curva. Bloco futuro segue o ultimo snapshot.
+        if command.block_number is not None and command.block_number <= latest_block:
+            complete_block = self._distribution_port.get_tick_history_complete_block(
+                pool_id=command.pool_id,
+                chain_id=command.chain_id,
+                dex_id=command.dex_id,
+            )
+            if complete_block is not None and command.block_number <= complete_block:
+                return f"{PINNED_VERSION_PREFIX}{command.block_number}"
+        return f"block:{latest_block}"
+
+    def execute(self, command: GetLiquidityDistributionInput) -> GetLiquidityDistributionOutput:
+        self.validate(command)
 
         pool = resolve_liquidity_distribution_pool(
             distribution_port=self._distribution_port,
@@ -32,11 +74,8 @@ class GetLiquidityDistributionUseCase:
             dex_id=command.dex_id,
         )
 
-        current_tick = command.center_tick if command.center_tick is not None else pool.current_tick
-        if current_tick is None:
-            raise LiquidityDistributionNotFoundError("Pool current tick not found.")
-        if command.swapped_pair and command.center_tick is not None:
-            current_tick = -current_tick
+        if command.block_number is not None or command.timestamp is not None:
+            return self._execute_historical(pool=pool, command=command)
 
         latest_period = self._distribution_port.get_latest_period_start(pool_id=pool.id)
         if latest_period is None:
@@ -46,57 +85,128 @@ class GetLiquidityDistributionUseCase:
         if not rows:
             raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
 
-        if pool.onchain_liquidity is None:
-            raise LiquidityDistributionNotFoundError("Pool liquidity not found.")
+        return build_liquidity_distribution_output(pool=pool, rows=rows, command=command)
 
-        min_tick = current_tick - command.tick_range
-        max_tick = current_tick + command.tick_range
+    def _execute_historical(
+        self,
+        *,
+        pool: LiquidityDistributionPool,
+        command: GetLiquidityDistributionInput,
+    ) -> GetLiquidityDistributionOutput:
+        if pool.pool_address is None or pool.chain_id is None or pool.dex_id is None:
+            raise LiquidityDistributionNotFoundError("Pool snapshot not found for the requested block.")
 
-        points = build_liquidity_distribution(
-            rows=rows,
-            current_tick=current_tick,
-            min_tick=min_tick,
-            max_tick=max_tick,
-            onchain_liquidity=pool.onchain_liquidity,
-            token0_decimals=pool.token0_decimals,
-            token1_decimals=pool.token1_decimals,
+        timestamp: int | None = None
+        if command.timestamp is not None:
+            moment = command.timestamp
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            timestamp = int(moment.timestamp())
+
+        snapshot = self._distribution_port.get_pool_snapshot_at(
+            pool_address=pool.pool_address,
+            chain_id=pool.chain_id,
+            dex_id=pool.dex_id,
+            block_number=command.block_number,
+            timestamp=timestamp,
         )
-        if not points:
-            raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
+        if snapshot is None:
+            raise LiquidityDistributionNotFoundError("Pool snapshot not found for the requested block.")
 
-        output_points = [
-            LiquidityDistributionPointOutput(
-                tick=tick,
-                liquidity=str(liquidity),
-                price=price,
+        # Curva de bloco com historico de ticks completo nunca muda, entao o
+        # cache nao expira; as demais nao entram no cache.
+        cache_key = (pool.id, snapshot.block_number)
+        rows = self._history_cache.get(cache_key) if self._history_cache is not None else None
+        if rows is None:
+            rows = self._distribution_port.get_ticks_at_block(
+                pool_address=pool.pool_address,
+                chain_id=pool.chain_id,
+                dex_id=pool.dex_id,
+                block_number=snapshot.block_number,
             )
-            for tick, liquidity, price in points
-        ]
+            if rows and self._history_cache is not None:
+                complete_block = self._distribution_port.get_tick_history_complete_block(
+                    pool_id=pool.pool_address,
+                    chain_id=pool.chain_id,
+                    dex_id=pool.dex_id,
+                )
+                if complete_block is not None and snapshot.block_number <= complete_block:
+                    self._history_cache.set(cache_key, rows)
+        if not rows:
+            raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
 
-        if not command.swapped_pair:
-            return GetLiquidityDistributionOutput(
-                token0=pool.token0_symbol,
-                token1=pool.token1_symbol,
-                current_tick=current_tick,
-                data=output_points,
-            )
+        historical_pool = replace(
+            pool,
+            current_tick=snapshot.tick,
+            onchain_liquidity=snapshot.liquidity,
+        )
+        output = build_liquidity_distribution_output(pool=historical_pool, rows=rows, command=command)
+        return replace(output, block_number=snapshot.block_number)
 
-        try:
-            swapped_points = [
-                LiquidityDistributionPointOutput(
-                    tick=-item.tick,
-                    liquidity=item.liquidity,
-                    price=invert_float_price(item.price, field_name="price"),
-                )
-                for item in output_points
-            ]
-        except ValueError as exc:
-            raise LiquidityDistributionInputError(str(exc)) from exc
-        swapped_points.sort(key=lambda item: item.tick)
 
+def build_liquidity_distribution_output(
+    *,
+    pool: LiquidityDistributionPool,
+    rows: list[TickLiquidity],
+    command: GetLiquidityDistributionInput,
+) -> GetLiquidityDistributionOutput:
+    current_tick = command.center_tick if command.center_tick is not None else pool.current_tick
+    if current_tick is None:
+        raise LiquidityDistributionNotFoundError("Pool current tick not found.")
+    if command.swapped_pair and command.center_tick is not None:
+        current_tick = -current_tick
+
+    if pool.onchain_liquidity is None:
+        raise LiquidityDistributionNotFoundError("Pool liquidity not found.")
+
+    min_tick = current_tick - command.tick_range
+    max_tick = current_tick + command.tick_range
+
+    points = build_liquidity_distribution(
+        rows=rows,
+        current_tick=current_tick,
+        min_tick=min_tick,
+        max_tick=max_tick,
+        onchain_liquidity=pool.onchain_liquidity,
+        token0_decimals=pool.token0_decimals,
+        token1_decimals=pool.token1_decimals,
+    )
+    if not points:
+        raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
+
+    output_points = [
+        LiquidityDistributionPointOutput(
+            tick=tick,
+            liquidity=str(liquidity),
+            price=price,
+        )
+        for tick, liquidity, price in points
+    ]
+
+    if not command.swapped_pair:
         return GetLiquidityDistributionOutput(
-            token0=pool.token1_symbol,
-            token1=pool.token0_symbol,
-            current_tick=-current_tick,
-            data=swapped_points,
+            token0=pool.token0_symbol,
+            token1=pool.token1_symbol,
+            current_tick=current_tick,
+            data=output_points,
         )
+
+    try:
+        swapped_points = [
+            LiquidityDistributionPointOutput(
+                tick=-item.tick,
+                liquidity=item.liquidity,
+                price=invert_float_price(item.price, field_name="price"),
+            )
+            for item in output_points
+        ]
+    except ValueError as exc:
+        raise LiquidityDistributionInputError(str(exc)) from exc
+    swapped_points.sort(key=lambda item: item.tick)
+
+    return GetLiquidityDistributionOutput(
+        token0=pool.token1_symbol,
+        token1=pool.token0_symbol,
+        current_tick=-current_tick,
+        data=swapped_points,
+    )
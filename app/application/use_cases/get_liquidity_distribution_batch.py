@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from app.application.dto.liquidity_distribution import (
+    GetLiquidityDistributionBatchInput,
+    GetLiquidityDistributionBatchOutput,
+    GetLiquidityDistributionInput,
+    LiquidityDistributionBatchItemOutput,
+)
+from app.application.ports.liquidity_distribution_port import LiquidityDistributionPort
+from app.application.use_cases.get_liquidity_distribution import build_liquidity_distribution_output
+from app.application.use_cases.liquidity_distribution_pool_resolver import (
+    normalize_liquidity_distribution_pool_address,
+    select_liquidity_distribution_pool,
+)
+from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.domain.exceptions import (
+    DomainError,
+    LiquidityDistributionInputError,
+    LiquidityDistributionNotFoundError,
+    PoolNotFoundError,
+)
+
+
+MAX_BATCH_ITEMS = 20
+
+
+class GetLiquidityDistributionBatchUseCase:
+    def __init__(self, *, distribution_port: LiquidityDistributionPort):
+        self._distribution_port = distribution_port
+
+    def execute(self, command: GetLiquidityDistributionBatchInput) -> GetLiquidityDistributionBatchOutput:
+        if not command.items:
+            raise LiquidityDistributionInputError("items must not be empty.")
+        if len(command.items) > MAX_BATCH_ITEMS:
+            raise LiquidityDistributionInputError(f"items must have at most {MAX_BATCH_ITEMS} entries.")
+
+        pool_ids: set[int] = set()
+        pool_addresses: set[str] = set()
+        for item in command.items:
+            if isinstance(item.pool_id, int):
+                pool_ids.add(item.pool_id)
+                continue
+            try:
+                pool_addresses.add(normalize_liquidity_distribution_pool_address(item.pool_id))
+            except LiquidityDistributionInputError:
+                continue
+
+        candidates = self._distribution_port.get_pools_by_refs(
+            pool_ids=sorted(pool_ids),
+            pool_addresses=sorted(pool_addresses),
+        )
+
+        resolved: list[LiquidityDistributionPool | DomainError] = []
+        pools_by_id: dict[int, LiquidityDistributionPool] = {}
+        for item in command.items:
+            try:
+                if item.tick_range < 1:
+                    raise LiquidityDistributionInputError("tick_range must be >= 1.")
+                if item.block_number is not None or item.timestamp is not None:
+                    raise LiquidityDistributionInputError(
+                        "block_number/timestamp are not supported in batch requests."
+                    )
+                pool = select_liquidity_distribution_pool(
+                    candidates=candidates,
+                    pool_id=item.pool_id,
+                    chain_id=item.chain_id,
+                    dex_id=item.dex_id,
+                )
+                if pool.latest_period_start is None:
+                    raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
+            except DomainError as exc:
+                resolved.append(exc)
+                continue
+            resolved.append(pool)
+            pools_by_id[pool.id] = pool
+
+        ticks_by_pool = (
+            self._distribution_port.get_ticks_for_pools(pools=list(pools_by_id.values()))
+            if pools_by_id
+            else {}
+        )
+
+        return GetLiquidityDistributionBatchOutput(
+            items=[
+                self._build_item(item=item, resolved=entry, ticks_by_pool=ticks_by_pool)
+                for item, entry in zip(command.items, resolved)
+            ]
+        )
+
+    @staticmethod
+    def _build_item(
+        *,
+        item: GetLiquidityDistributionInput,
+        resolved: LiquidityDistributionPool | DomainError,
+        ticks_by_pool: dict[int, list[TickLiquidity]],
+    ) -> LiquidityDistributionBatchItemOutput:
+        try:
+            if isinstance(resolved, DomainError):
+                raise resolved
+            rows = ticks_by_pool.get(resolved.id) or []
+            if not rows:
+                raise LiquidityDistributionNotFoundError("Tick snapshot not found.")
+            result = build_liquidity_distribution_output(pool=resolved, rows=rows, command=item)
+        except PoolNotFoundError as exc:
+            return _error_item(item=item, error_code="pool_not_found", error=str(exc))
+        except LiquidityDistributionNotFoundError as exc:
+            return _error_item(item=item, error_code="distribution_not_found", error=str(exc))
+        except LiquidityDistributionInputError as exc:
+            return _error_item(item=item, error_code="invalid_input", error=str(exc))
+
+        return LiquidityDistributionBatchItemOutput(
+            pool_id=item.pool_id,
+            chain_id=item.chain_id,
+            dex_id=item.dex_id,
+            result=result,
+        )
+
+
+def _error_item(
+    *,
+    item: GetLiquidityDistributionInput,
+    error_code: str,
+    error: str,
+) -> LiquidityDistributionBatchItemOutput:
+    return LiquidityDistributionBatchItemOutput(
+        pool_id=item.pool_id,
+        chain_id=item.chain_id,
+        dex_id=item.dex_id,
+        error_code=error_code,
+        error=error,
+    )
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from math import ceil
-from decimal import Decimal
 
 from app.application.dto.pool_price import GetPoolPriceInput, GetPoolPriceOutput
 from app.application.ports.pool_price_port import PoolPricePort
-from app.domain.entities.pool_price import PoolPricePoint
+from app.domain.entities.pool_price import PoolPriceCandle, PoolPricePoint, PoolPriceStats
 from app.domain.exceptions import PoolNotFoundError, PoolPriceInputError, PoolPriceNotFoundError
-from app.domain.services.pool_price import resolve_current_pool_price
+from app.domain.services.pool_price import (
+    lttb_indices,
+    resolve_current_pool_price,
+    summarize_pool_prices,
+)
 from app.domain.services.pair_orientation import invert_decimal_price
 
 
+RESOLUTION_SECONDS = {"5m": 300, "1h": 3600, "1d": 86400}
+MIN_MAX_POINTS = 3
+MAX_MAX_POINTS = 5000
+
+
 class GetPoolPriceUseCase:
     def __init__(self, *, pool_price_port: PoolPricePort):
         self._pool_price_port = pool_price_port
 
-    def execute(self, command: GetPoolPriceInput) -> GetPoolPriceOutput:
+    def validate(self, command: GetPoolPriceInput) -> None:
         if (command.start is None) != (command.end is None):
             raise PoolPriceInputError("start and end must be provided together.")
 
@@ -31,55 +40,53 @@ class GetPoolPriceUseCase:
                 raise PoolPriceInputError("days must be a positive integer.")
         if command.chain_id <= 0 or command.dex_id <= 0:
             raise PoolPriceInputError("chain_id and dex_id must be positive integers.")
+        if command.resolution is not None and command.resolution not in RESOLUTION_SECONDS:
+            raise PoolPriceInputError(
+                f"resolution must be one of: {', '.join(RESOLUTION_SECONDS)}."
+            )
+        if command.max_points is not None and not (
+            MIN_MAX_POINTS <= command.max_points <= MAX_MAX_POINTS
+        ):
+            raise PoolPriceInputError(
+                f"max_points must be between {MIN_MAX_POINTS} and {MAX_MAX_POINTS}."
+            )
 
-        if not self._pool_price_port.pool_exists(
+    def get_version(self, command: GetPoolPriceInput) -> str | None:
+        latest_block = self._pool_price_port.get_latest_block_number(
             pool_address=command.pool_address,
             chain_id=command.chain_id,
             dex_id=command.dex_id,
-        ):
-            raise PoolNotFoundError("Pool not found.")
+        )
+        if latest_block is None:
+            return None
+        if command.start is not None and command.end is not None:
+            return f"block:{latest_block}"
+        # A janela de `days` e relativa a now(): muda a cada hora cheia mesmo sem blocos novos.
+        current_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        return f"block:{latest_block}:now:{current_hour.isoformat()}"
+
+    def execute(self, command: GetPoolPriceInput) -> GetPoolPriceOutput:
+        self.validate(command)
+        bucket_seconds = RESOLUTION_SECONDS[command.resolution] if command.resolution is not None else None
 
         if command.start is not None and command.end is not None:
-            stats = self._pool_price_port.get_stats_range(
-                pool_address=command.pool_address,
-                chain_id=command.chain_id,
-                dex_id=command.dex_id,
-                start=command.start,
-                end=command.end,
-            )
-            series = self._pool_price_port.get_series_range(
-                pool_address=command.pool_address,
-                chain_id=command.chain_id,
-                dex_id=command.dex_id,
-                start=command.start,
-                end=command.end,
-            )
             days_value = int(ceil((command.end - command.start).total_seconds() / 86400))
         else:
-            if command.days is None:
-                raise PoolPriceInputError("days is required when start/end is not provided.")
             days_value = int(command.days)
-            stats = self._pool_price_port.get_stats(
-                pool_address=command.pool_address,
-                chain_id=command.chain_id,
-                dex_id=command.dex_id,
-                days=days_value,
-            )
-            series = self._pool_price_port.get_series(
-                pool_address=command.pool_address,
-                chain_id=command.chain_id,
-                dex_id=command.dex_id,
-                days=days_value,
-            )
 
-        current = self._pool_price_port.get_latest_price(
+        window = self._pool_price_port.get_price_window(
             pool_address=command.pool_address,
             chain_id=command.chain_id,
             dex_id=command.dex_id,
+            days=command.days,
+            start=command.start,
+            end=command.end,
+            bucket_seconds=bucket_seconds,
         )
-        if current is None:
-            raise PoolPriceNotFoundError("Pool price not found.")
+        if window is None:
+            raise PoolNotFoundError("Pool not found.")
 
+        current = window.current
         try:
             current_price = resolve_current_pool_price(
                 token1_price=current.token1_price,
@@ -92,13 +99,12 @@ class GetPoolPriceUseCase:
                 raise PoolPriceNotFoundError(detail) from exc
             raise PoolPriceInputError(detail) from exc
 
-        min_price = stats.min_price
-        max_price = stats.max_price
-        avg_price = stats.avg_price
-
+        series = window.series
+        candles = window.candles
         if command.swapped_pair:
             try:
                 current_price = invert_decimal_price(current_price, field_name="price")
+                candles = [_invert_candle(candle) for candle in candles]
                 series = [
                     PoolPricePoint(
                         timestamp=row.timestamp,
@@ -109,37 +115,65 @@ class GetPoolPriceUseCase:
             except ValueError as exc:
                 raise PoolPriceInputError(str(exc)) from exc
 
-            if series:
-                prices = [row.price for row in series]
-                min_price = min(prices)
-                max_price = max(prices)
-                avg_price = sum(prices, Decimal("0")) / Decimal(len(prices))
-            else:
-                try:
-                    min_price = (
-                        invert_decimal_price(stats.max_price, field_name="stats.max")
-                        if stats.max_price is not None
-                        else None
-                    )
-                    max_price = (
-                        invert_decimal_price(stats.min_price, field_name="stats.min")
-                        if stats.min_price is not None
-                        else None
-                    )
-                    avg_price = (
-                        invert_decimal_price(stats.avg_price, field_name="stats.avg")
-                        if stats.avg_price is not None
-                        else None
-                    )
-                except ValueError as exc:
-                    raise PoolPriceInputError(str(exc)) from exc
+        if bucket_seconds is None:
+            # Sem resolution a serie e a janela completa: stats saem dela em uma passada.
+            stats = summarize_pool_prices(row.price for row in series)
+        elif command.swapped_pair:
+            stats = _invert_stats(window.stats)
+        else:
+            stats = window.stats or PoolPriceStats(min_price=None, max_price=None, avg_price=None)
+
+        if bucket_seconds is not None:
+            series = [PoolPricePoint(timestamp=candle.timestamp, price=candle.close) for candle in candles]
+
+        if command.max_points is not None and len(series) > command.max_points:
+            indices = lttb_indices(
+                [(row.timestamp.timestamp(), float(row.price)) for row in series],
+                command.max_points,
+            )
+            series = [series[i] for i in indices]
+            if candles:
+                candles = [candles[i] for i in indices]
 
         return GetPoolPriceOutput(
             pool_address=command.pool_address,
             days=days_value,
-            min_price=min_price,
-            max_price=max_price,
-            avg_price=avg_price,
+            min_price=stats.min_price,
+            max_price=stats.max_price,
+            avg_price=stats.avg_price,
             current_price=current_price,
             series=series,
+            resolution=command.resolution,
+            candles=candles,
+        )
+
+
+def _invert_stats(stats: PoolPriceStats | None) -> PoolPriceStats:
+    if stats is None:
+        return PoolPriceStats(min_price=None, max_price=None, avg_price=None)
+    try:
+        return PoolPriceStats(
+            min_price=(
+                invert_decimal_price(stats.max_price, field_name="stats.max")
+                if stats.max_price is not None
+                else None
+            ),
+            max_price=(
+                invert_decimal_price(stats.min_price, field_name="stats.min")
+                if stats.min_price is not None
+                else None
+            ),
+            avg_price=stats.avg_inverse_price,
         )
+    except ValueError as exc:
+        raise PoolPriceInputError(str(exc)) from exc
+
+
+def _invert_candle(candle: PoolPriceCandle) -> PoolPriceCandle:
+    return PoolPriceCandle(
+        timestamp=candle.timestamp,
+        open=invert_decimal_price(candle.open, field_name="candles.open"),
+        high=invert_decimal_price(candle.low, field_name="candles.low"),
+        low=invert_decimal_price(candle.high, field_name="candles.high"),
+        close=invert_decimal_price(candle.close, field_name="candles.close"),
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
 from app.application.dto.pool_volume_history import (
@@ -9,15 +10,26 @@ from app.application.dto.pool_volume_history import (
     PoolVolumeHistorySummaryOutput,
 )
 from app.application.ports.pool_volume_history_port import PoolVolumeHistoryPort
+from app.domain.entities.pool_volume_history import PoolVolumeHistorySummaryPremium
 from app.domain.exceptions import PoolVolumeHistoryInputError
-from app.domain.services.pool_summary import calculate_daily_tvl_pct
+from app.domain.services.pool_summary import calculate_daily_tvl_pct, summarize_ohlc_premium
+from app.shared.cache import LruCache
+
+
+PremiumCacheKey = tuple[str, str, str | None, int, date]
 
 
 class GetPoolVolumeHistoryUseCase:
-    def __init__(self, *, pool_volume_history_port: PoolVolumeHistoryPort):
+    def __init__(
+        self,
+        *,
+        pool_volume_history_port: PoolVolumeHistoryPort,
+        premium_cache: LruCache[PremiumCacheKey, PoolVolumeHistorySummaryPremium] | None = None,
+    ):
         self._pool_volume_history_port = pool_volume_history_port
+        self._premium_cache = premium_cache
 
-    def execute(self, command: GetPoolVolumeHistoryInput) -> GetPoolVolumeHistoryOutput:
+    def validate(self, command: GetPoolVolumeHistoryInput) -> None:
         if not command.pool_address or not command.pool_address.lower().startswith("0x"):
             raise PoolVolumeHistoryInputError("pool_address must start with 0x.")
         if command.days < 1 or command.days > 365:
@@ -27,13 +39,28 @@ class GetPoolVolumeHistoryUseCase:
         if command.dex_id is not None and command.dex_id <= 0:
             raise PoolVolumeHistoryInputError("dex_id must be a positive integer when provided.")
 
-        rows = self._pool_volume_history_port.list_daily_volume_history(
+    def get_version(self, command: GetPoolVolumeHistoryInput) -> str | None:
+        latest_hour = self._pool_volume_history_port.get_latest_hour_start(
+            pool_address=command.pool_address.lower(),
+            chain_id=command.chain_id,
+            dex_id=command.dex_id,
+        )
+        if latest_hour is None:
+            return None
+        # A janela diaria desliza na virada do dia UTC mesmo sem novas linhas.
+        today = datetime.now(timezone.utc).date()
+        return f"hour:{latest_hour.isoformat()}:day:{today.isoformat()}"
+
+    def execute(self, command: GetPoolVolumeHistoryInput) -> GetPoolVolumeHistoryOutput:
+        self.validate(command)
+
+        window = self._pool_volume_history_port.get_volume_history_window(
             pool_address=command.pool_address.lower(),
             days=command.days,
             chain_id=command.chain_id,
             dex_id=command.dex_id,
         )
-        ordered = sorted(rows, key=lambda row: row.time)
+        ordered = sorted(window.points, key=lambda row: row.time)
         points = [
             PoolVolumeHistoryPointOutput(
                 time=row.time,
@@ -49,34 +76,64 @@ class GetPoolVolumeHistoryUseCase:
             avg_daily_fees_usd = sum((row.fees_usd for row in points), Decimal("0")) / count
             avg_daily_volume_usd = sum((row.value for row in points), Decimal("0")) / count
 
-        base = self._pool_volume_history_port.get_summary_base(
-            pool_address=command.pool_address.lower(),
-            days=command.days,
-            chain_id=command.chain_id,
-            dex_id=command.dex_id,
-        )
-
         daily_fees_tvl_pct = calculate_daily_tvl_pct(
             avg_daily_usd=avg_daily_fees_usd,
-            tvl_usd=base.tvl_usd,
+            tvl_usd=window.tvl_usd,
         )
         daily_volume_tvl_pct = calculate_daily_tvl_pct(
             avg_daily_usd=avg_daily_volume_usd,
-            tvl_usd=base.tvl_usd,
+            tvl_usd=window.tvl_usd,
         )
 
-        price_volatility_pct: Decimal | None = None
-        correlation: Decimal | None = None
-        geometric_mean_price: Decimal | None = None
+        premium = None
+        if command.include_premium and command.symbol0:
+            premium = self._get_premium(command)
 
         summary = PoolVolumeHistorySummaryOutput(
-            tvl_usd=base.tvl_usd,
+            tvl_usd=window.tvl_usd,
             avg_daily_fees_usd=avg_daily_fees_usd,
             daily_fees_tvl_pct=daily_fees_tvl_pct,
             avg_daily_volume_usd=avg_daily_volume_usd,
             daily_volume_tvl_pct=daily_volume_tvl_pct,
-            price_volatility_pct=price_volatility_pct,
-            correlation=correlation,
-            geometric_mean_price=geometric_mean_price,
+            price_volatility_pct=premium.price_volatility_pct if premium else None,
+            correlation=premium.correlation if premium else None,
+            geometric_mean_price=premium.geometric_mean_price if premium else None,
         )
         return GetPoolVolumeHistoryOutput(volume_history=points, summary=summary)
+
+    def _get_premium(self, command: GetPoolVolumeHistoryInput) -> PoolVolumeHistorySummaryPremium:
+        symbol0 = command.symbol0.strip()
+        symbol1 = command.symbol1.strip() if command.symbol1 else None
+        end_day = datetime.now(timezone.utc).date()
+        # end_day na chave: a janela so muda quando entra o candle diario seguinte.
+        key = (command.exchange, symbol0, symbol1, command.days, end_day)
+        if self._premium_cache is not None:
+            cached = self._premium_cache.get(key)
+            if cached is not None:
+                return cached
+
+        symbols = [symbol0] if symbol1 is None else [symbol0, symbol1]
+        series = self._pool_volume_history_port.list_daily_ohlc(
+            exchange=command.exchange,
+            symbols=symbols,
+            start_day=end_day - timedelta(days=command.days),
+            end_day=end_day,
+        )
+        base = series.get(symbol0)
+        if base is None:
+            return PoolVolumeHistorySummaryPremium(
+                price_volatility_pct=None,
+                correlation=None,
+                geometric_mean_price=None,
+            )
+        quote = series.get(symbol1) if symbol1 is not None else None
+        premium = summarize_ohlc_premium(base=base, quote=quote)
+
+        # Enquanto o candle de ontem nao foi ingerido o resultado nao e cacheado.
+        last_day = end_day - timedelta(days=1)
+        complete = base.day_starts[-1] == last_day and (
+            symbol1 is None or (quote is not None and quote.day_starts[-1] == last_day)
+        )
+        if complete and self._premium_cache is not None:
+            self._premium_cache.set(key, premium)
+        return premium
@@ -1,36 +1,79 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from app.application.dto.entitlements import UserEntitlementsOutput
 from app.application.ports.entitlements_port import EntitlementsPort
+from app.domain.entities.feature import PlanFeatureGrant
 from app.domain.exceptions import PlanNotFoundError
 from app.domain.services.entitlements import build_user_entitlements
+from app.shared.cache import LruCache
+
+
+# Chave do plano padrao no cache de grants; planos pagos usam o plan_price_id.
+FREE_PLAN_CACHE_KEY = "plan_code:free"
+
+PlanGrants = tuple[str, tuple[PlanFeatureGrant, ...]]
 
 
 class GetUserEntitlementsUseCase:
-    def __init__(self, *, entitlements_port: EntitlementsPort):
+    def __init__(
+        self,
+        *,
+        entitlements_port: EntitlementsPort,
+        entitlements_cache: LruCache[str, UserEntitlementsOutput] | None = None,
+        plan_grants_cache: LruCache[str, PlanGrants] | None = None,
+    ):
         self._entitlements_port = entitlements_port
+        self._entitlements_cache = entitlements_cache
+        self._plan_grants_cache = plan_grants_cache
 
-    def execute(self, *, user_id: str) -> UserEntitlementsOutput:
-        subscription = self._entitlements_port.get_effective_subscription_for_user(user_id=user_id)
+    def execute(self, *, user_id: str, use_cache: bool = True) -> UserEntitlementsOutput:
+        if use_cache and self._entitlements_cache is not None:
+            cached = self._entitlements_cache.get(user_id)
+            if cached is not None:
+                return cached
 
+        subscription = self._entitlements_port.get_effective_subscription_for_user(user_id=user_id)
         if subscription is None:
-            plan = self._entitlements_port.get_plan_by_code(code="free")
-            if plan is None:
-                raise PlanNotFoundError("Default plan 'free' not found.")
+            plan_code, grants = self._plan_grants(FREE_PLAN_CACHE_KEY, self._load_free_plan_grants)
         else:
-            plan_price = self._entitlements_port.get_plan_price_by_id(plan_price_id=subscription.plan_price_id)
-            if plan_price is None:
-                raise PlanNotFoundError("Plan price from active subscription was not found.")
-            plan = self._entitlements_port.get_plan_by_id(plan_id=plan_price.plan_id)
-            if plan is None:
-                raise PlanNotFoundError("Plan from active subscription was not found.")
-
-        grants = self._entitlements_port.list_plan_feature_grants(plan_id=plan.id)
-        entitlements = build_user_entitlements(user_id=user_id, plan_code=plan.code, grants=grants)
+            plan_code, grants = self._plan_grants(
+                f"plan_price:{subscription.plan_price_id}",
+                lambda: self._load_plan_price_grants(subscription.plan_price_id),
+            )
+        entitlements = build_user_entitlements(user_id=user_id, plan_code=plan_code, grants=list(grants))
 
-        return UserEntitlementsOutput(
+        output = UserEntitlementsOutput(
             user_id=entitlements.user_id,
             plan_code=entitlements.plan_code,
             boolean_features=entitlements.boolean_features,
             limits=entitlements.limits,
         )
+        if self._entitlements_cache is not None:
+            self._entitlements_cache.set(user_id, output)
+        return output
+
+    def _plan_grants(self, key: str, loader: Callable[[], PlanGrants]) -> PlanGrants:
+        if self._plan_grants_cache is None:
+            return loader()
+        cached = self._plan_grants_cache.get(key)
+        if cached is None:
+            cached = loader()
+            self._plan_grants_cache.set(key, cached)
+        return cached
+
+    def _load_free_plan_grants(self) -> PlanGrants:
+        plan = self._entitlements_port.get_plan_by_code(code="free")
+        if plan is None:
+            raise PlanNotFoundError("Default plan 'free' not found.")
+        return plan.code, tuple(self._entitlements_port.list_plan_feature_grants(plan_id=plan.id))
+
+    def _load_plan_price_grants(self, plan_price_id: str) -> PlanGrants:
+        plan_price = self._entitlements_port.get_plan_price_by_id(plan_price_id=plan_price_id)
+        if plan_price is None:
+            raise PlanNotFoundError("Plan price from active subscription was not found.")
+        plan = self._entitlements_port.get_plan_by_id(plan_id=plan_price.plan_id)
+        if plan is None:
+            raise PlanNotFoundError("Plan from active subscription was not found.")
+        return plan.code, tuple(self._entitlements_port.list_plan_feature_grants(plan_id=plan.id))
@@ -5,6 +5,13 @@ from app.domain.entities.liquidity_distribution import LiquidityDistributionPool
 from app.domain.exceptions import LiquidityDistributionInputError, PoolNotFoundError
 
 
+def normalize_liquidity_distribution_pool_address(pool_id: str) -> str:
+    pool_address = pool_id.strip().lower()
+    if not pool_address.startswith("0x"):
+        raise LiquidityDistributionInputError("pool_id string must be a valid pool_address.")
+    return pool_address
+
+
 def resolve_liquidity_distribution_pool(
     *,
     distribution_port: LiquidityDistributionPort,
@@ -18,15 +25,47 @@ def resolve_liquidity_distribution_pool(
             raise PoolNotFoundError("Pool not found.")
         return pool
 
-    pool_address = pool_id.strip().lower()
-    if not pool_address.startswith("0x"):
-        raise LiquidityDistributionInputError("pool_id string must be a valid pool_address.")
+    pool_address = normalize_liquidity_distribution_pool_address(pool_id)
 
     pools = distribution_port.find_pools_by_address(
         pool_address=pool_address,
         chain_id=chain_id,
         dex_id=dex_id,
     )
+    return _select_single_pool(pools=pools, chain_id=chain_id, dex_id=dex_id)
+
+
+def select_liquidity_distribution_pool(
+    *,
+    candidates: list[LiquidityDistributionPool],
+    pool_id: int | str,
+    chain_id: int | None,
+    dex_id: int | None,
+) -> LiquidityDistributionPool:
+    if isinstance(pool_id, int):
+        for pool in candidates:
+            if pool.id == pool_id:
+                return pool
+        raise PoolNotFoundError("Pool not found.")
+
+    pool_address = normalize_liquidity_distribution_pool_address(pool_id)
+    pools = [
+        pool
+        for pool in candidates
+        if pool.pool_address is not None
+        and pool.pool_address.lower() == pool_address
+        and (chain_id is None or pool.chain_id == chain_id)
+        and (dex_id is None or pool.dex_id == dex_id)
+    ]
+    return _select_single_pool(pools=pools, chain_id=chain_id, dex_id=dex_id)
+
+
+def _select_single_pool(
+    *,
+    pools: list[LiquidityDistributionPool],
+    chain_id: int | None,
+    dex_id: int | None,
+) -> LiquidityDistributionPool:
     if not pools:
         raise PoolNotFoundError("Pool not found.")
     if len(pools) > 1 and (chain_id is None or dex_id is None):
@@ -2,17 +2,39 @@ from __future__ import annotations
 
 from app.application.dto.catalog import ListExchangeNetworkPoolsInput
 from app.application.ports.catalog_query_port import CatalogQueryPort
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
 from app.domain.entities.catalog import PoolSummary
+from app.domain.services.token_search import normalize_token_term
 
 
 class ListExchangeNetworkPoolsUseCase:
-    def __init__(self, *, catalog_port: CatalogQueryPort):
+    def __init__(
+        self,
+        *,
+        catalog_port: CatalogQueryPort,
+        token_index_provider: TokenSearchIndexProvider,
+    ):
         self._catalog_port = catalog_port
+        self._token_index_provider = token_index_provider
 
     def execute(self, command: ListExchangeNetworkPoolsInput) -> list[PoolSummary]:
-        return self._catalog_port.list_pools_by_exchange_network_tokens(
+        if normalize_token_term(command.token0_address) == normalize_token_term(command.token1_address):
+            return []
+        index = self._token_index_provider.get_index()
+        # Pools do par = intersecao dos pools de cada token.
+        pool_keys = index.resolve(
+            command.token0_address,
+            chain_id=command.network_id,
+            dex_id=command.exchange_id,
+        ) & index.resolve(
+            command.token1_address,
+            chain_id=command.network_id,
+            dex_id=command.exchange_id,
+        )
+        if not pool_keys:
+            return []
+        return self._catalog_port.list_pools_by_exchange_network_addresses(
             exchange_id=command.exchange_id,
             network_id=command.network_id,
-            token0_address=command.token0_address,
-            token1_address=command.token1_address,
+            pool_addresses=sorted(key.pool_address for key in pool_keys),
         )
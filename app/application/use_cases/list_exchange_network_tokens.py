@@ -2,16 +2,39 @@ from __future__ import annotations
 
 from app.application.dto.catalog import ListExchangeNetworkTokensInput
 from app.application.ports.catalog_query_port import CatalogQueryPort
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
 from app.domain.entities.catalog import Token
+from app.domain.services.token_search import normalize_token_term
 
 
 class ListExchangeNetworkTokensUseCase:
-    def __init__(self, *, catalog_port: CatalogQueryPort):
+    def __init__(
+        self,
+        *,
+        catalog_port: CatalogQueryPort,
+        token_index_provider: TokenSearchIndexProvider,
+    ):
         self._catalog_port = catalog_port
+        self._token_index_provider = token_index_provider
 
     def execute(self, command: ListExchangeNetworkTokensInput) -> list[Token]:
+        token = (command.token_address or "").strip()
+        if not token:
+            return self._catalog_port.list_tokens_by_exchange_network(
+                exchange_id=command.exchange_id,
+                network_id=command.network_id,
+            )
+
+        pool_keys = self._token_index_provider.get_index().resolve(
+            token,
+            chain_id=command.network_id,
+            dex_id=command.exchange_id,
+        )
+        if not pool_keys:
+            return []
         return self._catalog_port.list_tokens_by_exchange_network(
             exchange_id=command.exchange_id,
             network_id=command.network_id,
-            token_address=command.token_address,
+            pool_addresses=sorted(key.pool_address for key in pool_keys),
+            exclude_token=normalize_token_term(token),
         )
@@ -9,6 +9,7 @@ from app.application.ports.token_port import TokenPort
 from app.domain.exceptions import UserInactiveError
 
 from .auth_common import issue_tokens, normalize_email, utcnow
+from .get_user_entitlements import GetUserEntitlementsUseCase
 
 
 class LoginGoogleUseCase:
@@ -18,10 +19,12 @@ class LoginGoogleUseCase:
         auth_port: AuthPort,
         google_oauth_port: GoogleOauthPort,
         token_port: TokenPort,
+        get_user_entitlements_use_case: GetUserEntitlementsUseCase | None = None,
     ):
         self._auth_port = auth_port
         self._google_oauth_port = google_oauth_port
         self._token_port = token_port
+        self._get_user_entitlements_use_case = get_user_entitlements_use_case
 
     def execute(self, command: LoginGoogleInput) -> AuthTokensOutput:
         google_identity = self._google_oauth_port.verify_id_token(id_token=command.id_token)
@@ -82,6 +85,7 @@ class LoginGoogleUseCase:
                 token_port=self._token_port,
                 user_agent=command.user_agent,
                 ip=command.ip,
+                get_user_entitlements_use_case=self._get_user_entitlements_use_case,
             )
 
         return self._auth_port.execute_in_transaction(_tx)
@@ -7,6 +7,7 @@ from app.application.ports.token_port import TokenPort
 from app.domain.exceptions import InvalidCredentialsError, UserInactiveError
 
 from .auth_common import issue_tokens, normalize_email
+from .get_user_entitlements import GetUserEntitlementsUseCase
 
 
 class LoginLocalUseCase:
@@ -16,10 +17,12 @@ class LoginLocalUseCase:
         auth_port: AuthPort,
         password_hasher: PasswordHasherPort,
         token_port: TokenPort,
+        get_user_entitlements_use_case: GetUserEntitlementsUseCase | None = None,
     ):
         self._auth_port = auth_port
         self._password_hasher = password_hasher
         self._token_port = token_port
+        self._get_user_entitlements_use_case = get_user_entitlements_use_case
 
     def execute(self, command: LoginLocalInput) -> AuthTokensOutput:
         email = normalize_email(command.email)
@@ -54,6 +57,7 @@ class LoginLocalUseCase:
                 token_port=self._token_port,
                 user_agent=command.user_agent,
                 ip=command.ip,
+                get_user_entitlements_use_case=self._get_user_entitlements_use_case,
             )
 
         return self._auth_port.execute_in_transaction(_tx)
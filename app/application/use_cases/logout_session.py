@@ -3,14 +3,23 @@ from __future__ import annotations
 from app.application.dto.auth import LogoutInput
 from app.application.ports.auth_port import AuthPort
 from app.application.ports.token_port import TokenPort
+from app.domain.entities.user import User
+from app.shared.cache import LruCache
 
 from .auth_common import utcnow
 
 
 class LogoutSessionUseCase:
-    def __init__(self, *, auth_port: AuthPort, token_port: TokenPort):
+    def __init__(
+        self,
+        *,
+        auth_port: AuthPort,
+        token_port: TokenPort,
+        user_cache: LruCache[str, User] | None = None,
+    ):
         self._auth_port = auth_port
         self._token_port = token_port
+        self._user_cache = user_cache
 
     def execute(self, command: LogoutInput) -> None:
         token = command.refresh_token.strip()
@@ -21,3 +30,5 @@ class LogoutSessionUseCase:
         if session is None or session.revoked_at is not None:
             return
         self._auth_port.revoke_session(session_id=session.id, revoked_at=utcnow())
+        if self._user_cache is not None:
+            self._user_cache.pop(session.user_id)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from app.application.dto.billing import StripeWebhookInput, StripeWebhookOutput
+from app.application.dto.entitlements import UserEntitlementsOutput
 from app.application.ports.auth_port import AuthPort
 from app.application.ports.entitlements_port import EntitlementsPort
 from app.application.ports.stripe_port import StripePort
+from app.domain.entities.user import User
 from app.domain.exceptions import BillingError
+from app.shared.cache import LruCache
 
 from .auth_common import utcnow
 
@@ -16,10 +19,14 @@ class ProcessStripeWebhookUseCase:
         auth_port: AuthPort,
         entitlements_port: EntitlementsPort,
         stripe_port: StripePort,
+        entitlements_cache: LruCache[str, UserEntitlementsOutput] | None = None,
+        user_cache: LruCache[str, User] | None = None,
     ):
         self._auth_port = auth_port
         self._entitlements_port = entitlements_port
         self._stripe_port = stripe_port
+        self._entitlements_cache = entitlements_cache
+        self._user_cache = user_cache
 
     def execute(self, command: StripeWebhookInput) -> StripeWebhookOutput:
         event = self._stripe_port.verify_webhook(signature=command.signature, payload=command.payload)
@@ -56,6 +63,7 @@ class ProcessStripeWebhookUseCase:
                     canceled_at=subscription.canceled_at,
                     now=utcnow(),
                 )
+                self._invalidate_entitlements(user_id=user.id)
                 return StripeWebhookOutput(event_type=event.event_type, handled=True)
 
             if not subscription.price_id:
@@ -78,9 +86,19 @@ class ProcessStripeWebhookUseCase:
                 canceled_at=subscription.canceled_at,
                 now=utcnow(),
             )
+            self._invalidate_entitlements(user_id=user.id)
             return StripeWebhookOutput(event_type=event.event_type, handled=True)
 
         if event.event_type in {"invoice.paid", "invoice.payment_failed"}:
             return StripeWebhookOutput(event_type=event.event_type, handled=True)
 
         return StripeWebhookOutput(event_type=event.event_type, handled=False)
+
+    def _invalidate_entitlements(self, *, user_id: str) -> None:
+        # Nova epoca invalida as claims de plano/features dos access tokens ja
+        # emitidos; o usuario sai do cache para a epoca nova valer ja neste processo.
+        self._auth_port.increment_user_entitlements_epoch(user_id=user_id)
+        if self._entitlements_cache is not None:
+            self._entitlements_cache.pop(user_id)
+        if self._user_cache is not None:
+            self._user_cache.pop(user_id)
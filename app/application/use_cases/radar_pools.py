@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 
 from app.application.dto.radar_pools import (
@@ -9,8 +9,12 @@ from app.application.dto.radar_pools import (
     RadarPoolsOutput,
 )
 from app.application.ports.radar_pools_port import RadarPoolsPort
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
 from app.domain.exceptions import RadarPoolsInputError
-from app.domain.services.radar_pools import build_radar_item
+from app.domain.entities.radar_pools import RadarPoolItem
+from app.domain.entities.token_search import PoolKey
+from app.domain.services.radar_pools import PRECOMPUTED_TIMEFRAMES
+from app.shared.cache import StaleWhileRevalidateCache
 
 
 ORDER_FIELDS = {
@@ -39,11 +43,24 @@ ORDER_FIELDS = {
 }
 
 
+RadarListingKey = tuple[int | None, int | None, str | None, int, str, str]
+# Versao dos dados usada no carregamento + lista completa ordenada.
+RadarListing = tuple[str | None, tuple[RadarPoolItem, ...]]
+
+
 class RadarPoolsUseCase:
-    def __init__(self, *, radar_pools_port: RadarPoolsPort):
+    def __init__(
+        self,
+        *,
+        radar_pools_port: RadarPoolsPort,
+        token_index_provider: TokenSearchIndexProvider,
+        listing_cache: StaleWhileRevalidateCache[RadarListingKey, RadarListing] | None = None,
+    ):
         self._radar_pools_port = radar_pools_port
+        self._token_index_provider = token_index_provider
+        self._listing_cache = listing_cache
 
-    def execute(self, command: RadarPoolsInput) -> RadarPoolsOutput:
+    def validate(self, command: RadarPoolsInput) -> None:
         if command.timeframe_days < 1 or command.timeframe_days > 365:
             raise RadarPoolsInputError("timeframe_days must be between 1 and 365.")
         if command.page < 1:
@@ -55,35 +72,64 @@ class RadarPoolsUseCase:
         if command.order_by not in ORDER_FIELDS:
             raise RadarPoolsInputError("order_by is not supported.")
 
-        start_dt = datetime.utcnow() - timedelta(days=command.timeframe_days)
-        rows = self._radar_pools_port.list_pools(
-            start_dt=start_dt,
-            network_id=command.network_id,
-            exchange_id=command.exchange_id,
-            token_symbol=command.token_symbol.upper() if command.token_symbol else None,
-        )
+    def get_version(self, command: RadarPoolsInput) -> str | None:
+        if command.timeframe_days in PRECOMPUTED_TIMEFRAMES:
+            refreshed_at = self._radar_pools_port.get_aggregates_refreshed_at(
+                timeframe_days=command.timeframe_days
+            )
+            if refreshed_at is None:
+                return None
+            return f"refresh:{refreshed_at.isoformat()}"
+        latest_hour = self._radar_pools_port.get_latest_hour_start()
+        if latest_hour is None:
+            return None
+        # start_dt e relativo a utcnow, entao a janela muda a cada hora cheia.
+        current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        return f"hour:{latest_hour.isoformat()}:now:{current_hour.isoformat()}"
 
-        items = [
-            build_radar_item(row=row, timeframe_days=command.timeframe_days)
-            for row in rows
-        ]
-
-        def order_value(item: RadarPoolOutputItem | object):
-            value = getattr(item, command.order_by)
-            value_type = ORDER_FIELDS[command.order_by]
-            if value is None:
-                if value_type is str:
-                    return ""
-                if value_type is int:
-                    return 0
-                return Decimal("0")
-            return value
-
-        reverse = command.order_dir == "desc"
-        sorted_items = sorted(items, key=order_value, reverse=reverse)
-        total = len(sorted_items)
+    def execute(self, command: RadarPoolsInput, *, version: str | None = None) -> RadarPoolsOutput:
+        self.validate(command)
+
+        token_symbol = (command.token_symbol or "").strip().upper() or None
+        pool_keys = None
+        if token_symbol is not None:
+            pool_keys = self._token_index_provider.get_index().resolve(
+                token_symbol,
+                chain_id=command.network_id,
+                dex_id=command.exchange_id,
+            )
         offset = (command.page - 1) * command.page_size
-        page_items = sorted_items[offset : offset + command.page_size]
+        if pool_keys is not None and not pool_keys:
+            total = 0
+            page_items = []
+        elif self._listing_cache is not None:
+            version, listing = self._get_cached_listing(
+                command,
+                token_symbol=token_symbol,
+                pool_keys=pool_keys,
+                version=version,
+            )
+            total = len(listing)
+            page_items = list(listing[offset : offset + command.page_size])
+        else:
+            total = self._radar_pools_port.count_pools(
+                timeframe_days=command.timeframe_days,
+                network_id=command.network_id,
+                exchange_id=command.exchange_id,
+                pool_keys=pool_keys,
+            )
+            page_items = []
+            if offset < total:
+                page_items = self._radar_pools_port.list_pools_page(
+                    timeframe_days=command.timeframe_days,
+                    network_id=command.network_id,
+                    exchange_id=command.exchange_id,
+                    pool_keys=pool_keys,
+                    order_by=command.order_by,
+                    order_dir=command.order_dir,
+                    limit=command.page_size,
+                    offset=offset,
+                )
 
         return RadarPoolsOutput(
             page=command.page,
@@ -116,4 +162,45 @@ class RadarPoolsUseCase:
                 )
                 for row in page_items
             ],
+            version=version,
         )
+
+    def _get_cached_listing(
+        self,
+        command: RadarPoolsInput,
+        *,
+        token_symbol: str | None,
+        pool_keys: frozenset[PoolKey] | None,
+        version: str | None,
+    ) -> RadarListing:
+        # A chave e so a entrada normalizada; a versao calculada pelo router fica
+        # junto do valor. Versao nova serve a lista anterior (com a versao dela,
+        # para o ETag nao adiantar os dados) e recarrega em segundo plano.
+        key = (
+            command.network_id,
+            command.exchange_id,
+            token_symbol,
+            command.timeframe_days,
+            command.order_by,
+            command.order_dir,
+        )
+
+        def load() -> RadarListing:
+            items = tuple(
+                self._radar_pools_port.list_pools_page(
+                    timeframe_days=command.timeframe_days,
+                    network_id=command.network_id,
+                    exchange_id=command.exchange_id,
+                    pool_keys=pool_keys,
+                    order_by=command.order_by,
+                    order_dir=command.order_dir,
+                    limit=None,
+                    offset=0,
+                )
+            )
+            return version, items
+
+        def is_stale(cached: RadarListing) -> bool:
+            return version is not None and cached[0] != version
+
+        return self._listing_cache.get_or_load(key, load, is_stale=is_stale)
@@ -6,12 +6,20 @@ from app.application.ports.token_port import TokenPort
 from app.domain.exceptions import RefreshSessionInvalidError, UserInactiveError
 
 from .auth_common import issue_tokens, utcnow
+from .get_user_entitlements import GetUserEntitlementsUseCase
 
 
 class RefreshSessionUseCase:
-    def __init__(self, *, auth_port: AuthPort, token_port: TokenPort):
+    def __init__(
+        self,
+        *,
+        auth_port: AuthPort,
+        token_port: TokenPort,
+        get_user_entitlements_use_case: GetUserEntitlementsUseCase | None = None,
+    ):
         self._auth_port = auth_port
         self._token_port = token_port
+        self._get_user_entitlements_use_case = get_user_entitlements_use_case
 
     def execute(self, command: RefreshSessionInput) -> AuthTokensOutput:
         token = command.refresh_token.strip()
@@ -43,6 +51,7 @@ class RefreshSessionUseCase:
                 token_port=self._token_port,
                 user_agent=command.user_agent,
                 ip=command.ip,
+                get_user_entitlements_use_case=self._get_user_entitlements_use_case,
             )
 
         return self._auth_port.execute_in_transaction(_tx)
@@ -6,7 +6,9 @@ from app.application.dto.password_reset import ResetPasswordInput, ResetPassword
 from app.application.ports.auth_port import AuthPort
 from app.application.ports.password_hasher_port import PasswordHasherPort
 from app.application.ports.token_port import TokenPort
+from app.domain.entities.user import User
 from app.domain.exceptions import PasswordResetTokenInvalidError
+from app.shared.cache import LruCache
 
 from .auth_common import utcnow
 
@@ -18,10 +20,12 @@ class ResetPasswordUseCase:
         auth_port: AuthPort,
         token_port: TokenPort,
         password_hasher: PasswordHasherPort,
+        user_cache: LruCache[str, User] | None = None,
     ):
         self._auth_port = auth_port
         self._token_port = token_port
         self._password_hasher = password_hasher
+        self._user_cache = user_cache
 
     def execute(self, command: ResetPasswordInput) -> ResetPasswordOutput:
         token = command.token.strip()
@@ -72,4 +76,6 @@ class ResetPasswordUseCase:
             auth_port.revoke_sessions_for_user(user_id=user.id, revoked_at=now)
 
         self._auth_port.execute_in_transaction(_tx)
+        if self._user_cache is not None:
+            self._user_cache.pop(user.id)
         return ResetPasswordOutput(message="Password updated")
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from app.application.dto.catalog import SearchTokensInput
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
+from app.domain.entities.token_search import TokenSuggestion
+from app.domain.exceptions import TokenSearchInputError
+
+
+class SearchTokensUseCase:
+    def __init__(self, *, token_index_provider: TokenSearchIndexProvider):
+        self._token_index_provider = token_index_provider
+
+    def execute(self, command: SearchTokensInput) -> list[TokenSuggestion]:
+        if not command.query.strip():
+            raise TokenSearchInputError("q must not be empty.")
+        if command.limit < 1 or command.limit > 50:
+            raise TokenSearchInputError("limit must be between 1 and 50.")
+        return self._token_index_provider.get_index().suggest(
+            command.query,
+            limit=command.limit,
+            chain_id=command.network_id,
+            dex_id=command.exchange_id,
+        )
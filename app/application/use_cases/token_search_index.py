@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from app.application.ports.token_search_port import TokenSearchPort
+from app.domain.services.token_search import TokenSearchIndex
+from app.shared.cache import StaleWhileRevalidateCache
+
+
+class TokenSearchIndexProvider:
+    _CACHE_KEY = "token-search-index"
+
+    def __init__(
+        self,
+        *,
+        token_search_port: TokenSearchPort,
+        cache: StaleWhileRevalidateCache[str, TokenSearchIndex],
+    ):
+        self._token_search_port = token_search_port
+        self._cache = cache
+
+    def get_index(self) -> TokenSearchIndex:
+        # Indice inteiro vira uma unica entrada; refresh em background quando expira.
+        return self._cache.get_or_load(
+            self._CACHE_KEY,
+            lambda: TokenSearchIndex(self._token_search_port.list_pool_tokens()),
+        )
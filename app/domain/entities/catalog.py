@@ -46,3 +46,39 @@ class PoolDetail:
     token1_address: str
     token1_symbol: str
     token1_decimals: int
+
+
+@dataclass(frozen=True)
+class CatalogDex:
+    id: int
+    key: str
+    name: str
+    version: str | None
+    icon_url: str | None
+
+
+@dataclass(frozen=True)
+class CatalogChain:
+    id: int
+    key: str
+    name: str
+    icon_url: str | None
+
+
+@dataclass(frozen=True)
+class CatalogToken:
+    chain_id: int
+    address: str
+    symbol: str | None
+    decimals: int | None
+    icon_url: str | None
+
+
+@dataclass(frozen=True)
+class CatalogPool:
+    chain_id: int
+    dex_id: int
+    pool_address: str
+    fee_tier: int
+    token0_address: str
+    token1_address: str
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+
+
+@dataclass(frozen=True)
+class CryptoOhlcDailySeries:
+    symbol: str
+    day_starts: list[date] = field(default_factory=list)
+    # Colunas alinhadas com day_starts; valores ausentes viram NaN.
+    highs: array = field(default_factory=lambda: array("d"))
+    lows: array = field(default_factory=lambda: array("d"))
+    closes: array = field(default_factory=lambda: array("d"))
@@ -18,6 +18,10 @@ class LiquidityDistributionPool:
     current_tick: int | None
     current_price_token1_per_token0: Decimal | None
     onchain_liquidity: Decimal | None
+    pool_address: str | None = None
+    chain_id: int | None = None
+    dex_id: int | None = None
+    latest_period_start: datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -29,3 +33,11 @@ class TickLiquidity:
 @dataclass(frozen=True)
 class LiquidityDistributionSnapshot:
     period_start: datetime
+
+
+@dataclass(frozen=True)
+class LiquidityDistributionBlockSnapshot:
+    block_number: int
+    block_timestamp: int | None
+    tick: int | None
+    liquidity: Decimal | None
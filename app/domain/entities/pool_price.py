@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
@@ -11,11 +11,21 @@ class PoolPricePoint:
     price: Decimal
 
 
+@dataclass(frozen=True)
+class PoolPriceCandle:
+    timestamp: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+
+
 @dataclass(frozen=True)
 class PoolPriceStats:
     min_price: Decimal | None
     max_price: Decimal | None
     avg_price: Decimal | None
+    avg_inverse_price: Decimal | None = None
 
 
 @dataclass(frozen=True)
@@ -23,3 +33,11 @@ class PoolCurrentPrice:
     token1_price: Decimal | None
     token0_price: Decimal | None
     sqrt_price_x96: int | None
+
+
+@dataclass(frozen=True)
+class PoolPriceWindow:
+    current: PoolCurrentPrice
+    series: list[PoolPricePoint] = field(default_factory=list)
+    candles: list[PoolPriceCandle] = field(default_factory=list)
+    stats: PoolPriceStats | None = None
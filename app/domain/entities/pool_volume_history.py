@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from decimal import Decimal
 
 
@@ -12,12 +13,11 @@ class PoolVolumeHistoryPoint:
 
 
 @dataclass(frozen=True)
-class PoolVolumeHistorySummaryBase:
-    tvl_usd: Decimal | None
-    avg_daily_fees_usd: Decimal | None
-    avg_daily_volume_usd: Decimal | None
-    token0_symbol: str | None
-    token1_symbol: str | None
+class PoolVolumeHistoryWindow:
+    points: list[PoolVolumeHistoryPoint] = field(default_factory=list)
+    tvl_usd: Decimal | None = None
+    token0_symbol: str | None = None
+    token1_symbol: str | None = None
 
 
 @dataclass(frozen=True)
@@ -25,3 +25,13 @@ class PoolVolumeHistorySummaryPremium:
     price_volatility_pct: Decimal | None
     correlation: Decimal | None
     geometric_mean_price: Decimal | None
+
+
+@dataclass(frozen=True)
+class PoolHourlyVolumePoint:
+    hour_start: datetime
+    chain_id: int
+    dex_id: int
+    volume_usd: Decimal | None
+    fees_usd: Decimal | None
+    tvl_usd: Decimal | None
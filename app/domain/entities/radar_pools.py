@@ -4,28 +4,6 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
-class RadarPoolAggregate:
-    pool_id: int
-    pool_address: str
-    network_name: str
-    exchange_name: str
-    dex_id: int
-    chain_id: int
-    token0_address: str
-    token1_address: str
-    token0_symbol: str
-    token1_symbol: str
-    token0_icon_url: str | None
-    token1_icon_url: str | None
-    fee_tier: int
-    avg_tvl_usd: Decimal | None
-    total_fees_usd: Decimal | None
-    avg_hourly_fees_usd: Decimal | None
-    avg_hourly_volume_usd: Decimal | None
-    samples: int
-
-
 @dataclass(frozen=True)
 class RadarPoolItem:
     pool_id: int
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    chain_id: int
+    dex_id: int
+    pool_address: str
+
+
+@dataclass(frozen=True)
+class PoolTokenPair:
+    chain_id: int
+    dex_id: int
+    pool_address: str
+    token0_address: str
+    token0_symbol: str | None
+    token1_address: str
+    token1_symbol: str | None
+
+
+@dataclass(frozen=True)
+class TokenSuggestion:
+    term: str
+    kind: str
+    pool_count: int
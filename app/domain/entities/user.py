@@ -18,6 +18,7 @@ class User:
     stripe_customer_id: str | None
     created_at: datetime
     updated_at: datetime
+    entitlements_epoch: int = 0
 
 
 @dataclass(frozen=True)
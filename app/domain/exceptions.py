@@ -41,6 +41,10 @@ class RadarPoolsInputError(DomainError):
     """Parametros invalidos para busca no radar."""
 
 
+class TokenSearchInputError(DomainError):
+    """Parametros invalidos para busca de tokens."""
+
+
 class InvalidSimulationInputError(DomainError):
     """Parametros invalidos para simulacao de APR."""
 
@@ -106,3 +110,7 @@ class BillingError(DomainError):
 
 class PasswordResetTokenInvalidError(AuthError):
     """Token de recuperacao de senha invalido, expirado ou ja utilizado."""
+
+
+class PasswordHashingBusyError(AuthError):
+    """Fila de hashing de senha cheia; tente novamente em instantes."""
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from app.domain.entities.catalog import (
+    CatalogChain,
+    CatalogDex,
+    CatalogPool,
+    CatalogToken,
+    Exchange,
+    Network,
+    PoolDetail,
+    PoolSummary,
+    Token,
+)
+
+
+# Foto imutavel do catalogo (pools ja filtrados por TVL minimo) com indices
+# em dicts; responde as mesmas consultas do CatalogQueryPort sem ir ao banco.
+class CatalogSnapshot:
+    def __init__(
+        self,
+        *,
+        dexes: Iterable[CatalogDex],
+        chains: Iterable[CatalogChain],
+        tokens: Iterable[CatalogToken],
+        pools: Iterable[CatalogPool],
+    ):
+        self._dexes = {dex.id: dex for dex in dexes}
+        self._chains = {chain.id: chain for chain in chains}
+        self._tokens = {(token.chain_id, token.address.lower()): token for token in tokens}
+
+        self._pools_by_exchange_network: dict[tuple[int, int], list[CatalogPool]] = {}
+        self._pools_by_key: dict[tuple[int, int, str], CatalogPool] = {}
+        for pool in pools:
+            self._pools_by_exchange_network.setdefault((pool.dex_id, pool.chain_id), []).append(pool)
+            self._pools_by_key.setdefault((pool.chain_id, pool.dex_id, pool.pool_address.lower()), pool)
+        for bucket in self._pools_by_exchange_network.values():
+            bucket.sort(key=lambda pool: (pool.fee_tier, pool.pool_address))
+
+        network_ids_by_exchange: dict[int, set[int]] = {}
+        for dex_id, chain_id in self._pools_by_exchange_network:
+            if chain_id in self._chains:
+                network_ids_by_exchange.setdefault(dex_id, set()).add(chain_id)
+        self._exchanges = sorted(
+            (
+                Exchange(id=dex.id, name=dex.name, icon_url=dex.icon_url)
+                for dex_id, dex in self._dexes.items()
+                if dex_id in network_ids_by_exchange
+            ),
+            key=lambda exchange: exchange.name,
+        )
+        self._networks_by_exchange = {
+            dex_id: sorted(
+                (
+                    Network(id=chain_id, name=self._chains[chain_id].name, icon_url=self._chains[chain_id].icon_url)
+                    for chain_id in chain_ids
+                ),
+                key=lambda network: network.name,
+            )
+            for dex_id, chain_ids in network_ids_by_exchange.items()
+        }
+
+    @property
+    def pool_count(self) -> int:
+        return len(self._pools_by_key)
+
+    def list_exchanges(self) -> list[Exchange]:
+        return list(self._exchanges)
+
+    def list_networks_by_exchange(self, *, exchange_id: int) -> list[Network]:
+        return list(self._networks_by_exchange.get(exchange_id, ()))
+
+    def list_tokens_by_exchange_network(
+        self,
+        *,
+        exchange_id: int,
+        network_id: int,
+        pool_addresses: list[str] | None = None,
+        exclude_token: str | None = None,
+    ) -> list[Token]:
+        pools = self._pools_by_exchange_network.get((exchange_id, network_id), ())
+        if pool_addresses is not None:
+            wanted = {address.lower() for address in pool_addresses}
+            pools = [pool for pool in pools if pool.pool_address.lower() in wanted]
+
+        tokens: dict[str, Token] = {}
+        for pool in pools:
+            for address in (pool.token0_address, pool.token1_address):
+                if address.lower() in tokens:
+                    continue
+                tokens[address.lower()] = self._token(chain_id=network_id, address=address)
+        rows = tokens.values()
+        if exclude_token is not None:
+            rows = [
+                token
+                for token in rows
+                if token.address.lower() != exclude_token.lower()
+                and token.symbol.upper() != exclude_token.upper()
+            ]
+        return sorted(rows, key=lambda token: (token.symbol, token.address))
+
+    def list_pools_by_exchange_network_addresses(
+        self,
+        *,
+        exchange_id: int,
+        network_id: int,
+        pool_addresses: list[str],
+    ) -> list[PoolSummary]:
+        wanted = {address.lower() for address in pool_addresses}
+        return [
+            PoolSummary(pool_address=pool.pool_address, fee_tier=pool.fee_tier)
+            for pool in self._pools_by_exchange_network.get((exchange_id, network_id), ())
+            if pool.pool_address.lower() in wanted
+        ]
+
+    def get_pool_by_address(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        exchange_id: int,
+    ) -> PoolDetail | None:
+        pool = self._pools_by_key.get((chain_id, exchange_id, pool_address.lower()))
+        dex = self._dexes.get(exchange_id)
+        chain = self._chains.get(chain_id)
+        if pool is None or dex is None or chain is None:
+            return None
+        token0 = self._token(chain_id=chain_id, address=pool.token0_address)
+        token1 = self._token(chain_id=chain_id, address=pool.token1_address)
+        return PoolDetail(
+            id=pool.pool_address,
+            dex_key=dex.key,
+            dex_name=dex.name,
+            dex_version=dex.version,
+            chain_key=chain.key,
+            chain_name=chain.name,
+            fee_tier=pool.fee_tier,
+            token0_address=pool.token0_address,
+            token0_symbol=token0.symbol,
+            token0_decimals=token0.decimals,
+            token1_address=pool.token1_address,
+            token1_symbol=token1.symbol,
+            token1_decimals=token1.decimals,
+        )
+
+    def _token(self, *, chain_id: int, address: str) -> Token:
+        # Mesmo fallback do SQL: sem linha em tokens, simbolo = endereco e decimals = 0.
+        token = self._tokens.get((chain_id, address.lower()))
+        if token is None:
+            return Token(address=address, symbol=address, decimals=0, icon_url=None)
+        return Token(
+            address=address,
+            symbol=token.symbol or address,
+            decimals=token.decimals or 0,
+            icon_url=token.icon_url,
+        )
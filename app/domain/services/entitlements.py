@@ -30,3 +30,33 @@ def build_user_entitlements(
         boolean_features=boolean_features,
         limits=limits,
     )
+
+
+# Limite do plano usado pelo rate limit das rotas caras (tokens por minuto).
+REQUESTS_PER_MINUTE_LIMIT = "requests_per_minute"
+
+# Feature booleana das rotas /v1/ops/*; fora de FEATURE_BITS, sempre conferida
+# nos entitlements do banco.
+OPS_ADMIN_FEATURE = "ops_admin"
+
+# Posicao de cada feature booleana no bitset do access token. So acrescente no
+# fim: reordenar muda o significado dos tokens ja emitidos.
+FEATURE_BITS: tuple[str, ...] = (
+    "charts_advanced",
+    "export_csv",
+)
+
+
+def encode_feature_bits(boolean_features: dict[str, bool]) -> int:
+    bits = 0
+    for position, feature_code in enumerate(FEATURE_BITS):
+        if boolean_features.get(feature_code, False):
+            bits |= 1 << position
+    return bits
+
+
+def feature_bit_enabled(feature_bits: int, feature_code: str) -> bool | None:
+    # None quando a feature nao tem bit; o chamador consulta os entitlements.
+    if feature_code not in FEATURE_BITS:
+        return None
+    return bool(feature_bits >> FEATURE_BITS.index(feature_code) & 1)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from decimal import Decimal, getcontext
 
+from app.domain.entities.pool_price import PoolPriceStats
+
 
 getcontext().prec = 50
 
@@ -35,3 +38,57 @@ def resolve_current_pool_price(
     if price <= 0:
         raise ValueError("Invalid pool price.")
     return price
+
+
+def summarize_pool_prices(prices: Iterable[Decimal]) -> PoolPriceStats:
+    count = 0
+    total = Decimal("0")
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    for price in prices:
+        count += 1
+        total += price
+        if min_price is None or price < min_price:
+            min_price = price
+        if max_price is None or price > max_price:
+            max_price = price
+    if count == 0:
+        return PoolPriceStats(min_price=None, max_price=None, avg_price=None)
+    return PoolPriceStats(min_price=min_price, max_price=max_price, avg_price=total / Decimal(count))
+
+
+def lttb_indices(points: list[tuple[float, float]], max_points: int) -> list[int]:
+    n = len(points)
+    if max_points >= n or max_points < 3:
+        return list(range(n))
+
+    selected = [0]
+    bucket_size = (n - 2) / (max_points - 2)
+    a = 0
+    for i in range(max_points - 2):
+        bucket_start = int(i * bucket_size) + 1
+        bucket_end = int((i + 1) * bucket_size) + 1
+
+        next_start = bucket_end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_start >= n - 1 or i == max_points - 3:
+            avg_x, avg_y = points[n - 1]
+        else:
+            count = next_end - next_start
+            avg_x = sum(x for x, _ in points[next_start:next_end]) / count
+            avg_y = sum(y for _, y in points[next_start:next_end]) / count
+
+        ax, ay = points[a]
+        best_idx = bucket_start
+        best_area = -1.0
+        for j in range(bucket_start, bucket_end):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best_idx = j
+        selected.append(best_idx)
+        a = best_idx
+
+    selected.append(n - 1)
+    return selected
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
+import math
+
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
+from app.domain.entities.pool_volume_history import PoolVolumeHistorySummaryPremium
 
 
 def calculate_daily_tvl_pct(*, avg_daily_usd: Decimal | None, tvl_usd: Decimal | None) -> Decimal | None:
@@ -9,3 +13,71 @@ def calculate_daily_tvl_pct(*, avg_daily_usd: Decimal | None, tvl_usd: Decimal |
     if tvl_usd is None or tvl_usd <= 0:
         return None
     return (avg_daily_usd / tvl_usd) * Decimal("100")
+
+
+def summarize_ohlc_premium(
+    *,
+    base: CryptoOhlcDailySeries,
+    quote: CryptoOhlcDailySeries | None = None,
+) -> PoolVolumeHistorySummaryPremium:
+    # Volatilidade e media geometrica vem do simbolo base; correlacao usa os
+    # fechamentos dos dois simbolos nos dias em comum.
+    ranges = [
+        (high, low)
+        for high, low in zip(base.highs, base.lows)
+        if not math.isnan(high) and not math.isnan(low)
+    ]
+    swings = [(high - low) / high * 100.0 for high, low in ranges if high != 0]
+    price_volatility_pct = sum(swings) / len(swings) if swings else None
+
+    geometric_mean_price = None
+    if ranges:
+        min_low = min(low for _, low in ranges)
+        max_high = max(high for high, _ in ranges)
+        if min_low > 0 and max_high > 0:
+            geometric_mean_price = math.sqrt(min_low * max_high)
+
+    correlation = None
+    if quote is not None:
+        correlation = _pearson_on_common_days(base, quote)
+
+    return PoolVolumeHistorySummaryPremium(
+        price_volatility_pct=_to_decimal(price_volatility_pct),
+        correlation=_to_decimal(correlation),
+        geometric_mean_price=_to_decimal(geometric_mean_price),
+    )
+
+
+def _pearson_on_common_days(
+    base: CryptoOhlcDailySeries,
+    quote: CryptoOhlcDailySeries,
+) -> float | None:
+    quote_closes = {
+        day: close for day, close in zip(quote.day_starts, quote.closes) if not math.isnan(close)
+    }
+    pairs = [
+        (close, quote_closes[day])
+        for day, close in zip(base.day_starts, base.closes)
+        if not math.isnan(close) and day in quote_closes
+    ]
+    return pearson_correlation(pairs)
+
+
+def pearson_correlation(pairs: list[tuple[float, float]]) -> float | None:
+    if len(pairs) < 2:
+        return None
+    count = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / count
+    mean_y = sum(y for _, y in pairs) / count
+    sxx = sum((x - mean_x) ** 2 for x, _ in pairs)
+    syy = sum((y - mean_y) ** 2 for _, y in pairs)
+    if sxx == 0 or syy == 0:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    return sxy / math.sqrt(sxx * syy)
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    if value is None or not math.isfinite(value):
+        return None
+    return Decimal(str(value))
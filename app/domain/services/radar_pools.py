@@ -1,53 +1,63 @@
 from __future__ import annotations
 
-from decimal import Decimal
-
-from app.domain.entities.radar_pools import RadarPoolAggregate, RadarPoolItem
-
-
-def decimal_or_zero(value: Decimal | None) -> Decimal:
-    return value if value is not None else Decimal("0")
-
-
-def build_radar_item(*, row: RadarPoolAggregate, timeframe_days: int) -> RadarPoolItem:
-    tvl_usd = decimal_or_zero(row.avg_tvl_usd)
-    avg_hourly_fees = decimal_or_zero(row.avg_hourly_fees_usd)
-    avg_hourly_volume = decimal_or_zero(row.avg_hourly_volume_usd)
-    total_fees = decimal_or_zero(row.total_fees_usd)
-
-    avg_daily_fees_usd = avg_hourly_fees * Decimal("24")
-    avg_daily_volume_usd = avg_hourly_volume * Decimal("24")
-
-    if tvl_usd > 0:
-        daily_fees_tvl_pct = avg_daily_fees_usd / tvl_usd
-        daily_volume_tvl_pct = avg_daily_volume_usd / tvl_usd
-        average_apr = (total_fees / tvl_usd) * (Decimal("365") / Decimal(timeframe_days)) * Decimal("100")
-    else:
-        daily_fees_tvl_pct = Decimal("0")
-        daily_volume_tvl_pct = Decimal("0")
-        average_apr = Decimal("0")
-
-    return RadarPoolItem(
-        pool_id=row.pool_id,
-        pool_address=row.pool_address,
-        pool_name=f"{row.token0_symbol} / {row.token1_symbol}",
-        network=row.network_name,
-        exchange=row.exchange_name,
-        dex_id=row.dex_id,
-        chain_id=row.chain_id,
-        token0_address=row.token0_address,
-        token1_address=row.token1_address,
-        token0_symbol=row.token0_symbol,
-        token1_symbol=row.token1_symbol,
-        token0_icon_url=row.token0_icon_url,
-        token1_icon_url=row.token1_icon_url,
-        fee_tier=row.fee_tier,
-        average_apr=average_apr,
-        price_volatility=None,
-        tvl_usd=tvl_usd,
-        correlation=None,
-        avg_daily_fees_usd=avg_daily_fees_usd,
-        daily_fees_tvl_pct=daily_fees_tvl_pct,
-        avg_daily_volume_usd=avg_daily_volume_usd,
-        daily_volume_tvl_pct=daily_volume_tvl_pct,
-    )
+from array import array
+from collections.abc import Mapping, Sequence
+from datetime import date
+import math
+
+from app.domain.services.pool_summary import pearson_correlation
+
+
+# Janelas com agregados precomputados em public.radar_pool_aggregates.
+PRECOMPUTED_TIMEFRAMES = (1, 7, 14, 30, 90, 365)
+
+
+def build_close_matrix(
+    *,
+    days: Sequence[date],
+    closes: Mapping[str, Mapping[date, float]],
+) -> dict[str, array]:
+    # Matriz dia x simbolo densa, armazenada por coluna; dia sem candle vira NaN.
+    return {
+        symbol: array("d", (by_day.get(day, math.nan) for day in days))
+        for symbol, by_day in closes.items()
+    }
+
+
+def daily_log_returns(closes: Sequence[float]) -> array:
+    returns = array("d", [math.nan]) if closes else array("d")
+    for previous, current in zip(closes, closes[1:]):
+        if previous > 0 and current > 0:
+            returns.append(math.log(current / previous))
+        else:
+            # NaN falha as duas comparacoes acima, entao dias sem candle caem aqui.
+            returns.append(math.nan)
+    return returns
+
+
+def pair_price_metrics(
+    *,
+    closes0: Sequence[float],
+    closes1: Sequence[float],
+    returns0: Sequence[float],
+    returns1: Sequence[float],
+) -> tuple[float | None, float | None]:
+    # Volatilidade diaria (%) do preco token0/token1 = desvio padrao de r0 - r1;
+    # correlacao de Pearson dos fechamentos, como no resumo premium.
+    spreads = [
+        r0 - r1
+        for r0, r1 in zip(returns0, returns1)
+        if not math.isnan(r0) and not math.isnan(r1)
+    ]
+    volatility = None
+    if len(spreads) >= 2:
+        mean = sum(spreads) / len(spreads)
+        variance = sum((value - mean) ** 2 for value in spreads) / (len(spreads) - 1)
+        volatility = math.sqrt(variance) * 100.0
+
+    pairs = [
+        (c0, c1)
+        for c0, c1 in zip(closes0, closes1)
+        if not math.isnan(c0) and not math.isnan(c1)
+    ]
+    return volatility, pearson_correlation(pairs)
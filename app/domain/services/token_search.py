@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from app.domain.entities.token_search import PoolKey, PoolTokenPair, TokenSuggestion
+
+
+TERM_KIND_SYMBOL = "symbol"
+TERM_KIND_ADDRESS = "address"
+
+
+def normalize_token_term(value: str) -> str:
+    # Enderecos sao comparados em minusculas; simbolos em maiusculas.
+    term = value.strip()
+    if term[:2].lower() == "0x":
+        return term.lower()
+    return term.upper()
+
+
+# Indice em memoria de simbolo/endereco de token -> pools que contem o token.
+class TokenSearchIndex:
+    def __init__(self, pairs: Iterable[PoolTokenPair]):
+        pools_by_term: dict[str, set[PoolKey]] = {}
+        for pair in pairs:
+            key = PoolKey(
+                chain_id=pair.chain_id,
+                dex_id=pair.dex_id,
+                pool_address=pair.pool_address.lower(),
+            )
+            for address, symbol in (
+                (pair.token0_address, pair.token0_symbol),
+                (pair.token1_address, pair.token1_symbol),
+            ):
+                for raw in (address, symbol):
+                    if raw and raw.strip():
+                        pools_by_term.setdefault(normalize_token_term(raw), set()).add(key)
+
+        self._pools_by_term = {term: frozenset(keys) for term, keys in pools_by_term.items()}
+        # Termos ordenados permitem busca por prefixo com bisect.
+        self._terms = sorted(self._pools_by_term)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def resolve(
+        self,
+        query: str,
+        *,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> frozenset[PoolKey]:
+        if not query.strip():
+            return frozenset()
+        keys = self._pools_by_term.get(normalize_token_term(query), frozenset())
+        if chain_id is None and dex_id is None:
+            return keys
+        return frozenset(key for key in keys if _matches(key, chain_id=chain_id, dex_id=dex_id))
+
+    def suggest(
+        self,
+        prefix: str,
+        *,
+        limit: int,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> list[TokenSuggestion]:
+        if not prefix.strip() or limit < 1:
+            return []
+        normalized = normalize_token_term(prefix)
+        suggestions: list[TokenSuggestion] = []
+        for index in range(bisect_left(self._terms, normalized), len(self._terms)):
+            term = self._terms[index]
+            if not term.startswith(normalized):
+                break
+            pool_count = sum(
+                1
+                for key in self._pools_by_term[term]
+                if _matches(key, chain_id=chain_id, dex_id=dex_id)
+            )
+            if pool_count:
+                suggestions.append(
+                    TokenSuggestion(
+                        term=term,
+                        kind=TERM_KIND_ADDRESS if term.startswith("0x") else TERM_KIND_SYMBOL,
+                        pool_count=pool_count,
+                    )
+                )
+        # Match exato primeiro, depois os tokens com mais pools.
+        suggestions.sort(key=lambda item: (item.term != normalized, -item.pool_count, item.term))
+        return suggestions[:limit]
+
+
+def _matches(key: PoolKey, *, chain_id: int | None, dex_id: int | None) -> bool:
+    return (chain_id is None or key.chain_id == chain_id) and (dex_id is None or key.dex_id == dex_id)
@@ -11,18 +11,13 @@ class PriceServiceAdapter(TokenPricePort):
     def __init__(self, price_service: PriceService):
         self._price_service = price_service
 
-    def get_pair_prices(
+    def get_prices_usd(
         self,
         *,
-        token0_address: str,
-        token1_address: str,
+        token_addresses: list[str],
         network: str,
-    ) -> tuple[Decimal, Decimal]:
+    ) -> dict[str, Decimal]:
         try:
-            return self._price_service.get_pair_prices(
-                token0=token0_address,
-                token1=token1_address,
-                network=network,
-            )
+            return self._price_service.get_prices_usd(tokens=token_addresses, network=network)
         except PriceLookupError as exc:
             raise PriceLookupDomainError(str(exc)) from exc
@@ -51,12 +51,21 @@ class PriceOverrides:
 
 
 class CoingeckoPriceProvider:
-    def __init__(self, api_base: str, timeout_seconds: float, cache_ttl_seconds: float = 300):
+    def __init__(
+        self,
+        api_base: str,
+        timeout_seconds: float,
+        cache_ttl_seconds: float = 300,
+        max_addresses_per_request: int = 100,
+        http_client: httpx.Client | None = None,
+    ):
         self.api_base = api_base.rstrip("/")
         self.timeout = timeout_seconds
         self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_addresses_per_request = max(1, max_addresses_per_request)
         self._cache: dict[tuple[str, str], tuple[float, Decimal]] = {}
         self._lock = Lock()
+        self._client = http_client
 
     def _cache_get(self, *, platform: str, token_address: str) -> Decimal | None:
         if self.cache_ttl_seconds <= 0:
@@ -81,32 +90,66 @@ class CoingeckoPriceProvider:
         with self._lock:
             self._cache[key] = (expires_at, value)
 
+    def _http_client(self) -> httpx.Client:
+        # Cliente unico por processo: reaproveita conexoes TLS entre requisicoes.
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=self.timeout)
+            return self._client
+
     def get_price_usd(self, network: str, token_address: str) -> Decimal:
+        prices = self.get_prices_usd(network, [token_address])
+        value = prices.get(token_address.lower())
+        if value is None:
+            raise PriceLookupError("Price not found for token.")
+        return value
+
+    def get_prices_usd(self, network: str, token_addresses: list[str]) -> dict[str, Decimal]:
+        # Devolve {endereco em minusculas: preco}; tokens sem preco ficam de fora.
         platform = COINGECKO_PLATFORMS.get(_normalize_network(network))
         if not platform:
             raise PriceLookupError(f"Unsupported network for pricing: {network}")
-        if not token_address.lower().startswith("0x"):
+        addresses = list(dict.fromkeys(address.lower() for address in token_addresses))
+        if any(not address.startswith("0x") for address in addresses):
             raise PriceLookupError("Coingecko pricing requires a token address.")
 
-        cached = self._cache_get(platform=platform, token_address=token_address)
-        if cached is not None:
-            return cached
+        prices: dict[str, Decimal] = {}
+        misses: list[str] = []
+        for address in addresses:
+            cached = self._cache_get(platform=platform, token_address=address)
+            if cached is None:
+                misses.append(address)
+            else:
+                prices[address] = cached
 
         url = f"{self.api_base}/simple/token_price/{platform}"
-        params = {
-            "contract_addresses": token_address,
-            "vs_currencies": "usd",
-        }
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
-        token_key = token_address.lower()
-        if token_key not in payload or "usd" not in payload[token_key]:
-            raise PriceLookupError("Price not found for token.")
-        value = Decimal(str(payload[token_key]["usd"]))
-        self._cache_set(platform=platform, token_address=token_address, value=value)
-        return value
+        for start in range(0, len(misses), self.max_addresses_per_request):
+            chunk = misses[start : start + self.max_addresses_per_request]
+            params = {
+                "contract_addresses": ",".join(chunk),
+                "vs_currencies": "usd",
+            }
+            try:
+                response = self._http_client().get(url, params=params)
+                response.raise_for_status()
+                body = response.json()
+            except httpx.HTTPStatusError as exc:
+                raise PriceLookupError(
+                    f"Coingecko request failed with status {exc.response.status_code}."
+                ) from exc
+            except (httpx.HTTPError, ValueError) as exc:
+                raise PriceLookupError("Coingecko request failed.") from exc
+            if not isinstance(body, dict):
+                raise PriceLookupError("Unexpected Coingecko response.")
+            payload = {key.lower(): value for key, value in body.items()}
+            for address in chunk:
+                entry = payload.get(address)
+                if not isinstance(entry, dict) or "usd" not in entry:
+                    continue
+                value = Decimal(str(entry["usd"]))
+                self._cache_set(platform=platform, token_address=address, value=value)
+                prices[address] = value
+        return prices
 
 
 class PriceService:
@@ -124,7 +167,24 @@ class PriceService:
             "Token price unavailable. Provide PRICE_OVERRIDES or use token address."
         )
 
-    def get_pair_prices(self, *, token0: str, token1: str, network: str) -> tuple[Decimal, Decimal]:
-        price0 = self.get_price_usd(token=token0, network=network)
-        price1 = self.get_price_usd(token=token1, network=network)
-        return price0, price1
+    def get_prices_usd(self, *, tokens: list[str], network: str) -> dict[str, Decimal]:
+        # Overrides primeiro; os enderecos restantes vao numa unica chamada ao Coingecko.
+        prices: dict[str, Decimal] = {}
+        addresses: list[str] = []
+        for token in tokens:
+            override = self.overrides.get_price(network, token)
+            if override is not None:
+                prices[token] = override
+            elif token.lower().startswith("0x"):
+                addresses.append(token)
+            else:
+                raise PriceLookupError(
+                    "Token price unavailable. Provide PRICE_OVERRIDES or use token address."
+                )
+        if addresses:
+            fetched = self.coingecko.get_prices_usd(network, addresses)
+            for token in addresses:
+                value = fetched.get(token.lower())
+                if value is not None:
+                    prices[token] = value
+        return prices
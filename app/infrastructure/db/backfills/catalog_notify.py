@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import text
+
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+# Canal usado pelos triggers da migracao 0007_catalog_notify.
+CATALOG_CHANGED_CHANNEL = "catalog_changed"
+
+
+def notify_catalog_changed(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_notify(:channel, 'manual')"), {"channel": CATALOG_CHANGED_CHANNEL})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Envia um NOTIFY manual para as APIs recarregarem a foto do catalogo agora "
+            "(os triggers de escrita vem da migracao 0007_catalog_notify)."
+        )
+    )
+    parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    notify_catalog_changed(engine)
+    print(f"NOTIFY enviado em {CATALOG_CHANGED_CHANNEL}")
+
+
+if __name__ == "__main__":
+    main()
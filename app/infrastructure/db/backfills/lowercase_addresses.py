@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+# Colunas de endereco gravadas sempre em minusculas (triggers da migracao
+# 0004_lowercase_addresses); as consultas comparam a coluna crua para usar
+# indices B-tree simples em vez de lower(coluna).
+ADDRESS_COLUMNS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("public.pools", ("pool_address", "token0_address", "token1_address")),
+    ("public.tokens", ("address",)),
+    ("public.pool_state_snapshots", ("pool_address",)),
+    ("public.pool_hourly", ("pool_address",)),
+    ("public.pool_ticks_initialized", ("pool_address",)),
+    ("apr_exact.tick_snapshot", ("pool_address",)),
+)
+
+# Indices de expressao sobre lower(pool_address) que as consultas deixaram de
+# usar. idx_pool_state_snapshots_price_ts era criado pelo backfill antigo de
+# pool_state_snapshot_price em (chain_id, dex_id, lower(pool_address),
+# meta_block_timestamp); foi substituido por idx_pool_state_snapshots_price_key_ts
+# (migracao 0008_derived_table_indexes).
+OBSOLETE_INDEXES = ("public.idx_pool_state_snapshots_price_ts",)
+
+
+@dataclass(frozen=True)
+class LowercaseBackfillReport:
+    updated: dict[str, int] = field(default_factory=dict)
+    # Linhas cuja versao em minusculas ja existe (ou colide com outra linha da
+    # mesma tabela): ficam como estao e precisam ser mescladas manualmente.
+    skipped: dict[str, list[dict[str, object]]] = field(default_factory=dict)
+
+
+def _mixed_case_filter(columns: tuple[str, ...]) -> str:
+    return " OR ".join(f"{column} <> lower({column})" for column in columns)
+
+
+def backfill_lowercase_addresses(engine, *, batch_size: int = 50_000) -> LowercaseBackfillReport:
+    report = LowercaseBackfillReport()
+    for table, columns in ADDRESS_COLUMNS:
+        updated, skipped = _backfill_table(engine, table=table, columns=columns, batch_size=batch_size)
+        report.updated[table] = updated
+        if skipped:
+            report.skipped[table] = skipped
+    return report
+
+
+def _backfill_table(
+    engine,
+    *,
+    table: str,
+    columns: tuple[str, ...],
+    batch_size: int,
+) -> tuple[int, list[dict[str, object]]]:
+    assignments = ", ".join(f"{column} = lower({column})" for column in columns)
+    # Lotes por ctid para nao segurar locks na tabela inteira; linhas puladas
+    # ficam fora das proximas selecoes.
+    pending_sql = f"""
+        SELECT ctid::text AS ctid
+        FROM {table}
+        WHERE ({_mixed_case_filter(columns)})
+          AND NOT (ctid = ANY(CAST(:skipped AS tid[])))
+        LIMIT :batch_size
+    """
+    batch_sql = f"""
+        UPDATE {table}
+        SET {assignments}
+        WHERE ctid = ANY(CAST(:ctids AS tid[]))
+    """
+    row_sql = f"UPDATE {table} SET {assignments} WHERE ctid = CAST(:ctid AS tid)"
+    conflict_sql = f"""
+        SELECT ctid::text AS ctid, {", ".join(columns)}
+        FROM {table}
+        WHERE ctid = CAST(:ctid AS tid)
+    """
+
+    total = 0
+    skipped_ctids: list[str] = []
+    skipped_rows: list[dict[str, object]] = []
+    while True:
+        with engine.begin() as conn:
+            ctids = list(
+                conn.execute(
+                    text(pending_sql),
+                    {"skipped": skipped_ctids, "batch_size": batch_size},
+                ).scalars()
+            )
+            if not ctids:
+                break
+            try:
+                with conn.begin_nested():
+                    total += conn.execute(text(batch_sql), {"ctids": ctids}).rowcount or 0
+            except IntegrityError:
+                # Chave em minusculas ja existe: refaz o lote linha a linha e
+                # pula (reportando) so as linhas em conflito.
+                for ctid in ctids:
+                    try:
+                        with conn.begin_nested():
+                            total += conn.execute(text(row_sql), {"ctid": ctid}).rowcount or 0
+                    except IntegrityError:
+                        skipped_ctids.append(ctid)
+                        row = conn.execute(text(conflict_sql), {"ctid": ctid}).mappings().first()
+                        skipped_rows.append(dict(row) if row is not None else {"ctid": ctid})
+        if len(ctids) < batch_size:
+            break
+    return total, skipped_rows
+
+
+def count_mixed_case_rows(engine) -> dict[str, int]:
+    # Gate de deploy: as consultas comparam a coluna crua, entao linhas ainda
+    # com maiusculas somem das respostas da API ate o backfill terminar.
+    counts: dict[str, int] = {}
+    with engine.connect() as conn:
+        for table, columns in ADDRESS_COLUMNS:
+            counts[table] = int(
+                conn.execute(
+                    text(f"SELECT count(*) FROM {table} WHERE {_mixed_case_filter(columns)}")
+                ).scalar_one()
+            )
+    return counts
+
+
+def drop_obsolete_indexes(engine) -> None:
+    # CONCURRENTLY nao roda dentro de transacao.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Normaliza para minusculas as colunas de endereco ja gravadas "
+            "(os triggers de escrita vem da migracao 0004_lowercase_addresses)."
+        )
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Linhas por transacao no backfill.")
+    parser.add_argument(
+        "--keep-old-indexes",
+        action="store_true",
+        help=f"Nao remove os indices sobre lower(pool_address) ({', '.join(OBSOLETE_INDEXES)}).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="So conta linhas com maiusculas e sai com erro se houver (gate antes de publicar a API).",
+    )
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    if args.check:
+        counts = count_mixed_case_rows(engine)
+        for table, total in counts.items():
+            print(f"{table}: {total} linhas com maiusculas")
+        if any(counts.values()):
+            raise SystemExit("Enderecos com maiusculas pendentes; rode o backfill antes de publicar a API.")
+        return
+
+    report = backfill_lowercase_addresses(engine, batch_size=args.batch_size)
+    for table, total in report.updated.items():
+        print(f"{table}: {total} linhas normalizadas")
+    for table, rows in report.skipped.items():
+        print(f"{table}: {len(rows)} linhas puladas (versao em minusculas ja existe)")
+        for row in rows:
+            print(f"  {row}")
+    if report.skipped:
+        raise SystemExit("Resolva as linhas puladas (mesclar ou apagar a duplicata) e rode de novo.")
+    if not args.keep_old_indexes:
+        drop_obsolete_indexes(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+def refresh_pool_daily(engine, *, from_day: date, to_day: date) -> int:
+    with engine.begin() as conn:
+        upserted = conn.execute(
+            text("SELECT public.refresh_pool_daily(:from_day, :to_day)"),
+            {"from_day": from_day, "to_day": to_day},
+        ).scalar_one()
+    return int(upserted or 0)
+
+
+def backfill_pool_daily(engine, *, chunk_days: int = 7) -> int:
+    with engine.connect() as conn:
+        first_hour = conn.execute(text("SELECT min(h.hour_start) FROM public.pool_hourly h")).scalar()
+    if first_hour is None:
+        return 0
+
+    today = datetime.now(timezone.utc).date()
+    if first_hour.tzinfo is not None:
+        first_hour = first_hour.astimezone(timezone.utc)
+    day = first_hour.date()
+    upserted = 0
+    # Uma transacao por bloco de dias para nao segurar o pool_hourly inteiro.
+    while day <= today:
+        last_day = min(day + timedelta(days=chunk_days - 1), today)
+        upserted += refresh_pool_daily(engine, from_day=day, to_day=last_day)
+        day = last_day + timedelta(days=1)
+    return upserted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(
+            "Mantem public.pool_daily a partir de public.pool_hourly "
+            "(tabela e funcao: migracao 0005_pool_daily)."
+        ))
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=2,
+        help="Recalcula os ultimos N dias UTC (default 2: ontem e hoje, uso apos cada ingestao horaria).",
+    )
+    parser.add_argument("--all", action="store_true", help="Backfill de todo o historico de pool_hourly.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    if args.all:
+        upserted = backfill_pool_daily(engine)
+    else:
+        today = datetime.now(timezone.utc).date()
+        upserted = refresh_pool_daily(
+            engine,
+            from_day=today - timedelta(days=max(args.days, 1) - 1),
+            to_day=today,
+        )
+    print(f"pool_daily atualizados: {upserted}")
+
+
+if __name__ == "__main__":
+    main()
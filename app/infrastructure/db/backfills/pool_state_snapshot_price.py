@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import text
+
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+BACKFILL_POOL_SQL = """
+    UPDATE public.pool_state_snapshots s
+    SET price_token1_per_token0 = (
+        power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
+        * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
+    )::double precision
+    FROM public.pools p
+    LEFT JOIN public.tokens t0
+      ON t0.chain_id = p.chain_id
+     AND t0.address = p.token0_address
+    LEFT JOIN public.tokens t1
+      ON t1.chain_id = p.chain_id
+     AND t1.address = p.token1_address
+    WHERE p.chain_id = :chain_id
+      AND p.dex_id = :dex_id
+      AND p.pool_address = :pool_address
+      AND s.chain_id = p.chain_id
+      AND s.dex_id = p.dex_id
+      AND s.pool_address = :pool_address
+      AND (:recompute OR s.price_token1_per_token0 IS NULL)
+      AND s.sqrt_price_x96 IS NOT NULL
+      AND s.sqrt_price_x96 ~ '^[0-9]+$'
+      AND s.sqrt_price_x96 <> '0'
+"""
+
+
+def backfill_pool_state_snapshot_price(engine, *, recompute: bool = False) -> int:
+    with engine.connect() as conn:
+        pools = conn.execute(
+            text(
+                """
+                SELECT DISTINCT p.chain_id, p.dex_id, p.pool_address AS pool_address
+                FROM public.pools p
+                ORDER BY p.chain_id, p.dex_id, pool_address
+                """
+            )
+        ).mappings().all()
+
+    updated = 0
+    # Uma transacao por pool para nao segurar locks na tabela inteira.
+    for pool in pools:
+        with engine.begin() as conn:
+            result = conn.execute(
+                text(BACKFILL_POOL_SQL),
+                {
+                    "chain_id": pool["chain_id"],
+                    "dex_id": pool["dex_id"],
+                    "pool_address": pool["pool_address"],
+                    "recompute": recompute,
+                },
+            )
+            updated += result.rowcount or 0
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Preenche public.pool_state_snapshots.price_token1_per_token0 "
+            "(coluna e trigger: migracao 0003_pool_state_snapshot_price)."
+        )
+    )
+    parser.add_argument(
+        "--recompute",
+        action="store_true",
+        help="Recalcula tambem linhas que ja possuem preco (ex.: decimals corrigidos).",
+    )
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    updated = backfill_pool_state_snapshot_price(engine, recompute=args.recompute)
+    print(f"pool_state_snapshots atualizados: {updated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.domain.services.radar_pools import (
+    PRECOMPUTED_TIMEFRAMES,
+    build_close_matrix,
+    daily_log_returns,
+    pair_price_metrics,
+)
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+def refresh_radar_pool_aggregates(
+    engine,
+    *,
+    ohlc_exchange: str,
+    timeframes: tuple[int, ...] = PRECOMPUTED_TIMEFRAMES,
+) -> int:
+    # Agregados e metricas de preco na mesma transacao: leitores nunca veem a
+    # tabela recem-recalculada sem price_volatility/correlation.
+    with engine.begin() as conn:
+        inserted = conn.execute(
+            text("SELECT public.refresh_radar_pool_aggregates(:timeframes)"),
+            {"timeframes": list(timeframes)},
+        ).scalar_one()
+        _refresh_price_metrics(conn, ohlc_exchange=ohlc_exchange, timeframes=timeframes)
+    return int(inserted or 0)
+
+
+def _refresh_price_metrics(conn, *, ohlc_exchange: str, timeframes: tuple[int, ...]) -> None:
+    pools = conn.execute(
+        text(
+            """
+            SELECT
+                a.timeframe_days,
+                a.chain_id,
+                a.dex_id,
+                a.pool_address,
+                UPPER(a.token0_symbol) AS symbol0,
+                UPPER(a.token1_symbol) AS symbol1
+            FROM public.radar_pool_aggregates a
+            WHERE a.timeframe_days = ANY(:timeframes)
+            """
+        ),
+        {"timeframes": list(timeframes)},
+    ).mappings().all()
+    if not pools:
+        return
+
+    end_day = datetime.now(timezone.utc).date()
+    max_days = max(timeframes)
+    days = [end_day - timedelta(days=max_days - offset) for offset in range(max_days)]
+    symbols = sorted({row["symbol0"] for row in pools} | {row["symbol1"] for row in pools})
+    closes: dict[str, dict] = defaultdict(dict)
+    for row in conn.execute(
+        text(
+            """
+            SELECT UPPER(c.symbol) AS symbol, c.day_start, c.close
+            FROM public.crypto_ohlc_daily c
+            WHERE c.exchange = :exchange
+              AND c.timeframe = '1d'
+              AND UPPER(c.symbol) = ANY(:symbols)
+              AND c.day_start >= :start_day
+              AND c.day_start <  :end_day
+              AND c.close IS NOT NULL
+            """
+        ),
+        {"exchange": ohlc_exchange, "symbols": symbols, "start_day": days[0], "end_day": end_day},
+    ).mappings():
+        closes[row["symbol"]][row["day_start"]] = float(row["close"])
+
+    matrix = build_close_matrix(days=days, closes=closes)
+    returns = {symbol: daily_log_returns(column) for symbol, column in matrix.items()}
+
+    metrics: dict[tuple[int, str, str], tuple[float | None, float | None]] = {}
+    updates = []
+    for row in pools:
+        timeframe, symbol0, symbol1 = row["timeframe_days"], row["symbol0"], row["symbol1"]
+        key = (timeframe, symbol0, symbol1)
+        if key not in metrics:
+            if symbol0 in matrix and symbol1 in matrix:
+                start = max_days - timeframe
+                # O retorno do primeiro dia da janela depende do dia anterior; fica de fora.
+                metrics[key] = pair_price_metrics(
+                    closes0=matrix[symbol0][start:],
+                    closes1=matrix[symbol1][start:],
+                    returns0=returns[symbol0][start + 1 :],
+                    returns1=returns[symbol1][start + 1 :],
+                )
+            else:
+                metrics[key] = (None, None)
+        price_volatility, correlation = metrics[key]
+        if price_volatility is None and correlation is None:
+            continue
+        updates.append(
+            {
+                "timeframe_days": timeframe,
+                "chain_id": row["chain_id"],
+                "dex_id": row["dex_id"],
+                "pool_address": row["pool_address"],
+                "price_volatility": price_volatility,
+                "correlation": correlation,
+            }
+        )
+    if updates:
+        conn.execute(
+            text(
+                """
+                UPDATE public.radar_pool_aggregates
+                SET price_volatility = :price_volatility,
+                    correlation = :correlation
+                WHERE timeframe_days = :timeframe_days
+                  AND chain_id = :chain_id
+                  AND dex_id = :dex_id
+                  AND pool_address = :pool_address
+                """
+            ),
+            updates,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recalcula public.radar_pool_aggregates a partir de public.pool_daily "
+            "e public.crypto_ohlc_daily (tabela e funcao: migracao 0006_radar_pool_aggregates)."
+        )
+    )
+    parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    inserted = refresh_radar_pool_aggregates(engine, ohlc_exchange=settings.radar_ohlc_exchange)
+    print(f"radar_pool_aggregates atualizados: {inserted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import select
+from threading import Event, Thread
+import time
+
+from app.application.use_cases.catalog_snapshot import CatalogSnapshotProvider
+from app.infrastructure.db.backfills.catalog_notify import CATALOG_CHANGED_CHANNEL
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSnapshotRefresher:
+    # Recarrega a foto do catalogo a cada interval_seconds ou ao receber NOTIFY
+    # em catalog_changed (triggers da migracao 0007_catalog_notify). Rajadas de
+    # NOTIFY da ingestao viram no maximo um refresh a cada min_interval_seconds.
+    _POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        *,
+        engine,
+        provider: CatalogSnapshotProvider,
+        interval_seconds: float,
+        min_interval_seconds: float,
+        channel: str = CATALOG_CHANGED_CHANNEL,
+    ):
+        self._engine = engine
+        self._provider = provider
+        self._interval_seconds = interval_seconds
+        self._min_interval_seconds = min_interval_seconds
+        self._channel = channel
+        self._stop = Event()
+        self._thread: Thread | None = None
+        self._last_refresh = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._refresh()
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="catalog-snapshot-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._POLL_SECONDS * 5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Catalog snapshot listener failed; reconnecting.")
+                self._stop.wait(max(self._min_interval_seconds, self._POLL_SECONDS))
+
+    def _listen(self) -> None:
+        raw = self._engine.raw_connection()
+        # Conexao dedicada ao LISTEN; nao volta para o pool em autocommit.
+        raw.detach()
+        try:
+            conn = raw.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self._channel}"')
+            pending = False
+            while not self._stop.is_set():
+                readable, _, _ = select.select([conn], [], [], self._POLL_SECONDS)
+                if readable:
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        pending = True
+                elapsed = time.monotonic() - self._last_refresh
+                if (pending and elapsed >= self._min_interval_seconds) or elapsed >= self._interval_seconds:
+                    self._refresh()
+                    pending = False
+        finally:
+            raw.close()
+
+    def _refresh(self) -> None:
+        started = time.monotonic()
+        try:
+            snapshot = self._provider.refresh()
+        except Exception:
+            logger.exception("Catalog snapshot refresh failed; keeping previous snapshot.")
+        else:
+            logger.info(
+                "Catalog snapshot refreshed: %s pools in %.2fs.",
+                snapshot.pool_count,
+                time.monotonic() - started,
+            )
+        self._last_refresh = time.monotonic()
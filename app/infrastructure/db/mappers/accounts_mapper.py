@@ -23,6 +23,7 @@ def map_row_to_user(row: Mapping[str, Any]) -> User:
         stripe_customer_id=row.get("stripe_customer_id"),
         created_at=row["created_at"],
         updated_at=row["updated_at"],
+        entitlements_epoch=int(row.get("entitlements_epoch") or 0),
     )
 
 
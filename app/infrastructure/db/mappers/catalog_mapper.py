@@ -3,7 +3,17 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from app.domain.entities.catalog import Exchange, Network, PoolDetail, PoolSummary, Token
+from app.domain.entities.catalog import (
+    CatalogChain,
+    CatalogDex,
+    CatalogPool,
+    CatalogToken,
+    Exchange,
+    Network,
+    PoolDetail,
+    PoolSummary,
+    Token,
+)
 
 
 def map_row_to_exchange(row: Mapping[str, Any]) -> Exchange:
@@ -51,3 +61,43 @@ def map_row_to_pool_detail(row: Mapping[str, Any]) -> PoolDetail:
         token1_symbol=row["token1_symbol"],
         token1_decimals=row["token1_decimals"],
     )
+
+
+def map_row_to_catalog_dex(row: Mapping[str, Any]) -> CatalogDex:
+    return CatalogDex(
+        id=int(row["id"]),
+        key=row["dex_key"],
+        name=row["name"],
+        version=row.get("version"),
+        icon_url=row.get("icon_url"),
+    )
+
+
+def map_row_to_catalog_chain(row: Mapping[str, Any]) -> CatalogChain:
+    return CatalogChain(
+        id=int(row["id"]),
+        key=row["chain_key"],
+        name=row["name"],
+        icon_url=row.get("icon_url"),
+    )
+
+
+def map_row_to_catalog_token(row: Mapping[str, Any]) -> CatalogToken:
+    return CatalogToken(
+        chain_id=int(row["chain_id"]),
+        address=row["address"],
+        symbol=row.get("symbol"),
+        decimals=row.get("decimals"),
+        icon_url=row.get("icon_url"),
+    )
+
+
+def map_row_to_catalog_pool(row: Mapping[str, Any]) -> CatalogPool:
+    return CatalogPool(
+        chain_id=int(row["chain_id"]),
+        dex_id=int(row["dex_id"]),
+        pool_address=row["pool_address"],
+        fee_tier=int(row["fee_tier"]),
+        token0_address=row["token0_address"],
+        token1_address=row["token1_address"],
+    )
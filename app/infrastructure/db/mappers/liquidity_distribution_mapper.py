@@ -4,7 +4,11 @@ from collections.abc import Mapping
 from decimal import Decimal
 from typing import Any
 
-from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.domain.entities.liquidity_distribution import (
+    LiquidityDistributionBlockSnapshot,
+    LiquidityDistributionPool,
+    TickLiquidity,
+)
 
 
 def map_row_to_liquidity_pool(row: Mapping[str, Any]) -> LiquidityDistributionPool:
@@ -24,6 +28,10 @@ def map_row_to_liquidity_pool(row: Mapping[str, Any]) -> LiquidityDistributionPo
         onchain_liquidity=Decimal(str(row["onchain_liquidity"]))
         if row["onchain_liquidity"] is not None
         else None,
+        pool_address=str(row["pool_address"]).lower() if row.get("pool_address") is not None else None,
+        chain_id=int(row["chain_id"]) if row.get("chain_id") is not None else None,
+        dex_id=int(row["dex_id"]) if row.get("dex_id") is not None else None,
+        latest_period_start=row.get("latest_period_start"),
     )
 
 
@@ -32,3 +40,12 @@ def map_row_to_tick_liquidity(row: Mapping[str, Any]) -> TickLiquidity:
         tick_idx=row["tick_idx"],
         liquidity_net=Decimal(str(row["liquidity_net"])),
     )
+
+
+def map_row_to_block_snapshot(row: Mapping[str, Any]) -> LiquidityDistributionBlockSnapshot:
+    return LiquidityDistributionBlockSnapshot(
+        block_number=int(row["meta_block_number"]),
+        block_timestamp=int(row["meta_block_timestamp"]) if row["meta_block_timestamp"] is not None else None,
+        tick=int(row["tick"]) if row["tick"] is not None else None,
+        liquidity=Decimal(str(row["liquidity"])) if row["liquidity"] is not None else None,
+    )
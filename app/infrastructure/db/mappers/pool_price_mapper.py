@@ -4,7 +4,12 @@ from collections.abc import Mapping
 from decimal import Decimal
 from typing import Any
 
-from app.domain.entities.pool_price import PoolCurrentPrice, PoolPricePoint, PoolPriceStats
+from app.domain.entities.pool_price import (
+    PoolCurrentPrice,
+    PoolPriceCandle,
+    PoolPricePoint,
+    PoolPriceStats,
+)
 
 
 def map_row_to_pool_price_point(row: Mapping[str, Any]) -> PoolPricePoint:
@@ -19,6 +24,19 @@ def map_row_to_pool_price_stats(row: Mapping[str, Any]) -> PoolPriceStats:
         min_price=Decimal(str(row["min_price"])) if row["min_price"] is not None else None,
         max_price=Decimal(str(row["max_price"])) if row["max_price"] is not None else None,
         avg_price=Decimal(str(row["avg_price"])) if row["avg_price"] is not None else None,
+        avg_inverse_price=(
+            Decimal(str(row["avg_inverse_price"])) if row.get("avg_inverse_price") is not None else None
+        ),
+    )
+
+
+def map_row_to_pool_price_candle(row: Mapping[str, Any]) -> PoolPriceCandle:
+    return PoolPriceCandle(
+        timestamp=row["timestamp"],
+        open=Decimal(str(row["open_price"])),
+        high=Decimal(str(row["high_price"])),
+        low=Decimal(str(row["low_price"])),
+        close=Decimal(str(row["close_price"])),
     )
 
 
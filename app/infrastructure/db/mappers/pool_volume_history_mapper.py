@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from decimal import Decimal
+import math
 from typing import Any
 
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
 from app.domain.entities.pool_volume_history import (
+    PoolHourlyVolumePoint,
     PoolVolumeHistoryPoint,
-    PoolVolumeHistorySummaryBase,
-    PoolVolumeHistorySummaryPremium,
+    PoolVolumeHistoryWindow,
 )
 
 
@@ -20,29 +22,45 @@ def map_row_to_pool_volume_history_point(row: Mapping[str, Any]) -> PoolVolumeHi
     )
 
 
-def map_row_to_pool_volume_history_summary_base(row: Mapping[str, Any]) -> PoolVolumeHistorySummaryBase:
-    return PoolVolumeHistorySummaryBase(
-        tvl_usd=Decimal(str(row["tvl_usd"])) if row.get("tvl_usd") is not None else None,
-        avg_daily_fees_usd=Decimal(str(row["avg_daily_fees_usd"]))
-        if row.get("avg_daily_fees_usd") is not None
-        else None,
-        avg_daily_volume_usd=Decimal(str(row["avg_daily_volume_usd"]))
-        if row.get("avg_daily_volume_usd") is not None
-        else None,
-        token0_symbol=str(row["token0_symbol"]) if row.get("token0_symbol") is not None else None,
-        token1_symbol=str(row["token1_symbol"]) if row.get("token1_symbol") is not None else None,
+def map_rows_to_pool_volume_history_window(rows: Sequence[Mapping[str, Any]]) -> PoolVolumeHistoryWindow:
+    if not rows:
+        return PoolVolumeHistoryWindow()
+    head = rows[0]
+    return PoolVolumeHistoryWindow(
+        points=[map_row_to_pool_volume_history_point(row) for row in rows if row["time"] is not None],
+        tvl_usd=Decimal(str(head["tvl_usd"])) if head["tvl_usd"] is not None else None,
+        token0_symbol=str(head["token0_symbol"]) if head["token0_symbol"] is not None else None,
+        token1_symbol=str(head["token1_symbol"]) if head["token1_symbol"] is not None else None,
     )
 
 
-def map_row_to_pool_volume_history_summary_premium(
-    row: Mapping[str, Any],
-) -> PoolVolumeHistorySummaryPremium:
-    return PoolVolumeHistorySummaryPremium(
-        price_volatility_pct=Decimal(str(row["price_volatility_pct"]))
-        if row.get("price_volatility_pct") is not None
-        else None,
-        correlation=Decimal(str(row["correlation"])) if row.get("correlation") is not None else None,
-        geometric_mean_price=Decimal(str(row["geometric_mean_price"]))
-        if row.get("geometric_mean_price") is not None
-        else None,
+def map_rows_to_crypto_ohlc_daily_series(
+    rows: Sequence[Mapping[str, Any]],
+) -> dict[str, CryptoOhlcDailySeries]:
+    series: dict[str, CryptoOhlcDailySeries] = {}
+    for row in rows:
+        symbol = str(row["symbol"])
+        current = series.get(symbol)
+        if current is None:
+            current = CryptoOhlcDailySeries(symbol=symbol)
+            series[symbol] = current
+        current.day_starts.append(row["day_start"])
+        current.highs.append(_float_or_nan(row["high"]))
+        current.lows.append(_float_or_nan(row["low"]))
+        current.closes.append(_float_or_nan(row["close"]))
+    return series
+
+
+def _float_or_nan(value: Any) -> float:
+    return float(value) if value is not None else math.nan
+
+
+def map_row_to_pool_hourly_volume_point(row: Mapping[str, Any]) -> PoolHourlyVolumePoint:
+    return PoolHourlyVolumePoint(
+        hour_start=row["hour_start"],
+        chain_id=int(row["chain_id"]),
+        dex_id=int(row["dex_id"]),
+        volume_usd=Decimal(str(row["volume_usd"])) if row["volume_usd"] is not None else None,
+        fees_usd=Decimal(str(row["fees_usd"])) if row["fees_usd"] is not None else None,
+        tvl_usd=Decimal(str(row["tvl_usd"])) if row["tvl_usd"] is not None else None,
     )
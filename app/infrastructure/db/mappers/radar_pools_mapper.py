@@ -4,15 +4,24 @@ from collections.abc import Mapping
 from decimal import Decimal
 from typing import Any
 
-from app.domain.entities.radar_pools import RadarPoolAggregate
+from app.domain.entities.radar_pools import RadarPoolItem
 
 
-def map_row_to_radar_pool_aggregate(row: Mapping[str, Any]) -> RadarPoolAggregate:
-    return RadarPoolAggregate(
-        pool_id=row["pool_id"],
+def _decimal(value: Any) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
+
+
+def _optional_decimal(value: Any) -> Decimal | None:
+    return Decimal(str(value)) if value is not None else None
+
+
+def map_row_to_radar_pool_item(row: Mapping[str, Any]) -> RadarPoolItem:
+    return RadarPoolItem(
+        pool_id=int(row["pool_id"]),
         pool_address=row["pool_address"],
-        network_name=row["network_name"],
-        exchange_name=row["exchange_name"],
+        pool_name=row["pool_name"],
+        network=row["network"],
+        exchange=row["exchange"],
         dex_id=int(row["dex_id"]),
         chain_id=int(row["chain_id"]),
         token0_address=row["token0_address"],
@@ -21,14 +30,13 @@ def map_row_to_radar_pool_aggregate(row: Mapping[str, Any]) -> RadarPoolAggregat
         token1_symbol=row["token1_symbol"],
         token0_icon_url=row.get("token0_icon_url"),
         token1_icon_url=row.get("token1_icon_url"),
-        fee_tier=row["fee_tier"],
-        avg_tvl_usd=Decimal(str(row["avg_tvl_usd"])) if row["avg_tvl_usd"] is not None else None,
-        total_fees_usd=Decimal(str(row["total_fees_usd"])) if row["total_fees_usd"] is not None else None,
-        avg_hourly_fees_usd=Decimal(str(row["avg_hourly_fees_usd"]))
-        if row["avg_hourly_fees_usd"] is not None
-        else None,
-        avg_hourly_volume_usd=Decimal(str(row["avg_hourly_volume_usd"]))
-        if row["avg_hourly_volume_usd"] is not None
-        else None,
-        samples=int(row["samples"] or 0),
+        fee_tier=int(row["fee_tier"]),
+        average_apr=_decimal(row["average_apr"]),
+        price_volatility=_optional_decimal(row["price_volatility"]),
+        tvl_usd=_decimal(row["tvl_usd"]),
+        correlation=_optional_decimal(row["correlation"]),
+        avg_daily_fees_usd=_decimal(row["avg_daily_fees_usd"]),
+        daily_fees_tvl_pct=_decimal(row["daily_fees_tvl_pct"]),
+        avg_daily_volume_usd=_decimal(row["avg_daily_volume_usd"]),
+        daily_volume_tvl_pct=_decimal(row["daily_volume_tvl_pct"]),
     )
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from app.domain.entities.token_search import PoolTokenPair
+
+
+def map_row_to_pool_token_pair(row: Mapping[str, Any]) -> PoolTokenPair:
+    return PoolTokenPair(
+        chain_id=int(row["chain_id"]),
+        dex_id=int(row["dex_id"]),
+        pool_address=row["pool_address"],
+        token0_address=row["token0_address"],
+        token0_symbol=row.get("token0_symbol"),
+        token1_address=row["token1_address"],
+        token1_symbol=row.get("token1_symbol"),
+    )
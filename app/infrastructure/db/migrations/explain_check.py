@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+import json
+from typing import Any
+
+from sqlalchemy import text
+
+from app.infrastructure.db.engine import get_engine
+from app.infrastructure.db.repositories.accounts_repository import SqlAccountsRepository
+from app.infrastructure.db.repositories.liquidity_distribution_repository import (
+    SqlLiquidityDistributionRepository,
+)
+from app.infrastructure.db.repositories.pool_price_repository import SqlPoolPriceRepository
+from app.infrastructure.db.repositories.pool_volume_history_repository import (
+    SqlPoolVolumeHistoryRepository,
+)
+from app.shared.config import get_settings
+
+
+@dataclass(frozen=True)
+class SamplePool:
+    chain_id: int
+    dex_id: int
+    pool_address: str
+    pool_id: int
+    block_number: int
+
+
+@dataclass(frozen=True)
+class ExplainCheck:
+    name: str
+    # Chama o metodo do repositorio; a primeira consulta executada e a explicada.
+    run: Callable[[Any, SamplePool], object]
+    # Relacao -> indices aceitos; toda leitura da relacao precisa usar um deles.
+    expected_indexes: Mapping[str, frozenset[str]]
+
+
+@dataclass(frozen=True)
+class ScanNode:
+    node_type: str
+    relation: str | None
+    index_name: str | None
+
+
+EXPLAIN_CHECKS = (
+    ExplainCheck(
+        name="pool_price.get_latest_block_number",
+        run=lambda engine, pool: SqlPoolPriceRepository(engine).get_latest_block_number(
+            pool_address=pool.pool_address,
+            chain_id=pool.chain_id,
+            dex_id=pool.dex_id,
+        ),
+        expected_indexes={
+            "pool_state_snapshots": frozenset({"idx_pool_state_snapshots_key_block"}),
+        },
+    ),
+    ExplainCheck(
+        name="pool_price.get_price_window",
+        run=lambda engine, pool: SqlPoolPriceRepository(engine).get_price_window(
+            pool_address=pool.pool_address,
+            chain_id=pool.chain_id,
+            dex_id=pool.dex_id,
+            days=7,
+        ),
+        expected_indexes={
+            "pools": frozenset({"idx_pools_address_chain_dex"}),
+            "pool_state_snapshots": frozenset(
+                {"idx_pool_state_snapshots_price_key_ts", "idx_pool_state_snapshots_key_ts"}
+            ),
+        },
+    ),
+    ExplainCheck(
+        name="liquidity_distribution.get_latest_block_number",
+        run=lambda engine, pool: SqlLiquidityDistributionRepository(
+            engine, min_tvl_usd=Decimal("0")
+        ).get_latest_block_number(pool_id=pool.pool_id),
+        expected_indexes={
+            "pools": frozenset({"idx_pools_legacy_pool_id"}),
+            "pool_state_snapshots": frozenset({"idx_pool_state_snapshots_key_block"}),
+        },
+    ),
+    ExplainCheck(
+        name="liquidity_distribution.get_tick_history_complete_block",
+        run=lambda engine, pool: SqlLiquidityDistributionRepository(
+            engine, min_tvl_usd=Decimal("0")
+        ).get_tick_history_complete_block(pool_id=pool.pool_id),
+        expected_indexes={
+            "pools": frozenset({"idx_pools_legacy_pool_id"}),
+            "tick_snapshot_coverage": frozenset({"tick_snapshot_coverage_pkey"}),
+        },
+    ),
+    ExplainCheck(
+        name="liquidity_distribution.get_ticks_at_block",
+        run=lambda engine, pool: SqlLiquidityDistributionRepository(
+            engine, min_tvl_usd=Decimal("0")
+        ).get_ticks_at_block(
+            pool_address=pool.pool_address,
+            chain_id=pool.chain_id,
+            dex_id=pool.dex_id,
+            block_number=pool.block_number,
+        ),
+        expected_indexes={
+            "tick_snapshot": frozenset({"idx_tick_snapshot_key_tick_block"}),
+        },
+    ),
+    ExplainCheck(
+        name="pool_volume_history.get_volume_history_window",
+        run=lambda engine, pool: SqlPoolVolumeHistoryRepository(engine).get_volume_history_window(
+            pool_address=pool.pool_address,
+            days=30,
+            chain_id=pool.chain_id,
+            dex_id=pool.dex_id,
+        ),
+        expected_indexes={
+            "pools": frozenset({"idx_pools_address_chain_dex"}),
+            "tokens": frozenset({"idx_tokens_chain_address"}),
+            # Com chain_id/dex_id informados a PK tambem serve a consulta.
+            "pool_daily": frozenset({"idx_pool_daily_address_key_day", "pool_daily_pkey"}),
+        },
+    ),
+    ExplainCheck(
+        name="accounts.get_user_by_email",
+        run=lambda engine, pool: SqlAccountsRepository(engine).get_user_by_email(
+            email="explain-check@example.com"
+        ),
+        expected_indexes={"users": frozenset({"idx_users_email_lower"})},
+    ),
+)
+
+
+class _PlanCaptured(Exception):
+    def __init__(self, plan: Mapping[str, Any]):
+        super().__init__("plan captured")
+        self.plan = plan
+
+
+class _ExplainConnection:
+    # Troca a execucao pelo EXPLAIN da mesma consulta com os mesmos parametros e
+    # interrompe o repositorio antes de ele tentar ler o resultado.
+    def __init__(self, conn):
+        self._conn = conn
+
+    def execution_options(self, **options):
+        return self
+
+    def execute(self, statement, parameters=None):
+        raw_plan = self._conn.execute(
+            text(f"EXPLAIN (FORMAT JSON) {statement.text}"),
+            parameters or {},
+        ).scalar_one()
+        document = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+        raise _PlanCaptured(document[0]["Plan"])
+
+
+class _ExplainEngine:
+    def __init__(self, engine, *, disable_seqscan: bool):
+        self._engine = engine
+        self._disable_seqscan = disable_seqscan
+
+    @contextmanager
+    def connect(self):
+        # Nada e commitado: o SET LOCAL morre no rollback ao fechar a conexao.
+        with self._engine.connect() as conn:
+            if self._disable_seqscan:
+                conn.execute(text("SET LOCAL enable_seqscan = off"))
+            yield _ExplainConnection(conn)
+
+    begin = connect
+
+
+def capture_plan(
+    engine,
+    check: ExplainCheck,
+    pool: SamplePool,
+    *,
+    disable_seqscan: bool = False,
+) -> Mapping[str, Any]:
+    try:
+        check.run(_ExplainEngine(engine, disable_seqscan=disable_seqscan), pool)
+    except _PlanCaptured as captured:
+        return captured.plan
+    raise RuntimeError(f"{check.name} nao executou nenhuma consulta.")
+
+
+def iter_scan_nodes(plan: Mapping[str, Any], *, bitmap_relation: str | None = None) -> Iterator[ScanNode]:
+    node_type = plan.get("Node Type", "")
+    # Bitmap Heap Scan le a tabela pelos Bitmap Index Scan filhos, que nao
+    # trazem "Relation Name"; cada um vira uma leitura da tabela pelo indice.
+    if node_type in ("Bitmap Heap Scan", "BitmapAnd", "BitmapOr"):
+        relation = plan.get("Relation Name", bitmap_relation)
+        for child in plan.get("Plans", ()):
+            yield from iter_scan_nodes(child, bitmap_relation=relation)
+        return
+    yield ScanNode(
+        node_type=node_type,
+        relation=plan.get("Relation Name", bitmap_relation),
+        index_name=plan.get("Index Name"),
+    )
+    for child in plan.get("Plans", ()):
+        yield from iter_scan_nodes(child)
+
+
+def check_expected_indexes(
+    plan: Mapping[str, Any],
+    expected_indexes: Mapping[str, frozenset[str]],
+) -> list[str]:
+    # Devolve os problemas encontrados; vazio se cada leitura de cada relacao
+    # esperada usar um dos indices aceitos.
+    problems: list[str] = []
+    nodes = list(iter_scan_nodes(plan))
+    for relation, accepted in sorted(expected_indexes.items()):
+        scans = [node for node in nodes if node.relation == relation]
+        if not scans:
+            problems.append(f"{relation}: ausente do plano")
+            continue
+        for node in scans:
+            if node.index_name is None:
+                problems.append(f"{relation}: {node.node_type}")
+            elif node.index_name not in accepted:
+                problems.append(f"{relation}: {node.index_name} (esperado {', '.join(sorted(accepted))})")
+    return problems
+
+
+def load_sample_pool(engine) -> SamplePool:
+    with engine.connect() as conn:
+        sample = conn.execute(
+            text(
+                """
+                SELECT p.chain_id, p.dex_id, p.pool_address
+                FROM public.pools p
+                LIMIT 1
+                """
+            )
+        ).mappings().first()
+    if sample is None:
+        raise SystemExit("public.pools esta vazia; nada para verificar.")
+
+    pools = SqlLiquidityDistributionRepository(engine, min_tvl_usd=Decimal("0")).find_pools_by_address(
+        pool_address=sample["pool_address"],
+        chain_id=sample["chain_id"],
+        dex_id=sample["dex_id"],
+    )
+    block_number = SqlPoolPriceRepository(engine).get_latest_block_number(
+        pool_address=sample["pool_address"],
+        chain_id=sample["chain_id"],
+        dex_id=sample["dex_id"],
+    )
+    return SamplePool(
+        chain_id=sample["chain_id"],
+        dex_id=sample["dex_id"],
+        pool_address=sample["pool_address"],
+        pool_id=pools[0].id,
+        block_number=block_number or 0,
+    )
+
+
+def run_explain_checks(engine, *, disable_seqscan: bool = False) -> dict[str, list[str]]:
+    pool = load_sample_pool(engine)
+    return {
+        check.name: check_expected_indexes(
+            capture_plan(engine, check, pool, disable_seqscan=disable_seqscan),
+            check.expected_indexes,
+        )
+        for check in EXPLAIN_CHECKS
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Roda EXPLAIN nas consultas reais dos repositorios e falha se alguma "
+            "nao usar os indices esperados."
+        )
+    )
+    parser.add_argument(
+        "--disable-seqscan",
+        action="store_true",
+        help=(
+            "SET LOCAL enable_seqscan = off; em bases pequenas (dev) o custo "
+            "favorece Seq Scan mesmo com o indice certo."
+        ),
+    )
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    results = run_explain_checks(engine, disable_seqscan=args.disable_seqscan)
+    for name, problems in results.items():
+        print(f"{name}: {'ok' if not problems else '; '.join(problems)}")
+    failures = [name for name, problems in results.items() if problems]
+    if failures:
+        raise SystemExit(f"Consultas fora dos indices esperados: {', '.join(failures)}")
+
+
+if __name__ == "__main__":
+    main()
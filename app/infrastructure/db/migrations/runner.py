@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import re
+
+from sqlalchemy import text
+
+from app.infrastructure.db.engine import get_engine
+from app.shared.config import get_settings
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "sql"
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+_FILENAME_PATTERN = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+DDL_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS public.schema_migrations (
+        version text PRIMARY KEY,
+        name text NOT NULL,
+        checksum text NOT NULL,
+        applied_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    name: str
+    statements: tuple[str, ...]
+    checksum: str
+    transactional: bool
+
+
+_DOLLAR_QUOTE = re.compile(r"\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$")
+
+
+def split_statements(sql: str) -> tuple[str, ...]:
+    # Separa por ';' fora de literais '...' e de corpos $tag$...$tag$ (funcoes);
+    # comentarios '--' fora de literais sao descartados.
+    statements: list[str] = []
+    current: list[str] = []
+    index = 0
+    while index < len(sql):
+        char = sql[index]
+        if sql.startswith("--", index):
+            end = sql.find("\n", index)
+            index = len(sql) if end == -1 else end
+            continue
+        if char == "'":
+            end = index + 1
+            while True:
+                end = sql.find("'", end)
+                if end == -1:
+                    raise ValueError("Unterminated string literal in migration.")
+                if sql.startswith("''", end):
+                    end += 2
+                    continue
+                break
+            current.append(sql[index : end + 1])
+            index = end + 1
+            continue
+        dollar = _DOLLAR_QUOTE.match(sql, index) if char == "$" else None
+        if dollar is not None:
+            tag = dollar.group(0)
+            end = sql.find(tag, dollar.end())
+            if end == -1:
+                raise ValueError(f"Unterminated {tag} block in migration.")
+            current.append(sql[index : end + len(tag)])
+            index = end + len(tag)
+            continue
+        if char == ";":
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        index += 1
+    statements.append("".join(current).strip())
+    return tuple(statement for statement in statements if statement)
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations: list[Migration] = []
+    for path in sorted(directory.glob("*.sql")):
+        match = _FILENAME_PATTERN.match(path.name)
+        if match is None:
+            raise ValueError(f"Invalid migration filename: {path.name}")
+        sql = path.read_text(encoding="utf-8")
+        migrations.append(
+            Migration(
+                version=match.group(1),
+                name=match.group(2),
+                statements=split_statements(sql),
+                checksum=hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+                transactional=NO_TRANSACTION_MARKER not in sql,
+            )
+        )
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicated migration version.")
+    return migrations
+
+
+def ensure_schema_migrations(engine) -> None:
+    with engine.begin() as conn:
+        for statement in DDL_STATEMENTS:
+            conn.execute(text(statement))
+
+
+def applied_checksums(engine) -> dict[str, str]:
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT version, checksum FROM public.schema_migrations")).mappings().all()
+    return {row["version"]: row["checksum"] for row in rows}
+
+
+def pending_migrations(migrations: list[Migration], applied: dict[str, str]) -> list[Migration]:
+    for migration in migrations:
+        checksum = applied.get(migration.version)
+        if checksum is not None and checksum != migration.checksum:
+            raise ValueError(
+                f"Migration {migration.version}_{migration.name} changed after being applied; "
+                "create a new migration instead."
+            )
+    return [migration for migration in migrations if migration.version not in applied]
+
+
+def apply_migration(engine, migration: Migration) -> None:
+    record = text(
+        """
+        INSERT INTO public.schema_migrations (version, name, checksum)
+        VALUES (:version, :name, :checksum)
+        """
+    )
+    params = {"version": migration.version, "name": migration.name, "checksum": migration.checksum}
+    if migration.transactional:
+        with engine.begin() as conn:
+            for statement in migration.statements:
+                conn.exec_driver_sql(statement)
+            conn.execute(record, params)
+        return
+    # CREATE INDEX CONCURRENTLY: um statement por vez em autocommit; so registra no fim.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for statement in migration.statements:
+            conn.exec_driver_sql(statement)
+        conn.execute(record, params)
+
+
+def migrate(engine, *, directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    ensure_schema_migrations(engine)
+    pending = pending_migrations(load_migrations(directory), applied_checksums(engine))
+    for migration in pending:
+        apply_migration(engine, migration)
+    return pending
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aplica as migracoes SQL versionadas pendentes.")
+    parser.add_argument("--list", action="store_true", help="Somente lista as migracoes pendentes.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.postgres_dsn:
+        raise SystemExit("POSTGRES_DSN is not configured.")
+    engine = get_engine(settings.postgres_dsn)
+
+    if args.list:
+        ensure_schema_migrations(engine)
+        for migration in pending_migrations(load_migrations(), applied_checksums(engine)):
+            print(f"pendente: {migration.version}_{migration.name}")
+        return
+    for migration in migrate(engine):
+        print(f"aplicada: {migration.version}_{migration.name} ({len(migration.statements)} statements)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+-- migrate: no-transaction
+-- Indices das consultas quentes dos repositorios. CONCURRENTLY nao bloqueia a
+-- ingestao, mas nao roda em transacao: se um CREATE falhar, o indice fica
+-- INVALID; remova-o com DROP INDEX CONCURRENTLY e rode o runner de novo.
+
+-- pools: lookup por endereco com ou sem chain_id/dex_id (simulate, pool price,
+-- volume history, liquidity distribution, allocate).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pools_address_chain_dex
+ON public.pools (pool_address, chain_id, dex_id);
+
+-- pools: pool_id numerico legado da liquidity distribution (mesma expressao do repositorio).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pools_legacy_pool_id
+ON public.pools (
+    (
+        (
+            'x' || substr(
+                md5(
+                    dex_id::text || ':' || chain_id::text || ':' || pool_address
+                ),
+                1,
+                8
+            )
+        )::bit(32)::int & 2147483647
+    )
+);
+
+-- tokens: joins t0/t1 por (chain_id, address) em quase todas as consultas de pool.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tokens_chain_address
+ON public.tokens (chain_id, address);
+
+-- pool_state_snapshots: ultimo snapshot/bloco da pool (ORDER BY meta_block_number DESC LIMIT 1, max()).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_state_snapshots_key_block
+ON public.pool_state_snapshots (chain_id, dex_id, pool_address, meta_block_number DESC);
+
+-- pool_state_snapshots: snapshot por timestamp (simulate v2, preco atual, janelas de APR).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_state_snapshots_key_ts
+ON public.pool_state_snapshots (chain_id, dex_id, pool_address, meta_block_timestamp DESC, meta_block_number DESC);
+
+-- pool_ticks_initialized: ticks com liquidez de uma pool em um intervalo de tick_idx.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_ticks_initialized_key_tick
+ON public.pool_ticks_initialized (chain_id, dex_id, pool_address, tick_idx)
+WHERE liquidity_net IS NOT NULL;
+
+-- pool_hourly: volume history e simulate (pool_address sempre presente, chain/dex opcionais).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_hourly_address_key_hour
+ON public.pool_hourly (pool_address, chain_id, dex_id, hour_start);
+
+-- pool_hourly: versao/ETag do radar (max(hour_start) global).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_hourly_hour_start
+ON public.pool_hourly (hour_start);
+
+-- users: login por e-mail (lower(email) = :email).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_lower
+ON public.users (lower(email));
@@ -0,0 +1,5 @@
+-- Epoca de entitlements por usuario. O access token carrega a epoca em que foi
+-- emitido; webhooks de assinatura incrementam a coluna e require_feature deixa
+-- de confiar nas claims de plano/features de tokens com epoca antiga.
+ALTER TABLE public.users
+ADD COLUMN IF NOT EXISTS entitlements_epoch integer NOT NULL DEFAULT 0;
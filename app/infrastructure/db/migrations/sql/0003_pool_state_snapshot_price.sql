@@ -0,0 +1,52 @@
+-- Preco token1/token0 por snapshot, calculado na escrita a partir de
+-- sqrt_price_x96 e dos decimals dos tokens. Linhas antigas ficam NULL ate o
+-- backfill (python -m app.infrastructure.db.backfills.pool_state_snapshot_price).
+ALTER TABLE public.pool_state_snapshots
+ADD COLUMN IF NOT EXISTS price_token1_per_token0 double precision;
+
+CREATE OR REPLACE FUNCTION public.pool_state_snapshots_set_price()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    dec0 integer;
+    dec1 integer;
+    sqrt_price_x96 text := NEW.sqrt_price_x96;
+BEGIN
+    NEW.price_token1_per_token0 := NULL;
+    IF sqrt_price_x96 IS NULL OR sqrt_price_x96 !~ '^[0-9]+$' OR sqrt_price_x96 = '0' THEN
+        RETURN NEW;
+    END IF;
+
+    SELECT t0.decimals, t1.decimals
+      INTO dec0, dec1
+      FROM public.pools p
+      LEFT JOIN public.tokens t0
+        ON t0.chain_id = p.chain_id
+       AND t0.address = p.token0_address
+      LEFT JOIN public.tokens t1
+        ON t1.chain_id = p.chain_id
+       AND t1.address = p.token1_address
+     WHERE p.dex_id = NEW.dex_id
+       AND p.chain_id = NEW.chain_id
+       AND p.pool_address = NEW.pool_address
+     LIMIT 1;
+    IF NOT FOUND THEN
+        RETURN NEW;
+    END IF;
+
+    NEW.price_token1_per_token0 := (
+        power((sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
+        * power(10::numeric, COALESCE(dec0, 0) - COALESCE(dec1, 0))
+    )::double precision;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_pool_state_snapshots_set_price ON public.pool_state_snapshots;
+
+CREATE TRIGGER trg_pool_state_snapshots_set_price
+BEFORE INSERT OR UPDATE OF sqrt_price_x96, pool_address, chain_id, dex_id
+ON public.pool_state_snapshots
+FOR EACH ROW
+EXECUTE FUNCTION public.pool_state_snapshots_set_price();
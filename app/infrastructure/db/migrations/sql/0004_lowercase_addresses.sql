@@ -0,0 +1,62 @@
+-- Enderecos sempre em minusculas na escrita (inclusive da ingestao externa);
+-- as consultas comparam a coluna crua. Linhas antigas: rode
+-- python -m app.infrastructure.db.backfills.lowercase_addresses.
+-- O prefixo "lowercase" ordena os triggers antes dos demais BEFORE da tabela
+-- (ex.: trg_pool_state_snapshots_set_price ja ve o endereco normalizado).
+CREATE OR REPLACE FUNCTION public.lowercase_address_columns()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    column_name text;
+    patch jsonb := '{}'::jsonb;
+BEGIN
+    FOREACH column_name IN ARRAY TG_ARGV LOOP
+        patch := patch || jsonb_build_object(column_name, lower(to_jsonb(NEW) ->> column_name));
+    END LOOP;
+    NEW := jsonb_populate_record(NEW, patch);
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_pools_lowercase_addresses ON public.pools;
+CREATE TRIGGER trg_pools_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address, token0_address, token1_address
+ON public.pools
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address', 'token0_address', 'token1_address');
+
+DROP TRIGGER IF EXISTS trg_tokens_lowercase_addresses ON public.tokens;
+CREATE TRIGGER trg_tokens_lowercase_addresses
+BEFORE INSERT OR UPDATE OF address
+ON public.tokens
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('address');
+
+DROP TRIGGER IF EXISTS trg_pool_state_snapshots_lowercase_addresses ON public.pool_state_snapshots;
+CREATE TRIGGER trg_pool_state_snapshots_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address
+ON public.pool_state_snapshots
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address');
+
+DROP TRIGGER IF EXISTS trg_pool_hourly_lowercase_addresses ON public.pool_hourly;
+CREATE TRIGGER trg_pool_hourly_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address
+ON public.pool_hourly
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address');
+
+DROP TRIGGER IF EXISTS trg_pool_ticks_initialized_lowercase_addresses ON public.pool_ticks_initialized;
+CREATE TRIGGER trg_pool_ticks_initialized_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address
+ON public.pool_ticks_initialized
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address');
+
+DROP TRIGGER IF EXISTS trg_tick_snapshot_lowercase_addresses ON apr_exact.tick_snapshot;
+CREATE TRIGGER trg_tick_snapshot_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address
+ON apr_exact.tick_snapshot
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address');
@@ -0,0 +1,67 @@
+-- Rollup diario (dia UTC) de public.pool_hourly, mantido por
+-- public.refresh_pool_daily na ingestao horaria; historico antigo:
+-- python -m app.infrastructure.db.backfills.pool_daily --all.
+CREATE TABLE IF NOT EXISTS public.pool_daily (
+    chain_id integer NOT NULL,
+    dex_id integer NOT NULL,
+    pool_address text NOT NULL,
+    day_utc date NOT NULL,
+    volume_usd numeric,
+    fees_usd numeric NOT NULL DEFAULT 0,
+    tvl_usd_sum numeric,
+    tvl_usd_samples integer NOT NULL DEFAULT 0,
+    hour_samples integer NOT NULL DEFAULT 0,
+    last_tvl_usd numeric,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (chain_id, dex_id, pool_address, day_utc)
+);
+
+-- Chamada pelo job de ingestao horaria: SELECT public.refresh_pool_daily(current_date - 1, current_date)
+CREATE OR REPLACE FUNCTION public.refresh_pool_daily(from_day date, to_day date)
+RETURNS bigint
+LANGUAGE sql
+AS $$
+    WITH upserted AS (
+        INSERT INTO public.pool_daily (
+            chain_id,
+            dex_id,
+            pool_address,
+            day_utc,
+            volume_usd,
+            fees_usd,
+            tvl_usd_sum,
+            tvl_usd_samples,
+            hour_samples,
+            last_tvl_usd,
+            updated_at
+        )
+        SELECT
+            h.chain_id,
+            h.dex_id,
+            h.pool_address,
+            date_trunc('day', h.hour_start AT TIME ZONE 'UTC')::date,
+            SUM(h.volume_usd),
+            SUM(COALESCE(h.fees_usd, 0)),
+            SUM(h.tvl_usd),
+            COUNT(h.tvl_usd),
+            COUNT(*),
+            (array_agg(h.tvl_usd ORDER BY h.hour_start DESC))[1],
+            now()
+        FROM public.pool_hourly h
+        -- Limites em UTC, como o agrupamento: no fuso da sessao os dias das
+        -- bordas entrariam com somas parciais e sobrescreveriam os totais.
+        WHERE h.hour_start >= (from_day::timestamp AT TIME ZONE 'UTC')
+          AND h.hour_start < ((to_day + 1)::timestamp AT TIME ZONE 'UTC')
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (chain_id, dex_id, pool_address, day_utc) DO UPDATE
+        SET volume_usd = EXCLUDED.volume_usd,
+            fees_usd = EXCLUDED.fees_usd,
+            tvl_usd_sum = EXCLUDED.tvl_usd_sum,
+            tvl_usd_samples = EXCLUDED.tvl_usd_samples,
+            hour_samples = EXCLUDED.hour_samples,
+            last_tvl_usd = EXCLUDED.last_tvl_usd,
+            updated_at = EXCLUDED.updated_at
+        RETURNING 1
+    )
+    SELECT count(*) FROM upserted
+$$;
@@ -0,0 +1,120 @@
+-- Agregados por janela padrao (PRECOMPUTED_TIMEFRAMES) lidos pelo radar,
+-- recalculados por python -m app.infrastructure.db.backfills.radar_pool_aggregates
+-- apos refresh_pool_daily na ingestao horaria.
+CREATE TABLE IF NOT EXISTS public.radar_pool_aggregates (
+    timeframe_days integer NOT NULL,
+    chain_id integer NOT NULL,
+    dex_id integer NOT NULL,
+    pool_address text NOT NULL,
+    pool_id bigint NOT NULL,
+    network_name text NOT NULL,
+    exchange_name text NOT NULL,
+    token0_address text NOT NULL,
+    token1_address text NOT NULL,
+    token0_symbol text NOT NULL,
+    token1_symbol text NOT NULL,
+    token0_icon_url text,
+    token1_icon_url text,
+    fee_tier integer NOT NULL,
+    avg_tvl_usd numeric,
+    total_fees_usd numeric,
+    avg_hourly_fees_usd numeric,
+    avg_hourly_volume_usd numeric,
+    samples bigint NOT NULL DEFAULT 0,
+    refreshed_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (timeframe_days, chain_id, dex_id, pool_address)
+);
+
+-- Bases criadas antes das metricas de preco.
+ALTER TABLE public.radar_pool_aggregates
+ADD COLUMN IF NOT EXISTS price_volatility numeric,
+ADD COLUMN IF NOT EXISTS correlation numeric;
+
+-- Recalcula todas as janelas em uma transacao: leitores veem o snapshot
+-- anterior ate o commit.
+CREATE OR REPLACE FUNCTION public.refresh_radar_pool_aggregates(timeframes integer[])
+RETURNS bigint
+LANGUAGE sql
+AS $$
+    DELETE FROM public.radar_pool_aggregates
+    WHERE timeframe_days = ANY(timeframes);
+
+    WITH inserted AS (
+        INSERT INTO public.radar_pool_aggregates (
+            timeframe_days,
+            chain_id,
+            dex_id,
+            pool_address,
+            pool_id,
+            network_name,
+            exchange_name,
+            token0_address,
+            token1_address,
+            token0_symbol,
+            token1_symbol,
+            token0_icon_url,
+            token1_icon_url,
+            fee_tier,
+            avg_tvl_usd,
+            total_fees_usd,
+            avg_hourly_fees_usd,
+            avg_hourly_volume_usd,
+            samples,
+            refreshed_at
+        )
+        SELECT
+            tf.days,
+            p.chain_id,
+            p.dex_id,
+            p.pool_address,
+            ABS(hashtext(p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address)::bigint),
+            c.name,
+            d.name,
+            p.token0_address,
+            p.token1_address,
+            COALESCE(t0.symbol, p.token0_address),
+            COALESCE(t1.symbol, p.token1_address),
+            t0.icon_url,
+            t1.icon_url,
+            COALESCE(p.fee_tier, 0),
+            SUM(pd.tvl_usd_sum) / NULLIF(SUM(pd.tvl_usd_samples), 0),
+            SUM(pd.fees_usd),
+            SUM(pd.fees_usd) / NULLIF(SUM(pd.hour_samples), 0),
+            SUM(COALESCE(pd.volume_usd, 0)) / NULLIF(SUM(pd.hour_samples), 0),
+            SUM(pd.hour_samples),
+            now()
+        FROM unnest(timeframes) AS tf(days)
+        JOIN public.pool_daily pd
+          ON pd.day_utc >= ((now() AT TIME ZONE 'UTC') - tf.days * interval '1 day')::date
+        JOIN public.pools p
+          ON p.dex_id = pd.dex_id
+         AND p.chain_id = pd.chain_id
+         AND p.pool_address = pd.pool_address
+        JOIN public.chains c
+          ON c.chain_id = p.chain_id
+        JOIN public.dexes d
+          ON d.dex_id = p.dex_id
+        LEFT JOIN public.tokens t0
+          ON t0.chain_id = p.chain_id
+         AND t0.address = p.token0_address
+        LEFT JOIN public.tokens t1
+          ON t1.chain_id = p.chain_id
+         AND t1.address = p.token1_address
+        GROUP BY
+            tf.days,
+            p.dex_id,
+            p.chain_id,
+            p.pool_address,
+            p.token0_address,
+            p.token1_address,
+            c.name,
+            d.name,
+            COALESCE(t0.symbol, p.token0_address),
+            COALESCE(t1.symbol, p.token1_address),
+            t0.icon_url,
+            t1.icon_url,
+            COALESCE(p.fee_tier, 0)
+        RETURNING 1
+    )
+    SELECT count(*) FROM inserted
+$$;
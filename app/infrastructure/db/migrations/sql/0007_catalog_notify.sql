@@ -0,0 +1,40 @@
+-- NOTIFY em catalog_changed (CATALOG_CHANGED_CHANNEL) a cada comando que altera
+-- o catalogo; as APIs recarregam a foto em memoria (catalog_snapshot_refresher).
+CREATE OR REPLACE FUNCTION public.notify_catalog_changed()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('catalog_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$;
+
+-- Por statement: um NOTIFY por comando da ingestao, nao por linha.
+DROP TRIGGER IF EXISTS trg_pools_notify_catalog_changed ON public.pools;
+CREATE TRIGGER trg_pools_notify_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+ON public.pools
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.notify_catalog_changed();
+
+DROP TRIGGER IF EXISTS trg_tokens_notify_catalog_changed ON public.tokens;
+CREATE TRIGGER trg_tokens_notify_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+ON public.tokens
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.notify_catalog_changed();
+
+DROP TRIGGER IF EXISTS trg_dexes_notify_catalog_changed ON public.dexes;
+CREATE TRIGGER trg_dexes_notify_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+ON public.dexes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.notify_catalog_changed();
+
+DROP TRIGGER IF EXISTS trg_chains_notify_catalog_changed ON public.chains;
+CREATE TRIGGER trg_chains_notify_catalog_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+ON public.chains
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.notify_catalog_changed();
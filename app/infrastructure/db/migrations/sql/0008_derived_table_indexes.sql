@@ -0,0 +1,26 @@
+-- migrate: no-transaction
+-- Indices das tabelas/colunas criadas em 0003-0006 e do DISTINCT ON sobre
+-- apr_exact.tick_snapshot. Mesmo cuidado do 0001 com indices INVALID.
+
+-- pool_state_snapshots: janelas de preco (pool price, export, stats).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_state_snapshots_price_key_ts
+ON public.pool_state_snapshots (chain_id, dex_id, pool_address, meta_block_timestamp)
+INCLUDE (price_token1_per_token0)
+WHERE price_token1_per_token0 IS NOT NULL;
+
+-- pool_daily: volume history por pool (chain_id/dex_id opcionais) e ultimo TVL.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_daily_address_key_day
+ON public.pool_daily (pool_address, chain_id, dex_id, day_utc);
+
+-- pool_daily: janelas do refresh do radar (day_utc >= inicio da janela).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pool_daily_day
+ON public.pool_daily (day_utc);
+
+-- Substituido por idx_pool_daily_address_key_day (criado pelo DDL antigo do backfill).
+DROP INDEX CONCURRENTLY IF EXISTS public.idx_pool_daily_pool_day;
+
+-- apr_exact.tick_snapshot: estado de cada tick em um bloco
+-- (DISTINCT ON (tick_idx) ... ORDER BY tick_idx, block_number DESC).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tick_snapshot_key_tick_block
+ON apr_exact.tick_snapshot (chain_id, dex_id, pool_address, tick_idx, block_number DESC)
+INCLUDE (liquidity_net);
@@ -0,0 +1,27 @@
+-- Snapshots gravados antes da linha em public.pools ficam com preco NULL
+-- (trg_pool_state_snapshots_set_price nao acha os decimals). Ao inserir a
+-- pool, reaplica o trigger de preco nesses snapshots: o SET em sqrt_price_x96
+-- dispara o BEFORE UPDATE OF sqrt_price_x96 sem mudar o valor.
+CREATE OR REPLACE FUNCTION public.pools_fill_pending_snapshot_prices()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE public.pool_state_snapshots s
+       SET sqrt_price_x96 = s.sqrt_price_x96
+     WHERE s.chain_id = NEW.chain_id
+       AND s.dex_id = NEW.dex_id
+       AND s.pool_address = NEW.pool_address
+       AND s.price_token1_per_token0 IS NULL
+       AND s.sqrt_price_x96 ~ '^[0-9]+$'
+       AND s.sqrt_price_x96 <> '0';
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_pools_fill_pending_snapshot_prices ON public.pools;
+CREATE TRIGGER trg_pools_fill_pending_snapshot_prices
+AFTER INSERT
+ON public.pools
+FOR EACH ROW
+EXECUTE FUNCTION public.pools_fill_pending_snapshot_prices();
@@ -0,0 +1,23 @@
+-- Ate qual bloco a ingestao de ticks ja gravou todas as mudancas de tick da
+-- pool em apr_exact.tick_snapshot. O fluxo on-demand do simulate grava so
+-- combinacoes (bloco, tick) avulsas e nunca escreve aqui. A curva historica
+-- de um bloco so e tratada como imutavel (Cache-Control immutable e cache por
+-- bloco) quando block_number <= complete_through_block.
+-- Mantida pelo job de ingestao:
+--   INSERT ... ON CONFLICT (chain_id, dex_id, pool_address)
+--   DO UPDATE SET complete_through_block = EXCLUDED.complete_through_block, updated_at = now()
+CREATE TABLE IF NOT EXISTS apr_exact.tick_snapshot_coverage (
+    chain_id integer NOT NULL,
+    dex_id integer NOT NULL,
+    pool_address text NOT NULL,
+    complete_through_block bigint NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (chain_id, dex_id, pool_address)
+);
+
+DROP TRIGGER IF EXISTS trg_tick_snapshot_coverage_lowercase_addresses ON apr_exact.tick_snapshot_coverage;
+CREATE TRIGGER trg_tick_snapshot_coverage_lowercase_addresses
+BEFORE INSERT OR UPDATE OF pool_address
+ON apr_exact.tick_snapshot_coverage
+FOR EACH ROW
+EXECUTE FUNCTION public.lowercase_address_columns('pool_address');
@@ -22,6 +22,7 @@ class UserModel(Base):
     stripe_customer_id: Mapped[str | None] = mapped_column(Text, nullable=True, unique=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    entitlements_epoch: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
 
 
 class AuthIdentityModel(Base):
@@ -48,7 +48,8 @@ class SqlAccountsRepository(AuthPort, EntitlementsPort):
 
     def get_user_by_id(self, *, user_id: str):
         sql = """
-            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at
+            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at,
+                   entitlements_epoch
             FROM public.users
             WHERE id = :user_id
             LIMIT 1
@@ -61,7 +62,8 @@ class SqlAccountsRepository(AuthPort, EntitlementsPort):
 
     def get_user_by_email(self, *, email: str):
         sql = """
-            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at
+            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at,
+                   entitlements_epoch
             FROM public.users
             WHERE lower(email) = :email
             LIMIT 1
@@ -74,7 +76,8 @@ class SqlAccountsRepository(AuthPort, EntitlementsPort):
 
     def get_user_by_stripe_customer_id(self, *, stripe_customer_id: str):
         sql = """
-            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at
+            SELECT id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at,
+                   entitlements_epoch
             FROM public.users
             WHERE stripe_customer_id = :stripe_customer_id
             LIMIT 1
@@ -102,7 +105,8 @@ class SqlAccountsRepository(AuthPort, EntitlementsPort):
             ) VALUES (
                 :id, :name, :email, :email_verified, :is_active, :created_at, :updated_at
             )
-            RETURNING id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at
+            RETURNING id, name, email, email_verified, is_active, stripe_customer_id, created_at, updated_at,
+                      entitlements_epoch
         """
         params = {
             "id": user_id,
@@ -143,6 +147,18 @@ class SqlAccountsRepository(AuthPort, EntitlementsPort):
                 },
             )
 
+    def increment_user_entitlements_epoch(self, *, user_id: str) -> int:
+        sql = """
+            UPDATE public.users
+            SET entitlements_epoch = entitlements_epoch + 1,
+                updated_at = now()
+            WHERE id = :user_id
+            RETURNING entitlements_epoch
+        """
+        with self._begin() as conn:
+            epoch = conn.execute(text(sql), {"user_id": user_id}).scalar_one_or_none()
+        return int(epoch or 0)
+
     def create_identity(
         self,
         *,
@@ -26,11 +26,11 @@ class SqlAllocationPoolRepository(AllocationPoolPort):
               ON c.chain_id = p.chain_id
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(p.pool_address) = :pool_address
+             AND t1.address = p.token1_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :dex_id
             ORDER BY p.dex_id, p.chain_id, p.pool_address
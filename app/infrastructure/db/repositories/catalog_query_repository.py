@@ -62,8 +62,10 @@ class SqlCatalogQueryRepository(CatalogQueryPort):
         *,
         exchange_id: int,
         network_id: int,
-        token_address: str | None = None,
+        pool_addresses: list[str] | None = None,
+        exclude_token: str | None = None,
     ) -> list[Token]:
+        # pool_addresses vem resolvido pelo indice de busca de tokens.
         sql = """
             SELECT DISTINCT
                 token_address AS address,
@@ -76,7 +78,10 @@ class SqlCatalogQueryRepository(CatalogQueryPort):
                 FROM public.pools p
                 WHERE p.dex_id = :exchange_id
                   AND p.chain_id = :network_id
-                  AND (:token IS NULL OR lower(p.token0_address) = :token OR lower(p.token1_address) = :token)
+                  AND (
+                    CAST(:pool_addresses AS text[]) IS NULL
+                    OR p.pool_address = ANY(CAST(:pool_addresses AS text[]))
+                  )
                   AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
                 UNION
                 SELECT
@@ -84,32 +89,41 @@ class SqlCatalogQueryRepository(CatalogQueryPort):
                 FROM public.pools p
                 WHERE p.dex_id = :exchange_id
                   AND p.chain_id = :network_id
-                  AND (:token IS NULL OR lower(p.token0_address) = :token OR lower(p.token1_address) = :token)
+                  AND (
+                    CAST(:pool_addresses AS text[]) IS NULL
+                    OR p.pool_address = ANY(CAST(:pool_addresses AS text[]))
+                  )
                   AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
             ) tokens
             LEFT JOIN public.tokens t
               ON t.chain_id = :network_id
-             AND lower(t.address) = lower(tokens.token_address)
-            WHERE (:token IS NULL OR lower(token_address) <> :token)
+             AND t.address = tokens.token_address
+            WHERE (
+                CAST(:exclude_token AS text) IS NULL
+                OR (
+                    token_address <> :exclude_token
+                    AND upper(COALESCE(t.symbol, '')) <> upper(:exclude_token)
+                )
+            )
             ORDER BY symbol
         """
         params = {
             "exchange_id": exchange_id,
             "network_id": network_id,
-            "token": token_address.lower() if token_address else None,
+            "pool_addresses": pool_addresses,
+            "exclude_token": exclude_token,
             "min_tvl_usd": self._min_tvl_usd,
         }
         with self._engine.connect() as conn:
             rows = conn.execute(text(sql), params).mappings().all()
         return [map_row_to_token(row) for row in rows]
 
-    def list_pools_by_exchange_network_tokens(
+    def list_pools_by_exchange_network_addresses(
         self,
         *,
         exchange_id: int,
         network_id: int,
-        token0_address: str,
-        token1_address: str,
+        pool_addresses: list[str],
     ) -> list[PoolSummary]:
         sql = """
             SELECT
@@ -119,17 +133,13 @@ class SqlCatalogQueryRepository(CatalogQueryPort):
             WHERE p.dex_id = :exchange_id
               AND p.chain_id = :network_id
               AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
-              AND (
-                (lower(p.token0_address) = :token0_address AND lower(p.token1_address) = :token1_address)
-                OR (lower(p.token0_address) = :token1_address AND lower(p.token1_address) = :token0_address)
-              )
+              AND p.pool_address = ANY(CAST(:pool_addresses AS text[]))
             ORDER BY COALESCE(p.fee_tier, 0), p.pool_address
         """
         params = {
             "exchange_id": exchange_id,
             "network_id": network_id,
-            "token0_address": token0_address.lower(),
-            "token1_address": token1_address.lower(),
+            "pool_addresses": pool_addresses,
             "min_tvl_usd": self._min_tvl_usd,
         }
         with self._engine.connect() as conn:
@@ -165,11 +175,11 @@ class SqlCatalogQueryRepository(CatalogQueryPort):
               ON c.chain_id = p.chain_id
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(p.pool_address) = :pool_address
+             AND t1.address = p.token1_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :exchange_id
               AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from app.application.ports.catalog_snapshot_port import CatalogSnapshotPort
+from app.domain.services.catalog_snapshot import CatalogSnapshot
+from app.infrastructure.db.mappers.catalog_mapper import (
+    map_row_to_catalog_chain,
+    map_row_to_catalog_dex,
+    map_row_to_catalog_pool,
+    map_row_to_catalog_token,
+)
+
+
+class SqlCatalogSnapshotRepository(CatalogSnapshotPort):
+    _DEXES_SQL = """
+        SELECT
+            d.dex_id AS id,
+            d.dex_key,
+            d.name,
+            CAST(d.version AS text) AS version,
+            d.icon_url
+        FROM public.dexes d
+    """
+
+    _CHAINS_SQL = """
+        SELECT
+            c.chain_id AS id,
+            c.chain_key,
+            c.name,
+            c.icon_url
+        FROM public.chains c
+    """
+
+    _POOLS_SQL = """
+        SELECT
+            p.chain_id,
+            p.dex_id,
+            p.pool_address,
+            COALESCE(p.fee_tier, 0) AS fee_tier,
+            p.token0_address,
+            p.token1_address
+        FROM public.pools p
+        WHERE COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
+          AND p.token0_address IS NOT NULL
+          AND p.token1_address IS NOT NULL
+    """
+
+    # Somente tokens referenciados por pools elegiveis entram na foto.
+    _TOKENS_SQL = """
+        SELECT
+            t.chain_id,
+            t.address,
+            t.symbol,
+            t.decimals,
+            t.icon_url
+        FROM public.tokens t
+        WHERE EXISTS (
+            SELECT 1
+            FROM public.pools p
+            WHERE p.chain_id = t.chain_id
+              AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
+              AND (
+                p.token0_address = t.address
+                OR p.token1_address = t.address
+              )
+        )
+    """
+
+    def __init__(self, engine, min_tvl_usd: Decimal):
+        self._engine = engine
+        self._min_tvl_usd = min_tvl_usd
+
+    def load_catalog_snapshot(self) -> CatalogSnapshot:
+        params = {"min_tvl_usd": self._min_tvl_usd}
+        # Uma transacao REPEATABLE READ para as quatro consultas verem o mesmo estado.
+        with self._engine.connect().execution_options(isolation_level="REPEATABLE READ") as conn:
+            dexes = conn.execute(text(self._DEXES_SQL)).mappings().all()
+            chains = conn.execute(text(self._CHAINS_SQL)).mappings().all()
+            pools = conn.execute(text(self._POOLS_SQL), params).mappings().all()
+            tokens = conn.execute(text(self._TOKENS_SQL), params).mappings().all()
+        return CatalogSnapshot(
+            dexes=[map_row_to_catalog_dex(row) for row in dexes],
+            chains=[map_row_to_catalog_chain(row) for row in chains],
+            tokens=[map_row_to_catalog_token(row) for row in tokens],
+            pools=[map_row_to_catalog_pool(row) for row in pools],
+        )
@@ -6,14 +6,21 @@ from decimal import Decimal
 from sqlalchemy import text
 
 from app.application.ports.liquidity_distribution_port import LiquidityDistributionPort
-from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.domain.entities.liquidity_distribution import (
+    LiquidityDistributionBlockSnapshot,
+    LiquidityDistributionPool,
+    TickLiquidity,
+)
 from app.infrastructure.db.mappers.liquidity_distribution_mapper import (
+    map_row_to_block_snapshot,
     map_row_to_liquidity_pool,
     map_row_to_tick_liquidity,
 )
 
 
 class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
+    _TICKS_STREAM_BATCH_SIZE = 5000
+
     def __init__(self, engine, min_tvl_usd: Decimal):
         self._engine = engine
         self._min_tvl_usd = min_tvl_usd
@@ -25,7 +32,7 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 (
                     'x' || substr(
                         md5(
-                            p.dex_id::text || ':' || p.chain_id::text || ':' || lower(p.pool_address)
+                            p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address
                         ),
                         1,
                         8
@@ -45,14 +52,17 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 p.tick AS pool_tick,
                 COALESCE(ss.tick, p.tick) AS current_tick,
                 p.price_token0_per_token1 AS current_price_token1_per_token0,
-                COALESCE(ss.liquidity, p.liquidity) AS onchain_liquidity
+                COALESCE(ss.liquidity, p.liquidity) AS onchain_liquidity,
+                p.pool_address,
+                p.chain_id,
+                p.dex_id
             FROM public.pools p
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
+             AND t1.address = p.token1_address
             LEFT JOIN LATERAL (
                 SELECT
                     s.tick,
@@ -60,7 +70,7 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 FROM public.pool_state_snapshots s
                 WHERE s.dex_id = p.dex_id
                   AND s.chain_id = p.chain_id
-                  AND lower(s.pool_address) = lower(p.pool_address)
+                  AND s.pool_address = p.pool_address
                 ORDER BY s.meta_block_number DESC
                 LIMIT 1
             ) ss ON true
@@ -90,7 +100,7 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 (
                     'x' || substr(
                         md5(
-                            p.dex_id::text || ':' || p.chain_id::text || ':' || lower(p.pool_address)
+                            p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address
                         ),
                         1,
                         8
@@ -110,14 +120,17 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 p.tick AS pool_tick,
                 COALESCE(ss.tick, p.tick) AS current_tick,
                 p.price_token0_per_token1 AS current_price_token1_per_token0,
-                COALESCE(ss.liquidity, p.liquidity) AS onchain_liquidity
+                COALESCE(ss.liquidity, p.liquidity) AS onchain_liquidity,
+                p.pool_address,
+                p.chain_id,
+                p.dex_id
             FROM public.pools p
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
+             AND t1.address = p.token1_address
             LEFT JOIN LATERAL (
                 SELECT
                     s.tick,
@@ -125,11 +138,11 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 FROM public.pool_state_snapshots s
                 WHERE s.dex_id = p.dex_id
                   AND s.chain_id = p.chain_id
-                  AND lower(s.pool_address) = lower(p.pool_address)
+                  AND s.pool_address = p.pool_address
                 ORDER BY s.meta_block_number DESC
                 LIMIT 1
             ) ss ON true
-            WHERE lower(p.pool_address) = :pool_address
+            WHERE p.pool_address = :pool_address
               AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
               AND (:chain_id IS NULL OR p.chain_id = :chain_id)
               AND (:dex_id IS NULL OR p.dex_id = :dex_id)
@@ -151,7 +164,7 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 (
                     'x' || substr(
                         md5(
-                            s.dex_id::text || ':' || s.chain_id::text || ':' || lower(s.pool_address)
+                            s.dex_id::text || ':' || s.chain_id::text || ':' || s.pool_address
                         ),
                         1,
                         8
@@ -171,6 +184,118 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
             row = conn.execute(text(sql), {"pool_id": pool_id}).mappings().first()
         return row["latest_period"] if row else None
 
+    def get_latest_block_number(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        if isinstance(pool_id, int):
+            # Resolve o pool_id em public.pools (indice idx_pools_legacy_pool_id) e
+            # le o ultimo bloco pelo indice (chain_id, dex_id, pool_address, bloco).
+            pool_id_expr = """
+                (
+                    (
+                        'x' || substr(
+                            md5(
+                                p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address
+                            ),
+                            1,
+                            8
+                        )
+                    )::bit(32)::int & 2147483647
+                )
+            """
+            sql = """
+                SELECT latest.meta_block_number AS latest_block_number
+                FROM public.pools p
+                CROSS JOIN LATERAL (
+                    SELECT s.meta_block_number
+                    FROM public.pool_state_snapshots s
+                    WHERE s.chain_id = p.chain_id
+                      AND s.dex_id = p.dex_id
+                      AND s.pool_address = p.pool_address
+                    ORDER BY s.meta_block_number DESC
+                    LIMIT 1
+                ) latest
+                WHERE {pool_id_expr} = :pool_id
+                LIMIT 1
+            """.format(pool_id_expr=pool_id_expr)
+            params: dict[str, object] = {"pool_id": pool_id}
+        else:
+            sql = """
+                SELECT max(s.meta_block_number) AS latest_block_number
+                FROM public.pool_state_snapshots s
+                WHERE s.pool_address = :pool_address
+                  AND (CAST(:chain_id AS int) IS NULL OR s.chain_id = :chain_id)
+                  AND (CAST(:dex_id AS int) IS NULL OR s.dex_id = :dex_id)
+            """
+            params = {
+                "pool_address": pool_id.strip().lower(),
+                "chain_id": chain_id,
+                "dex_id": dex_id,
+            }
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), params).mappings().first()
+        if not row or row["latest_block_number"] is None:
+            return None
+        return int(row["latest_block_number"])
+
+    def get_tick_history_complete_block(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        # Watermark da ingestao de ticks (migracao 0010_tick_snapshot_coverage);
+        # None quando a pool nao tem historico de ticks completo.
+        if isinstance(pool_id, int):
+            pool_id_expr = """
+                (
+                    (
+                        'x' || substr(
+                            md5(
+                                p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address
+                            ),
+                            1,
+                            8
+                        )
+                    )::bit(32)::int & 2147483647
+                )
+            """
+            sql = """
+                SELECT c.complete_through_block
+                FROM public.pools p
+                JOIN apr_exact.tick_snapshot_coverage c
+                  ON c.chain_id = p.chain_id
+                 AND c.dex_id = p.dex_id
+                 AND c.pool_address = p.pool_address
+                WHERE {pool_id_expr} = :pool_id
+                LIMIT 1
+            """.format(pool_id_expr=pool_id_expr)
+            params: dict[str, object] = {"pool_id": pool_id}
+        else:
+            # Sem chain_id/dex_id o endereco pode casar varias pools: vale a menor cobertura.
+            sql = """
+                SELECT min(c.complete_through_block) AS complete_through_block
+                FROM apr_exact.tick_snapshot_coverage c
+                WHERE c.pool_address = :pool_address
+                  AND (CAST(:chain_id AS int) IS NULL OR c.chain_id = :chain_id)
+                  AND (CAST(:dex_id AS int) IS NULL OR c.dex_id = :dex_id)
+            """
+            params = {
+                "pool_address": pool_id.strip().lower(),
+                "chain_id": chain_id,
+                "dex_id": dex_id,
+            }
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), params).mappings().first()
+        if not row or row["complete_through_block"] is None:
+            return None
+        return int(row["complete_through_block"])
+
     def get_ticks_by_period(self, *, pool_id: int, period_start: datetime) -> list[TickLiquidity]:
         _ = period_start
         pool_id_expr = """
@@ -178,7 +303,7 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
                 (
                     'x' || substr(
                         md5(
-                            t.dex_id::text || ':' || t.chain_id::text || ':' || lower(t.pool_address)
+                            t.dex_id::text || ':' || t.chain_id::text || ':' || t.pool_address
                         ),
                         1,
                         8
@@ -204,3 +329,199 @@ class SqlLiquidityDistributionRepository(LiquidityDistributionPort):
             for row in rows
             if row["liquidity_net"] is not None
         ]
+
+    def get_pools_by_refs(
+        self,
+        *,
+        pool_ids: list[int],
+        pool_addresses: list[str],
+    ) -> list[LiquidityDistributionPool]:
+        if not pool_ids and not pool_addresses:
+            return []
+        pool_id_expr = """
+            (
+                (
+                    'x' || substr(
+                        md5(
+                            p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address
+                        ),
+                        1,
+                        8
+                    )
+                )::bit(32)::int & 2147483647
+            )
+        """
+        sql = """
+            SELECT
+                {pool_id_expr} AS id,
+                COALESCE(t0.symbol, p.token0_address) AS token0_symbol,
+                COALESCE(t1.symbol, p.token1_address) AS token1_symbol,
+                COALESCE(t0.decimals, 0) AS token0_decimals,
+                COALESCE(t1.decimals, 0) AS token1_decimals,
+                p.fee_tier AS fee_tier,
+                p.tick_spacing AS tick_spacing,
+                p.tick AS pool_tick,
+                COALESCE(ss.tick, p.tick) AS current_tick,
+                p.price_token0_per_token1 AS current_price_token1_per_token0,
+                COALESCE(ss.liquidity, p.liquidity) AS onchain_liquidity,
+                p.pool_address,
+                p.chain_id,
+                p.dex_id,
+                ss.snapshot_at AS latest_period_start
+            FROM public.pools p
+            LEFT JOIN public.tokens t0
+              ON t0.chain_id = p.chain_id
+             AND t0.address = p.token0_address
+            LEFT JOIN public.tokens t1
+              ON t1.chain_id = p.chain_id
+             AND t1.address = p.token1_address
+            LEFT JOIN LATERAL (
+                SELECT
+                    s.tick,
+                    s.liquidity,
+                    s.snapshot_at
+                FROM public.pool_state_snapshots s
+                WHERE s.dex_id = p.dex_id
+                  AND s.chain_id = p.chain_id
+                  AND s.pool_address = p.pool_address
+                ORDER BY s.meta_block_number DESC
+                LIMIT 1
+            ) ss ON true
+            WHERE (
+                {pool_id_expr} = ANY(CAST(:pool_ids AS int[]))
+                OR p.pool_address = ANY(CAST(:pool_addresses AS text[]))
+            )
+              AND COALESCE(p.tvl_usd, 0) >= :min_tvl_usd
+            ORDER BY COALESCE(p.tvl_usd, 0) DESC, p.dex_id, p.chain_id
+        """.format(pool_id_expr=pool_id_expr)
+        params = {
+            "pool_ids": list(pool_ids),
+            "pool_addresses": [address.lower() for address in pool_addresses],
+            "min_tvl_usd": self._min_tvl_usd,
+        }
+        with self._engine.connect() as conn:
+            rows = conn.execute(text(sql), params).mappings().all()
+        return [map_row_to_liquidity_pool(row) for row in rows]
+
+    def get_ticks_for_pools(
+        self,
+        *,
+        pools: list[LiquidityDistributionPool],
+    ) -> dict[int, list[TickLiquidity]]:
+        pool_ids_by_key = {
+            (pool.dex_id, pool.chain_id, pool.pool_address.lower()): pool.id
+            for pool in pools
+            if pool.pool_address is not None and pool.chain_id is not None and pool.dex_id is not None
+        }
+        if not pool_ids_by_key:
+            return {}
+
+        # Um unico scan para todas as pools; as chaves exatas sao conferidas
+        # em Python porque ANY() por coluna aceita combinacoes cruzadas.
+        sql = """
+            SELECT
+                t.dex_id,
+                t.chain_id,
+                t.pool_address AS pool_address,
+                t.tick_idx,
+                t.liquidity_net
+            FROM public.pool_ticks_initialized t
+            WHERE t.pool_address = ANY(CAST(:pool_keys AS text[]))
+              AND t.chain_id = ANY(CAST(:chain_ids AS int[]))
+              AND t.dex_id = ANY(CAST(:dex_ids AS int[]))
+              AND t.liquidity_net IS NOT NULL
+            ORDER BY t.dex_id, t.chain_id, t.pool_address, t.tick_idx
+        """
+        params = {
+            "pool_keys": sorted({key[2] for key in pool_ids_by_key}),
+            "chain_ids": sorted({key[1] for key in pool_ids_by_key}),
+            "dex_ids": sorted({key[0] for key in pool_ids_by_key}),
+        }
+        ticks_by_pool: dict[int, list[TickLiquidity]] = {}
+        with self._engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=self._TICKS_STREAM_BATCH_SIZE,
+            ).execute(text(sql), params)
+            for row in result.mappings():
+                pool_id = pool_ids_by_key.get((row["dex_id"], row["chain_id"], row["pool_address"]))
+                if pool_id is None:
+                    continue
+                ticks_by_pool.setdefault(pool_id, []).append(map_row_to_tick_liquidity(row))
+        return ticks_by_pool
+
+    def get_pool_snapshot_at(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int | None = None,
+        timestamp: int | None = None,
+    ) -> LiquidityDistributionBlockSnapshot | None:
+        sql = """
+            SELECT
+                s.meta_block_number,
+                s.meta_block_timestamp,
+                s.tick,
+                s.liquidity
+            FROM public.pool_state_snapshots s
+            WHERE s.dex_id = :dex_id
+              AND s.chain_id = :chain_id
+              AND s.pool_address = :pool_address
+              AND (CAST(:block_number AS bigint) IS NULL OR s.meta_block_number <= :block_number)
+              AND (CAST(:timestamp AS bigint) IS NULL OR s.meta_block_timestamp <= :timestamp)
+            ORDER BY s.meta_block_number DESC
+            LIMIT 1
+        """
+        params = {
+            "pool_address": pool_address.lower(),
+            "chain_id": chain_id,
+            "dex_id": dex_id,
+            "block_number": block_number,
+            "timestamp": timestamp,
+        }
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), params).mappings().first()
+        if not row:
+            return None
+        return map_row_to_block_snapshot(row)
+
+    def get_ticks_at_block(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int,
+    ) -> list[TickLiquidity]:
+        # Estado de cada tick no bloco: ultima linha de apr_exact.tick_snapshot
+        # com block_number <= bloco alvo.
+        sql = """
+            SELECT
+                latest.tick_idx,
+                latest.liquidity_net
+            FROM (
+                SELECT DISTINCT ON (ts.tick_idx)
+                    ts.tick_idx,
+                    ts.liquidity_net
+                FROM apr_exact.tick_snapshot ts
+                WHERE ts.dex_id = :dex_id
+                  AND ts.chain_id = :chain_id
+                  AND ts.pool_address = :pool_address
+                  AND ts.block_number <= :block_number
+                ORDER BY ts.tick_idx, ts.block_number DESC
+            ) latest
+            WHERE latest.liquidity_net IS NOT NULL
+            ORDER BY latest.tick_idx
+        """
+        params = {
+            "pool_address": pool_address.lower(),
+            "chain_id": chain_id,
+            "dex_id": dex_id,
+            "block_number": block_number,
+        }
+        with self._engine.connect() as conn:
+            rows = conn.execute(text(sql), params).mappings().all()
+        ticks = [map_row_to_tick_liquidity(row) for row in rows]
+        return [row for row in ticks if row.liquidity_net != 0]
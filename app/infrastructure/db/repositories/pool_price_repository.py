@@ -1,21 +1,145 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from decimal import Decimal
+import time
 
 from sqlalchemy import text
 
 from app.application.ports.pool_price_port import PoolPricePort
-from app.domain.entities.pool_price import PoolCurrentPrice, PoolPricePoint, PoolPriceStats
+from app.domain.entities.pool_price import PoolPricePoint, PoolPriceWindow
 from app.infrastructure.db.mappers.pool_price_mapper import (
     map_row_to_current_pool_price,
+    map_row_to_pool_price_candle,
     map_row_to_pool_price_point,
     map_row_to_pool_price_stats,
 )
+from app.shared.cache import TimeSeriesCache
 
 
 class SqlPoolPriceRepository(PoolPricePort):
-    def __init__(self, engine):
+    # pool/latest sempre retornam no maximo uma linha; os pontos da janela sao
+    # anexados via LEFT JOIN para que tudo venha em uma unica ida ao banco.
+    _WINDOW_SQL = """
+        WITH pool AS (
+            SELECT p.price_token0_per_token1, p.sqrt_price_x96
+            FROM public.pools p
+            WHERE p.pool_address = :pool_address
+              AND p.chain_id = :chain_id
+              AND p.dex_id = :dex_id
+            LIMIT 1
+        ),
+        latest AS (
+            SELECT s.price_token1_per_token0
+            FROM public.pool_state_snapshots s
+            WHERE s.chain_id = :chain_id
+              AND s.dex_id = :dex_id
+              AND s.pool_address = :pool_address
+              AND s.price_token1_per_token0 IS NOT NULL
+            ORDER BY s.meta_block_timestamp DESC, s.meta_block_number DESC
+            LIMIT 1
+        ),
+        window_rows AS (
+            SELECT
+                s.meta_block_timestamp,
+                s.meta_block_number,
+                s.price_token1_per_token0 AS price
+            FROM public.pool_state_snapshots s
+            WHERE s.chain_id = :chain_id
+              AND s.dex_id = :dex_id
+              AND s.pool_address = :pool_address
+              AND {time_filter}
+              AND s.price_token1_per_token0 IS NOT NULL
+        ){extra_ctes}
+        SELECT
+            latest.price_token1_per_token0 AS token1_price,
+            CASE
+                WHEN pool.price_token0_per_token1 IS NOT NULL AND pool.price_token0_per_token1 > 0
+                THEN pool.price_token0_per_token1
+                ELSE NULL
+            END AS token0_price,
+            CASE
+                WHEN latest.price_token1_per_token0 IS NULL THEN pool.sqrt_price_x96
+            END AS sqrt_price_x96,
+            {point_columns}
+        FROM pool
+        LEFT JOIN latest ON true
+        {point_joins}
+    """
+
+    _SERIES_PARTS = {
+        "extra_ctes": "",
+        "point_columns": """
+            to_timestamp(w.meta_block_timestamp) AT TIME ZONE 'UTC' AS timestamp,
+            w.meta_block_timestamp AS block_timestamp,
+            w.price
+        """,
+        "point_joins": """
+            LEFT JOIN window_rows w ON true
+            ORDER BY w.meta_block_timestamp ASC, w.meta_block_number ASC
+        """,
+    }
+
+    _CANDLE_PARTS = {
+        "extra_ctes": """,
+        candles AS (
+            SELECT
+                w.meta_block_timestamp - (w.meta_block_timestamp % :bucket_seconds) AS bucket,
+                (
+                    array_agg(w.price ORDER BY w.meta_block_timestamp ASC, w.meta_block_number ASC)
+                )[1] AS open_price,
+                MAX(w.price) AS high_price,
+                MIN(w.price) AS low_price,
+                (
+                    array_agg(w.price ORDER BY w.meta_block_timestamp DESC, w.meta_block_number DESC)
+                )[1] AS close_price
+            FROM window_rows w
+            GROUP BY 1
+        ),
+        stats AS (
+            SELECT
+                MIN(w.price) AS min_price,
+                MAX(w.price) AS max_price,
+                AVG(w.price) AS avg_price,
+                AVG(1 / NULLIF(w.price, 0)) AS avg_inverse_price
+            FROM window_rows w
+        )""",
+        "point_columns": """
+            stats.min_price,
+            stats.max_price,
+            stats.avg_price,
+            stats.avg_inverse_price,
+            to_timestamp(c.bucket) AT TIME ZONE 'UTC' AS timestamp,
+            c.open_price,
+            c.high_price,
+            c.low_price,
+            c.close_price
+        """,
+        "point_joins": """
+            CROSS JOIN stats
+            LEFT JOIN candles c ON true
+            ORDER BY c.bucket ASC
+        """,
+    }
+
+    _DAYS_FILTER = (
+        "s.meta_block_timestamp >= "
+        "CAST(extract(epoch FROM now()) AS bigint) - CAST(:days AS bigint) * 86400"
+    )
+    _RANGE_FILTER = "s.meta_block_timestamp >= :start_ts AND s.meta_block_timestamp <= :end_ts"
+    _TAIL_FILTER = "s.meta_block_timestamp >= :start_ts"
+    _EXPORT_STREAM_BATCH_SIZE = 5000
+
+    def __init__(
+        self,
+        engine,
+        series_cache: TimeSeriesCache[tuple[int, int, str], Decimal] | None = None,
+        tail_overlap_seconds: int = 3600,
+    ):
         self._engine = engine
+        self._series_cache = series_cache
+        self._tail_overlap_seconds = tail_overlap_seconds
 
     @staticmethod
     def _params(*, pool_address: str, chain_id: int, dex_id: int) -> dict[str, object]:
@@ -25,11 +149,17 @@ class SqlPoolPriceRepository(PoolPricePort):
             "dex_id": dex_id,
         }
 
+    @staticmethod
+    def _epoch_seconds(value: datetime) -> int:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+
     def pool_exists(self, *, pool_address: str, chain_id: int, dex_id: int) -> bool:
         sql = """
             SELECT 1
             FROM public.pools p
-            WHERE lower(p.pool_address) = :pool_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :dex_id
             LIMIT 1
@@ -39,260 +169,161 @@ class SqlPoolPriceRepository(PoolPricePort):
             row = conn.execute(text(sql), params).first()
         return row is not None
 
-    def get_series(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        days: int,
-    ) -> list[PoolPricePoint]:
+    def get_latest_block_number(self, *, pool_address: str, chain_id: int, dex_id: int) -> int | None:
         sql = """
-            SELECT
-                to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC' AS timestamp,
-                (
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS price
+            SELECT max(s.meta_block_number) AS latest_block_number
             FROM public.pool_state_snapshots s
-            JOIN public.pools p
-              ON p.dex_id = s.dex_id
-             AND p.chain_id = s.chain_id
-             AND lower(p.pool_address) = lower(s.pool_address)
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(s.pool_address) = :pool_address
+            WHERE s.pool_address = :pool_address
               AND s.chain_id = :chain_id
               AND s.dex_id = :dex_id
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') >= (now() - (:days || ' days')::interval)
-              AND s.sqrt_price_x96 IS NOT NULL
-              AND s.sqrt_price_x96 ~ '^[0-9]+$'
-              AND s.sqrt_price_x96 <> '0'
-            ORDER BY (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') ASC
         """
         params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
-        params["days"] = days
         with self._engine.connect() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [
-            map_row_to_pool_price_point(row)
-            for row in rows
-            if row["timestamp"] is not None and row["price"] is not None
-        ]
+            row = conn.execute(text(sql), params).mappings().first()
+        if not row or row["latest_block_number"] is None:
+            return None
+        return int(row["latest_block_number"])
 
-    def get_series_range(
+    def get_price_window(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> list[PoolPricePoint]:
-        sql = """
-            SELECT
-                to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC' AS timestamp,
-                (
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS price
-            FROM public.pool_state_snapshots s
-            JOIN public.pools p
-              ON p.dex_id = s.dex_id
-             AND p.chain_id = s.chain_id
-             AND lower(p.pool_address) = lower(s.pool_address)
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(s.pool_address) = :pool_address
-              AND s.chain_id = :chain_id
-              AND s.dex_id = :dex_id
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') >= :start
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') <= :end
-              AND s.sqrt_price_x96 IS NOT NULL
-              AND s.sqrt_price_x96 ~ '^[0-9]+$'
-              AND s.sqrt_price_x96 <> '0'
-            ORDER BY (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') ASC
-        """
+        days: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bucket_seconds: int | None = None,
+    ) -> PoolPriceWindow | None:
+        # So a janela deslizante de `days` usa o cache; intervalos start..end
+        # historicos vao direto ao banco com os dois limites.
+        sliding_window = start is None or end is None
+        if bucket_seconds is None and sliding_window and self._series_cache is not None:
+            return self._get_cached_price_window(
+                pool_address=pool_address,
+                chain_id=chain_id,
+                dex_id=dex_id,
+                start_ts=int(time.time()) - int(days or 0) * 86400,
+            )
+
         params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
-        params.update({"start": start, "end": end})
+        if start is not None and end is not None:
+            time_filter = self._RANGE_FILTER
+            params.update({"start_ts": self._epoch_seconds(start), "end_ts": self._epoch_seconds(end)})
+        else:
+            time_filter = self._DAYS_FILTER
+            params["days"] = days
+        parts = self._SERIES_PARTS if bucket_seconds is None else self._CANDLE_PARTS
+        if bucket_seconds is not None:
+            params["bucket_seconds"] = bucket_seconds
+        sql = self._WINDOW_SQL.format(time_filter=time_filter, **parts)
+
         with self._engine.connect() as conn:
             rows = conn.execute(text(sql), params).mappings().all()
-        return [
-            map_row_to_pool_price_point(row)
-            for row in rows
-            if row["timestamp"] is not None and row["price"] is not None
-        ]
+        if not rows:
+            return None
 
-    def get_stats(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        days: int,
-    ) -> PoolPriceStats:
-        sql = """
-            SELECT
-                MIN(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS min_price,
-                MAX(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS max_price,
-                AVG(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS avg_price
-            FROM public.pool_state_snapshots s
-            JOIN public.pools p
-              ON p.dex_id = s.dex_id
-             AND p.chain_id = s.chain_id
-             AND lower(p.pool_address) = lower(s.pool_address)
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(s.pool_address) = :pool_address
-              AND s.chain_id = :chain_id
-              AND s.dex_id = :dex_id
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') >= (now() - (:days || ' days')::interval)
-              AND s.sqrt_price_x96 IS NOT NULL
-              AND s.sqrt_price_x96 ~ '^[0-9]+$'
-              AND s.sqrt_price_x96 <> '0'
-        """
-        params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
-        params["days"] = days
-        with self._engine.connect() as conn:
-            row = conn.execute(text(sql), params).mappings().first()
-        if not row:
-            return PoolPriceStats(min_price=None, max_price=None, avg_price=None)
-        return map_row_to_pool_price_stats(row)
+        current = map_row_to_current_pool_price(rows[0])
+        points = [row for row in rows if row["timestamp"] is not None]
+        if bucket_seconds is None:
+            return PoolPriceWindow(
+                current=current,
+                series=[map_row_to_pool_price_point(row) for row in points if row["price"] is not None],
+            )
+        return PoolPriceWindow(
+            current=current,
+            candles=[map_row_to_pool_price_candle(row) for row in points],
+            stats=map_row_to_pool_price_stats(rows[0]),
+        )
 
-    def get_stats_range(
+    def iter_price_points(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> PoolPriceStats:
+        days: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[PoolPricePoint]:
+        params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
+        if start is not None and end is not None:
+            time_filter = self._RANGE_FILTER
+            params.update({"start_ts": self._epoch_seconds(start), "end_ts": self._epoch_seconds(end)})
+        else:
+            time_filter = self._DAYS_FILTER
+            params["days"] = days
         sql = """
             SELECT
-                MIN(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS min_price,
-                MAX(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS max_price,
-                AVG(
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS avg_price
+                to_timestamp(s.meta_block_timestamp) AT TIME ZONE 'UTC' AS timestamp,
+                s.price_token1_per_token0 AS price
             FROM public.pool_state_snapshots s
-            JOIN public.pools p
-              ON p.dex_id = s.dex_id
-             AND p.chain_id = s.chain_id
-             AND lower(p.pool_address) = lower(s.pool_address)
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(s.pool_address) = :pool_address
-              AND s.chain_id = :chain_id
+            WHERE s.chain_id = :chain_id
               AND s.dex_id = :dex_id
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') >= :start
-              AND (to_timestamp(meta_block_timestamp) AT TIME ZONE 'UTC') <= :end
-              AND s.sqrt_price_x96 IS NOT NULL
-              AND s.sqrt_price_x96 ~ '^[0-9]+$'
-              AND s.sqrt_price_x96 <> '0'
-        """
-        params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
-        params.update({"start": start, "end": end})
+              AND s.pool_address = :pool_address
+              AND {time_filter}
+              AND s.price_token1_per_token0 IS NOT NULL
+            ORDER BY s.meta_block_timestamp ASC, s.meta_block_number ASC
+        """.format(time_filter=time_filter)
         with self._engine.connect() as conn:
-            row = conn.execute(text(sql), params).mappings().first()
-        if not row:
-            return PoolPriceStats(min_price=None, max_price=None, avg_price=None)
-        return map_row_to_pool_price_stats(row)
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=self._EXPORT_STREAM_BATCH_SIZE,
+            ).execute(text(sql), params)
+            for row in result.mappings():
+                yield map_row_to_pool_price_point(row)
 
-    def get_latest_price(
+    def _get_cached_price_window(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-    ) -> PoolCurrentPrice | None:
-        sql = """
-            SELECT
-                (
-                    power((s.sqrt_price_x96::numeric / power(2::numeric, 96)), 2)
-                    * power(10::numeric, COALESCE(t0.decimals, 0) - COALESCE(t1.decimals, 0))
-                ) AS token1_price,
-                CASE
-                    WHEN p.price_token0_per_token1 IS NOT NULL AND p.price_token0_per_token1 > 0
-                    THEN p.price_token0_per_token1
-                    ELSE NULL
-                END AS token0_price,
-                s.sqrt_price_x96
-            FROM public.pool_state_snapshots s
-            JOIN public.pools p
-              ON p.dex_id = s.dex_id
-             AND p.chain_id = s.chain_id
-             AND lower(p.pool_address) = lower(s.pool_address)
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(s.pool_address) = :pool_address
-              AND s.chain_id = :chain_id
-              AND s.dex_id = :dex_id
-              AND s.sqrt_price_x96 IS NOT NULL
-              AND s.sqrt_price_x96 ~ '^[0-9]+$'
-              AND s.sqrt_price_x96 <> '0'
-            ORDER BY s.meta_block_number DESC
-            LIMIT 1
-        """
-        params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
-        with self._engine.connect() as conn:
-            row = conn.execute(text(sql), params).mappings().first()
-        if row:
-            return map_row_to_current_pool_price(row)
+        start_ts: int,
+    ) -> PoolPriceWindow | None:
+        cache = self._series_cache
+        key = (chain_id, dex_id, pool_address.lower())
+        tail_start = cache.tail_start(key, start_ts=start_ts, overlap_seconds=self._tail_overlap_seconds)
+        fetch_from = start_ts if tail_start is None else tail_start
 
-        fallback_sql = """
-            SELECT
-                NULL AS token1_price,
-                CASE
-                    WHEN p.price_token0_per_token1 IS NOT NULL AND p.price_token0_per_token1 > 0
-                    THEN p.price_token0_per_token1
-                    ELSE NULL
-                END AS token0_price,
-                p.sqrt_price_x96
-            FROM public.pools p
-            WHERE lower(p.pool_address) = :pool_address
-              AND p.chain_id = :chain_id
-              AND p.dex_id = :dex_id
-            LIMIT 1
-        """
+        params = self._params(pool_address=pool_address, chain_id=chain_id, dex_id=dex_id)
+        params["start_ts"] = fetch_from
+        sql = self._WINDOW_SQL.format(time_filter=self._TAIL_FILTER, **self._SERIES_PARTS)
         with self._engine.connect() as conn:
-            fallback_row = conn.execute(text(fallback_sql), params).mappings().first()
-        if not fallback_row:
+            rows = conn.execute(text(sql), params).mappings().all()
+        if not rows:
             return None
-        return map_row_to_current_pool_price(fallback_row)
+
+        point_rows = [row for row in rows if row["block_timestamp"] is not None and row["price"] is not None]
+        timestamps = [int(row["block_timestamp"]) for row in point_rows]
+        values = [map_row_to_pool_price_point(row).price for row in point_rows]
+        cache.store(
+            key,
+            from_ts=fetch_from,
+            timestamps=timestamps,
+            values=values,
+            replace=tail_start is None,
+        )
+        cached = cache.window(key, start_ts=start_ts)
+        if cached is None:
+            if tail_start is not None:
+                # Entrada despejada durante a busca da cauda: refaz a janela completa.
+                return self._get_cached_price_window(
+                    pool_address=pool_address,
+                    chain_id=chain_id,
+                    dex_id=dex_id,
+                    start_ts=start_ts,
+                )
+            # Serie maior que o orcamento de memoria: serve direto do que veio do banco.
+            cached = (timestamps, values)
+
+        return PoolPriceWindow(
+            current=map_row_to_current_pool_price(rows[0]),
+            series=[
+                PoolPricePoint(
+                    timestamp=datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None),
+                    price=price,
+                )
+                for ts, price in zip(*cached)
+            ],
+        )
@@ -1,81 +1,101 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from datetime import date, datetime
+
 from sqlalchemy import text
 
 from app.application.ports.pool_volume_history_port import PoolVolumeHistoryPort
-from app.domain.entities.pool_volume_history import (
-    PoolVolumeHistoryPoint,
-    PoolVolumeHistorySummaryBase,
-    PoolVolumeHistorySummaryPremium,
-)
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
+from app.domain.entities.pool_volume_history import PoolHourlyVolumePoint, PoolVolumeHistoryWindow
 from app.infrastructure.db.mappers.pool_volume_history_mapper import (
-    map_row_to_pool_volume_history_point,
-    map_row_to_pool_volume_history_summary_base,
-    map_row_to_pool_volume_history_summary_premium,
+    map_row_to_pool_hourly_volume_point,
+    map_rows_to_crypto_ohlc_daily_series,
+    map_rows_to_pool_volume_history_window,
 )
 
 
 class SqlPoolVolumeHistoryRepository(PoolVolumeHistoryPort):
+    _EXPORT_STREAM_BATCH_SIZE = 5000
+
     def __init__(self, engine):
         self._engine = engine
 
-    def list_daily_volume_history(
+    def get_latest_hour_start(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int | None,
+        dex_id: int | None,
+    ) -> datetime | None:
+        sql = """
+            SELECT max(h.hour_start) AS latest_hour_start
+            FROM public.pool_hourly h
+            WHERE h.pool_address = :pool_address
+              AND (:chain_id IS NULL OR h.chain_id = :chain_id)
+              AND (:dex_id IS NULL OR h.dex_id = :dex_id)
+        """
+        params = {
+            "pool_address": pool_address.lower(),
+            "chain_id": chain_id,
+            "dex_id": dex_id,
+        }
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), params).mappings().first()
+        return row["latest_hour_start"] if row else None
+
+    def iter_hourly_volume(
         self,
         *,
         pool_address: str,
         days: int,
         chain_id: int | None,
         dex_id: int | None,
-    ) -> list[PoolVolumeHistoryPoint]:
+    ) -> Iterator[PoolHourlyVolumePoint]:
         sql = """
-            WITH daily AS (
-              SELECT
-                date_trunc('day', h.hour_start AT TIME ZONE 'UTC') AS day_utc,
-                SUM(h.volume_usd)            AS volume_usd,
-                SUM(COALESCE(h.fees_usd, 0)) AS fees_usd
-              FROM public.pool_hourly h
-              WHERE lower(h.pool_address) = :pool_address
-                AND (:chain_id IS NULL OR h.chain_id = :chain_id)
-                AND (:dex_id IS NULL OR h.dex_id = :dex_id)
-                AND h.hour_start >= (
-                    date_trunc('day', now() AT TIME ZONE 'UTC')
-                    - (CAST(:days AS int) * interval '1 day')
-                )
-              GROUP BY 1
-            )
             SELECT
-              TO_CHAR(
-                ((day_utc AT TIME ZONE 'UTC') AT TIME ZONE 'America/Sao_Paulo'),
-                'YYYY-MM-DD'
-              )                                    AS time,
-              volume_usd::numeric                 AS value,
-              fees_usd::numeric                   AS fees_usd
-            FROM daily
-            ORDER BY day_utc
+              h.hour_start,
+              h.chain_id,
+              h.dex_id,
+              h.volume_usd,
+              h.fees_usd,
+              h.tvl_usd
+            FROM public.pool_hourly h
+            WHERE h.pool_address = :pool_address
+              AND (:chain_id IS NULL OR h.chain_id = :chain_id)
+              AND (:dex_id IS NULL OR h.dex_id = :dex_id)
+              AND h.hour_start >= (now() - (CAST(:days AS int) * interval '1 day'))
+            ORDER BY h.hour_start, h.chain_id, h.dex_id
         """
         params = {
             "pool_address": pool_address.lower(),
-            "days": days - 1,
+            "days": days,
             "chain_id": chain_id,
             "dex_id": dex_id,
         }
         with self._engine.connect() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [map_row_to_pool_volume_history_point(row) for row in rows]
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=self._EXPORT_STREAM_BATCH_SIZE,
+            ).execute(text(sql), params)
+            for row in result.mappings():
+                yield map_row_to_pool_hourly_volume_point(row)
 
-    def get_summary_base(
+    def get_volume_history_window(
         self,
         *,
         pool_address: str,
         days: int,
         chain_id: int | None,
         dex_id: int | None,
-    ) -> PoolVolumeHistorySummaryBase:
+    ) -> PoolVolumeHistoryWindow:
+        # pool_meta/last_tvl tem no maximo uma linha; os dias sao anexados via
+        # LEFT JOIN para que pontos, TVL e simbolos venham em uma unica consulta.
         sql = """
             WITH bounds AS (
               SELECT
-                date_trunc('day', now() AT TIME ZONE 'UTC') AS end_ts,
-                date_trunc('day', now() AT TIME ZONE 'UTC') - (CAST(:days AS int) * interval '1 day') AS start_ts
+                (now() AT TIME ZONE 'UTC')::date AS end_day,
+                (now() AT TIME ZONE 'UTC')::date - CAST(:days AS int) AS start_day
             ),
             pool_meta AS (
               SELECT
@@ -84,223 +104,92 @@ class SqlPoolVolumeHistoryRepository(PoolVolumeHistoryPort):
               FROM public.pools p
               LEFT JOIN public.tokens t0
                 ON t0.chain_id = p.chain_id
-               AND lower(t0.address) = lower(p.token0_address)
+               AND t0.address = p.token0_address
               LEFT JOIN public.tokens t1
                 ON t1.chain_id = p.chain_id
-               AND lower(t1.address) = lower(p.token1_address)
-              WHERE lower(p.pool_address) = :pool_address
+               AND t1.address = p.token1_address
+              WHERE p.pool_address = :pool_address
                 AND (:chain_id IS NULL OR p.chain_id = :chain_id)
                 AND (:dex_id IS NULL OR p.dex_id = :dex_id)
               LIMIT 1
             ),
             last_tvl AS (
-              SELECT h.tvl_usd
-              FROM public.pool_hourly h, bounds b
-              WHERE lower(h.pool_address) = :pool_address
-                AND (:chain_id IS NULL OR h.chain_id = :chain_id)
-                AND (:dex_id IS NULL OR h.dex_id = :dex_id)
-                AND h.hour_start < b.end_ts
-              ORDER BY h.hour_start DESC
+              SELECT d.last_tvl_usd AS tvl_usd
+              FROM public.pool_daily d, bounds b
+              WHERE d.pool_address = :pool_address
+                AND (:chain_id IS NULL OR d.chain_id = :chain_id)
+                AND (:dex_id IS NULL OR d.dex_id = :dex_id)
+                AND d.day_utc < b.end_day
+              ORDER BY d.day_utc DESC, d.chain_id, d.dex_id
               LIMIT 1
             ),
             daily AS (
               SELECT
-                date_trunc('day', h.hour_start AT TIME ZONE 'UTC') AS day_utc,
-                SUM(h.volume_usd)            AS volume_usd,
-                SUM(COALESCE(h.fees_usd, 0)) AS fees_usd
-              FROM public.pool_hourly h, bounds b
-              WHERE lower(h.pool_address) = :pool_address
-                AND (:chain_id IS NULL OR h.chain_id = :chain_id)
-                AND (:dex_id IS NULL OR h.dex_id = :dex_id)
-                AND h.hour_start >= b.start_ts
-                AND h.hour_start <  b.end_ts
+                d.day_utc,
+                SUM(d.volume_usd) AS volume_usd,
+                SUM(d.fees_usd)   AS fees_usd
+              FROM public.pool_daily d, bounds b
+              WHERE d.pool_address = :pool_address
+                AND (:chain_id IS NULL OR d.chain_id = :chain_id)
+                AND (:dex_id IS NULL OR d.dex_id = :dex_id)
+                AND d.day_utc >= b.start_day
               GROUP BY 1
-            ),
-            agg AS (
-              SELECT
-                AVG(d.fees_usd)   AS avg_daily_fees_usd,
-                AVG(d.volume_usd) AS avg_daily_volume_usd
-              FROM daily d
             )
             SELECT
-              (SELECT tvl_usd FROM last_tvl) AS tvl_usd,
-              a.avg_daily_fees_usd,
-              a.avg_daily_volume_usd,
               pm.token0_symbol,
-              pm.token1_symbol
-            FROM agg a
+              pm.token1_symbol,
+              lt.tvl_usd,
+              TO_CHAR(
+                ((daily.day_utc::timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'America/Sao_Paulo'),
+                'YYYY-MM-DD'
+              )                                    AS time,
+              daily.volume_usd::numeric           AS value,
+              daily.fees_usd::numeric             AS fees_usd
+            FROM bounds
             LEFT JOIN pool_meta pm ON true
+            LEFT JOIN last_tvl lt ON true
+            LEFT JOIN daily ON true
+            ORDER BY daily.day_utc
         """
         params = {
             "pool_address": pool_address.lower(),
-            "days": days,
+            "days": days - 1,
             "chain_id": chain_id,
             "dex_id": dex_id,
         }
         with self._engine.connect() as conn:
-            row = conn.execute(text(sql), params).mappings().first()
-        if row is None:
-            return PoolVolumeHistorySummaryBase(
-                tvl_usd=None,
-                avg_daily_fees_usd=None,
-                avg_daily_volume_usd=None,
-                token0_symbol=None,
-                token1_symbol=None,
-            )
-        return map_row_to_pool_volume_history_summary_base(row)
+            rows = conn.execute(text(sql), params).mappings().all()
+        return map_rows_to_pool_volume_history_window(rows)
 
-    def get_summary_premium(
+    def list_daily_ohlc(
         self,
         *,
         exchange: str,
-        symbol0: str,
-        symbol1: str | None,
-        days: int,
-    ) -> PoolVolumeHistorySummaryPremium:
-
-        print(">>>>.", symbol0, symbol1)
-        if symbol1 is None:
-            sql = """
-                WITH bounds AS (
-                  SELECT
-                    (date_trunc('day', now() AT TIME ZONE 'UTC') - (CAST(:days AS int) * interval '1 day'))::date AS start_date,
-                    (date_trunc('day', now() AT TIME ZONE 'UTC'))::date AS end_date
-                ),
-                vol AS (
-                  SELECT
-                    AVG(((high - low) / NULLIF(high, 0)) * 100.0) AS price_volatility_pct
-                  FROM public.crypto_ohlc_daily c, bounds b
-                  WHERE c.exchange = :exchange
-                    AND c.symbol = :symbol0
-                    AND c.timeframe = '1d'
-                    AND c.day_start >= b.start_date
-                    AND c.day_start <  b.end_date
-                    AND c.high IS NOT NULL
-                    AND c.low  IS NOT NULL
-                ),
-                minmax AS (
-                  SELECT
-                    MIN(c.low)  AS min_price,
-                    MAX(c.high) AS max_price
-                  FROM public.crypto_ohlc_daily c, bounds b
-                  WHERE c.exchange = :exchange
-                    AND c.symbol = :symbol0
-                    AND c.timeframe = '1d'
-                    AND c.day_start >= b.start_date
-                    AND c.day_start <  b.end_date
-                    AND c.low  IS NOT NULL
-                    AND c.high IS NOT NULL
-                )
-                SELECT
-                  v.price_volatility_pct,
-                  NULL::numeric AS correlation,
-                  CASE
-                    WHEN m.min_price IS NOT NULL AND m.max_price IS NOT NULL AND m.min_price > 0 AND m.max_price > 0
-                    THEN sqrt(m.min_price * m.max_price)
-                    ELSE NULL
-                  END AS geometric_mean_price
-                FROM vol v
-                CROSS JOIN minmax m
-            """
-            params = {
-                "exchange": exchange,
-                "symbol0": symbol0,
-                "days": days,
-            }
-            with self._engine.connect() as conn:
-                row = conn.execute(text(sql), params).mappings().first()
-            if row is None:
-                return PoolVolumeHistorySummaryPremium(
-                    price_volatility_pct=None,
-                    correlation=None,
-                    geometric_mean_price=None,
-                )
-            return map_row_to_pool_volume_history_summary_premium(row)
-
+        symbols: list[str],
+        start_day: date,
+        end_day: date,
+    ) -> dict[str, CryptoOhlcDailySeries]:
         sql = """
-            WITH bounds AS (
-              SELECT
-                (date_trunc('day', now() AT TIME ZONE 'UTC') - (CAST(:days AS int) * interval '1 day'))::date AS start_date,
-                (date_trunc('day', now() AT TIME ZONE 'UTC'))::date AS end_date
-            ),
-            vol AS (
-              SELECT
-                AVG(((high - low) / NULLIF(high, 0)) * 100.0) AS price_volatility_pct
-              FROM public.crypto_ohlc_daily c, bounds b
-              WHERE c.exchange = :exchange
-                AND c.symbol = :symbol0
-                AND c.timeframe = '1d'
-                AND c.day_start >= b.start_date
-                AND c.day_start <  b.end_date
-                AND c.high IS NOT NULL
-                AND c.low  IS NOT NULL
-            ),
-            minmax AS (
-              SELECT
-                MIN(c.low)  AS min_price,
-                MAX(c.high) AS max_price
-              FROM public.crypto_ohlc_daily c, bounds b
-              WHERE c.exchange = :exchange
-                AND c.symbol = :symbol0
-                AND c.timeframe = '1d'
-                AND c.day_start >= b.start_date
-                AND c.day_start <  b.end_date
-                AND c.low  IS NOT NULL
-                AND c.high IS NOT NULL
-            ),
-            corr_data AS (
-              WITH a AS (
-                SELECT day_start, close::double precision AS c0
-                FROM public.crypto_ohlc_daily c, bounds b
-                WHERE c.exchange = :exchange
-                  AND c.symbol = :symbol0
-                  AND c.timeframe = '1d'
-                  AND c.day_start >= b.start_date
-                  AND c.day_start <  b.end_date
-                  AND c.close IS NOT NULL
-              ),
-              b AS (
-                SELECT day_start, close::double precision AS c1
-                FROM public.crypto_ohlc_daily c, bounds b2
-                WHERE c.exchange = :exchange
-                  AND c.symbol = :symbol1
-                  AND c.timeframe = '1d'
-                  AND c.day_start >= b2.start_date
-                  AND c.day_start <  b2.end_date
-                  AND c.close IS NOT NULL
-              ),
-              joined AS (
-                SELECT a.day_start, a.c0, b.c1
-                FROM a JOIN b USING (day_start)
-              )
-              SELECT corr(c0, c1) AS correlation
-              FROM joined
-            )
             SELECT
-              v.price_volatility_pct,
-              c.correlation,
-              CASE
-                WHEN m.min_price IS NOT NULL AND m.max_price IS NOT NULL AND m.min_price > 0 AND m.max_price > 0
-                THEN sqrt(m.min_price * m.max_price)
-                ELSE NULL
-              END AS geometric_mean_price
-            FROM vol v
-            CROSS JOIN minmax m
-            CROSS JOIN corr_data c
+              c.symbol,
+              c.day_start,
+              c.high,
+              c.low,
+              c.close
+            FROM public.crypto_ohlc_daily c
+            WHERE c.exchange = :exchange
+              AND c.symbol = ANY(:symbols)
+              AND c.timeframe = '1d'
+              AND c.day_start >= :start_day
+              AND c.day_start <  :end_day
+            ORDER BY c.symbol, c.day_start
         """
         params = {
             "exchange": exchange,
-            "symbol0": symbol0,
-            "symbol1": symbol1,
-            "days": days,
+            "symbols": list(symbols),
+            "start_day": start_day,
+            "end_day": end_day,
         }
         with self._engine.connect() as conn:
-            row = conn.execute(text(sql), params).mappings().first()
-        print(">>>>>>>", exchange, symbol0, symbol1, days, row)
-        if row is None:
-            return PoolVolumeHistorySummaryPremium(
-                price_volatility_pct=None,
-                correlation=None,
-                geometric_mean_price=None,
-            )
-        return map_row_to_pool_volume_history_summary_premium(row)
+            rows = conn.execute(text(sql), params).mappings().all()
+        return map_rows_to_crypto_ohlc_daily_series(rows)
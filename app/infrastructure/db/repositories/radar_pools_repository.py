@@ -1,89 +1,298 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy import text
 
 from app.application.ports.radar_pools_port import RadarPoolsPort
-from app.domain.entities.radar_pools import RadarPoolAggregate
-from app.infrastructure.db.mappers.radar_pools_mapper import map_row_to_radar_pool_aggregate
+from app.domain.entities.radar_pools import RadarPoolItem
+from app.domain.entities.token_search import PoolKey
+from app.domain.services.radar_pools import PRECOMPUTED_TIMEFRAMES
+from app.infrastructure.db.mappers.radar_pools_mapper import map_row_to_radar_pool_item
 
 
 class SqlRadarPoolsRepository(RadarPoolsPort):
+    _PRECOMPUTED_SOURCE = """
+        SELECT
+            a.pool_id,
+            a.pool_address,
+            a.network_name,
+            a.exchange_name,
+            a.dex_id,
+            a.chain_id,
+            a.token0_address,
+            a.token1_address,
+            a.token0_symbol,
+            a.token1_symbol,
+            a.token0_icon_url,
+            a.token1_icon_url,
+            a.fee_tier,
+            a.avg_tvl_usd,
+            a.total_fees_usd,
+            a.avg_hourly_fees_usd,
+            a.avg_hourly_volume_usd,
+            a.price_volatility,
+            a.correlation
+        FROM public.radar_pool_aggregates a
+        WHERE a.timeframe_days = :timeframe_days
+          AND (:network_id IS NULL OR a.chain_id = :network_id)
+          AND (:exchange_id IS NULL OR a.dex_id = :exchange_id)
+          AND (
+            NOT CAST(:filter_pools AS boolean)
+            OR (a.chain_id, a.dex_id, a.pool_address) IN ({pool_keys})
+          )
+    """
+
+    _LIVE_SOURCE = """
+        SELECT
+            ABS(hashtext(p.dex_id::text || ':' || p.chain_id::text || ':' || p.pool_address)::bigint) AS pool_id,
+            p.pool_address,
+            c.name AS network_name,
+            d.name AS exchange_name,
+            p.dex_id AS dex_id,
+            p.chain_id AS chain_id,
+            p.token0_address,
+            p.token1_address,
+            COALESCE(t0.symbol, p.token0_address) AS token0_symbol,
+            COALESCE(t1.symbol, p.token1_address) AS token1_symbol,
+            t0.icon_url AS token0_icon_url,
+            t1.icon_url AS token1_icon_url,
+            COALESCE(p.fee_tier, 0) AS fee_tier,
+            SUM(pd.tvl_usd_sum) / NULLIF(SUM(pd.tvl_usd_samples), 0) AS avg_tvl_usd,
+            SUM(pd.fees_usd) AS total_fees_usd,
+            SUM(pd.fees_usd) / NULLIF(SUM(pd.hour_samples), 0) AS avg_hourly_fees_usd,
+            SUM(COALESCE(pd.volume_usd, 0)) / NULLIF(SUM(pd.hour_samples), 0) AS avg_hourly_volume_usd,
+            NULL::numeric AS price_volatility,
+            NULL::numeric AS correlation
+        FROM public.pools p
+        JOIN public.pool_daily pd
+          ON pd.dex_id = p.dex_id
+         AND pd.chain_id = p.chain_id
+         AND pd.pool_address = p.pool_address
+        JOIN public.chains c
+          ON c.chain_id = p.chain_id
+        JOIN public.dexes d
+          ON d.dex_id = p.dex_id
+        LEFT JOIN public.tokens t0
+          ON t0.chain_id = p.chain_id
+         AND t0.address = p.token0_address
+        LEFT JOIN public.tokens t1
+          ON t1.chain_id = p.chain_id
+         AND t1.address = p.token1_address
+        WHERE pd.day_utc >= :start_day
+          AND (:network_id IS NULL OR p.chain_id = :network_id)
+          AND (:exchange_id IS NULL OR p.dex_id = :exchange_id)
+          AND (
+            NOT CAST(:filter_pools AS boolean)
+            OR (p.chain_id, p.dex_id, p.pool_address) IN ({pool_keys})
+          )
+        GROUP BY
+            p.dex_id,
+            p.chain_id,
+            p.pool_address,
+            p.token0_address,
+            p.token1_address,
+            c.name,
+            d.name,
+            COALESCE(t0.symbol, p.token0_address),
+            COALESCE(t1.symbol, p.token1_address),
+            t0.icon_url,
+            t1.icon_url,
+            COALESCE(p.fee_tier, 0)
+    """
+
+    # Metricas derivadas calculadas no SQL para ordenar e paginar antes de
+    # materializar as linhas; so page_size linhas saem do banco.
+    _PAGE_SQL = """
+        WITH agg AS ({source}),
+        base AS (
+            SELECT
+                agg.pool_id,
+                agg.pool_address,
+                agg.token0_symbol || ' / ' || agg.token1_symbol AS pool_name,
+                agg.network_name AS network,
+                agg.exchange_name AS exchange,
+                agg.dex_id,
+                agg.chain_id,
+                agg.token0_address,
+                agg.token1_address,
+                agg.token0_symbol,
+                agg.token1_symbol,
+                agg.token0_icon_url,
+                agg.token1_icon_url,
+                agg.fee_tier,
+                COALESCE(agg.avg_tvl_usd, 0) AS tvl_usd,
+                COALESCE(agg.total_fees_usd, 0) AS total_fees_usd,
+                COALESCE(agg.avg_hourly_fees_usd, 0) * 24 AS avg_daily_fees_usd,
+                COALESCE(agg.avg_hourly_volume_usd, 0) * 24 AS avg_daily_volume_usd,
+                agg.price_volatility,
+                agg.correlation
+            FROM agg
+        ),
+        items AS (
+            SELECT
+                base.*,
+                CASE
+                    WHEN base.tvl_usd > 0
+                    THEN (base.total_fees_usd / base.tvl_usd)
+                        * (365 / CAST(:timeframe_days AS numeric)) * 100
+                    ELSE 0
+                END AS average_apr,
+                CASE WHEN base.tvl_usd > 0 THEN base.avg_daily_fees_usd / base.tvl_usd ELSE 0 END
+                    AS daily_fees_tvl_pct,
+                CASE WHEN base.tvl_usd > 0 THEN base.avg_daily_volume_usd / base.tvl_usd ELSE 0 END
+                    AS daily_volume_tvl_pct
+            FROM base
+        )
+        SELECT *
+        FROM items
+        ORDER BY {order_expression} {order_dir}, chain_id, dex_id, pool_address
+        LIMIT :limit OFFSET :offset
+    """
+
+    # Pools resolvidos pelo indice de busca de tokens, enviados como tres arrays paralelos.
+    _POOL_KEYS_SQL = """
+        SELECT k.chain_id, k.dex_id, k.pool_address
+        FROM unnest(
+            CAST(:key_chain_ids AS integer[]),
+            CAST(:key_dex_ids AS integer[]),
+            CAST(:key_pool_addresses AS text[])
+        ) AS k(chain_id, dex_id, pool_address)
+    """
+
+    _COUNT_SQL = """
+        WITH agg AS ({source})
+        SELECT count(*) AS total
+        FROM agg
+    """
+
+    _TEXT_ORDER_FIELDS = frozenset(
+        {
+            "pool_address",
+            "pool_name",
+            "network",
+            "exchange",
+            "token0_address",
+            "token1_address",
+            "token0_symbol",
+            "token1_symbol",
+            "token0_icon_url",
+            "token1_icon_url",
+        }
+    )
+    _NUMERIC_ORDER_FIELDS = frozenset(
+        {
+            "pool_id",
+            "dex_id",
+            "chain_id",
+            "fee_tier",
+            "average_apr",
+            "price_volatility",
+            "tvl_usd",
+            "correlation",
+            "avg_daily_fees_usd",
+            "daily_fees_tvl_pct",
+            "avg_daily_volume_usd",
+            "daily_volume_tvl_pct",
+        }
+    )
+
     def __init__(self, engine):
         self._engine = engine
 
-    def list_pools(
+    def get_latest_hour_start(self) -> datetime | None:
+        sql = """
+            SELECT max(ph.hour_start) AS latest_hour_start
+            FROM public.pool_hourly ph
+        """
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql)).mappings().first()
+        return row["latest_hour_start"] if row else None
+
+    def get_aggregates_refreshed_at(self, *, timeframe_days: int) -> datetime | None:
+        sql = """
+            SELECT max(a.refreshed_at) AS refreshed_at
+            FROM public.radar_pool_aggregates a
+            WHERE a.timeframe_days = :timeframe_days
+        """
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), {"timeframe_days": timeframe_days}).mappings().first()
+        return row["refreshed_at"] if row else None
+
+    def count_pools(
         self,
         *,
-        start_dt: datetime,
+        timeframe_days: int,
         network_id: int | None,
         exchange_id: int | None,
-        token_symbol: str | None,
-    ) -> list[RadarPoolAggregate]:
-        sql = """
-            SELECT
-                ABS(hashtext(p.dex_id::text || ':' || p.chain_id::text || ':' || lower(p.pool_address))::bigint) AS pool_id,
-                p.pool_address,
-                c.name AS network_name,
-                d.name AS exchange_name,
-                p.dex_id AS dex_id,
-                p.chain_id AS chain_id,
-                p.token0_address,
-                p.token1_address,
-                COALESCE(t0.symbol, p.token0_address) AS token0_symbol,
-                COALESCE(t1.symbol, p.token1_address) AS token1_symbol,
-                t0.icon_url AS token0_icon_url,
-                t1.icon_url AS token1_icon_url,
-                COALESCE(p.fee_tier, 0) AS fee_tier,
-                AVG(ph.tvl_usd) AS avg_tvl_usd,
-                SUM(COALESCE(ph.fees_usd, 0)) AS total_fees_usd,
-                AVG(COALESCE(ph.fees_usd, 0)) AS avg_hourly_fees_usd,
-                AVG(COALESCE(ph.volume_usd, 0)) AS avg_hourly_volume_usd,
-                COUNT(*) AS samples
-            FROM public.pools p
-            JOIN public.pool_hourly ph
-              ON ph.dex_id = p.dex_id
-             AND ph.chain_id = p.chain_id
-             AND lower(ph.pool_address) = lower(p.pool_address)
-            JOIN public.chains c
-              ON c.chain_id = p.chain_id
-            JOIN public.dexes d
-              ON d.dex_id = p.dex_id
-            LEFT JOIN public.tokens t0
-              ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
-            LEFT JOIN public.tokens t1
-              ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE ph.hour_start >= :start_dt
-              AND (:network_id IS NULL OR p.chain_id = :network_id)
-              AND (:exchange_id IS NULL OR p.dex_id = :exchange_id)
-              AND (
-                :token_symbol IS NULL
-                OR UPPER(COALESCE(t0.symbol, p.token0_address)) = :token_symbol
-                OR UPPER(COALESCE(t1.symbol, p.token1_address)) = :token_symbol
-              )
-            GROUP BY
-                p.dex_id,
-                p.chain_id,
-                p.pool_address,
-                p.token0_address,
-                p.token1_address,
-                c.name,
-                d.name,
-                COALESCE(t0.symbol, p.token0_address),
-                COALESCE(t1.symbol, p.token1_address),
-                t0.icon_url,
-                t1.icon_url,
-                COALESCE(p.fee_tier, 0)
-        """
-        params = {
-            "start_dt": start_dt,
+        pool_keys: frozenset[PoolKey] | None,
+    ) -> int:
+        source, params = self._source(
+            timeframe_days=timeframe_days,
+            network_id=network_id,
+            exchange_id=exchange_id,
+            pool_keys=pool_keys,
+        )
+        with self._engine.connect() as conn:
+            row = conn.execute(text(self._COUNT_SQL.format(source=source)), params).mappings().first()
+        return int(row["total"]) if row else 0
+
+    def list_pools_page(
+        self,
+        *,
+        timeframe_days: int,
+        network_id: int | None,
+        exchange_id: int | None,
+        pool_keys: frozenset[PoolKey] | None,
+        order_by: str,
+        order_dir: str,
+        limit: int | None,
+        offset: int,
+    ) -> list[RadarPoolItem]:
+        if order_by in self._TEXT_ORDER_FIELDS:
+            # COLLATE "C" mantem a ordem por codepoint, independente da collation do banco.
+            order_expression = f"COALESCE({order_by}, '') COLLATE \"C\""
+        elif order_by in self._NUMERIC_ORDER_FIELDS:
+            order_expression = f"COALESCE({order_by}, 0)"
+        else:
+            raise ValueError(f"Unsupported radar order_by: {order_by}")
+        if order_dir not in {"asc", "desc"}:
+            raise ValueError(f"Unsupported radar order_dir: {order_dir}")
+
+        source, params = self._source(
+            timeframe_days=timeframe_days,
+            network_id=network_id,
+            exchange_id=exchange_id,
+            pool_keys=pool_keys,
+        )
+        params.update({"limit": limit, "offset": offset})
+        sql = self._PAGE_SQL.format(
+            source=source,
+            order_expression=order_expression,
+            order_dir=order_dir.upper(),
+        )
+        with self._engine.connect() as conn:
+            rows = conn.execute(text(sql), params).mappings().all()
+        return [map_row_to_radar_pool_item(row) for row in rows]
+
+    def _source(
+        self,
+        *,
+        timeframe_days: int,
+        network_id: int | None,
+        exchange_id: int | None,
+        pool_keys: frozenset[PoolKey] | None,
+    ) -> tuple[str, dict[str, object]]:
+        params: dict[str, object] = {
+            "timeframe_days": timeframe_days,
             "network_id": network_id,
             "exchange_id": exchange_id,
-            "token_symbol": token_symbol,
+            "filter_pools": pool_keys is not None,
+            "key_chain_ids": [key.chain_id for key in pool_keys or ()],
+            "key_dex_ids": [key.dex_id for key in pool_keys or ()],
+            "key_pool_addresses": [key.pool_address for key in pool_keys or ()],
         }
-        with self._engine.connect() as conn:
-            rows = conn.execute(text(sql), params).mappings().all()
-        return [map_row_to_radar_pool_aggregate(row) for row in rows]
+        if timeframe_days in PRECOMPUTED_TIMEFRAMES:
+            return self._PRECOMPUTED_SOURCE.format(pool_keys=self._POOL_KEYS_SQL), params
+        params["start_day"] = (datetime.utcnow() - timedelta(days=timeframe_days)).date()
+        return self._LIVE_SOURCE.format(pool_keys=self._POOL_KEYS_SQL), params
@@ -42,11 +42,11 @@ class SqlSimulateAprRepository(SimulateAprPort):
             FROM public.pools p
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(p.pool_address) = :pool_address
+             AND t1.address = p.token1_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :dex_id
             LIMIT 1
@@ -85,11 +85,11 @@ class SqlSimulateAprRepository(SimulateAprPort):
                 FROM public.pool_state_snapshots ss
                 WHERE ss.dex_id = p.dex_id
                   AND ss.chain_id = p.chain_id
-                  AND lower(ss.pool_address) = lower(p.pool_address)
+                  AND ss.pool_address = p.pool_address
                 ORDER BY ss.meta_block_number DESC
                 LIMIT 1
             ) s ON true
-            WHERE lower(p.pool_address) = :pool_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :dex_id
             LIMIT 1
@@ -121,7 +121,7 @@ class SqlSimulateAprRepository(SimulateAprPort):
                 COALESCE(h.fees_usd, 0) AS fees_usd,
                 h.volume_usd
             FROM public.pool_hourly h
-            WHERE lower(h.pool_address) = :pool_address
+            WHERE h.pool_address = :pool_address
               AND h.chain_id = :chain_id
               AND h.dex_id = :dex_id
               AND h.hour_start >= (now() - (:hours || ' hours')::interval)
@@ -160,7 +160,7 @@ class SqlSimulateAprRepository(SimulateAprPort):
                         ORDER BY s.meta_block_number DESC
                     ) AS rn
                 FROM public.pool_state_snapshots s
-                WHERE lower(s.pool_address) = :pool_address
+                WHERE s.pool_address = :pool_address
                   AND s.chain_id = :chain_id
                   AND s.dex_id = :dex_id
                   AND (to_timestamp(s.meta_block_timestamp) AT TIME ZONE 'UTC') >= (
@@ -201,7 +201,7 @@ class SqlSimulateAprRepository(SimulateAprPort):
                 t.tick_idx,
                 t.liquidity_net
             FROM public.pool_ticks_initialized t
-            WHERE lower(t.pool_address) = :pool_address
+            WHERE t.pool_address = :pool_address
               AND t.chain_id = :chain_id
               AND t.dex_id = :dex_id
               AND t.liquidity_net IS NOT NULL
@@ -45,11 +45,11 @@ class SqlSimulateAprV2Repository(SimulateAprV2Port):
             FROM public.pools p
             LEFT JOIN public.tokens t0
               ON t0.chain_id = p.chain_id
-             AND lower(t0.address) = lower(p.token0_address)
+             AND t0.address = p.token0_address
             LEFT JOIN public.tokens t1
               ON t1.chain_id = p.chain_id
-             AND lower(t1.address) = lower(p.token1_address)
-            WHERE lower(p.pool_address) = :pool_address
+             AND t1.address = p.token1_address
+            WHERE p.pool_address = :pool_address
               AND p.chain_id = :chain_id
               AND p.dex_id = :dex_id
             LIMIT 1
@@ -92,7 +92,7 @@ class SqlSimulateAprV2Repository(SimulateAprV2Port):
             FROM public.pool_state_snapshots
             WHERE dex_id = :dex_id
               AND chain_id = :chain_id
-              AND lower(pool_address) = :pool_address
+              AND pool_address = :pool_address
             ORDER BY meta_block_timestamp DESC
             LIMIT 1
         """
@@ -135,7 +135,7 @@ class SqlSimulateAprV2Repository(SimulateAprV2Port):
             FROM public.pool_state_snapshots
             WHERE dex_id = :dex_id
               AND chain_id = :chain_id
-              AND lower(pool_address) = :pool_address
+              AND pool_address = :pool_address
               AND meta_block_timestamp <= :target_timestamp
             ORDER BY meta_block_timestamp DESC
             LIMIT 1
@@ -180,7 +180,7 @@ class SqlSimulateAprV2Repository(SimulateAprV2Port):
             FROM apr_exact.tick_snapshot
             WHERE dex_id = :dex_id
               AND chain_id = :chain_id
-              AND lower(pool_address) = :pool_address
+              AND pool_address = :pool_address
               AND block_number IN :block_numbers
               AND tick_idx IN :tick_indices
             """
@@ -233,7 +233,7 @@ class SqlSimulateAprV2Repository(SimulateAprV2Port):
                 t.tick_idx,
                 t.liquidity_net
             FROM public.pool_ticks_initialized t
-            WHERE lower(t.pool_address) = :pool_address
+            WHERE t.pool_address = :pool_address
               AND t.chain_id = :chain_id
               AND t.dex_id = :dex_id
               AND t.liquidity_net IS NOT NULL
@@ -47,7 +47,7 @@ class SqlTickSnapshotOnDemandRepository(TickSnapshotOnDemandPort):
             FROM apr_exact.tick_snapshot
             WHERE dex_id = :dex_id
               AND chain_id = :chain_id
-              AND lower(pool_address) = :pool_address
+              AND pool_address = :pool_address
               AND block_number IN :block_numbers
               AND tick_idx IN :tick_indices
             """
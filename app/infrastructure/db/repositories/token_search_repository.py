@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from app.application.ports.token_search_port import TokenSearchPort
+from app.domain.entities.token_search import PoolTokenPair
+from app.infrastructure.db.mappers.token_search_mapper import map_row_to_pool_token_pair
+
+
+class SqlTokenSearchRepository(TokenSearchPort):
+    def __init__(self, engine):
+        self._engine = engine
+
+    def list_pool_tokens(self) -> list[PoolTokenPair]:
+        sql = """
+            SELECT
+                p.chain_id,
+                p.dex_id,
+                p.pool_address AS pool_address,
+                p.token0_address AS token0_address,
+                t0.symbol AS token0_symbol,
+                p.token1_address AS token1_address,
+                t1.symbol AS token1_symbol
+            FROM public.pools p
+            LEFT JOIN public.tokens t0
+              ON t0.chain_id = p.chain_id
+             AND t0.address = p.token0_address
+            LEFT JOIN public.tokens t1
+              ON t1.chain_id = p.chain_id
+             AND t1.address = p.token1_address
+            WHERE p.token0_address IS NOT NULL
+              AND p.token1_address IS NOT NULL
+        """
+        with self._engine.connect() as conn:
+            rows = conn.execute(text(sql)).mappings().all()
+        return [map_row_to_pool_token_pair(row) for row in rows]
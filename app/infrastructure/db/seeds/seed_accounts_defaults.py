@@ -141,6 +141,18 @@ def seed_accounts_defaults(engine) -> None:
                 "description": "Quantidade mensal de chamadas",
                 "type": "limit",
             },
+            {
+                "code": "requests_per_minute",
+                "name": "Requisicoes por minuto",
+                "description": "Tokens por minuto do rate limit das rotas caras",
+                "type": "limit",
+            },
+            {
+                "code": "ops_admin",
+                "name": "Operacao",
+                "description": "Acesso as rotas /v1/ops (estatisticas internas do processo)",
+                "type": "boolean",
+            },
         ):
             conn.execute(
                 text(
@@ -171,9 +183,13 @@ def seed_accounts_defaults(engine) -> None:
             (str(free_plan_id), feature_ids["charts_advanced"], False, None),
             (str(free_plan_id), feature_ids["export_csv"], False, None),
             (str(free_plan_id), feature_ids["api_calls"], True, 100),
+            (str(free_plan_id), feature_ids["requests_per_minute"], True, 60),
+            (str(free_plan_id), feature_ids["ops_admin"], False, None),
             (str(pro_plan_id), feature_ids["charts_advanced"], True, None),
             (str(pro_plan_id), feature_ids["export_csv"], True, None),
             (str(pro_plan_id), feature_ids["api_calls"], True, 10000),
+            (str(pro_plan_id), feature_ids["requests_per_minute"], True, 600),
+            (str(pro_plan_id), feature_ids["ops_admin"], False, None),
         )
         for plan_id, feature_id, is_enabled, limit_value in assignments:
             conn.execute(
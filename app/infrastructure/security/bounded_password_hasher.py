@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+import time
+from typing import TypeVar
+
+from app.application.ports.password_hasher_port import PasswordHasherPort
+from app.domain.exceptions import PasswordHashingBusyError
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    workers: int
+    max_queue: int
+    in_flight: int
+    completed: int
+    rejected: int
+    queue_wait_avg_ms: float | None
+    queue_wait_p95_ms: float | None
+    queue_wait_max_ms: float | None
+
+
+class BoundedPasswordHasher(PasswordHasherPort):
+    # argon2/bcrypt rodam num pool proprio com max_workers threads (as libs
+    # liberam o GIL). No maximo max_workers + max_queue chamadas ficam em voo;
+    # acima disso a chamada falha na hora com PasswordHashingBusyError (429),
+    # entao uma rajada de logins prende poucas threads do threadpool do AnyIO.
+    _WAIT_SAMPLES = 1024
+
+    def __init__(self, *, inner: PasswordHasherPort, max_workers: int, max_queue: int):
+        self._inner = inner
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._slots = BoundedSemaphore(max_workers + max_queue)
+        self._lock = Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._waits_ms: deque[float] = deque(maxlen=self._WAIT_SAMPLES)
+
+    def hash(self, plain_password: str) -> str:
+        return self._run(lambda: self._inner.hash(plain_password))
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        return self._run(lambda: self._inner.verify(plain_password, password_hash))
+
+    def verify_and_update(self, plain_password: str, password_hash: str) -> tuple[bool, str | None]:
+        return self._run(lambda: self._inner.verify_and_update(plain_password, password_hash))
+
+    def stats(self) -> PasswordHashingStats:
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            in_flight, completed, rejected = self._in_flight, self._completed, self._rejected
+        return PasswordHashingStats(
+            workers=self._max_workers,
+            max_queue=self._max_queue,
+            in_flight=in_flight,
+            completed=completed,
+            rejected=rejected,
+            queue_wait_avg_ms=sum(waits) / len(waits) if waits else None,
+            queue_wait_p95_ms=waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else None,
+            queue_wait_max_ms=waits[-1] if waits else None,
+        )
+
+    def _run(self, fn: Callable[[], T]) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHashingBusyError("Too many concurrent password operations; retry shortly.")
+        with self._lock:
+            self._in_flight += 1
+        submitted_at = time.monotonic()
+
+        def _task() -> T:
+            wait_ms = (time.monotonic() - submitted_at) * 1000.0
+            with self._lock:
+                self._waits_ms.append(wait_ms)
+            return fn()
+
+        try:
+            return self._executor.submit(_task).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+            self._slots.release()
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 import jwt
 
-from app.application.dto.auth import AccessTokenPayload
+from app.application.dto.auth import AccessTokenClaims, AccessTokenPayload
 from app.application.ports.token_port import TokenPort
 
 
@@ -22,7 +22,13 @@ class JwtTokenService(TokenPort):
         self._access_ttl_minutes = access_ttl_minutes
         self._refresh_ttl_days = refresh_ttl_days
 
-    def create_access_token(self, *, user_id: str, now: datetime) -> tuple[str, datetime]:
+    def create_access_token(
+        self,
+        *,
+        user_id: str,
+        now: datetime,
+        claims: AccessTokenClaims | None = None,
+    ) -> tuple[str, datetime]:
         exp = now + timedelta(minutes=self._access_ttl_minutes)
         payload = {
             "sub": user_id,
@@ -30,6 +36,12 @@ class JwtTokenService(TokenPort):
             "iat": int(now.timestamp()),
             "exp": int(exp.timestamp()),
         }
+        if claims is not None:
+            payload["plan"] = claims.plan_code
+            payload["fbits"] = claims.feature_bits
+            payload["epc"] = claims.entitlements_epoch
+            if claims.requests_per_minute is not None:
+                payload["rpm"] = claims.requests_per_minute
         token = jwt.encode(payload, self._jwt_secret, algorithm="HS256")
         return token, exp
 
@@ -46,7 +58,7 @@ class JwtTokenService(TokenPort):
         if not user_id or not isinstance(user_id, str):
             raise ValueError("Invalid token subject.")
 
-        return AccessTokenPayload(user_id=user_id)
+        return AccessTokenPayload(user_id=user_id, claims=_decode_claims(payload))
 
     def generate_refresh_token(self) -> str:
         return secrets.token_urlsafe(48)
@@ -58,5 +70,22 @@ class JwtTokenService(TokenPort):
         return now + timedelta(days=self._refresh_ttl_days)
 
 
+def _decode_claims(payload: dict) -> AccessTokenClaims | None:
+    # Tokens sem claims (ou emitidos antes delas) seguem validos; o chamador
+    # consulta os entitlements no banco.
+    plan_code = payload.get("plan")
+    feature_bits = payload.get("fbits")
+    entitlements_epoch = payload.get("epc")
+    if not isinstance(plan_code, str) or not isinstance(feature_bits, int) or not isinstance(entitlements_epoch, int):
+        return None
+    requests_per_minute = payload.get("rpm")
+    return AccessTokenClaims(
+        plan_code=plan_code,
+        feature_bits=feature_bits,
+        entitlements_epoch=entitlements_epoch,
+        requests_per_minute=requests_per_minute if isinstance(requests_per_minute, int) else None,
+    )
+
+
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
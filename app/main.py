@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -12,14 +14,41 @@ from .api.routers.estimated_fees import router as estimated_fees_router
 from .api.routers.liquidity_distribution import router as liquidity_distribution_router
 from .api.routers.match_ticks import router as match_ticks_router
 from .api.routers.me import router as me_router
+from .api.routers.ops import router as ops_router
 from .api.routers.pool_price import router as pool_price_router
 from .api.routers.pool_volume_history import router as pool_volume_history_router
 from .api.routers.simulate_apr import router as simulate_apr_router
 from .api.routers.simulate_apr_v2 import router as simulate_apr_v2_router
+from .api.deps import decode_access_token_or_none, get_rate_limiter, start_catalog_snapshot_refresher
+from .api.rate_limit import RateLimitMiddleware
 from .shared.config import get_settings
+from .shared.rate_limit import parse_rate_limit_rules, parse_trusted_proxies
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Foto do catalogo carregada no startup e recarregada em background.
+    refresher = start_catalog_snapshot_refresher()
+    try:
+        yield
+    finally:
+        if refresher is not None:
+            refresher.stop()
+
 
-app = FastAPI(title="LP API")
+app = FastAPI(title="LP API", lifespan=lifespan)
 settings = get_settings()
+if settings.rate_limit_enabled:
+    # Adicionado antes do CORS para que as respostas 429 tambem levem os headers de CORS.
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=get_rate_limiter(),
+        rules=parse_rate_limit_rules(settings.rate_limit_rules),
+        decode_access_token=decode_access_token_or_none,
+        user_per_minute=settings.rate_limit_user_per_minute,
+        ip_per_minute=settings.rate_limit_ip_per_minute,
+        trusted_proxies=parse_trusted_proxies(settings.rate_limit_trusted_proxies),
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_allow_origins,
@@ -41,3 +70,4 @@ app.include_router(simulate_apr_v2_router)
 app.include_router(auth_router)
 app.include_router(me_router)
 app.include_router(billing_router)
+app.include_router(ops_router)
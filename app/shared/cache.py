@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+import logging
+import sys
+from threading import Lock, Thread
+import time
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class LruCache(Generic[K, V]):
+    def __init__(self, *, max_entries: int, ttl_seconds: float | None = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> V | None:
+        if self.max_entries <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self._misses += 1
+                return None
+            expires_at, value = cached
+            if expires_at is not None and expires_at <= now:
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class StaleWhileRevalidateCache(Generic[K, V]):
+    # Valor fresco ate ttl_seconds; depois disso, por mais stale_seconds, o valor
+    # antigo e servido enquanto uma unica thread recalcula em segundo plano.
+    # Sem valor utilizavel, apenas um chamador por chave executa o loader e os
+    # demais aguardam o mesmo resultado (single-flight).
+    def __init__(self, *, max_entries: int, ttl_seconds: float, stale_seconds: float = 0.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[K, Future[V]] = {}
+        self._lock = Lock()
+
+    def get_or_load(
+        self,
+        key: K,
+        loader: Callable[[], V],
+        *,
+        is_stale: Callable[[V], bool] | None = None,
+    ) -> V:
+        # is_stale marca como antigo um valor ainda dentro do ttl (ex.: versao
+        # dos dados mudou): ele e servido e recalculado em segundo plano.
+        if self.max_entries <= 0:
+            return loader()
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                loaded_at, value = cached
+                age = now - loaded_at
+                if age < self.ttl_seconds + self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    stale = age >= self.ttl_seconds or (is_stale is not None and is_stale(value))
+                    if stale and key not in self._inflight:
+                        future: Future[V] = Future()
+                        self._inflight[key] = future
+                        Thread(
+                            target=self._refresh,
+                            args=(key, loader, future),
+                            name="swr-cache-refresh",
+                            daemon=True,
+                        ).start()
+                    return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        return self._load(key, loader, future)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self, key: K, loader: Callable[[], V], future: Future[V]) -> V:
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def _refresh(self, key: K, loader: Callable[[], V], future: Future[V]) -> None:
+        try:
+            self._load(key, loader, future)
+        except Exception:
+            logger.exception("Background cache refresh failed; keeping stale value.")
+
+
+class TimeSeriesCache(Generic[K, V]):
+    # Serie (timestamp epoch, valor) por chave: timestamps em array colunar e
+    # valores como vieram do banco (ex.: Decimal, sem perder precisao); cobre
+    # [coverage_start, ultimo timestamp] e cresce apenas pela cauda.
+    _ENTRY_OVERHEAD_BYTES = 256
+    _POINTER_BYTES = 8
+
+    def __init__(self, *, max_series: int, max_bytes: int):
+        self.max_series = max_series
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[K, tuple[int, array, list[V]]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    @classmethod
+    def _entry_bytes(cls, timestamps: array, values: list[V]) -> int:
+        # Estimativa: todos os valores do tamanho do primeiro.
+        value_bytes = cls._POINTER_BYTES + (sys.getsizeof(values[0]) if values else 0)
+        return cls._ENTRY_OVERHEAD_BYTES + timestamps.itemsize * len(timestamps) + value_bytes * len(values)
+
+    def tail_start(self, key: K, *, start_ts: int, overlap_seconds: int = 0) -> int | None:
+        # Inicio da cauda a rebuscar; overlap_seconds antes do ultimo ponto pega
+        # snapshots ingeridos com atraso (sem passar do inicio da cobertura).
+        if self.max_series <= 0:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            coverage_start, timestamps, _ = cached
+            if coverage_start > start_ts:
+                return None
+            if not timestamps:
+                return coverage_start
+            return max(coverage_start, timestamps[-1] - max(overlap_seconds, 0))
+
+    def store(
+        self,
+        key: K,
+        *,
+        from_ts: int,
+        timestamps: list[int],
+        values: list[V],
+        replace: bool,
+    ) -> None:
+        if self.max_series <= 0:
+            return
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None and not replace:
+                # Entrada despejada entre tail_start e store: a cauda sozinha nao cobre a janela.
+                return
+            if replace:
+                if cached is not None:
+                    self._total_bytes -= self._entry_bytes(cached[1], cached[2])
+                coverage_start = from_ts
+                new_timestamps = array("q", timestamps)
+                new_values = list(values)
+            else:
+                coverage_start, new_timestamps, new_values = cached
+                self._total_bytes -= self._entry_bytes(new_timestamps, new_values)
+                # A cauda refeita substitui tudo a partir de from_ts (idempotente).
+                cut = bisect_left(new_timestamps, from_ts)
+                del new_timestamps[cut:]
+                del new_values[cut:]
+                new_timestamps.extend(timestamps)
+                new_values.extend(values)
+            self._entries[key] = (coverage_start, new_timestamps, new_values)
+            self._entries.move_to_end(key)
+            self._total_bytes += self._entry_bytes(new_timestamps, new_values)
+            self._evict_locked()
+
+    def window(
+        self,
+        key: K,
+        *,
+        start_ts: int,
+        end_ts: int | None = None,
+    ) -> tuple[list[int], list[V]] | None:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            coverage_start, timestamps, values = cached
+            if coverage_start > start_ts:
+                return None
+            self._entries.move_to_end(key)
+            lo = bisect_left(timestamps, start_ts)
+            hi = len(timestamps) if end_ts is None else bisect_right(timestamps, end_ts)
+            return timestamps[lo:hi].tolist(), values[lo:hi]
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            cached = self._entries.pop(key, None)
+            if cached is not None:
+                self._total_bytes -= self._entry_bytes(cached[1], cached[2])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict_locked(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_series or self._total_bytes > self.max_bytes
+        ):
+            _, (_, timestamps, values) = self._entries.popitem(last=False)
+            self._total_bytes -= self._entry_bytes(timestamps, values)
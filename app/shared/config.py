@@ -7,6 +7,8 @@ from decimal import Decimal
 
 from dotenv import load_dotenv
 
+from app.shared.rate_limit import DEFAULT_RATE_LIMIT_RULES
+
 
 load_dotenv()
 
@@ -40,6 +42,7 @@ class Settings:
     coingecko_api_base: str
     coingecko_timeout_seconds: float
     coingecko_cache_ttl_seconds: float
+    coingecko_max_addresses_per_request: int
     postgres_dsn: str
     graph_api_key: str
     graph_gateway_base: str
@@ -51,9 +54,36 @@ class Settings:
     graph_on_demand_min_interval_ms: int
     graph_on_demand_max_combinations: int
     pool_min_tvl_usd: Decimal
+    liquidity_history_cache_max_entries: int
+    pool_price_cache_max_pools: int
+    pool_price_cache_max_mb: int
+    pool_price_cache_tail_overlap_seconds: int
+    premium_summary_cache_max_entries: int
+    radar_cache_max_entries: int
+    radar_cache_ttl_seconds: float
+    radar_cache_stale_seconds: float
+    radar_ohlc_exchange: str
+    token_search_index_ttl_seconds: float
+    token_search_index_stale_seconds: float
+    catalog_snapshot_refresh_seconds: float
+    catalog_snapshot_min_refresh_seconds: float
+    user_cache_max_entries: int
+    user_cache_ttl_seconds: float
+    entitlements_cache_max_entries: int
+    entitlements_cache_ttl_seconds: float
+    plan_grants_cache_ttl_seconds: float
     jwt_secret: str
     jwt_access_ttl_minutes: int
     jwt_refresh_ttl_days: int
+    jwt_entitlement_claims: bool
+    password_hash_workers: int
+    password_hash_max_queue: int
+    rate_limit_enabled: bool
+    rate_limit_rules: dict
+    rate_limit_user_per_minute: float
+    rate_limit_ip_per_minute: float
+    rate_limit_max_keys: int
+    rate_limit_trusted_proxies: list[str]
     google_client_id: str
     stripe_secret_key: str
     stripe_webhook_secret: str
@@ -92,6 +122,7 @@ def get_settings() -> Settings:
         coingecko_api_base=_env("COINGECKO_API_BASE", "https://api.coingecko.com/api/v3"),
         coingecko_timeout_seconds=float(_env("COINGECKO_TIMEOUT_SECONDS", "10")),
         coingecko_cache_ttl_seconds=float(_env("COINGECKO_CACHE_TTL_SECONDS", "300")),
+        coingecko_max_addresses_per_request=int(_env("COINGECKO_MAX_ADDRESSES_PER_REQUEST", "100")),
         postgres_dsn=_env("POSTGRES_DSN", ""),
         graph_api_key=_env("GRAPH_API_KEY", ""),
         graph_gateway_base=_env("GRAPH_GATEWAY_BASE", "https://gateway.thegraph.com/api"),
@@ -103,9 +134,36 @@ def get_settings() -> Settings:
         graph_on_demand_min_interval_ms=int(_env("GRAPH_ON_DEMAND_MIN_INTERVAL_MS", "120")),
         graph_on_demand_max_combinations=int(_env("GRAPH_ON_DEMAND_MAX_COMBINATIONS", "4")),
         pool_min_tvl_usd=Decimal(_env("POOL_MIN_TVL_USD", "100000")),
+        liquidity_history_cache_max_entries=int(_env("LIQUIDITY_HISTORY_CACHE_MAX_ENTRIES", "256")),
+        pool_price_cache_max_pools=int(_env("POOL_PRICE_CACHE_MAX_POOLS", "64")),
+        pool_price_cache_max_mb=int(_env("POOL_PRICE_CACHE_MAX_MB", "64")),
+        pool_price_cache_tail_overlap_seconds=int(_env("POOL_PRICE_CACHE_TAIL_OVERLAP_SECONDS", "3600")),
+        premium_summary_cache_max_entries=int(_env("PREMIUM_SUMMARY_CACHE_MAX_ENTRIES", "512")),
+        radar_cache_max_entries=int(_env("RADAR_CACHE_MAX_ENTRIES", "256")),
+        radar_cache_ttl_seconds=float(_env("RADAR_CACHE_TTL_SECONDS", "60")),
+        radar_cache_stale_seconds=float(_env("RADAR_CACHE_STALE_SECONDS", "600")),
+        radar_ohlc_exchange=_env("RADAR_OHLC_EXCHANGE", "coingecko-derived") or "coingecko-derived",
+        token_search_index_ttl_seconds=float(_env("TOKEN_SEARCH_INDEX_TTL_SECONDS", "300")),
+        token_search_index_stale_seconds=float(_env("TOKEN_SEARCH_INDEX_STALE_SECONDS", "3600")),
+        catalog_snapshot_refresh_seconds=float(_env("CATALOG_SNAPSHOT_REFRESH_SECONDS", "900")),
+        catalog_snapshot_min_refresh_seconds=float(_env("CATALOG_SNAPSHOT_MIN_REFRESH_SECONDS", "30")),
+        user_cache_max_entries=int(_env("USER_CACHE_MAX_ENTRIES", "10000")),
+        user_cache_ttl_seconds=float(_env("USER_CACHE_TTL_SECONDS", "30")),
+        entitlements_cache_max_entries=int(_env("ENTITLEMENTS_CACHE_MAX_ENTRIES", "10000")),
+        entitlements_cache_ttl_seconds=float(_env("ENTITLEMENTS_CACHE_TTL_SECONDS", "60")),
+        plan_grants_cache_ttl_seconds=float(_env("PLAN_GRANTS_CACHE_TTL_SECONDS", "600")),
         jwt_secret=_env("JWT_SECRET", "") or "",
         jwt_access_ttl_minutes=int(_env("JWT_ACCESS_TTL_MINUTES", "15")),
         jwt_refresh_ttl_days=int(_env("JWT_REFRESH_TTL_DAYS", "30")),
+        jwt_entitlement_claims=_bool("JWT_ENTITLEMENT_CLAIMS", True),
+        password_hash_workers=int(_env("PASSWORD_HASH_WORKERS", "4")),
+        password_hash_max_queue=int(_env("PASSWORD_HASH_MAX_QUEUE", "16")),
+        rate_limit_enabled=_bool("RATE_LIMIT_ENABLED", True),
+        rate_limit_rules=_json("RATE_LIMIT_RULES") or dict(DEFAULT_RATE_LIMIT_RULES),
+        rate_limit_user_per_minute=float(_env("RATE_LIMIT_USER_PER_MINUTE", "60")),
+        rate_limit_ip_per_minute=float(_env("RATE_LIMIT_IP_PER_MINUTE", "30")),
+        rate_limit_max_keys=int(_env("RATE_LIMIT_MAX_KEYS", "100000")),
+        rate_limit_trusted_proxies=_csv("RATE_LIMIT_TRUSTED_PROXIES"),
         google_client_id=_env("GOOGLE_CLIENT_ID", "") or "",
         stripe_secret_key=_env("STRIPE_SECRET_KEY", "") or "",
         stripe_webhook_secret=_env("STRIPE_WEBHOOK_SECRET", "") or "",
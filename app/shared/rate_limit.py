@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import ipaddress
+from threading import Lock
+import time
+
+
+# Custo em tokens por rota ("METODO /caminho", com * para segmentos variaveis).
+# Rotas fora da lista nao consomem tokens.
+DEFAULT_RATE_LIMIT_RULES: dict[str, float] = {
+    "POST /v2/simulate/apr": 5,
+    "POST /v1/simulate/apr": 5,
+    "POST /v1/allocate": 2,
+    "POST /v1/liquidity-distribution*": 2,
+    "POST /v1/estimated-fees": 1,
+    "POST /v1/match-ticks": 1,
+    "GET /v1/pool-price*": 1,
+    "GET /v1/pools/*/volume-history*": 1,
+    "GET /v1/radar/pools": 1,
+    "POST /v1/auth/login": 1,
+    "POST /v1/auth/register": 1,
+    "POST /v1/auth/password/*": 1,
+}
+
+# Retry-After devolvido quando o limite por minuto e 0.
+BLOCKED_RETRY_AFTER_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    method: str
+    path_pattern: str
+    cost: float
+
+    def matches(self, *, method: str, path: str) -> bool:
+        return self.method in {"*", method} and fnmatchcase(path, self.path_pattern)
+
+
+def parse_rate_limit_rules(raw: Mapping[str, float]) -> tuple[RateLimitRule, ...]:
+    rules = []
+    for route, cost in raw.items():
+        method, _, path_pattern = route.strip().partition(" ")
+        if not path_pattern:
+            raise ValueError(f"Invalid rate limit route '{route}'; expected 'METHOD /path'.")
+        rules.append(RateLimitRule(method=method.upper(), path_pattern=path_pattern.strip(), cost=float(cost)))
+    return tuple(rules)
+
+
+def match_rate_limit_rule(rules: tuple[RateLimitRule, ...], *, method: str, path: str) -> RateLimitRule | None:
+    for rule in rules:
+        if rule.matches(method=method, path=path):
+            return rule
+    return None
+
+
+TrustedProxies = tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]
+
+
+def parse_trusted_proxies(values: list[str]) -> TrustedProxies:
+    return tuple(ipaddress.ip_network(value.strip(), strict=False) for value in values if value.strip())
+
+
+def _is_trusted(address: str, trusted_proxies: TrustedProxies) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def resolve_client_ip(*, peer: str | None, forwarded_for: str, trusted_proxies: TrustedProxies) -> str:
+    # So confia no X-Forwarded-For quando a conexao vem de um proxy configurado;
+    # o cliente e o hop mais a direita que nao e proxy (os da esquerda sao do cliente).
+    if peer is None or not _is_trusted(peer, trusted_proxies):
+        return peer or "unknown"
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted_proxies):
+            return hop
+    return hops[0] if hops else peer
+
+
+class TokenBucketLimiter:
+    # Um bucket por chave (usuario ou IP) com capacidade = per_minute tokens e
+    # reposicao continua de per_minute/60 por segundo. Chaves ociosas saem por
+    # LRU; um bucket despejado volta cheio, o que so afrouxa o limite.
+    def __init__(self, *, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def acquire(self, key: str, *, cost: float, per_minute: float) -> float:
+        # Devolve 0 se liberou; senao, segundos ate haver tokens suficientes.
+        return self.acquire_all(((key, per_minute),), cost=cost)
+
+    def acquire_all(self, limits: Sequence[tuple[str, float]], *, cost: float) -> float:
+        # Cobra o custo em todos os buckets ou em nenhum: um bucket sem tokens
+        # nao deixa os outros pagarem por uma requisicao rejeitada. Devolve o
+        # maior tempo de espera entre os buckets sem tokens.
+        if cost <= 0:
+            return 0.0
+        if any(per_minute <= 0 for _, per_minute in limits):
+            # Limite desligado no plano (grant desabilitado vira 0): nada passa.
+            return BLOCKED_RETRY_AFTER_SECONDS
+        now = time.monotonic()
+        with self._lock:
+            retry_after = 0.0
+            refilled: list[tuple[str, float, float]] = []
+            for key, per_minute in limits:
+                capacity = float(per_minute)
+                refill_per_second = capacity / 60.0
+                key_cost = min(cost, capacity)
+                tokens, updated_at = self._buckets.pop(key, (capacity, now))
+                tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+                if tokens < key_cost:
+                    retry_after = max(retry_after, (key_cost - tokens) / refill_per_second)
+                refilled.append((key, tokens, key_cost))
+            for key, tokens, key_cost in refilled:
+                self._buckets[key] = (tokens - key_cost if retry_after == 0 else tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buckets)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import jwt
+import pytest
+
+from app.application.dto.auth import AccessTokenClaims
+from app.domain.services.entitlements import FEATURE_BITS, encode_feature_bits, feature_bit_enabled
+from app.infrastructure.security.token_service import JwtTokenService
+
+
+SECRET = "test-secret"
+
+
+def _service() -> JwtTokenService:
+    return JwtTokenService(jwt_secret=SECRET, access_ttl_minutes=15, refresh_ttl_days=30)
+
+
+def test_feature_bits_round_trip_and_unknown_features():
+    bits = encode_feature_bits({"charts_advanced": True, "export_csv": False, "unknown": True})
+
+    assert bits == 1
+    assert feature_bit_enabled(bits, "charts_advanced") is True
+    assert feature_bit_enabled(bits, "export_csv") is False
+    assert feature_bit_enabled(bits, "unknown") is None
+    assert FEATURE_BITS[:2] == ("charts_advanced", "export_csv")
+
+
+def test_access_token_carries_claims_and_stays_compatible_without_them():
+    service = _service()
+    now = datetime.now(timezone.utc)
+    claims = AccessTokenClaims(plan_code="pro", feature_bits=3, entitlements_epoch=2)
+
+    token, _ = service.create_access_token(user_id="u1", now=now, claims=claims)
+    payload = service.decode_access_token(token=token)
+    assert payload.user_id == "u1"
+    assert payload.claims == claims
+
+    legacy_token, _ = service.create_access_token(user_id="u1", now=now)
+    assert service.decode_access_token(token=legacy_token).claims is None
+
+    tampered = jwt.encode({**jwt.decode(token, options={"verify_signature": False}), "fbits": 7}, "other")
+    with pytest.raises(ValueError):
+        service.decode_access_token(token=tampered)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+import re
+from contextlib import nullcontext
+import unittest
+
+from sqlalchemy.exc import IntegrityError
+
+from app.infrastructure.db.backfills.lowercase_addresses import ADDRESS_COLUMNS, _backfill_table
+from app.infrastructure.db.migrations.runner import load_migrations
+
+
+SQL_MODULES = sorted(
+    path
+    for pattern in (
+        "app/infrastructure/db/repositories/*.py",
+        "app/infrastructure/db/backfills/*.py",
+    )
+    for path in Path(".").glob(pattern)
+    if path.name != "lowercase_addresses.py"
+)
+
+# lower(...) sobre colunas de endereco impede o uso dos indices B-tree.
+LOWER_ON_ADDRESS = re.compile(r"lower\(\s*(?:\w+\.)?\w*address\s*\)", re.IGNORECASE)
+
+
+def _string_constants(path: Path) -> list[str]:
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return [
+        node.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    ]
+
+
+class _FakeResult:
+    def __init__(self, rows=(), rowcount=0):
+        self._rows = list(rows)
+        self.rowcount = rowcount
+
+    def scalars(self):
+        return [row["ctid"] for row in self._rows]
+
+    def mappings(self):
+        return self
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakePoolsTable:
+    # public.pools com chave unica (chain_id, pool_address).
+    def __init__(self, rows: dict[str, tuple[int, str]]):
+        self.rows = dict(rows)
+
+    def begin(self):
+        return _FakeConnection(self)
+
+
+class _FakeConnection:
+    def __init__(self, table: _FakePoolsTable):
+        self._table = table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        rows = self._table.rows
+        if sql.lstrip().startswith("SELECT"):
+            if "LIMIT" not in sql:
+                _, address = rows[params["ctid"]]
+                return _FakeResult([{"ctid": params["ctid"], "pool_address": address}])
+            pending = [
+                {"ctid": ctid}
+                for ctid, (_, address) in sorted(rows.items())
+                if address != address.lower() and ctid not in params["skipped"]
+            ]
+            return _FakeResult(pending[: params["batch_size"]])
+        ctids = params["ctids"] if "ctids" in params else [params["ctid"]]
+        updated = dict(rows)
+        for ctid in ctids:
+            updated[ctid] = (updated[ctid][0], updated[ctid][1].lower())
+        if len(set(updated.values())) < len(updated):
+            raise IntegrityError(sql, params, Exception("duplicate key value violates unique constraint"))
+        self._table.rows = updated
+        return _FakeResult(rowcount=len(ctids))
+
+
+class AddressNormalizationTests(unittest.TestCase):
+    def test_backfill_skips_and_reports_rows_whose_lowercase_key_exists(self):
+        table = _FakePoolsTable(
+            {
+                "(0,1)": (1, "0xAAA"),
+                "(0,2)": (1, "0xaaa"),
+                "(0,3)": (1, "0xBBB"),
+                "(0,4)": (2, "0xAAA"),
+                "(0,5)": (1, "0xCcC"),
+            }
+        )
+
+        updated, skipped = _backfill_table(
+            table,
+            table="public.pools",
+            columns=("pool_address",),
+            batch_size=2,
+        )
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(skipped, [{"ctid": "(0,1)", "pool_address": "0xAAA"}])
+        self.assertEqual(
+            table.rows,
+            {
+                "(0,1)": (1, "0xAAA"),
+                "(0,2)": (1, "0xaaa"),
+                "(0,3)": (1, "0xbbb"),
+                "(0,4)": (2, "0xaaa"),
+                "(0,5)": (1, "0xccc"),
+            },
+        )
+
+    def test_repository_sql_compares_raw_address_columns(self):
+        self.assertTrue(SQL_MODULES)
+        offenders = [
+            f"{path}: {match.group(0)}"
+            for path in SQL_MODULES
+            for value in _string_constants(path)
+            for match in LOWER_ON_ADDRESS.finditer(value)
+        ]
+        self.assertEqual(offenders, [])
+
+    def test_lowercase_triggers_cover_address_columns_and_run_before_price_trigger(self):
+        migration = next(m for m in load_migrations() if m.name == "lowercase_addresses")
+        creates = [statement for statement in migration.statements if statement.startswith("CREATE TRIGGER")]
+
+        self.assertEqual(len(creates), len(ADDRESS_COLUMNS))
+        for table, columns in ADDRESS_COLUMNS:
+            name = f"trg_{table.split('.')[-1]}_lowercase_addresses"
+            [create] = [statement for statement in creates if f"CREATE TRIGGER {name}\n" in statement]
+            self.assertIn(f"BEFORE INSERT OR UPDATE OF {', '.join(columns)}\nON {table}\n", create)
+            arguments = ", ".join(f"'{column}'" for column in columns)
+            self.assertIn(f"lowercase_address_columns({arguments})", create)
+        # Triggers BEFORE disparam em ordem alfabetica.
+        self.assertLess("trg_pool_state_snapshots_lowercase_addresses", "trg_pool_state_snapshots_set_price")
+
+
+if __name__ == "__main__":
+    unittest.main()
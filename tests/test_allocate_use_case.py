@@ -24,15 +24,10 @@ class FakePoolPort:
 
 
 class FakePricePort:
-    def get_pair_prices(
-        self,
-        *,
-        token0_address: str,
-        token1_address: str,
-        network: str,
-    ) -> tuple[Decimal, Decimal]:
-        _ = (token0_address, token1_address, network)
-        return Decimal("2000"), Decimal("1")
+    def get_prices_usd(self, *, token_addresses: list[str], network: str) -> dict[str, Decimal]:
+        _ = network
+        prices = {"0xt0": Decimal("2000"), "0xt1": Decimal("1")}
+        return {address: prices[address] for address in token_addresses if address in prices}
 
 
 class AllocateUseCaseTests(unittest.TestCase):
@@ -4,15 +4,25 @@ from dataclasses import replace
 from datetime import datetime, timedelta
 import hashlib
 
-from app.application.dto.auth import LoginGoogleInput, LoginLocalInput, RefreshSessionInput, RegisterUserInput
+from app.application.dto.auth import (
+    AccessTokenClaims,
+    LoginGoogleInput,
+    LoginLocalInput,
+    LogoutInput,
+    RefreshSessionInput,
+    RegisterUserInput,
+)
 from app.application.dto.auth import GoogleIdentityInfo
+from app.application.dto.entitlements import UserEntitlementsOutput
 from app.application.use_cases.login_google import LoginGoogleUseCase
 from app.application.use_cases.login_local import LoginLocalUseCase
+from app.application.use_cases.logout_session import LogoutSessionUseCase
 from app.application.use_cases.refresh_session import RefreshSessionUseCase
 from app.application.use_cases.register_user import RegisterUserUseCase
 from app.domain.entities.password_reset import PasswordResetToken
 from app.domain.entities.user import AuthIdentity, AuthSession, User
 from app.domain.exceptions import RefreshSessionInvalidError
+from app.shared.cache import LruCache
 
 
 class FakeAuthPort:
@@ -232,8 +242,16 @@ class FakePasswordHasherWithRehash(FakePasswordHasher):
 class FakeTokenPort:
     def __init__(self):
         self._refresh_seq = 0
+        self.access_claims: list[AccessTokenClaims | None] = []
 
-    def create_access_token(self, *, user_id: str, now: datetime) -> tuple[str, datetime]:
+    def create_access_token(
+        self,
+        *,
+        user_id: str,
+        now: datetime,
+        claims: AccessTokenClaims | None = None,
+    ) -> tuple[str, datetime]:
+        self.access_claims.append(claims)
         return f"access-{user_id}", now + timedelta(minutes=15)
 
     def decode_access_token(self, *, token: str):
@@ -251,6 +269,20 @@ class FakeTokenPort:
         return now + timedelta(days=30)
 
 
+class FakeEntitlementsUseCase:
+    def __init__(self):
+        self.calls: list[tuple[str, bool]] = []
+
+    def execute(self, *, user_id: str, use_cache: bool = True) -> UserEntitlementsOutput:
+        self.calls.append((user_id, use_cache))
+        return UserEntitlementsOutput(
+            user_id=user_id,
+            plan_code="pro",
+            boolean_features={"charts_advanced": True, "export_csv": False},
+            limits={"api_calls": 10000},
+        )
+
+
 class FakeGoogleOauthPort:
     def verify_id_token(self, *, id_token: str) -> GoogleIdentityInfo:
         assert id_token == "token-google"
@@ -456,3 +488,48 @@ def test_refresh_session_invalid_token_returns_error():
     except RefreshSessionInvalidError:
         return
     raise AssertionError("Expected RefreshSessionInvalidError")
+
+
+def test_logout_revokes_session_and_evicts_cached_user():
+    auth_port = FakeAuthPort()
+    token_port = FakeTokenPort()
+    RegisterUserUseCase(auth_port=auth_port, password_hasher=FakePasswordHasher()).execute(
+        RegisterUserInput(name="User", email="user@example.com", password="12345678")
+    )
+    login = LoginLocalUseCase(
+        auth_port=auth_port,
+        password_hasher=FakePasswordHasher(),
+        token_port=token_port,
+    ).execute(
+        LoginLocalInput(email="user@example.com", password="12345678", user_agent="pytest", ip="127.0.0.1")
+    )
+    user_cache: LruCache[str, User] = LruCache(max_entries=10, ttl_seconds=30)
+    user_cache.set(login.user.id, auth_port.users[login.user.id])
+
+    LogoutSessionUseCase(auth_port=auth_port, token_port=token_port, user_cache=user_cache).execute(
+        LogoutInput(refresh_token=login.refresh_token)
+    )
+
+    assert user_cache.get(login.user.id) is None
+    assert all(session.revoked_at is not None for session in auth_port.sessions.values())
+
+
+def test_login_embeds_fresh_entitlements_and_user_epoch():
+    auth_port = FakeAuthPort()
+    RegisterUserUseCase(auth_port=auth_port, password_hasher=FakePasswordHasher()).execute(
+        RegisterUserInput(name="User", email="user@example.com", password="12345678")
+    )
+    token_port = FakeTokenPort()
+    entitlements_use_case = FakeEntitlementsUseCase()
+
+    output = LoginLocalUseCase(
+        auth_port=auth_port,
+        password_hasher=FakePasswordHasher(),
+        token_port=token_port,
+        get_user_entitlements_use_case=entitlements_use_case,
+    ).execute(
+        LoginLocalInput(email="user@example.com", password="12345678", user_agent="pytest", ip="127.0.0.1")
+    )
+
+    assert entitlements_use_case.calls == [(output.user.id, False)]
+    assert token_port.access_claims == [AccessTokenClaims(plan_code="pro", feature_bits=1, entitlements_epoch=0)]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from threading import Event, Thread
+import time
+
+import pytest
+
+from app.domain.exceptions import PasswordHashingBusyError
+from app.infrastructure.security.bounded_password_hasher import BoundedPasswordHasher
+
+
+class BlockingHasher:
+    def __init__(self):
+        self.release = Event()
+        self.started = 0
+
+    def hash(self, plain_password: str) -> str:
+        self.started += 1
+        self.release.wait(timeout=5)
+        return f"hash::{plain_password}"
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        return password_hash == f"hash::{plain_password}"
+
+    def verify_and_update(self, plain_password: str, password_hash: str) -> tuple[bool, str | None]:
+        return self.verify(plain_password, password_hash), None
+
+
+def _wait_until(predicate) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timeout")
+        time.sleep(0.01)
+
+
+def test_rejects_immediately_when_workers_and_queue_are_full():
+    inner = BlockingHasher()
+    hasher = BoundedPasswordHasher(inner=inner, max_workers=1, max_queue=1)
+    results: list[str] = []
+    callers = [Thread(target=lambda: results.append(hasher.hash("secret"))) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    _wait_until(lambda: hasher.stats().in_flight == 2)
+
+    started = time.monotonic()
+    with pytest.raises(PasswordHashingBusyError):
+        hasher.verify("secret", "hash::secret")
+    assert time.monotonic() - started < 0.5
+
+    inner.release.set()
+    for caller in callers:
+        caller.join(timeout=5)
+
+    stats = hasher.stats()
+    assert results == ["hash::secret", "hash::secret"]
+    assert (stats.in_flight, stats.completed, stats.rejected) == (0, 2, 1)
+    assert stats.queue_wait_max_ms is not None and stats.queue_wait_max_ms >= stats.queue_wait_avg_ms
+    assert hasher.verify("secret", "hash::secret") is True
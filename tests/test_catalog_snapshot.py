@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import unittest
+
+from app.application.use_cases.catalog_snapshot import CatalogSnapshotProvider
+from app.domain.entities.catalog import (
+    CatalogChain,
+    CatalogDex,
+    CatalogPool,
+    CatalogToken,
+    Exchange,
+    Network,
+    PoolSummary,
+    Token,
+)
+from app.domain.services.catalog_snapshot import CatalogSnapshot
+
+
+def _snapshot(pools: list[CatalogPool] | None = None) -> CatalogSnapshot:
+    return CatalogSnapshot(
+        dexes=[
+            CatalogDex(id=1, key="uniswap_v3", name="uniswap", version="3", icon_url=None),
+            CatalogDex(id=2, key="aerodrome", name="aerodrome", version=None, icon_url="a.png"),
+            CatalogDex(id=3, key="empty", name="empty", version=None, icon_url=None),
+        ],
+        chains=[
+            CatalogChain(id=10, key="base", name="base", icon_url=None),
+            CatalogChain(id=20, key="arbitrum", name="arbitrum", icon_url=None),
+        ],
+        tokens=[
+            CatalogToken(chain_id=10, address="0xWETH", symbol="WETH", decimals=18, icon_url="weth.png"),
+            CatalogToken(chain_id=10, address="0xusdc", symbol="USDC", decimals=6, icon_url=None),
+        ],
+        pools=pools
+        if pools is not None
+        else [
+            CatalogPool(10, 1, "0xP2", 3000, "0xweth", "0xusdc"),
+            CatalogPool(10, 1, "0xp1", 500, "0xweth", "0xusdc"),
+            CatalogPool(10, 1, "0xp3", 100, "0xusdc", "0xnosymbol"),
+            CatalogPool(20, 1, "0xp4", 500, "0xweth", "0xusdc"),
+            CatalogPool(10, 2, "0xp5", 100, "0xweth", "0xusdc"),
+        ],
+    )
+
+
+class FakeCatalogSnapshotPort:
+    def __init__(self):
+        self.loads = 0
+
+    def load_catalog_snapshot(self):
+        self.loads += 1
+        return _snapshot(pools=[] if self.loads > 1 else None)
+
+
+class CatalogSnapshotTests(unittest.TestCase):
+    def test_exchanges_and_networks_only_list_entries_with_pools(self):
+        snapshot = _snapshot()
+
+        self.assertEqual(
+            snapshot.list_exchanges(),
+            [Exchange(id=2, name="aerodrome", icon_url="a.png"), Exchange(id=1, name="uniswap", icon_url=None)],
+        )
+        self.assertEqual(
+            snapshot.list_networks_by_exchange(exchange_id=1),
+            [Network(id=20, name="arbitrum", icon_url=None), Network(id=10, name="base", icon_url=None)],
+        )
+        self.assertEqual(snapshot.list_networks_by_exchange(exchange_id=3), [])
+
+    def test_tokens_use_sql_fallbacks_and_pool_filter(self):
+        snapshot = _snapshot()
+
+        tokens = snapshot.list_tokens_by_exchange_network(exchange_id=1, network_id=10)
+        self.assertEqual(
+            tokens,
+            [
+                Token(address="0xnosymbol", symbol="0xnosymbol", decimals=0, icon_url=None),
+                Token(address="0xusdc", symbol="USDC", decimals=6, icon_url=None),
+                Token(address="0xweth", symbol="WETH", decimals=18, icon_url="weth.png"),
+            ],
+        )
+
+        filtered = snapshot.list_tokens_by_exchange_network(
+            exchange_id=1,
+            network_id=10,
+            pool_addresses=["0xp2"],
+            exclude_token="weth",
+        )
+        self.assertEqual([token.symbol for token in filtered], ["USDC"])
+
+    def test_pools_and_pool_detail_are_served_from_indexes(self):
+        snapshot = _snapshot()
+
+        self.assertEqual(
+            snapshot.list_pools_by_exchange_network_addresses(
+                exchange_id=1,
+                network_id=10,
+                pool_addresses=["0xp2", "0xP1", "0xp4"],
+            ),
+            [PoolSummary(pool_address="0xp1", fee_tier=500), PoolSummary(pool_address="0xP2", fee_tier=3000)],
+        )
+
+        detail = snapshot.get_pool_by_address(pool_address="0XP2", chain_id=10, exchange_id=1)
+        self.assertEqual(detail.id, "0xP2")
+        self.assertEqual((detail.dex_key, detail.dex_version, detail.chain_name), ("uniswap_v3", "3", "base"))
+        self.assertEqual((detail.token0_symbol, detail.token0_decimals), ("WETH", 18))
+        self.assertIsNone(snapshot.get_pool_by_address(pool_address="0xp2", chain_id=20, exchange_id=1))
+
+
+class CatalogSnapshotProviderTests(unittest.TestCase):
+    def test_loads_once_and_swaps_on_refresh(self):
+        port = FakeCatalogSnapshotPort()
+        provider = CatalogSnapshotProvider(snapshot_port=port)
+
+        first = provider.current()
+        self.assertIs(provider.current(), first)
+        self.assertEqual(port.loads, 1)
+        self.assertEqual(first.pool_count, 5)
+
+        provider.refresh()
+        self.assertEqual(port.loads, 2)
+        self.assertEqual(provider.current().list_exchanges(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from app.infrastructure.clients.pricing import (
+    CoingeckoPriceProvider,
+    PriceLookupError,
+    PriceOverrides,
+    PriceService,
+)
+
+
+PRICES = {"0xaaa": 2000, "0xbbb": 1, "0xccc": 0.5}
+
+
+class RecordingTransport(httpx.BaseTransport):
+    def __init__(self):
+        self.requested: list[list[str]] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        addresses = request.url.params["contract_addresses"].split(",")
+        self.requested.append(addresses)
+        payload = {address: {"usd": PRICES[address]} for address in addresses if address in PRICES}
+        return httpx.Response(200, json=payload)
+
+
+def _provider(transport: httpx.BaseTransport, **kwargs) -> CoingeckoPriceProvider:
+    return CoingeckoPriceProvider(
+        api_base="https://coingecko.test/api/v3",
+        timeout_seconds=1,
+        http_client=httpx.Client(transport=transport),
+        **kwargs,
+    )
+
+
+def test_misses_are_fetched_in_one_request_and_hits_served_from_cache():
+    transport = RecordingTransport()
+    provider = _provider(transport)
+
+    assert provider.get_price_usd("arbitrum", "0xAAA") == Decimal("2000")
+    prices = provider.get_prices_usd("arbitrum", ["0xaaa", "0xBBB", "0xccc", "0xddd"])
+
+    assert prices == {"0xaaa": Decimal("2000"), "0xbbb": Decimal("1"), "0xccc": Decimal("0.5")}
+    assert transport.requested == [["0xaaa"], ["0xbbb", "0xccc", "0xddd"]]
+
+    provider.get_prices_usd("arbitrum", ["0xbbb", "0xccc"])
+    assert len(transport.requested) == 2
+
+
+def test_misses_are_chunked_by_max_addresses_per_request():
+    transport = RecordingTransport()
+    provider = _provider(transport, max_addresses_per_request=2)
+
+    prices = provider.get_prices_usd("arbitrum", ["0xaaa", "0xbbb", "0xccc"])
+
+    assert len(prices) == 3
+    assert transport.requested == [["0xaaa", "0xbbb"], ["0xccc"]]
+
+
+def test_price_service_applies_overrides_before_batch_lookup():
+    transport = RecordingTransport()
+    service = PriceService(
+        overrides=PriceOverrides({"arbitrum": {"usdc": "1"}}),
+        coingecko=_provider(transport),
+    )
+
+    prices = service.get_prices_usd(tokens=["usdc", "0xAAA"], network="arbitrum")
+
+    assert prices == {"usdc": Decimal("1"), "0xAAA": Decimal("2000")}
+    assert transport.requested == [["0xaaa"]]
+    with pytest.raises(PriceLookupError):
+        service.get_prices_usd(tokens=["weth"], network="arbitrum")
+
+
+class FailingTransport(httpx.BaseTransport):
+    def __init__(self, response: httpx.Response | None):
+        self.response = response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.response is None:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return self.response
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(429, json={"status": {"error_code": 429, "error_message": "rate limited"}}),
+        httpx.Response(503, text="<html>unavailable</html>"),
+        httpx.Response(200, text="not json"),
+        None,
+    ],
+)
+def test_http_and_decoding_errors_raise_price_lookup_error(response):
+    provider = _provider(FailingTransport(response))
+
+    with pytest.raises(PriceLookupError):
+        provider.get_prices_usd("arbitrum", ["0xaaa"])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.application.dto.auth import AccessTokenPayload
+from app.domain.entities.user import User
+from app.shared.cache import LruCache
+
+
+class FakeAccountsRepository:
+    def __init__(self, users: list[User]):
+        self.users = {user.id: user for user in users}
+        self.lookups = 0
+
+    def get_user_by_id(self, *, user_id: str) -> User | None:
+        self.lookups += 1
+        return self.users.get(user_id)
+
+
+def _user(user_id: str, *, is_active: bool = True) -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        id=user_id,
+        name="Alice",
+        email="alice@example.com",
+        email_verified=True,
+        is_active=is_active,
+        stripe_customer_id=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def repository(monkeypatch) -> FakeAccountsRepository:
+    repository = FakeAccountsRepository([_user("u1"), _user("u2", is_active=False)])
+    user_cache: LruCache[str, User] = LruCache(max_entries=10, ttl_seconds=30)
+    monkeypatch.setattr(deps, "_get_accounts_repository", lambda: repository)
+    monkeypatch.setattr(deps, "_get_user_cache", lambda: user_cache)
+    return repository
+
+
+def test_get_current_user_reads_postgres_once_per_ttl(repository):
+    first = deps.get_current_user(payload=AccessTokenPayload(user_id="u1"))
+    repository.users["u1"] = replace(first, name="Renamed")
+    second = deps.get_current_user(payload=AccessTokenPayload(user_id="u1"))
+
+    assert second is first
+    assert repository.lookups == 1
+
+    deps._get_user_cache().pop("u1")
+    assert deps.get_current_user(payload=AccessTokenPayload(user_id="u1")).name == "Renamed"
+    assert repository.lookups == 2
+
+
+def test_get_current_user_does_not_cache_inactive_or_missing_users(repository):
+    for _ in range(2):
+        with pytest.raises(HTTPException) as inactive:
+            deps.get_current_user(payload=AccessTokenPayload(user_id="u2"))
+        assert inactive.value.status_code == 403
+        with pytest.raises(HTTPException) as missing:
+            deps.get_current_user(payload=AccessTokenPayload(user_id="u3"))
+        assert missing.value.status_code == 401
+
+    assert repository.lookups == 4
+    assert len(deps._get_user_cache()) == 0
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.application.dto.billing import StripeSubscriptionEventData, StripeWebhookEvent, StripeWebhookInput
+from app.application.dto.entitlements import UserEntitlementsOutput
+from app.application.use_cases.get_user_entitlements import GetUserEntitlementsUseCase, PlanGrants
+from app.application.use_cases.process_stripe_webhook import ProcessStripeWebhookUseCase
+from app.domain.entities.feature import PlanFeatureGrant
+from app.domain.entities.plan import Plan, PlanPrice
+from app.domain.entities.subscription import Subscription
+from app.domain.entities.user import User
+from app.shared.cache import LruCache
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+PLANS = {
+    "plan-free": Plan(id="plan-free", code="free", name="Free", description=None, is_active=True, sort_order=0),
+    "plan-pro": Plan(id="plan-pro", code="pro", name="Pro", description=None, is_active=True, sort_order=1),
+}
+GRANTS = {
+    "plan-free": [PlanFeatureGrant("charts_advanced", "boolean", False, None)],
+    "plan-pro": [
+        PlanFeatureGrant("charts_advanced", "boolean", True, None),
+        PlanFeatureGrant("api_calls", "limit", True, 10000),
+    ],
+}
+
+
+class FakeEntitlementsPort:
+    def __init__(self):
+        self.subscriptions: dict[str, Subscription] = {}
+        self.calls: list[str] = []
+
+    def get_plan_by_code(self, *, code: str) -> Plan | None:
+        self.calls.append("plan_by_code")
+        return next((plan for plan in PLANS.values() if plan.code == code), None)
+
+    def get_plan_by_id(self, *, plan_id: str) -> Plan | None:
+        self.calls.append("plan_by_id")
+        return PLANS.get(plan_id)
+
+    def get_plan_price_by_id(self, *, plan_price_id: str) -> PlanPrice | None:
+        self.calls.append("plan_price_by_id")
+        return PlanPrice(
+            id=plan_price_id,
+            plan_id="plan-pro",
+            interval="month",
+            currency="usd",
+            amount_cents=1000,
+            is_active=True,
+            external_price_id="price_ext",
+        )
+
+    def get_plan_price_by_external_price_id(self, *, external_price_id: str) -> PlanPrice | None:
+        return self.get_plan_price_by_id(plan_price_id="price-pro")
+
+    def list_plan_feature_grants(self, *, plan_id: str) -> list[PlanFeatureGrant]:
+        self.calls.append("grants")
+        return list(GRANTS[plan_id])
+
+    def get_effective_subscription_for_user(self, *, user_id: str) -> Subscription | None:
+        self.calls.append("subscription")
+        return self.subscriptions.get(user_id)
+
+    def upsert_subscription_by_external_id(self, *, subscription_id: str, user_id: str, plan_price_id: str, **kwargs):
+        subscription = Subscription(
+            id=subscription_id,
+            user_id=user_id,
+            plan_price_id=plan_price_id,
+            status=kwargs["status"],
+            current_period_start=None,
+            current_period_end=None,
+            cancel_at_period_end=False,
+            canceled_at=None,
+            external_subscription_id=subscription_id,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        self.subscriptions[user_id] = subscription
+        return subscription
+
+
+class FakeAuthPort:
+    def __init__(self):
+        self.entitlements_epoch = 0
+
+    def increment_user_entitlements_epoch(self, *, user_id: str) -> int:
+        self.entitlements_epoch += 1
+        return self.entitlements_epoch
+
+    def get_user_by_stripe_customer_id(self, *, stripe_customer_id: str) -> User | None:
+        return User(
+            id="u1",
+            name="User",
+            email="user@example.com",
+            email_verified=True,
+            is_active=True,
+            stripe_customer_id=stripe_customer_id,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+
+class FakeStripePort:
+    def verify_webhook(self, *, signature: str, payload: bytes) -> StripeWebhookEvent:
+        return StripeWebhookEvent(
+            event_type="customer.subscription.created",
+            subscription=StripeSubscriptionEventData(
+                subscription_id="sub_1",
+                customer_id="cus_1",
+                price_id="price_ext",
+                status="active",
+                current_period_start=None,
+                current_period_end=None,
+                cancel_at_period_end=False,
+                canceled_at=None,
+            ),
+            checkout_completed=None,
+        )
+
+
+def _use_case(port: FakeEntitlementsPort, entitlements_cache, plan_grants_cache) -> GetUserEntitlementsUseCase:
+    return GetUserEntitlementsUseCase(
+        entitlements_port=port,
+        entitlements_cache=entitlements_cache,
+        plan_grants_cache=plan_grants_cache,
+    )
+
+
+def test_entitlements_are_cached_per_user_and_plan_grants_globally():
+    port = FakeEntitlementsPort()
+    entitlements_cache: LruCache[str, UserEntitlementsOutput] = LruCache(max_entries=10, ttl_seconds=60)
+    plan_grants_cache: LruCache[str, PlanGrants] = LruCache(max_entries=10, ttl_seconds=600)
+    use_case = _use_case(port, entitlements_cache, plan_grants_cache)
+
+    first = use_case.execute(user_id="u1")
+    assert use_case.execute(user_id="u1") is first
+    assert port.calls == ["subscription", "plan_by_code", "grants"]
+
+    port.calls.clear()
+    other = use_case.execute(user_id="u2")
+    assert other.plan_code == "free"
+    assert port.calls == ["subscription"]
+
+    stats = entitlements_cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert plan_grants_cache.stats().hit_rate == 0.5
+
+
+def test_subscription_webhook_evicts_cached_entitlements():
+    port = FakeEntitlementsPort()
+    entitlements_cache: LruCache[str, UserEntitlementsOutput] = LruCache(max_entries=10, ttl_seconds=60)
+    use_case = _use_case(port, entitlements_cache, LruCache(max_entries=10, ttl_seconds=600))
+    assert use_case.execute(user_id="u1").plan_code == "free"
+
+    auth_port = FakeAuthPort()
+    ProcessStripeWebhookUseCase(
+        auth_port=auth_port,
+        entitlements_port=port,
+        stripe_port=FakeStripePort(),
+        entitlements_cache=entitlements_cache,
+    ).execute(StripeWebhookInput(signature="sig", payload=b"{}"))
+
+    assert auth_port.entitlements_epoch == 1
+    upgraded = use_case.execute(user_id="u1")
+    assert upgraded.plan_code == "pro"
+    assert upgraded.limits == {"api_calls": 10000}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.application.dto.liquidity_distribution import (
+    GetLiquidityDistributionBatchInput,
+    GetLiquidityDistributionInput,
+)
+from app.application.use_cases.get_liquidity_distribution_batch import (
+    GetLiquidityDistributionBatchUseCase,
+)
+from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.domain.exceptions import LiquidityDistributionInputError
+
+
+def _pool(*, pool_id: int, pool_address: str, chain_id: int = 1, dex_id: int = 2) -> LiquidityDistributionPool:
+    return LiquidityDistributionPool(
+        id=pool_id,
+        token0_symbol="WETH",
+        token1_symbol="USDC",
+        token0_decimals=0,
+        token1_decimals=0,
+        fee_tier=3000,
+        tick_spacing=60,
+        pool_tick=0,
+        current_tick=0,
+        current_price_token1_per_token0=Decimal("1"),
+        onchain_liquidity=Decimal("100"),
+        pool_address=pool_address,
+        chain_id=chain_id,
+        dex_id=dex_id,
+        latest_period_start=datetime(2026, 2, 1, 0, 0, 0),
+    )
+
+
+class FakeBatchDistributionPort:
+    def __init__(
+        self,
+        pools: list[LiquidityDistributionPool],
+        ticks_by_pool: dict[int, list[TickLiquidity]],
+    ):
+        self._pools = pools
+        self._ticks_by_pool = ticks_by_pool
+        self.pool_queries = 0
+        self.tick_queries = 0
+        self.last_refs: tuple[list[int], list[str]] | None = None
+
+    def get_pools_by_refs(
+        self,
+        *,
+        pool_ids: list[int],
+        pool_addresses: list[str],
+    ) -> list[LiquidityDistributionPool]:
+        self.pool_queries += 1
+        self.last_refs = (pool_ids, pool_addresses)
+        return self._pools
+
+    def get_ticks_for_pools(
+        self,
+        *,
+        pools: list[LiquidityDistributionPool],
+    ) -> dict[int, list[TickLiquidity]]:
+        self.tick_queries += 1
+        return {pool.id: self._ticks_by_pool.get(pool.id, []) for pool in pools}
+
+
+def _item(pool_id: int | str, **overrides) -> GetLiquidityDistributionInput:
+    payload = {
+        "pool_id": pool_id,
+        "chain_id": None,
+        "dex_id": None,
+        "snapshot_date": date(2026, 2, 1),
+        "current_tick": 0,
+        "center_tick": None,
+        "tick_range": 10,
+    }
+    payload.update(overrides)
+    return GetLiquidityDistributionInput(**payload)
+
+
+def test_batch_resolves_and_loads_ticks_with_one_query_each():
+    rows = [
+        TickLiquidity(tick_idx=-1, liquidity_net=Decimal("10")),
+        TickLiquidity(tick_idx=1, liquidity_net=Decimal("-10")),
+    ]
+    port = FakeBatchDistributionPort(
+        pools=[_pool(pool_id=1, pool_address="0xaaa"), _pool(pool_id=2, pool_address="0xbbb")],
+        ticks_by_pool={1: rows, 2: rows},
+    )
+    use_case = GetLiquidityDistributionBatchUseCase(distribution_port=port)
+
+    result = use_case.execute(
+        GetLiquidityDistributionBatchInput(
+            items=[_item(1), _item(" 0xBBB "), _item("0xbbb", swapped_pair=True)],
+        )
+    )
+
+    assert port.pool_queries == 1
+    assert port.tick_queries == 1
+    assert port.last_refs == ([1], ["0xbbb"])
+    assert [item.error for item in result.items] == [None, None, None]
+    assert result.items[0].result is not None
+    assert result.items[2].result is not None
+    assert result.items[2].result.token0 == "USDC"
+    assert [point.tick for point in result.items[2].result.data] == [-1, 1]
+
+
+def test_batch_reports_errors_per_item_without_failing_the_others():
+    port = FakeBatchDistributionPort(
+        pools=[
+            _pool(pool_id=1, pool_address="0xaaa"),
+            _pool(pool_id=2, pool_address="0xdup", chain_id=1),
+            _pool(pool_id=3, pool_address="0xdup", chain_id=10),
+        ],
+        ticks_by_pool={1: [TickLiquidity(tick_idx=0, liquidity_net=Decimal("1"))]},
+    )
+    use_case = GetLiquidityDistributionBatchUseCase(distribution_port=port)
+
+    result = use_case.execute(
+        GetLiquidityDistributionBatchInput(
+            items=[
+                _item(1),
+                _item(99),
+                _item("0xdup"),
+                _item("0xdup", chain_id=10, dex_id=2),
+                _item("pool"),
+            ],
+        )
+    )
+
+    assert result.items[0].error is None
+    assert result.items[1].error_code == "pool_not_found"
+    assert result.items[2].error_code == "invalid_input"
+    assert result.items[3].error_code == "distribution_not_found"
+    assert result.items[4].error_code == "invalid_input"
+
+
+def test_batch_rejects_empty_items():
+    use_case = GetLiquidityDistributionBatchUseCase(
+        distribution_port=FakeBatchDistributionPort(pools=[], ticks_by_pool={})
+    )
+
+    with pytest.raises(LiquidityDistributionInputError):
+        use_case.execute(GetLiquidityDistributionBatchInput(items=[]))
@@ -3,9 +3,20 @@ from __future__ import annotations
 from datetime import date, datetime
 from decimal import Decimal
 
+import pytest
+
 from app.application.dto.liquidity_distribution import GetLiquidityDistributionInput
-from app.application.use_cases.get_liquidity_distribution import GetLiquidityDistributionUseCase
-from app.domain.entities.liquidity_distribution import LiquidityDistributionPool, TickLiquidity
+from app.application.use_cases.get_liquidity_distribution import (
+    PINNED_VERSION_PREFIX,
+    GetLiquidityDistributionUseCase,
+)
+from app.domain.entities.liquidity_distribution import (
+    LiquidityDistributionBlockSnapshot,
+    LiquidityDistributionPool,
+    TickLiquidity,
+)
+from app.domain.exceptions import LiquidityDistributionInputError
+from app.shared.cache import LruCache
 
 
 class FakeDistributionPort:
@@ -36,6 +47,72 @@ class FakeDistributionPort:
         return self._rows
 
 
+class FakeHistoricalDistributionPort(FakeDistributionPort):
+    def __init__(
+        self,
+        pool: LiquidityDistributionPool,
+        rows: list[TickLiquidity],
+        *,
+        latest_block: int = 1000,
+        complete_block: int | None = 1000,
+    ):
+        super().__init__(pool, rows)
+        self.latest_block = latest_block
+        self.complete_block = complete_block
+        self.snapshot_calls: list[tuple[int | None, int | None]] = []
+        self.tick_calls: list[int] = []
+
+    def get_latest_block_number(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        _ = (pool_id, chain_id, dex_id)
+        return self.latest_block
+
+    def get_tick_history_complete_block(
+        self,
+        *,
+        pool_id: int | str,
+        chain_id: int | None = None,
+        dex_id: int | None = None,
+    ) -> int | None:
+        _ = (pool_id, chain_id, dex_id)
+        return self.complete_block
+
+    def get_pool_snapshot_at(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int | None = None,
+        timestamp: int | None = None,
+    ) -> LiquidityDistributionBlockSnapshot | None:
+        _ = (pool_address, chain_id, dex_id)
+        self.snapshot_calls.append((block_number, timestamp))
+        return LiquidityDistributionBlockSnapshot(
+            block_number=900,
+            block_timestamp=1_700_000_000,
+            tick=1,
+            liquidity=Decimal("50"),
+        )
+
+    def get_ticks_at_block(
+        self,
+        *,
+        pool_address: str,
+        chain_id: int,
+        dex_id: int,
+        block_number: int,
+    ) -> list[TickLiquidity]:
+        _ = (pool_address, chain_id, dex_id)
+        self.tick_calls.append(block_number)
+        return self._rows
+
+
 def test_swapped_pair_inverts_prices_ticks_current_tick_and_pool_labels():
     pool = LiquidityDistributionPool(
         id=1,
@@ -151,3 +228,142 @@ def test_range_min_max_do_not_change_distribution_window():
 
     # swapped_pair only changes orientation, not the amount of points selected.
     assert len(with_range.data) == len(baseline.data)
+
+
+def _historical_pool() -> LiquidityDistributionPool:
+    return LiquidityDistributionPool(
+        id=7,
+        token0_symbol="WETH",
+        token1_symbol="USDC",
+        token0_decimals=0,
+        token1_decimals=0,
+        fee_tier=3000,
+        tick_spacing=60,
+        pool_tick=0,
+        current_tick=0,
+        current_price_token1_per_token0=Decimal("1"),
+        onchain_liquidity=Decimal("100"),
+        pool_address="0xpool",
+        chain_id=1,
+        dex_id=2,
+    )
+
+
+def test_block_number_uses_snapshot_state_and_caches_curve_per_block():
+    rows = [
+        TickLiquidity(tick_idx=-1, liquidity_net=Decimal("10")),
+        TickLiquidity(tick_idx=1, liquidity_net=Decimal("-10")),
+    ]
+    port = FakeHistoricalDistributionPort(_historical_pool(), rows)
+    use_case = GetLiquidityDistributionUseCase(
+        distribution_port=port,
+        history_cache=LruCache(max_entries=8),
+    )
+    command = GetLiquidityDistributionInput(
+        pool_id=7,
+        chain_id=None,
+        dex_id=None,
+        snapshot_date=date(2026, 2, 1),
+        current_tick=0,
+        center_tick=None,
+        tick_range=10,
+        block_number=950,
+    )
+
+    first = use_case.execute(command)
+    second = use_case.execute(command)
+
+    assert first == second
+    assert first.block_number == 900
+    assert first.current_tick == 1
+    # Anchored on the snapshot liquidity (50) at tick 1: baseline 50 - 0 = 50.
+    assert [(item.tick, item.liquidity) for item in first.data] == [(-1, "60"), (1, "50")]
+    assert port.snapshot_calls == [(950, None), (950, None)]
+    assert port.tick_calls == [900]
+
+
+def _block_command(block_number: int) -> GetLiquidityDistributionInput:
+    return GetLiquidityDistributionInput(
+        pool_id=7,
+        chain_id=None,
+        dex_id=None,
+        snapshot_date=date(2026, 2, 1),
+        current_tick=0,
+        center_tick=None,
+        tick_range=10,
+        block_number=block_number,
+    )
+
+
+def test_block_beyond_tick_coverage_is_not_cached():
+    # Ticks do bloco 900 ainda podem chegar pelo on-demand do simulate.
+    port = FakeHistoricalDistributionPort(
+        _historical_pool(),
+        [TickLiquidity(tick_idx=0, liquidity_net=Decimal("1"))],
+        complete_block=899,
+    )
+    use_case = GetLiquidityDistributionUseCase(
+        distribution_port=port,
+        history_cache=LruCache(max_entries=8),
+    )
+
+    use_case.execute(_block_command(950))
+    use_case.execute(_block_command(950))
+
+    assert port.tick_calls == [900, 900]
+
+
+def test_version_pins_only_blocks_within_tick_coverage():
+    port = FakeHistoricalDistributionPort(_historical_pool(), [], latest_block=1000, complete_block=900)
+    use_case = GetLiquidityDistributionUseCase(distribution_port=port)
+
+    assert use_case.get_version(_block_command(900)) == f"{PINNED_VERSION_PREFIX}900"
+    assert use_case.get_version(_block_command(950)) == "block:1000"
+    assert use_case.get_version(_block_command(1200)) == "block:1000"
+
+    port.complete_block = None
+    assert use_case.get_version(_block_command(900)) == "block:1000"
+
+
+def test_timestamp_is_converted_to_unix_seconds_in_utc():
+    port = FakeHistoricalDistributionPort(
+        _historical_pool(),
+        [TickLiquidity(tick_idx=0, liquidity_net=Decimal("1"))],
+    )
+    use_case = GetLiquidityDistributionUseCase(distribution_port=port)
+
+    use_case.execute(
+        GetLiquidityDistributionInput(
+            pool_id=7,
+            chain_id=None,
+            dex_id=None,
+            snapshot_date=date(2026, 2, 1),
+            current_tick=0,
+            center_tick=None,
+            tick_range=10,
+            timestamp=datetime(2023, 11, 14, 22, 13, 20),
+        )
+    )
+
+    assert port.snapshot_calls == [(None, 1_700_000_000)]
+
+
+def test_block_number_and_timestamp_are_mutually_exclusive():
+    use_case = GetLiquidityDistributionUseCase(
+        distribution_port=FakeHistoricalDistributionPort(_historical_pool(), [])
+    )
+
+    with pytest.raises(LiquidityDistributionInputError):
+        use_case.execute(
+            GetLiquidityDistributionInput(
+                pool_id=7,
+                chain_id=None,
+                dex_id=None,
+                snapshot_date=date(2026, 2, 1),
+                current_tick=0,
+                center_tick=None,
+                tick_range=10,
+                block_number=1,
+                timestamp=datetime(2026, 1, 1),
+            )
+        )
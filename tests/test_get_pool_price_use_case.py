@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
 
 from app.application.dto.pool_price import GetPoolPriceInput
 from app.application.use_cases.get_pool_price import GetPoolPriceUseCase
-from app.domain.entities.pool_price import PoolCurrentPrice, PoolPricePoint, PoolPriceStats
-from app.domain.exceptions import PoolPriceInputError
+from app.domain.entities.pool_price import (
+    PoolCurrentPrice,
+    PoolPriceCandle,
+    PoolPricePoint,
+    PoolPriceStats,
+    PoolPriceWindow,
+)
+from app.domain.exceptions import PoolNotFoundError, PoolPriceInputError
 
 
 class FakePoolPricePort:
@@ -18,70 +24,36 @@ class FakePoolPricePort:
         stats: PoolPriceStats,
         series: list[PoolPricePoint],
         current: PoolCurrentPrice,
+        candles: list[PoolPriceCandle] | None = None,
     ):
         self._stats = stats
         self._series = series
         self._current = current
+        self._candles = candles or []
+        self.bucket_seconds: int | None = None
+        self.calls = 0
 
-    def pool_exists(self, *, pool_address: str, chain_id: int, dex_id: int) -> bool:
+    def get_latest_block_number(self, *, pool_address: str, chain_id: int, dex_id: int) -> int | None:
         _ = (pool_address, chain_id, dex_id)
-        return True
+        return 1
 
-    def get_series(
+    def get_price_window(
         self,
         *,
         pool_address: str,
         chain_id: int,
         dex_id: int,
-        days: int,
-    ) -> list[PoolPricePoint]:
-        _ = (pool_address, chain_id, dex_id, days)
-        return self._series
-
-    def get_series_range(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> list[PoolPricePoint]:
-        _ = (pool_address, chain_id, dex_id, start, end)
-        return self._series
-
-    def get_stats(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        days: int,
-    ) -> PoolPriceStats:
-        _ = (pool_address, chain_id, dex_id, days)
-        return self._stats
-
-    def get_stats_range(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-        start: datetime,
-        end: datetime,
-    ) -> PoolPriceStats:
-        _ = (pool_address, chain_id, dex_id, start, end)
-        return self._stats
-
-    def get_latest_price(
-        self,
-        *,
-        pool_address: str,
-        chain_id: int,
-        dex_id: int,
-    ) -> PoolCurrentPrice | None:
-        _ = (pool_address, chain_id, dex_id)
-        return self._current
+        days: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bucket_seconds: int | None = None,
+    ) -> PoolPriceWindow | None:
+        _ = (pool_address, chain_id, dex_id, days, start, end)
+        self.calls += 1
+        self.bucket_seconds = bucket_seconds
+        if bucket_seconds is None:
+            return PoolPriceWindow(current=self._current, series=self._series)
+        return PoolPriceWindow(current=self._current, candles=self._candles, stats=self._stats)
 
 
 def test_swapped_pair_inverts_series_and_recomputes_stats():
@@ -146,3 +118,162 @@ def test_swapped_pair_rejects_zero_price_in_series():
                 swapped_pair=True,
             )
         )
+
+
+def test_resolution_returns_candles_and_inverts_exact_stats_when_swapped():
+    port = FakePoolPricePort(
+        stats=PoolPriceStats(
+            min_price=Decimal("1"),
+            max_price=Decimal("10"),
+            avg_price=Decimal("4"),
+            avg_inverse_price=Decimal("0.6"),
+        ),
+        series=[],
+        candles=[
+            PoolPriceCandle(
+                timestamp=datetime(2026, 1, 1, 0, 0, 0),
+                open=Decimal("2"),
+                high=Decimal("10"),
+                low=Decimal("1"),
+                close=Decimal("4"),
+            ),
+        ],
+        current=PoolCurrentPrice(token1_price=Decimal("4"), token0_price=None, sqrt_price_x96=None),
+    )
+    use_case = GetPoolPriceUseCase(pool_price_port=port)
+
+    result = use_case.execute(
+        GetPoolPriceInput(
+            pool_address="0xpool",
+            chain_id=1,
+            dex_id=2,
+            days=7,
+            swapped_pair=True,
+            resolution="1h",
+        )
+    )
+
+    assert port.bucket_seconds == 3600
+    assert result.resolution == "1h"
+    candle = result.candles[0]
+    assert (candle.open, candle.high, candle.low, candle.close) == (
+        Decimal("0.5"),
+        Decimal("1"),
+        Decimal("0.1"),
+        Decimal("0.25"),
+    )
+    assert [row.price for row in result.series] == [Decimal("0.25")]
+    assert result.min_price == Decimal("0.1")
+    assert result.max_price == Decimal("1")
+    assert result.avg_price == Decimal("0.6")
+
+
+def test_max_points_downsamples_series_and_keeps_full_window_stats():
+    series = [
+        PoolPricePoint(timestamp=datetime(2026, 1, 1, hour, 0, 0), price=Decimal(str(1 + (hour % 5))))
+        for hour in range(24)
+    ]
+    use_case = GetPoolPriceUseCase(
+        pool_price_port=FakePoolPricePort(
+            stats=PoolPriceStats(min_price=Decimal("1"), max_price=Decimal("5"), avg_price=Decimal("2.9")),
+            series=series,
+            current=PoolCurrentPrice(token1_price=Decimal("3"), token0_price=None, sqrt_price_x96=None),
+        )
+    )
+
+    result = use_case.execute(
+        GetPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=1, max_points=6)
+    )
+
+    assert len(result.series) == 6
+    assert result.series[0] == series[0]
+    assert result.series[-1] == series[-1]
+    assert [row.timestamp for row in result.series] == sorted(row.timestamp for row in result.series)
+    assert (result.min_price, result.max_price, result.avg_price) == (
+        Decimal("1"),
+        Decimal("5"),
+        Decimal("70") / Decimal("24"),
+    )
+
+
+@pytest.mark.parametrize(
+    "resolution,max_points",
+    [("2h", None), (None, 2), (None, 100000)],
+)
+def test_rejects_invalid_resolution_or_max_points(resolution, max_points):
+    use_case = GetPoolPriceUseCase(
+        pool_price_port=FakePoolPricePort(
+            stats=PoolPriceStats(min_price=None, max_price=None, avg_price=None),
+            series=[],
+            current=PoolCurrentPrice(token1_price=Decimal("1"), token0_price=None, sqrt_price_x96=None),
+        )
+    )
+
+    command = GetPoolPriceInput(
+        pool_address="0xpool",
+        chain_id=1,
+        dex_id=2,
+        days=7,
+        resolution=resolution,
+        max_points=max_points,
+    )
+    with pytest.raises(PoolPriceInputError):
+        use_case.validate(command)
+    with pytest.raises(PoolPriceInputError):
+        use_case.execute(command)
+
+
+def test_single_port_call_and_not_found_when_window_is_missing():
+    port = FakePoolPricePort(
+        stats=PoolPriceStats(min_price=None, max_price=None, avg_price=None),
+        series=[],
+        current=PoolCurrentPrice(token1_price=None, token0_price=Decimal("4"), sqrt_price_x96=None),
+    )
+    result = GetPoolPriceUseCase(pool_price_port=port).execute(
+        GetPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=7)
+    )
+
+    assert port.calls == 1
+    assert result.current_price == Decimal("0.25")
+    assert (result.min_price, result.max_price, result.avg_price) == (None, None, None)
+
+    class MissingPoolPort(FakePoolPricePort):
+        def get_price_window(self, **_kwargs):
+            return None
+
+    with pytest.raises(PoolNotFoundError):
+        GetPoolPriceUseCase(
+            pool_price_port=MissingPoolPort(
+                stats=PoolPriceStats(min_price=None, max_price=None, avg_price=None),
+                series=[],
+                current=PoolCurrentPrice(token1_price=None, token0_price=None, sqrt_price_x96=None),
+            )
+        ).execute(GetPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=7))
+
+
+def test_version_of_days_window_includes_the_current_hour():
+    use_case = GetPoolPriceUseCase(
+        pool_price_port=FakePoolPricePort(
+            stats=PoolPriceStats(min_price=None, max_price=None, avg_price=None),
+            series=[],
+            current=PoolCurrentPrice(token1_price=Decimal("1"), token0_price=None, sqrt_price_x96=None),
+        )
+    )
+    current_hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    sliding = use_case.get_version(GetPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=7))
+    fixed = use_case.get_version(
+        GetPoolPriceInput(
+            pool_address="0xpool",
+            chain_id=1,
+            dex_id=2,
+            start=datetime(2026, 1, 1),
+            end=datetime(2026, 1, 2),
+        )
+    )
+
+    assert sliding in {
+        f"block:1:now:{current_hour.isoformat()}",
+        f"block:1:now:{(current_hour + timedelta(hours=1)).isoformat()}",
+    }
+    assert fixed == "block:1"
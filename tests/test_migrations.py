@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+from app.infrastructure.db.migrations.explain_check import (
+    EXPLAIN_CHECKS,
+    SamplePool,
+    capture_plan,
+    check_expected_indexes,
+)
+from app.infrastructure.db.migrations.runner import (
+    load_migrations,
+    pending_migrations,
+    split_statements,
+)
+
+
+class MigrationRunnerTests(unittest.TestCase):
+    def test_index_pack_runs_outside_transaction(self):
+        migrations = load_migrations()
+
+        self.assertEqual(migrations[0].version, "0001")
+        self.assertFalse(migrations[0].transactional)
+        self.assertTrue(migrations[0].statements)
+        for statement in migrations[0].statements:
+            self.assertTrue(statement.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS"), statement)
+        joined = "\n".join(migrations[0].statements)
+        self.assertIn(
+            "ON public.pool_state_snapshots (chain_id, dex_id, pool_address, meta_block_number DESC)",
+            joined,
+        )
+        self.assertIn("ON public.pool_ticks_initialized (chain_id, dex_id, pool_address, tick_idx)", joined)
+        self.assertIn("ON public.pool_hourly (pool_address, chain_id, dex_id, hour_start)", joined)
+
+    def test_split_statements_ignores_comment_lines(self):
+        sql = "-- cabecalho; com ponto e virgula\nCREATE TABLE a (id int);\n\n-- fim\nSELECT 1;\n"
+        self.assertEqual(split_statements(sql), ("CREATE TABLE a (id int)", "SELECT 1"))
+
+    def test_split_statements_keeps_function_bodies_and_literals_whole(self):
+        sql = (
+            "CREATE FUNCTION f() RETURNS trigger LANGUAGE plpgsql AS $$\n"
+            "BEGIN\n    -- comentario; dentro do corpo\n    PERFORM pg_notify('a;b', 'it''s');\n"
+            "    RETURN NULL;\nEND;\n$$;\n"
+            "SELECT $tag$ ; $tag$;\n"
+        )
+        statements = split_statements(sql)
+
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(statements[0].endswith("END;\n$$"))
+        self.assertIn("-- comentario; dentro do corpo", statements[0])
+        self.assertIn("pg_notify('a;b', 'it''s')", statements[0])
+        self.assertEqual(statements[1], "SELECT $tag$ ; $tag$")
+        with self.assertRaises(ValueError):
+            split_statements("CREATE FUNCTION f() AS $$ BEGIN")
+
+    def test_derived_schema_lives_in_migrations(self):
+        migrations = {migration.name: migration for migration in load_migrations()}
+
+        price = migrations["pool_state_snapshot_price"]
+        self.assertTrue(price.transactional)
+        self.assertEqual(
+            [statement.split("\n")[0] for statement in price.statements],
+            [
+                "ALTER TABLE public.pool_state_snapshots",
+                "CREATE OR REPLACE FUNCTION public.pool_state_snapshots_set_price()",
+                "DROP TRIGGER IF EXISTS trg_pool_state_snapshots_set_price ON public.pool_state_snapshots",
+                "CREATE TRIGGER trg_pool_state_snapshots_set_price",
+            ],
+        )
+        daily = "\n".join(migrations["pool_daily"].statements)
+        self.assertIn("CREATE TABLE IF NOT EXISTS public.pool_daily", daily)
+        self.assertIn("h.hour_start >= (from_day::timestamp AT TIME ZONE 'UTC')", daily)
+        radar = "\n".join(migrations["radar_pool_aggregates"].statements)
+        self.assertIn("ADD COLUMN IF NOT EXISTS price_volatility numeric", radar)
+        self.assertIn("FUNCTION public.refresh_radar_pool_aggregates(timeframes integer[])", radar)
+        notify = "\n".join(migrations["catalog_notify"].statements)
+        for table in ("pools", "tokens", "dexes", "chains"):
+            self.assertIn(f"CREATE TRIGGER trg_{table}_notify_catalog_changed", notify)
+
+    def test_derived_indexes_run_outside_transaction(self):
+        migration = next(m for m in load_migrations() if m.name == "derived_table_indexes")
+
+        self.assertFalse(migration.transactional)
+        for statement in migration.statements:
+            self.assertRegex(statement, r"^(CREATE|DROP) INDEX CONCURRENTLY IF NOT EXISTS|^DROP INDEX CONCURRENTLY IF EXISTS")
+        joined = "\n".join(migration.statements)
+        self.assertIn(
+            "ON apr_exact.tick_snapshot (chain_id, dex_id, pool_address, tick_idx, block_number DESC)",
+            joined,
+        )
+        self.assertIn("ON public.pool_daily (pool_address, chain_id, dex_id, day_utc)", joined)
+        self.assertIn("DROP INDEX CONCURRENTLY IF EXISTS public.idx_pool_daily_pool_day", joined)
+
+    def test_pending_skips_applied_and_rejects_edited_migrations(self):
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "0001_first.sql").write_text("SELECT 1;", encoding="utf-8")
+            Path(directory, "0002_second.sql").write_text("SELECT 2;", encoding="utf-8")
+            migrations = load_migrations(Path(directory))
+
+        self.assertTrue(migrations[0].transactional)
+        pending = pending_migrations(migrations, {"0001": migrations[0].checksum})
+        self.assertEqual([migration.name for migration in pending], ["second"])
+        with self.assertRaises(ValueError):
+            pending_migrations(migrations, {"0001": "edited"})
+
+
+class _FakeResult:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one(self):
+        return self._value
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, statement, params=None):
+        self._engine.calls.append((str(statement), dict(params or {})))
+        return _FakeResult(json.dumps([{"Plan": self._engine.plan}]))
+
+
+class _FakeEngine:
+    def __init__(self, plan):
+        self.plan = plan
+        self.calls: list[tuple[str, dict]] = []
+
+    def connect(self):
+        return _FakeConnection(self)
+
+
+POOL = SamplePool(chain_id=1, dex_id=2, pool_address="0xabc", pool_id=42, block_number=100)
+
+
+class ExplainCheckTests(unittest.TestCase):
+    def test_accepts_expected_indexes_including_bitmap_scans(self):
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "pools",
+                    "Index Name": "idx_pools_address_chain_dex",
+                },
+                {
+                    "Node Type": "Bitmap Heap Scan",
+                    "Relation Name": "pool_daily",
+                    "Plans": [
+                        {"Node Type": "Bitmap Index Scan", "Index Name": "idx_pool_daily_address_key_day"},
+                    ],
+                },
+            ],
+        }
+
+        self.assertEqual(
+            check_expected_indexes(
+                plan,
+                {
+                    "pools": frozenset({"idx_pools_address_chain_dex"}),
+                    "pool_daily": frozenset({"idx_pool_daily_address_key_day"}),
+                },
+            ),
+            [],
+        )
+
+    def test_rejects_seq_scans_unexpected_indexes_and_missing_relations(self):
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "pool_hourly"},
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "pool_state_snapshots",
+                    "Index Name": "pool_state_snapshots_pkey",
+                },
+            ],
+        }
+
+        problems = check_expected_indexes(
+            plan,
+            {
+                "pool_hourly": frozenset({"idx_pool_hourly_address_key_hour"}),
+                "pool_state_snapshots": frozenset({"idx_pool_state_snapshots_key_block"}),
+                "tokens": frozenset({"idx_tokens_chain_address"}),
+            },
+        )
+
+        self.assertEqual(
+            problems,
+            [
+                "pool_hourly: Seq Scan",
+                "pool_state_snapshots: pool_state_snapshots_pkey (esperado idx_pool_state_snapshots_key_block)",
+                "tokens: ausente do plano",
+            ],
+        )
+
+    def test_explains_the_repository_query_with_its_parameters(self):
+        plan = {
+            "Node Type": "Unique",
+            "Plans": [
+                {
+                    "Node Type": "Index Only Scan",
+                    "Relation Name": "tick_snapshot",
+                    "Index Name": "idx_tick_snapshot_key_tick_block",
+                }
+            ],
+        }
+        engine = _FakeEngine(plan)
+        check = next(c for c in EXPLAIN_CHECKS if c.name == "liquidity_distribution.get_ticks_at_block")
+
+        captured = capture_plan(engine, check, POOL)
+
+        self.assertEqual(captured, plan)
+        self.assertEqual(check_expected_indexes(captured, check.expected_indexes), [])
+        [(sql, params)] = engine.calls
+        self.assertTrue(sql.startswith("EXPLAIN (FORMAT JSON) "))
+        self.assertIn("SELECT DISTINCT ON (ts.tick_idx)", sql)
+        self.assertEqual(
+            params,
+            {"pool_address": "0xabc", "chain_id": 1, "dex_id": 2, "block_number": 100},
+        )
+
+    def test_seqscan_is_disabled_only_on_request(self):
+        engine = _FakeEngine({"Node Type": "Result"})
+        check = next(c for c in EXPLAIN_CHECKS if c.name == "accounts.get_user_by_email")
+
+        capture_plan(engine, check, POOL)
+        capture_plan(engine, check, POOL, disable_seqscan=True)
+
+        statements = [sql for sql, _ in engine.calls]
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[0].startswith("EXPLAIN"))
+        self.assertEqual(statements[1], "SET LOCAL enable_seqscan = off")
+        self.assertTrue(statements[2].startswith("EXPLAIN"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_access_token_payload, get_current_user, get_get_user_entitlements_use_case
+from app.application.dto.auth import AccessTokenPayload
+from app.application.dto.entitlements import UserEntitlementsOutput
+from app.domain.entities.user import User
+from app.main import app
+
+
+class FakeEntitlementsUseCase:
+    def __init__(self, *, ops_admin: bool):
+        self._ops_admin = ops_admin
+
+    def execute(self, *, user_id: str) -> UserEntitlementsOutput:
+        return UserEntitlementsOutput(
+            user_id=user_id,
+            plan_code="pro",
+            boolean_features={"charts_advanced": True, "ops_admin": self._ops_admin},
+            limits={"requests_per_minute": 600},
+        )
+
+
+def _fake_user() -> User:
+    return User(
+        id="user-1",
+        name="Alice",
+        email="alice@example.com",
+        email_verified=True,
+        is_active=True,
+        stripe_customer_id=None,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def _client(*, ops_admin: bool) -> TestClient:
+    app.dependency_overrides[get_current_user] = _fake_user
+    app.dependency_overrides[get_access_token_payload] = lambda: AccessTokenPayload(user_id="user-1")
+    app.dependency_overrides[get_get_user_entitlements_use_case] = lambda: FakeEntitlementsUseCase(
+        ops_admin=ops_admin
+    )
+    return TestClient(app)
+
+
+def test_ops_routes_require_ops_admin_feature():
+    client = _client(ops_admin=False)
+    try:
+        for path in ("/v1/ops/caches", "/v1/ops/password-hashing"):
+            response = client.get(path)
+            assert response.status_code == 403, path
+            assert "ops_admin" in response.json()["detail"]
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_ops_admin_reads_cache_stats():
+    client = _client(ops_admin=True)
+    try:
+        response = client.get("/v1/ops/caches")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert {item["name"] for item in response.json()} >= {"user", "entitlements"}
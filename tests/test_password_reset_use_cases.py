@@ -12,6 +12,7 @@ from app.application.use_cases.reset_password import ResetPasswordUseCase
 from app.domain.entities.password_reset import PasswordResetToken
 from app.domain.entities.user import AuthIdentity, AuthSession, User
 from app.domain.exceptions import PasswordResetTokenInvalidError
+from app.shared.cache import LruCache
 
 
 class FakeAuthPort:
@@ -199,7 +200,7 @@ class FakeTokenPort:
     def __init__(self):
         self._seq = 0
 
-    def create_access_token(self, *, user_id: str, now: datetime):
+    def create_access_token(self, *, user_id: str, now: datetime, claims=None):
         _ = (user_id, now)
         raise NotImplementedError
 
@@ -292,15 +293,19 @@ def test_reset_password_with_valid_token_updates_password_and_marks_used():
         user_agent=None,
     )
 
+    user_cache: LruCache[str, User] = LruCache(max_entries=10, ttl_seconds=30)
+    user_cache.set(user.id, user)
     use_case = ResetPasswordUseCase(
         auth_port=auth_port,
         token_port=token_port,
         password_hasher=FakePasswordHasher(),
+        user_cache=user_cache,
     )
 
     output = use_case.execute(ResetPasswordInput(token=raw_token, new_password="new-password-123"))
 
     assert output.message == "Password updated"
+    assert user_cache.get(user.id) is None
     updated_identity = auth_port.identities[identity.id]
     assert updated_identity.password_hash == "hash::new-password-123"
     assert auth_port.reset_tokens["t1"].used_at is not None
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+import unittest
+
+from app.infrastructure.db.backfills import pool_daily
+from app.infrastructure.db.migrations.runner import load_migrations
+
+
+class _FakeResult:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar(self):
+        return self._value
+
+    def scalar_one(self):
+        return self._value
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if "min(h.hour_start)" in sql:
+            return _FakeResult(self._engine.first_hour)
+        self._engine.refresh_calls.append((params["from_day"], params["to_day"]))
+        return _FakeResult(3)
+
+
+class _FakeEngine:
+    def __init__(self, first_hour):
+        self.first_hour = first_hour
+        self.refresh_calls: list[tuple[date, date]] = []
+
+    def connect(self):
+        return _FakeConnection(self)
+
+    def begin(self):
+        return _FakeConnection(self)
+
+
+class PoolDailyRollupTests(unittest.TestCase):
+    def test_refresh_function_upserts_from_pool_hourly(self):
+        migration = next(m for m in load_migrations() if m.name == "pool_daily")
+        ddl = "\n".join(migration.statements)
+        self.assertIn("CREATE TABLE IF NOT EXISTS public.pool_daily", ddl)
+        self.assertIn("PRIMARY KEY (chain_id, dex_id, pool_address, day_utc)", ddl)
+        self.assertIn("FROM public.pool_hourly h", ddl)
+        self.assertIn("ON CONFLICT (chain_id, dex_id, pool_address, day_utc) DO UPDATE", ddl)
+        self.assertIn("h.hour_start >= (from_day::timestamp AT TIME ZONE 'UTC')", ddl)
+        self.assertIn("h.hour_start < ((to_day + 1)::timestamp AT TIME ZONE 'UTC')", ddl)
+
+    def test_backfill_walks_history_in_chunks_up_to_today(self):
+        today = datetime.now(timezone.utc).date()
+        first_hour = datetime.combine(today - timedelta(days=9), datetime.min.time())
+        engine = _FakeEngine(first_hour)
+
+        upserted = pool_daily.backfill_pool_daily(engine, chunk_days=4)
+
+        self.assertEqual(
+            engine.refresh_calls,
+            [
+                (today - timedelta(days=9), today - timedelta(days=6)),
+                (today - timedelta(days=5), today - timedelta(days=2)),
+                (today - timedelta(days=1), today),
+            ],
+        )
+        self.assertEqual(upserted, 9)
+
+    def test_backfill_starts_on_the_utc_day_of_the_first_hour(self):
+        today = datetime.now(timezone.utc).date()
+        # 23:00 em UTC-3 ja e o dia seguinte em UTC.
+        session_tz = timezone(timedelta(hours=-3))
+        first_hour = datetime.combine(today - timedelta(days=2), datetime.min.time(), session_tz).replace(hour=23)
+        engine = _FakeEngine(first_hour)
+
+        pool_daily.backfill_pool_daily(engine, chunk_days=7)
+
+        self.assertEqual(engine.refresh_calls, [(today - timedelta(days=1), today)])
+
+    def test_backfill_without_hourly_rows_is_noop(self):
+        engine = _FakeEngine(None)
+        self.assertEqual(pool_daily.backfill_pool_daily(engine), 0)
+        self.assertEqual(engine.refresh_calls, [])
+
+    def test_volume_history_and_radar_read_the_rollup(self):
+        volume_source = Path(
+            "app/infrastructure/db/repositories/pool_volume_history_repository.py"
+        ).read_text(encoding="utf-8")
+        radar_source = Path("app/infrastructure/db/repositories/radar_pools_repository.py").read_text(
+            encoding="utf-8"
+        )
+        self.assertEqual(volume_source.count("FROM public.pool_daily d"), 2)
+        self.assertNotIn("date_trunc('day', h.hour_start", volume_source)
+        self.assertIn("JOIN public.pool_daily pd", radar_source)
+        self.assertNotIn("JOIN public.pool_hourly", radar_source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+import json
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.api.auth import require_jwt
+from app.api.deps import get_export_pool_price_use_case
+from app.api.streaming import export_response
+from app.application.dto.pool_price import ExportPoolPriceInput
+from app.application.use_cases.export_pool_price import ExportPoolPriceUseCase
+from app.domain.entities.pool_price import PoolPricePoint
+from app.domain.exceptions import PoolNotFoundError, PoolPriceInputError
+from app.main import app
+
+
+POINTS = [
+    PoolPricePoint(timestamp=datetime(2026, 1, 1, 0, 0, 0), price=Decimal("2")),
+    PoolPricePoint(timestamp=datetime(2026, 1, 1, 1, 0, 0), price=Decimal("4")),
+]
+
+
+class FakeExportPricePort:
+    def __init__(self, *, exists: bool = True, points=POINTS, fail_after: int | None = None):
+        self.exists = exists
+        self.points = points
+        self.fail_after = fail_after
+        self.consumed = 0
+
+    def pool_exists(self, *, pool_address: str, chain_id: int, dex_id: int) -> bool:
+        _ = (pool_address, chain_id, dex_id)
+        return self.exists
+
+    def iter_price_points(self, **_kwargs):
+        for point in self.points:
+            if self.consumed == self.fail_after:
+                raise OperationalError("FETCH FORWARD", {}, Exception("server closed the connection"))
+            self.consumed += 1
+            yield point
+
+
+def _client(port: FakeExportPricePort) -> TestClient:
+    app.dependency_overrides[require_jwt] = lambda: "token"
+    app.dependency_overrides[get_export_pool_price_use_case] = lambda: ExportPoolPriceUseCase(
+        pool_price_port=port
+    )
+    return TestClient(app, raise_server_exceptions=False)
+
+
+PARAMS = {"pool_address": "0xPool", "chain_id": 1, "dex_id": 2, "days": 30}
+
+
+def test_export_use_case_is_lazy_and_inverts_swapped_pair():
+    port = FakeExportPricePort()
+    points = ExportPoolPriceUseCase(pool_price_port=port).execute(
+        ExportPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=365, swapped_pair=True)
+    )
+
+    assert port.consumed == 0
+    assert [point.price for point in points] == [Decimal("0.5"), Decimal("0.25")]
+
+
+def test_export_use_case_keeps_non_invertible_points_with_null_price():
+    port = FakeExportPricePort(
+        points=[
+            PoolPricePoint(timestamp=datetime(2026, 1, 1, 0, 0, 0), price=Decimal("0")),
+            PoolPricePoint(timestamp=datetime(2026, 1, 1, 1, 0, 0), price=Decimal("4")),
+        ]
+    )
+    points = ExportPoolPriceUseCase(pool_price_port=port).execute(
+        ExportPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=30, swapped_pair=True)
+    )
+
+    assert [(point.timestamp.hour, point.price) for point in points] == [(0, None), (1, Decimal("0.25"))]
+
+
+def test_export_use_case_validates_before_streaming():
+    use_case = ExportPoolPriceUseCase(pool_price_port=FakeExportPricePort(exists=False))
+
+    with pytest.raises(PoolPriceInputError):
+        use_case.execute(ExportPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=400))
+    with pytest.raises(PoolNotFoundError):
+        use_case.execute(ExportPoolPriceInput(pool_address="0xpool", chain_id=1, dex_id=2, days=30))
+
+
+def test_export_router_streams_ndjson_and_csv():
+    client = _client(FakeExportPricePort())
+
+    ndjson = client.get("/v1/pool-price/export", params=PARAMS)
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in ndjson.text.splitlines()] == [
+        {"timestamp": "2026-01-01T00:00:00", "price": "2"},
+        {"timestamp": "2026-01-01T01:00:00", "price": "4"},
+        {"export": "complete", "rows": 2},
+    ]
+
+    csv_response = client.get("/v1/pool-price/export", params={**PARAMS, "format": "csv"})
+    assert csv_response.status_code == 200
+    assert "pool-price-0xpool.csv" in csv_response.headers["content-disposition"]
+    assert csv_response.text.splitlines() == [
+        "timestamp,price",
+        "2026-01-01T00:00:00,2",
+        "2026-01-01T01:00:00,4",
+        "# export=complete rows=2",
+    ]
+
+    invalid = client.get("/v1/pool-price/export", params={**PARAMS, "format": "xml"})
+    assert invalid.status_code == 422
+
+    app.dependency_overrides.clear()
+
+
+def test_export_router_fails_with_5xx_when_the_first_fetch_fails():
+    client = _client(FakeExportPricePort(fail_after=0))
+    try:
+        response = client.get("/v1/pool-price/export", params=PARAMS)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 500
+
+
+def _drain(response) -> tuple[str, Exception | None]:
+    # Le o corpo ate o stream terminar ou quebrar (TestClient descarta o corpo
+    # parcial quando o app levanta excecao depois dos headers).
+    async def collect():
+        chunks: list[bytes] = []
+        try:
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+        except Exception as exc:
+            return b"".join(chunks).decode("utf-8"), exc
+        return b"".join(chunks).decode("utf-8"), None
+
+    return asyncio.run(collect())
+
+
+def test_export_stream_ends_with_an_error_record_when_the_cursor_breaks():
+    def rows(port):
+        return ({"timestamp": point.timestamp, "price": point.price} for point in port.iter_price_points())
+
+    cases = (("ndjson", '{"export":"error","rows":1}'), ("csv", "# export=error rows=1"))
+    for export_format, last_line in cases:
+        response = export_response(
+            rows(FakeExportPricePort(fail_after=1)),
+            fields=["timestamp", "price"],
+            export_format=export_format,
+            filename="pool-price-0xpool",
+        )
+
+        body, error = _drain(response)
+
+        assert isinstance(error, OperationalError)
+        assert body.splitlines()[-1] == last_line
+        assert "2026-01-01T00:00:00" in body
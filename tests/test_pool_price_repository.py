@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import unittest
+
+from app.domain.entities.pool_price import PoolCurrentPrice, PoolPriceCandle, PoolPricePoint, PoolPriceStats
+from app.infrastructure.db.migrations.runner import load_migrations
+from app.infrastructure.db.repositories.pool_price_repository import SqlPoolPriceRepository
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, statement, params):
+        self._engine.calls.append((str(statement), dict(params)))
+        return _FakeResult(self._engine.rows)
+
+
+class _FakeEngine:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls: list[tuple[str, dict]] = []
+
+    def connect(self):
+        return _FakeConnection(self)
+
+
+T0 = datetime(2026, 2, 1, 10, 0, 0)
+HEADER = {"token1_price": 2.5, "token0_price": Decimal("0.4"), "sqrt_price_x96": None}
+
+
+def _repository(rows) -> tuple[SqlPoolPriceRepository, _FakeEngine]:
+    engine = _FakeEngine(rows)
+    return SqlPoolPriceRepository(engine), engine
+
+
+class PoolPriceRepositoryTests(unittest.TestCase):
+    def test_series_maps_precomputed_prices_from_one_statement(self):
+        repository, engine = _repository(
+            [
+                {**HEADER, "timestamp": T0, "block_timestamp": 1769940000, "price": 2.25},
+                {
+                    **HEADER,
+                    "timestamp": T0 + timedelta(minutes=5),
+                    "block_timestamp": 1769940300,
+                    "price": 2.5,
+                },
+            ]
+        )
+
+        window = repository.get_price_window(pool_address="0xABC", chain_id=1, dex_id=2, days=7)
+
+        self.assertEqual(
+            window.current,
+            PoolCurrentPrice(token1_price=Decimal("2.5"), token0_price=Decimal("0.4"), sqrt_price_x96=None),
+        )
+        self.assertEqual(
+            window.series,
+            [
+                PoolPricePoint(timestamp=T0, price=Decimal("2.25")),
+                PoolPricePoint(timestamp=T0 + timedelta(minutes=5), price=Decimal("2.5")),
+            ],
+        )
+        self.assertEqual(window.candles, [])
+        self.assertIsNone(window.stats)
+        [(sql, params)] = engine.calls
+        self.assertEqual(params, {"pool_address": "0xabc", "chain_id": 1, "dex_id": 2, "days": 7})
+        self.assertIn("s.price_token1_per_token0 IS NOT NULL", sql)
+        self.assertNotIn("power(", sql)
+
+    def test_missing_pool_returns_none(self):
+        repository, _ = _repository([])
+
+        self.assertIsNone(repository.get_price_window(pool_address="0xabc", chain_id=1, dex_id=2, days=7))
+
+    def test_pool_without_priced_snapshots_keeps_current_price_and_empty_series(self):
+        # Snapshots ainda sem price_token1_per_token0 (antes do backfill) nao
+        # entram na janela; o preco atual cai no sqrt_price_x96 da pool.
+        repository, _ = _repository(
+            [
+                {
+                    "token1_price": None,
+                    "token0_price": None,
+                    "sqrt_price_x96": "79228162514264337593543950336",
+                    "timestamp": None,
+                    "block_timestamp": None,
+                    "price": None,
+                }
+            ]
+        )
+
+        window = repository.get_price_window(pool_address="0xabc", chain_id=1, dex_id=2, days=7)
+
+        self.assertEqual(window.series, [])
+        self.assertEqual(window.current.sqrt_price_x96, 79228162514264337593543950336)
+
+    def test_candles_and_stats_for_an_explicit_range(self):
+        start = datetime(2026, 2, 1, 7, 0, 0, tzinfo=timezone(timedelta(hours=-3)))
+        end = start + timedelta(hours=1)
+        stats = {"min_price": 1.5, "max_price": 3.0, "avg_price": 2.0, "avg_inverse_price": 0.55}
+        candle = {"open_price": 1.5, "high_price": 3.0, "low_price": 1.5, "close_price": 2.0}
+        repository, engine = _repository(
+            [{**HEADER, **stats, **candle, "timestamp": T0}],
+        )
+
+        window = repository.get_price_window(
+            pool_address="0xabc",
+            chain_id=1,
+            dex_id=2,
+            start=start,
+            end=end,
+            bucket_seconds=3600,
+        )
+
+        self.assertEqual(
+            window.candles,
+            [
+                PoolPriceCandle(
+                    timestamp=T0,
+                    open=Decimal("1.5"),
+                    high=Decimal("3.0"),
+                    low=Decimal("1.5"),
+                    close=Decimal("2.0"),
+                )
+            ],
+        )
+        self.assertEqual(
+            window.stats,
+            PoolPriceStats(
+                min_price=Decimal("1.5"),
+                max_price=Decimal("3.0"),
+                avg_price=Decimal("2.0"),
+                avg_inverse_price=Decimal("0.55"),
+            ),
+        )
+        [(sql, params)] = engine.calls
+        self.assertEqual(params["start_ts"], 1769940000)
+        self.assertEqual(params["end_ts"], 1769943600)
+        self.assertEqual(params["bucket_seconds"], 3600)
+        self.assertIn(SqlPoolPriceRepository._RANGE_FILTER, sql)
+
+    def test_pool_exists_checks_the_pool_row(self):
+        repository, engine = _repository([{"?column?": 1}])
+        self.assertTrue(repository.pool_exists(pool_address="0xABC", chain_id=1, dex_id=2))
+        [(sql, params)] = engine.calls
+        self.assertIn("FROM public.pools p", sql)
+        self.assertEqual(params, {"pool_address": "0xabc", "chain_id": 1, "dex_id": 2})
+
+        missing, _ = _repository([])
+        self.assertFalse(missing.pool_exists(pool_address="0xabc", chain_id=1, dex_id=2))
+
+    def test_epoch_seconds_treats_naive_datetime_as_utc(self):
+        naive = datetime(2026, 2, 1, 10, 0, 0)
+        aware = datetime(2026, 2, 1, 7, 0, 0, tzinfo=timezone(timedelta(hours=-3)))
+        self.assertEqual(SqlPoolPriceRepository._epoch_seconds(naive), 1769940000)
+        self.assertEqual(SqlPoolPriceRepository._epoch_seconds(aware), 1769940000)
+
+    def test_inserting_a_pool_reprices_its_pending_snapshots(self):
+        migration = next(m for m in load_migrations() if m.name == "pool_state_snapshot_price_late_pools")
+        joined = "\n".join(migration.statements)
+
+        self.assertIn("AFTER INSERT\nON public.pools", joined)
+        self.assertIn("SET sqrt_price_x96 = s.sqrt_price_x96", joined)
+        self.assertIn("s.price_token1_per_token0 IS NULL", joined)
+
+
+if __name__ == "__main__":
+    unittest.main()
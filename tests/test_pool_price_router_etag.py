@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from app.api.auth import require_jwt
+from app.api.deps import get_pool_price_use_case
+from app.application.dto.pool_price import GetPoolPriceOutput
+from app.domain.entities.pool_price import PoolPricePoint
+from app.domain.exceptions import PoolPriceInputError
+from app.main import app
+
+
+class FakePoolPriceUseCase:
+    def __init__(self, version: str | None):
+        self.version = version
+        self.execute_calls = 0
+        self.version_calls = 0
+
+    def validate(self, command):
+        if command.days is not None and command.days <= 0:
+            raise PoolPriceInputError("days must be a positive integer.")
+
+    def get_version(self, _command):
+        self.version_calls += 1
+        return self.version
+
+    def execute(self, _command):
+        self.execute_calls += 1
+        return GetPoolPriceOutput(
+            pool_address="0xpool",
+            days=1,
+            min_price=Decimal("1"),
+            max_price=Decimal("2"),
+            avg_price=Decimal("1.5"),
+            current_price=Decimal("2"),
+            series=[PoolPricePoint(timestamp=datetime(2024, 1, 1), price=Decimal("2"))],
+        )
+
+
+PARAMS = {"pool_address": "0xpool", "chain_id": 1, "dex_id": 2, "days": 1}
+
+
+def test_pool_price_returns_etag_and_304_without_running_queries():
+    use_case = FakePoolPriceUseCase(version="block:100")
+    app.dependency_overrides[require_jwt] = lambda: "token"
+    app.dependency_overrides[get_pool_price_use_case] = lambda: use_case
+
+    client = TestClient(app)
+    first = client.get("/v1/pool-price", params=PARAMS)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "must-revalidate" in first.headers["cache-control"]
+
+    second = client.get("/v1/pool-price", params=PARAMS, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert use_case.execute_calls == 1
+
+    use_case.version = "block:101"
+    third = client.get("/v1/pool-price", params=PARAMS, headers={"If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["etag"] != etag
+    assert use_case.execute_calls == 2
+
+    app.dependency_overrides.clear()
+
+
+def test_pool_price_without_version_skips_etag():
+    use_case = FakePoolPriceUseCase(version=None)
+    app.dependency_overrides[require_jwt] = lambda: "token"
+    app.dependency_overrides[get_pool_price_use_case] = lambda: use_case
+
+    client = TestClient(app)
+    response = client.get("/v1/pool-price", params=PARAMS, headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+    app.dependency_overrides.clear()
+
+
+def test_pool_price_rejects_invalid_input_before_reading_the_version():
+    use_case = FakePoolPriceUseCase(version="block:100")
+    app.dependency_overrides[require_jwt] = lambda: "token"
+    app.dependency_overrides[get_pool_price_use_case] = lambda: use_case
+
+    client = TestClient(app)
+    response = client.get("/v1/pool-price", params={**PARAMS, "days": 0}, headers={"If-None-Match": "*"})
+    assert response.status_code == 400
+    assert use_case.version_calls == 0
+    assert use_case.execute_calls == 0
+
+    app.dependency_overrides.clear()
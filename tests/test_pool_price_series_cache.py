@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+import time
+
+from app.infrastructure.db.repositories.pool_price_repository import SqlPoolPriceRepository
+from app.shared.cache import TimeSeriesCache
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, _statement, params):
+        self._engine.calls.append(dict(params))
+        return FakeResult(self._engine.rows_between(params["start_ts"], params.get("end_ts")))
+
+
+class FakeEngine:
+    def __init__(self, points: list[tuple[int, Decimal]]):
+        self.points = points
+        self.calls: list[dict] = []
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def rows_between(self, start_ts: int, end_ts: int | None):
+        header = {"token1_price": Decimal("2.0"), "token0_price": None, "sqrt_price_x96": None}
+        rows = [
+            {**header, "timestamp": datetime.utcfromtimestamp(ts), "block_timestamp": ts, "price": price}
+            for ts, price in sorted(self.points)
+            if ts >= start_ts and (end_ts is None or ts <= end_ts)
+        ]
+        return rows or [{**header, "timestamp": None, "block_timestamp": None, "price": None}]
+
+
+def test_time_series_cache_appends_tail_and_bisects_windows():
+    cache: TimeSeriesCache[str, float] = TimeSeriesCache(max_series=4, max_bytes=1024 * 1024)
+    cache.store("pool", from_ts=100, timestamps=[100, 110, 120], values=[1.0, 2.0, 3.0], replace=True)
+
+    assert cache.tail_start("pool", start_ts=100) == 120
+    assert cache.tail_start("pool", start_ts=100, overlap_seconds=15) == 105
+    assert cache.tail_start("pool", start_ts=100, overlap_seconds=60) == 100
+    assert cache.tail_start("pool", start_ts=90) is None
+
+    cache.store("pool", from_ts=120, timestamps=[120, 130], values=[3.5, 4.0], replace=False)
+
+    assert cache.window("pool", start_ts=105, end_ts=125) == ([110, 120], [2.0, 3.5])
+    assert cache.window("pool", start_ts=100) == ([100, 110, 120, 130], [1.0, 2.0, 3.5, 4.0])
+
+
+def test_time_series_cache_evicts_by_lru_and_memory_budget():
+    cache: TimeSeriesCache[str, float] = TimeSeriesCache(max_series=2, max_bytes=10_000)
+    cache.store("a", from_ts=0, timestamps=[1], values=[1.0], replace=True)
+    cache.store("b", from_ts=0, timestamps=[1], values=[1.0], replace=True)
+    cache.window("a", start_ts=0)
+    cache.store("c", from_ts=0, timestamps=[1], values=[1.0], replace=True)
+
+    assert cache.window("b", start_ts=0) is None
+    assert cache.window("a", start_ts=0) is not None
+
+    cache.store("big", from_ts=0, timestamps=list(range(1000)), values=[1.0] * 1000, replace=True)
+
+    assert cache.window("big", start_ts=0) is None
+    assert cache.total_bytes <= 10_000
+
+
+def _repository(engine: FakeEngine, cache=None, **kwargs) -> SqlPoolPriceRepository:
+    if cache is None:
+        cache = TimeSeriesCache(max_series=4, max_bytes=1024 * 1024)
+    return SqlPoolPriceRepository(engine, series_cache=cache, **kwargs)
+
+
+def test_repository_fetches_only_tail_after_first_request():
+    now = int(time.time())
+    engine = FakeEngine([(now - 300, Decimal("1.0")), (now - 200, Decimal("2.0"))])
+    repository = _repository(engine, tail_overlap_seconds=0)
+
+    first = repository.get_price_window(pool_address="0xPool", chain_id=1, dex_id=2, days=1)
+    engine.points.append((now - 100, Decimal("3.0")))
+    second = repository.get_price_window(pool_address="0xpool", chain_id=1, dex_id=2, days=1)
+
+    assert [row.price for row in first.series] == [Decimal("1.0"), Decimal("2.0")]
+    assert [row.price for row in second.series] == [Decimal("1.0"), Decimal("2.0"), Decimal("3.0")]
+    assert second.current.token1_price == Decimal("2.0")
+    assert engine.calls[0]["start_ts"] <= now - 86400
+    assert engine.calls[1]["start_ts"] == now - 200
+
+
+def test_repository_keeps_numeric_precision_and_picks_up_late_snapshots():
+    now = int(time.time())
+    precise = Decimal("0.000123456789012345678901234567")
+    engine = FakeEngine([(now - 3000, precise), (now - 100, Decimal("2"))])
+    repository = _repository(engine, tail_overlap_seconds=3600)
+
+    first = repository.get_price_window(pool_address="0xpool", chain_id=1, dex_id=2, days=1)
+    # Snapshot ingerido depois, com timestamp anterior ao ultimo ponto em cache.
+    engine.points.append((now - 500, Decimal("1.5")))
+    second = repository.get_price_window(pool_address="0xpool", chain_id=1, dex_id=2, days=1)
+
+    assert first.series[0].price == precise
+    assert [row.price for row in second.series] == [precise, Decimal("1.5"), Decimal("2")]
+    assert engine.calls[1]["start_ts"] == now - 100 - 3600
+
+
+def test_repository_sends_start_end_ranges_to_the_database():
+    now = int(time.time())
+    engine = FakeEngine([(now - 300, Decimal("1")), (now - 200, Decimal("2")), (now - 100, Decimal("3"))])
+    cache: TimeSeriesCache[tuple[int, int, str], Decimal] = TimeSeriesCache(max_series=4, max_bytes=1024 * 1024)
+    repository = _repository(engine, cache)
+
+    window = repository.get_price_window(
+        pool_address="0xpool",
+        chain_id=1,
+        dex_id=2,
+        start=datetime.fromtimestamp(now - 350, tz=timezone.utc),
+        end=datetime.fromtimestamp(now - 150, tz=timezone.utc),
+    )
+
+    assert [row.price for row in window.series] == [Decimal("1"), Decimal("2")]
+    assert engine.calls == [
+        {"pool_address": "0xpool", "chain_id": 1, "dex_id": 2, "start_ts": now - 350, "end_ts": now - 150}
+    ]
+    assert len(cache) == 0
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from decimal import Decimal
+import math
+import unittest
+
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
+from app.domain.services.pool_summary import summarize_ohlc_premium
+
+
+DAYS = [date(2026, 2, 1), date(2026, 2, 2), date(2026, 2, 3)]
+
+
+class SummarizeOhlcPremiumTests(unittest.TestCase):
+    def test_missing_values_are_skipped(self):
+        base = CryptoOhlcDailySeries(
+            symbol="ETH",
+            day_starts=DAYS,
+            highs=array("d", [10.0, math.nan, 20.0]),
+            lows=array("d", [5.0, 1.0, 10.0]),
+            closes=array("d", [8.0, 9.0, 15.0]),
+        )
+        premium = summarize_ohlc_premium(base=base)
+        self.assertEqual(premium.price_volatility_pct, Decimal("50.0"))
+        self.assertEqual(premium.geometric_mean_price, Decimal(str(math.sqrt(100.0))))
+        self.assertIsNone(premium.correlation)
+
+    def test_correlation_uses_common_days_and_needs_variance(self):
+        base = CryptoOhlcDailySeries(
+            symbol="ETH",
+            day_starts=DAYS,
+            highs=array("d", [2.0, 3.0, 4.0]),
+            lows=array("d", [1.0, 1.0, 1.0]),
+            closes=array("d", [1.0, 2.0, 3.0]),
+        )
+        quote = CryptoOhlcDailySeries(
+            symbol="BTC",
+            day_starts=DAYS[1:],
+            highs=array("d", [1.0, 1.0]),
+            lows=array("d", [1.0, 1.0]),
+            closes=array("d", [6.0, 4.0]),
+        )
+        self.assertAlmostEqual(float(summarize_ohlc_premium(base=base, quote=quote).correlation), -1.0)
+
+        flat = CryptoOhlcDailySeries(
+            symbol="USDC",
+            day_starts=DAYS,
+            highs=array("d", [1.0, 1.0, 1.0]),
+            lows=array("d", [1.0, 1.0, 1.0]),
+            closes=array("d", [1.0, 1.0, 1.0]),
+        )
+        self.assertIsNone(summarize_ohlc_premium(base=base, quote=flat).correlation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,84 +1,82 @@
 from __future__ import annotations
 
+from array import array
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 import unittest
 
 from app.application.dto.pool_volume_history import GetPoolVolumeHistoryInput
 from app.application.use_cases.get_pool_volume_history import GetPoolVolumeHistoryUseCase
-from app.domain.entities.pool_volume_history import (
-    PoolVolumeHistoryPoint,
-    PoolVolumeHistorySummaryBase,
-    PoolVolumeHistorySummaryPremium,
-)
+from app.domain.entities.crypto_ohlc import CryptoOhlcDailySeries
+from app.domain.entities.pool_volume_history import PoolVolumeHistoryPoint, PoolVolumeHistoryWindow
 from app.domain.exceptions import PoolVolumeHistoryInputError
+from app.infrastructure.db.mappers.pool_volume_history_mapper import (
+    map_rows_to_pool_volume_history_window,
+)
+from app.shared.cache import LruCache
+
+
+def _series(symbol: str, closes: list[float], *, skip_last_day: bool = False) -> CryptoOhlcDailySeries:
+    today = datetime.now(timezone.utc).date()
+    last_day = today - timedelta(days=2 if skip_last_day else 1)
+    days = [last_day - timedelta(days=len(closes) - 1 - index) for index in range(len(closes))]
+    return CryptoOhlcDailySeries(
+        symbol=symbol,
+        day_starts=days,
+        highs=array("d", [close * 1.1 for close in closes]),
+        lows=array("d", [close * 0.9 for close in closes]),
+        closes=array("d", closes),
+    )
 
 
 class FakePoolVolumeHistoryPort:
     def __init__(self):
-        self.called_base = False
+        self.window_calls = 0
         self.called_premium = False
-        self.last_premium_call: dict[str, str | int | None] | None = None
+        self.premium_calls = 0
+        self.last_premium_call: dict[str, object] | None = None
+        self.ohlc = {
+            "WETH": _series("WETH", [100.0, 110.0, 120.0]),
+            "USDT": _series("USDT", [1.0, 2.0, 3.0]),
+        }
 
-    def list_daily_volume_history(
+    def get_volume_history_window(
         self,
         *,
         pool_address: str,
         days: int,
         chain_id: int | None,
         dex_id: int | None,
-    ):
+    ) -> PoolVolumeHistoryWindow:
         _ = (pool_address, days, chain_id, dex_id)
-        return [
-            PoolVolumeHistoryPoint(
-                time="2026-02-10",
-                value=Decimal("100.50"),
-                fees_usd=Decimal("1.25"),
-            ),
-            PoolVolumeHistoryPoint(
-                time="2026-02-09",
-                value=Decimal("90.00"),
-                fees_usd=Decimal("1.10"),
-            ),
-        ]
-
-    def get_summary_base(
-        self,
-        *,
-        pool_address: str,
-        days: int,
-        chain_id: int | None,
-        dex_id: int | None,
-    ) -> PoolVolumeHistorySummaryBase:
-        _ = (pool_address, days, chain_id, dex_id)
-        self.called_base = True
-        return PoolVolumeHistorySummaryBase(
+        self.window_calls += 1
+        return PoolVolumeHistoryWindow(
+            points=[
+                PoolVolumeHistoryPoint(
+                    time="2026-02-10",
+                    value=Decimal("100.50"),
+                    fees_usd=Decimal("1.25"),
+                ),
+                PoolVolumeHistoryPoint(
+                    time="2026-02-09",
+                    value=Decimal("90.00"),
+                    fees_usd=Decimal("1.10"),
+                ),
+            ],
             tvl_usd=Decimal("1000"),
-            avg_daily_fees_usd=Decimal("10"),
-            avg_daily_volume_usd=Decimal("100"),
             token0_symbol="WETH",
             token1_symbol="USDC",
         )
 
-    def get_summary_premium(
-        self,
-        *,
-        exchange: str,
-        symbol0: str,
-        symbol1: str | None,
-        days: int,
-    ) -> PoolVolumeHistorySummaryPremium:
+    def list_daily_ohlc(self, *, exchange: str, symbols: list[str], start_day, end_day):
         self.last_premium_call = {
             "exchange": exchange,
-            "symbol0": symbol0,
-            "symbol1": symbol1,
-            "days": days,
+            "symbols": list(symbols),
+            "days": (end_day - start_day).days,
         }
         self.called_premium = True
-        return PoolVolumeHistorySummaryPremium(
-            price_volatility_pct=Decimal("1.23"),
-            correlation=Decimal("0.55"),
-            geometric_mean_price=Decimal("2222.22"),
-        )
+        self.premium_calls += 1
+        return {symbol: self.ohlc[symbol] for symbol in symbols if symbol in self.ohlc}
 
 
 class PoolVolumeHistoryUseCaseTests(unittest.TestCase):
@@ -121,7 +119,7 @@ class PoolVolumeHistoryUseCaseTests(unittest.TestCase):
         self.assertEqual(result.volume_history[0].value, Decimal("90.00"))
         self.assertEqual(result.volume_history[0].fees_usd, Decimal("1.10"))
         self.assertEqual(result.volume_history[1].time, "2026-02-10")
-        self.assertTrue(port.called_base)
+        self.assertEqual(port.window_calls, 1)
         self.assertFalse(port.called_premium)
 
     def test_summary_without_premium_flag_still_populates_base_metrics(self):
@@ -139,10 +137,10 @@ class PoolVolumeHistoryUseCaseTests(unittest.TestCase):
         self.assertIsNone(result.summary.price_volatility_pct)
         self.assertIsNone(result.summary.correlation)
         self.assertIsNone(result.summary.geometric_mean_price)
-        self.assertTrue(port.called_base)
+        self.assertEqual(port.window_calls, 1)
         self.assertFalse(port.called_premium)
 
-    def test_summary_with_premium_flag_keeps_fields_as_null(self):
+    def test_summary_with_premium_flag_computes_ohlc_metrics(self):
         port = FakePoolVolumeHistoryPort()
         use_case = GetPoolVolumeHistoryUseCase(pool_volume_history_port=port)
         result = use_case.execute(
@@ -153,13 +151,53 @@ class PoolVolumeHistoryUseCaseTests(unittest.TestCase):
             )
         )
 
-        self.assertIsNotNone(result.summary)
-        assert result.summary is not None
-        self.assertIsNone(result.summary.price_volatility_pct)
+        summary = result.summary
+        self.assertAlmostEqual(float(summary.price_volatility_pct), 100 * 0.2 / 1.1)
+        self.assertAlmostEqual(float(summary.correlation), 1.0)
+        self.assertAlmostEqual(float(summary.geometric_mean_price), (90.0 * 132.0) ** 0.5)
+        self.assertEqual(
+            port.last_premium_call,
+            {"exchange": "binance", "symbols": ["WETH", "USDT"], "days": 7},
+        )
+
+    def test_premium_summary_is_cached_until_next_daily_candle(self):
+        port = FakePoolVolumeHistoryPort()
+        use_case = GetPoolVolumeHistoryUseCase(
+            pool_volume_history_port=port,
+            premium_cache=LruCache(max_entries=8),
+        )
+        command = self._base_input(include_premium=True, symbol0="WETH", symbol1="USDT")
+
+        first = use_case.execute(command)
+        second = use_case.execute(command)
+        self.assertEqual(port.premium_calls, 1)
+        self.assertEqual(first.summary, second.summary)
+
+        use_case.execute(self._base_input(include_premium=True, symbol0="WETH", days=30))
+        self.assertEqual(port.premium_calls, 2)
+
+    def test_premium_summary_missing_last_candle_is_not_cached(self):
+        port = FakePoolVolumeHistoryPort()
+        port.ohlc["WETH"] = _series("WETH", [100.0, 110.0], skip_last_day=True)
+        use_case = GetPoolVolumeHistoryUseCase(
+            pool_volume_history_port=port,
+            premium_cache=LruCache(max_entries=8),
+        )
+        command = self._base_input(include_premium=True, symbol0="WETH")
+
+        result = use_case.execute(command)
+        use_case.execute(command)
+
+        self.assertIsNotNone(result.summary.price_volatility_pct)
         self.assertIsNone(result.summary.correlation)
+        self.assertEqual(port.premium_calls, 2)
+
+    def test_unknown_premium_symbol_returns_nulls(self):
+        port = FakePoolVolumeHistoryPort()
+        use_case = GetPoolVolumeHistoryUseCase(pool_volume_history_port=port)
+        result = use_case.execute(self._base_input(include_premium=True, symbol0="NOPE"))
+        self.assertIsNone(result.summary.price_volatility_pct)
         self.assertIsNone(result.summary.geometric_mean_price)
-        self.assertTrue(port.called_base)
-        self.assertFalse(port.called_premium)
 
     def test_even_with_symbols_premium_fields_stay_null(self):
         port = FakePoolVolumeHistoryPort()
@@ -178,6 +216,24 @@ class PoolVolumeHistoryUseCaseTests(unittest.TestCase):
         self.assertIsNone(result.summary.geometric_mean_price)
         self.assertFalse(port.called_premium)
 
+    def test_window_mapper_reads_meta_from_first_row_and_skips_empty_days(self):
+        window = map_rows_to_pool_volume_history_window(
+            [
+                {
+                    "token0_symbol": "WETH",
+                    "token1_symbol": "USDC",
+                    "tvl_usd": Decimal("1000"),
+                    "time": None,
+                    "value": None,
+                    "fees_usd": None,
+                }
+            ]
+        )
+        self.assertEqual(window.points, [])
+        self.assertEqual(window.tvl_usd, Decimal("1000"))
+        self.assertEqual(window.token0_symbol, "WETH")
+        self.assertEqual(map_rows_to_pool_volume_history_window([]).tvl_usd, None)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+import time
+import unittest
+
+from app.application.dto.radar_pools import RadarPoolsInput
+from app.application.use_cases.radar_pools import RadarPoolsUseCase
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
+from app.domain.entities.radar_pools import RadarPoolItem
+from app.domain.entities.token_search import PoolKey, PoolTokenPair
+from app.domain.exceptions import RadarPoolsInputError
+from app.infrastructure.db.repositories.radar_pools_repository import SqlRadarPoolsRepository
+from app.shared.cache import StaleWhileRevalidateCache
+
+
+def _item(pool_id: int) -> RadarPoolItem:
+    return RadarPoolItem(
+        pool_id=pool_id,
+        pool_address=f"0x{pool_id}",
+        pool_name="WETH / USDC",
+        network="arbitrum",
+        exchange="uniswap",
+        dex_id=1,
+        chain_id=2,
+        token0_address="0xa",
+        token1_address="0xb",
+        token0_symbol="WETH",
+        token1_symbol="USDC",
+        token0_icon_url=None,
+        token1_icon_url=None,
+        fee_tier=500,
+        average_apr=Decimal("12"),
+        price_volatility=None,
+        tvl_usd=Decimal("1000"),
+        correlation=None,
+        avg_daily_fees_usd=Decimal("24"),
+        daily_fees_tvl_pct=Decimal("0.024"),
+        avg_daily_volume_usd=Decimal("240"),
+        daily_volume_tvl_pct=Decimal("0.24"),
+    )
+
+
+class FakeRadarPoolsPort:
+    def __init__(self, total: int = 25):
+        self.total = total
+        self.calls: list[tuple[str, dict]] = []
+
+    def get_latest_hour_start(self):
+        self.calls.append(("latest_hour", {}))
+        return datetime(2026, 2, 10, 12)
+
+    def get_aggregates_refreshed_at(self, *, timeframe_days: int):
+        self.calls.append(("refreshed_at", {"timeframe_days": timeframe_days}))
+        return datetime(2026, 2, 10, 12, 5)
+
+    def count_pools(self, **kwargs):
+        self.calls.append(("count", kwargs))
+        return self.total
+
+    def list_pools_page(self, **kwargs):
+        self.calls.append(("page", kwargs))
+        limit = self.total if kwargs["limit"] is None else min(kwargs["limit"], 3)
+        return [_item(kwargs["offset"] + index) for index in range(limit)]
+
+
+class FakeTokenSearchPort:
+    def list_pool_tokens(self):
+        return [
+            PoolTokenPair(
+                chain_id=2,
+                dex_id=1,
+                pool_address="0xPOOL",
+                token0_address="0xA",
+                token0_symbol="WETH",
+                token1_address="0xB",
+                token1_symbol="USDC",
+            )
+        ]
+
+
+def _use_case(port: FakeRadarPoolsPort, **kwargs) -> RadarPoolsUseCase:
+    return RadarPoolsUseCase(
+        radar_pools_port=port,
+        token_index_provider=TokenSearchIndexProvider(
+            token_search_port=FakeTokenSearchPort(),
+            cache=StaleWhileRevalidateCache(max_entries=1, ttl_seconds=60),
+        ),
+        **kwargs,
+    )
+
+
+WETH_POOLS = frozenset({PoolKey(chain_id=2, dex_id=1, pool_address="0xpool")})
+
+
+class RadarPoolsUseCaseTests(unittest.TestCase):
+    def test_page_is_ordered_and_sliced_by_the_port(self):
+        port = FakeRadarPoolsPort()
+        use_case = _use_case(port)
+
+        result = use_case.execute(
+            RadarPoolsInput(timeframe_days=30, token_symbol="weth", page=3, page_size=10, order_dir="asc")
+        )
+
+        filters = {"timeframe_days": 30, "network_id": None, "exchange_id": None, "pool_keys": WETH_POOLS}
+        self.assertEqual(
+            port.calls,
+            [
+                ("count", filters),
+                (
+                    "page",
+                    {**filters, "order_by": "average_apr", "order_dir": "asc", "limit": 10, "offset": 20},
+                ),
+            ],
+        )
+        self.assertEqual(result.total, 25)
+        self.assertEqual([item.pool_id for item in result.data], [20, 21, 22])
+
+    def test_page_past_total_skips_page_query(self):
+        port = FakeRadarPoolsPort(total=5)
+        use_case = _use_case(port)
+
+        result = use_case.execute(RadarPoolsInput(page=2, page_size=10))
+
+        self.assertEqual([name for name, _ in port.calls], ["count"])
+        self.assertEqual(result.data, [])
+        self.assertEqual(result.total, 5)
+
+    def test_unknown_token_returns_empty_page_without_queries(self):
+        port = FakeRadarPoolsPort()
+        use_case = _use_case(port)
+
+        result = use_case.execute(RadarPoolsInput(token_symbol="WBTC"))
+        other_network = use_case.execute(RadarPoolsInput(token_symbol="0xa", network_id=3))
+
+        self.assertEqual(port.calls, [])
+        self.assertEqual((result.total, result.data), (0, []))
+        self.assertEqual(other_network.total, 0)
+
+    def test_invalid_order_by_is_rejected_before_queries(self):
+        port = FakeRadarPoolsPort()
+        use_case = _use_case(port)
+        command = RadarPoolsInput(order_by="tvl_usd; DROP TABLE pools")
+        with self.assertRaises(RadarPoolsInputError):
+            use_case.validate(command)
+        with self.assertRaises(RadarPoolsInputError):
+            use_case.execute(command)
+        self.assertEqual(port.calls, [])
+
+    def test_cached_listing_serves_every_page_from_one_query(self):
+        port = FakeRadarPoolsPort(total=25)
+        use_case = _use_case(
+            port,
+            listing_cache=StaleWhileRevalidateCache(max_entries=8, ttl_seconds=60),
+        )
+
+        first = use_case.execute(RadarPoolsInput(page=1, page_size=10, token_symbol=" weth "))
+        third = use_case.execute(RadarPoolsInput(page=3, page_size=10, token_symbol="WETH"))
+
+        page_calls = [kwargs for name, kwargs in port.calls if name == "page"]
+        self.assertEqual(len(page_calls), 1)
+        self.assertEqual(page_calls[0]["limit"], None)
+        self.assertEqual(page_calls[0]["pool_keys"], WETH_POOLS)
+        self.assertNotIn("count", [name for name, _ in port.calls])
+        self.assertEqual([item.pool_id for item in first.data], list(range(10)))
+        self.assertEqual([item.pool_id for item in third.data], list(range(20, 25)))
+        self.assertEqual(third.total, 25)
+
+        port.calls.clear()
+        use_case.execute(RadarPoolsInput(order_dir="asc"))
+        self.assertEqual(len([name for name, _ in port.calls if name == "page"]), 1)
+
+    def test_cached_listing_is_keyed_by_input_and_revalidated_on_new_version(self):
+        port = FakeRadarPoolsPort(total=5)
+        use_case = _use_case(
+            port,
+            listing_cache=StaleWhileRevalidateCache(max_entries=8, ttl_seconds=60),
+        )
+
+        first = use_case.execute(RadarPoolsInput(), version="refresh:1")
+        port.total = 7
+        # Versao nova: serve a lista anterior com a versao dela e recarrega em segundo plano.
+        stale = use_case.execute(RadarPoolsInput(), version="refresh:2")
+        deadline = time.monotonic() + 2
+        fresh = use_case.execute(RadarPoolsInput(), version="refresh:2")
+        while fresh.version != "refresh:2" and time.monotonic() < deadline:
+            time.sleep(0.01)
+            fresh = use_case.execute(RadarPoolsInput(), version="refresh:2")
+
+        self.assertEqual((first.version, first.total), ("refresh:1", 5))
+        self.assertEqual((stale.version, stale.total), ("refresh:1", 5))
+        self.assertEqual((fresh.version, fresh.total), ("refresh:2", 7))
+        self.assertNotIn("refreshed_at", [name for name, _ in port.calls])
+        self.assertNotIn("latest_hour", [name for name, _ in port.calls])
+
+    def test_version_follows_aggregate_refresh_for_standard_timeframes(self):
+        port = FakeRadarPoolsPort()
+        use_case = _use_case(port)
+
+        version = use_case.get_version(RadarPoolsInput(timeframe_days=14))
+
+        self.assertEqual(version, "refresh:2026-02-10T12:05:00")
+        self.assertEqual(port.calls, [("refreshed_at", {"timeframe_days": 14})])
+
+    def test_repository_orders_and_paginates_in_sql(self):
+        source = Path("app/infrastructure/db/repositories/radar_pools_repository.py").read_text(
+            encoding="utf-8"
+        )
+        self.assertIn("LIMIT :limit OFFSET :offset", source)
+        self.assertIn("SELECT count(*) AS total", source)
+        with self.assertRaises(ValueError):
+            SqlRadarPoolsRepository(engine=None).list_pools_page(
+                timeframe_days=14,
+                network_id=None,
+                exchange_id=None,
+                pool_keys=None,
+                order_by="1; DROP TABLE pools",
+                order_dir="desc",
+                limit=10,
+                offset=0,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
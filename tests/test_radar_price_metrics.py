@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+import math
+import unittest
+
+from app.domain.services.radar_pools import build_close_matrix, daily_log_returns, pair_price_metrics
+from app.infrastructure.db.backfills import radar_pool_aggregates
+
+
+class _Rows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class _FakeConnection:
+    def __init__(self, pools, closes):
+        self.pools = pools
+        self.closes = closes
+        self.updates: list[dict] = []
+        self.close_queries = 0
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if "FROM public.radar_pool_aggregates a" in sql:
+            return _Rows(self.pools)
+        if "FROM public.crypto_ohlc_daily c" in sql:
+            self.close_queries += 1
+            return _Rows([row for row in self.closes if row["symbol"] in params["symbols"]])
+        self.updates.extend(params)
+        return _Rows([])
+
+
+class RadarPriceMetricsTests(unittest.TestCase):
+    def test_matrix_is_dense_with_nan_for_missing_days(self):
+        days = [date(2026, 2, 1), date(2026, 2, 2), date(2026, 2, 3)]
+        matrix = build_close_matrix(days=days, closes={"ETH": {days[0]: 1.0, days[2]: 3.0}})
+        self.assertEqual(matrix["ETH"][0], 1.0)
+        self.assertTrue(math.isnan(matrix["ETH"][1]))
+        returns = daily_log_returns(matrix["ETH"])
+        self.assertEqual(len(returns), 3)
+        self.assertTrue(all(math.isnan(value) for value in returns))
+
+    def test_pair_volatility_against_flat_quote_is_base_volatility(self):
+        closes0 = [100.0, 110.0, 99.0, 108.9]
+        closes1 = [1.0, 1.0, 1.0, 1.0]
+        volatility, correlation = pair_price_metrics(
+            closes0=closes0,
+            closes1=closes1,
+            returns0=daily_log_returns(closes0)[1:],
+            returns1=daily_log_returns(closes1)[1:],
+        )
+        expected = [math.log(1.1), math.log(0.9), math.log(1.1)]
+        mean = sum(expected) / 3
+        std = math.sqrt(sum((value - mean) ** 2 for value in expected) / 2)
+        self.assertAlmostEqual(volatility, std * 100)
+        self.assertIsNone(correlation)
+
+    def test_refresh_loads_closes_once_and_updates_known_pairs(self):
+        today = datetime.now(timezone.utc).date()
+        closes = []
+        for offset, (eth, btc) in enumerate([(100.0, 50.0), (110.0, 60.0), (99.0, 52.0), (120.0, 70.0)]):
+            day = today - timedelta(days=4 - offset)
+            closes.append({"symbol": "WETH", "day_start": day, "close": eth})
+            closes.append({"symbol": "WBTC", "day_start": day, "close": btc})
+        pools = [
+            {
+                "timeframe_days": timeframe,
+                "chain_id": 1,
+                "dex_id": 2,
+                "pool_address": address,
+                "symbol0": "WETH",
+                "symbol1": symbol1,
+            }
+            for timeframe in (7, 14)
+            for address, symbol1 in (("0xa", "WBTC"), ("0xb", "NOPE"))
+        ]
+        conn = _FakeConnection(pools, closes)
+
+        radar_pool_aggregates._refresh_price_metrics(conn, ohlc_exchange="binance", timeframes=(7, 14))
+
+        self.assertEqual(conn.close_queries, 1)
+        self.assertEqual(
+            {(row["timeframe_days"], row["pool_address"]) for row in conn.updates},
+            {(7, "0xa"), (14, "0xa")},
+        )
+        self.assertTrue(all(row["price_volatility"] > 0 for row in conn.updates))
+        self.assertTrue(all(0 < row["correlation"] <= 1 for row in conn.updates))
+
+
+if __name__ == "__main__":
+    unittest.main()
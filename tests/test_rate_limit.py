@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.rate_limit import RateLimitMiddleware
+from app.application.dto.auth import AccessTokenClaims, AccessTokenPayload
+from app.shared.rate_limit import (
+    BLOCKED_RETRY_AFTER_SECONDS,
+    DEFAULT_RATE_LIMIT_RULES,
+    TokenBucketLimiter,
+    match_rate_limit_rule,
+    parse_rate_limit_rules,
+    parse_trusted_proxies,
+    resolve_client_ip,
+)
+
+
+def _decode(token: str) -> AccessTokenPayload | None:
+    if token == "pro-token":
+        claims = AccessTokenClaims(plan_code="pro", feature_bits=0, entitlements_epoch=0, requests_per_minute=600)
+        return AccessTokenPayload(user_id="u-pro", claims=claims)
+    if token == "blocked-token":
+        claims = AccessTokenClaims(plan_code="blocked", feature_bits=0, entitlements_epoch=0, requests_per_minute=0)
+        return AccessTokenPayload(user_id="u-blocked", claims=claims)
+    if token == "legacy-token":
+        return AccessTokenPayload(user_id="u-legacy")
+    return None
+
+
+def _client(handler_calls: list[str], *, ip_per_minute: float = 10) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/v2/simulate/apr")
+    def simulate():
+        handler_calls.append("simulate")
+        return {"ok": True}
+
+    @app.get("/v1/exchanges")
+    def exchanges():
+        handler_calls.append("exchanges")
+        return []
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=TokenBucketLimiter(max_keys=100),
+        rules=parse_rate_limit_rules({"POST /v2/simulate/apr": 5}),
+        decode_access_token=_decode,
+        user_per_minute=10,
+        ip_per_minute=ip_per_minute,
+    )
+    return TestClient(app)
+
+
+def test_rules_match_method_and_path_globs():
+    rules = parse_rate_limit_rules(DEFAULT_RATE_LIMIT_RULES)
+
+    assert match_rate_limit_rule(rules, method="POST", path="/v2/simulate/apr").cost == 5
+    assert match_rate_limit_rule(rules, method="POST", path="/v1/liquidity-distribution/batch").cost == 2
+    assert match_rate_limit_rule(rules, method="GET", path="/v1/pools/0xabc/volume-history/export").cost == 1
+    assert match_rate_limit_rule(rules, method="GET", path="/v2/simulate/apr") is None
+    assert match_rate_limit_rule(rules, method="GET", path="/v1/exchanges") is None
+
+
+def test_bucket_rejects_with_retry_after_and_evicts_idle_keys():
+    limiter = TokenBucketLimiter(max_keys=2)
+
+    assert limiter.acquire("ip:a", cost=5, per_minute=10) == 0.0
+    assert limiter.acquire("ip:a", cost=5, per_minute=10) == 0.0
+    retry_after = limiter.acquire("ip:a", cost=5, per_minute=10)
+    assert 29.0 < retry_after <= 30.0
+    assert limiter.acquire("ip:b", cost=0, per_minute=10) == 0.0
+
+    limiter.acquire("ip:c", cost=1, per_minute=10)
+    limiter.acquire("ip:d", cost=1, per_minute=10)
+    assert len(limiter) == 2
+    assert limiter.acquire("ip:a", cost=5, per_minute=10) == 0.0
+
+
+def test_middleware_rejects_before_the_handler_runs():
+    calls: list[str] = []
+    client = _client(calls)
+
+    statuses = [client.post("/v2/simulate/apr").status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+    rejected = client.post("/v2/simulate/apr")
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert calls == ["simulate", "simulate"]
+
+    # Sem proxy confiavel o X-Forwarded-For e ignorado: trocar o header nao gera bucket novo.
+    spoofed = [
+        client.post("/v2/simulate/apr", headers={"X-Forwarded-For": f"203.0.113.{index}"}).status_code
+        for index in range(3)
+    ]
+    assert spoofed == [429, 429, 429]
+    assert all(client.get("/v1/exchanges").status_code == 200 for _ in range(5))
+
+
+def test_middleware_uses_plan_limit_from_token_claims():
+    calls: list[str] = []
+    client = _client(calls, ip_per_minute=100)
+
+    pro = [client.post("/v2/simulate/apr", headers={"Authorization": "Bearer pro-token"}) for _ in range(5)]
+    assert [response.status_code for response in pro] == [200] * 5
+
+    legacy = [client.post("/v2/simulate/apr", headers={"Authorization": "Bearer legacy-token"}) for _ in range(3)]
+    assert [response.status_code for response in legacy] == [200, 200, 429]
+
+
+def test_tokens_from_the_same_ip_share_the_ip_budget():
+    calls: list[str] = []
+    client = _client(calls, ip_per_minute=10)
+
+    pro = client.post("/v2/simulate/apr", headers={"Authorization": "Bearer pro-token"})
+    legacy = client.post("/v2/simulate/apr", headers={"Authorization": "Bearer legacy-token"})
+    assert (pro.status_code, legacy.status_code) == (200, 200)
+
+    # O plano pro ainda tem tokens, mas o IP gastou os 10 do minuto.
+    rejected = client.post("/v2/simulate/apr", headers={"Authorization": "Bearer pro-token"})
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert calls == ["simulate", "simulate"]
+
+
+def test_acquire_all_charges_every_bucket_or_none():
+    limiter = TokenBucketLimiter(max_keys=10)
+    assert limiter.acquire("ip:a", cost=10, per_minute=10) == 0.0
+
+    assert limiter.acquire_all((("ip:a", 10), ("user:u1", 10)), cost=5) > 0
+    # A rejeicao pelo IP nao consumiu o bucket do usuario.
+    assert limiter.acquire("user:u1", cost=10, per_minute=10) == 0.0
+
+
+def test_zero_limit_rejects_instead_of_allowing():
+    limiter = TokenBucketLimiter(max_keys=10)
+
+    assert limiter.acquire("user:u1", cost=1, per_minute=0) == BLOCKED_RETRY_AFTER_SECONDS
+    assert limiter.acquire("user:u1", cost=1, per_minute=-1) == BLOCKED_RETRY_AFTER_SECONDS
+
+    calls: list[str] = []
+    client = _client(calls)
+    response = client.post("/v2/simulate/apr", headers={"Authorization": "Bearer blocked-token"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert calls == []
+
+
+def test_client_ip_uses_forwarded_for_only_behind_trusted_proxies():
+    trusted = parse_trusted_proxies(["10.0.0.0/8", "192.168.1.1"])
+
+    spoofed = "1.1.1.1, 203.0.113.7"
+    assert resolve_client_ip(peer="203.0.113.7", forwarded_for=spoofed, trusted_proxies=trusted) == "203.0.113.7"
+    assert resolve_client_ip(peer="10.0.0.5", forwarded_for="", trusted_proxies=()) == "10.0.0.5"
+
+    # O cliente pode prefixar hops falsos; vale o mais a direita que nao e proxy.
+    chain = "1.1.1.1, 198.51.100.4, 10.0.0.9"
+    assert resolve_client_ip(peer="192.168.1.1", forwarded_for=chain, trusted_proxies=trusted) == "198.51.100.4"
+    assert resolve_client_ip(peer="10.0.0.1", forwarded_for="10.0.0.2", trusted_proxies=trusted) == "10.0.0.2"
+    assert resolve_client_ip(peer="10.0.0.1", forwarded_for="", trusted_proxies=trusted) == "10.0.0.1"
+    assert resolve_client_ip(peer=None, forwarded_for="1.1.1.1", trusted_proxies=trusted) == "unknown"
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
 from fastapi import HTTPException
 
 from app.api.deps import require_feature
+from app.application.dto.auth import AccessTokenClaims, AccessTokenPayload
 from app.application.dto.entitlements import UserEntitlementsOutput
 from app.domain.entities.user import User
+from app.domain.services.entitlements import encode_feature_bits
 
 
 class FakeEntitlementsUseCaseDenied:
@@ -51,6 +54,7 @@ def test_require_feature_blocks_when_feature_missing():
     with pytest.raises(HTTPException) as exc_info:
         dependency(
             user=_fake_user(),
+            payload=AccessTokenPayload(user_id="user-1"),
             entitlements_use_case=FakeEntitlementsUseCaseDenied(),
         )
 
@@ -62,7 +66,49 @@ def test_require_feature_allows_when_feature_enabled():
 
     user = dependency(
         user=_fake_user(),
+        payload=AccessTokenPayload(user_id="user-1"),
         entitlements_use_case=FakeEntitlementsUseCaseAllowed(),
     )
 
     assert user.id == "user-1"
+
+
+class FakeEntitlementsUseCaseUnavailable:
+    def execute(self, *, user_id: str) -> UserEntitlementsOutput:
+        raise AssertionError("claims validas nao devem consultar entitlements")
+
+
+def test_require_feature_authorizes_from_token_claims_when_epoch_matches():
+    dependency = require_feature("charts_advanced")
+    claims = AccessTokenClaims(
+        plan_code="pro",
+        feature_bits=encode_feature_bits({"charts_advanced": True}),
+        entitlements_epoch=0,
+    )
+
+    user = dependency(
+        user=_fake_user(),
+        payload=AccessTokenPayload(user_id="user-1", claims=claims),
+        entitlements_use_case=FakeEntitlementsUseCaseUnavailable(),
+    )
+
+    assert user.id == "user-1"
+
+
+def test_require_feature_ignores_claims_from_previous_epoch():
+    dependency = require_feature("charts_advanced")
+    claims = AccessTokenClaims(
+        plan_code="pro",
+        feature_bits=encode_feature_bits({"charts_advanced": True}),
+        entitlements_epoch=0,
+    )
+    downgraded_user = replace(_fake_user(), entitlements_epoch=1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        dependency(
+            user=downgraded_user,
+            payload=AccessTokenPayload(user_id="user-1", claims=claims),
+            entitlements_use_case=FakeEntitlementsUseCaseDenied(),
+        )
+
+    assert exc_info.value.status_code == 403
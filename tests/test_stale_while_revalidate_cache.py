@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from threading import Event, Thread
+import time
+import unittest
+
+from app.shared.cache import StaleWhileRevalidateCache
+
+
+class StaleWhileRevalidateCacheTests(unittest.TestCase):
+    def test_fresh_value_is_served_without_reloading(self):
+        cache: StaleWhileRevalidateCache[str, int] = StaleWhileRevalidateCache(max_entries=4, ttl_seconds=60)
+        calls: list[int] = []
+
+        def load() -> int:
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_stale_value_is_served_while_refreshing_in_background(self):
+        cache: StaleWhileRevalidateCache[str, int] = StaleWhileRevalidateCache(
+            max_entries=4,
+            ttl_seconds=0,
+            stale_seconds=60,
+        )
+        refreshed = Event()
+        calls: list[int] = []
+
+        def load() -> int:
+            calls.append(1)
+            if len(calls) == 2:
+                refreshed.set()
+            return len(calls)
+
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        self.assertEqual(cache.get_or_load("k", load), 1)
+        self.assertTrue(refreshed.wait(timeout=2))
+        deadline = time.monotonic() + 2
+        value = cache.get_or_load("k", load)
+        while value == 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            value = cache.get_or_load("k", load)
+        self.assertGreaterEqual(value, 2)
+
+    def test_concurrent_misses_run_loader_once(self):
+        cache: StaleWhileRevalidateCache[str, str] = StaleWhileRevalidateCache(max_entries=4, ttl_seconds=60)
+        release = Event()
+        started = Event()
+        calls: list[int] = []
+        results: list[str] = []
+
+        def load() -> str:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=2)
+            return "value"
+
+        threads = [Thread(target=lambda: results.append(cache.get_or_load("k", load))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(started.wait(timeout=2))
+        release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 5)
+
+    def test_failed_load_is_not_cached(self):
+        cache: StaleWhileRevalidateCache[str, int] = StaleWhileRevalidateCache(max_entries=4, ttl_seconds=60)
+
+        def fail() -> int:
+            raise RuntimeError("db down")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_load("k", fail)
+        self.assertEqual(cache.get_or_load("k", lambda: 7), 7)
+
+    def test_value_flagged_stale_is_served_and_reloaded_in_background(self):
+        cache: StaleWhileRevalidateCache[str, str] = StaleWhileRevalidateCache(max_entries=4, ttl_seconds=60)
+        reloaded = Event()
+
+        def load_v2() -> str:
+            reloaded.set()
+            return "v2"
+
+        self.assertEqual(cache.get_or_load("k", lambda: "v1"), "v1")
+        self.assertEqual(cache.get_or_load("k", load_v2, is_stale=lambda value: value != "v2"), "v1")
+        self.assertTrue(reloaded.wait(timeout=2))
+        deadline = time.monotonic() + 2
+        value = cache.get_or_load("k", load_v2, is_stale=lambda value: value != "v2")
+        while value != "v2" and time.monotonic() < deadline:
+            time.sleep(0.01)
+            value = cache.get_or_load("k", load_v2, is_stale=lambda value: value != "v2")
+        self.assertEqual(value, "v2")
+
+
+if __name__ == "__main__":
+    unittest.main()
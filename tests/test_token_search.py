@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import unittest
+
+from app.application.dto.catalog import (
+    ListExchangeNetworkPoolsInput,
+    ListExchangeNetworkTokensInput,
+    SearchTokensInput,
+)
+from app.application.use_cases.list_exchange_network_pools import ListExchangeNetworkPoolsUseCase
+from app.application.use_cases.list_exchange_network_tokens import ListExchangeNetworkTokensUseCase
+from app.application.use_cases.search_tokens import SearchTokensUseCase
+from app.application.use_cases.token_search_index import TokenSearchIndexProvider
+from app.domain.entities.token_search import PoolKey, PoolTokenPair
+from app.domain.exceptions import TokenSearchInputError
+from app.domain.services.token_search import TokenSearchIndex
+from app.shared.cache import StaleWhileRevalidateCache
+
+
+PAIRS = [
+    PoolTokenPair(1, 10, "0xP1", "0xWETH", "WETH", "0xUSDC", "USDC"),
+    PoolTokenPair(1, 10, "0xp2", "0xweth", "WETH", "0xusdt", "USDT"),
+    PoolTokenPair(1, 20, "0xp3", "0xweth", "weth", "0xusdc", "USDC"),
+    PoolTokenPair(2, 10, "0xp4", "0xweeth", "weETH", "0xusdc", None),
+]
+
+
+class FakeTokenSearchPort:
+    def __init__(self):
+        self.calls = 0
+
+    def list_pool_tokens(self):
+        self.calls += 1
+        return PAIRS
+
+
+class FakeCatalogPort:
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    def list_tokens_by_exchange_network(self, **kwargs):
+        self.calls.append(("tokens", kwargs))
+        return []
+
+    def list_pools_by_exchange_network_addresses(self, **kwargs):
+        self.calls.append(("pools", kwargs))
+        return []
+
+
+def _provider(port: FakeTokenSearchPort | None = None) -> TokenSearchIndexProvider:
+    return TokenSearchIndexProvider(
+        token_search_port=port or FakeTokenSearchPort(),
+        cache=StaleWhileRevalidateCache(max_entries=1, ttl_seconds=60),
+    )
+
+
+class TokenSearchIndexTests(unittest.TestCase):
+    def test_resolve_normalizes_symbols_and_addresses(self):
+        index = TokenSearchIndex(PAIRS)
+
+        self.assertEqual(
+            index.resolve(" weth "),
+            frozenset(
+                {
+                    PoolKey(1, 10, "0xp1"),
+                    PoolKey(1, 10, "0xp2"),
+                    PoolKey(1, 20, "0xp3"),
+                }
+            ),
+        )
+        self.assertEqual(index.resolve("0xUSDC", chain_id=1, dex_id=20), frozenset({PoolKey(1, 20, "0xp3")}))
+        self.assertEqual(index.resolve("WBTC"), frozenset())
+        self.assertEqual(index.resolve(""), frozenset())
+
+    def test_suggest_ranks_exact_match_then_pool_count(self):
+        index = TokenSearchIndex(PAIRS)
+
+        suggestions = index.suggest("we", limit=10)
+        self.assertEqual([(item.term, item.pool_count) for item in suggestions], [("WETH", 3), ("WEETH", 1)])
+        self.assertEqual(suggestions[0].kind, "symbol")
+
+        exact = index.suggest("weeth", limit=10)
+        self.assertEqual([item.term for item in exact], ["WEETH"])
+
+        addresses = index.suggest("0xUS", limit=10, chain_id=1, dex_id=10)
+        self.assertEqual([(item.term, item.kind) for item in addresses], [("0xusdc", "address"), ("0xusdt", "address")])
+        self.assertEqual(index.suggest("we", limit=10, chain_id=3), [])
+
+
+class TokenSearchUseCaseTests(unittest.TestCase):
+    def test_index_is_built_once_per_refresh(self):
+        port = FakeTokenSearchPort()
+        use_case = SearchTokensUseCase(token_index_provider=_provider(port))
+
+        use_case.execute(SearchTokensInput(query="w"))
+        use_case.execute(SearchTokensInput(query="u"))
+
+        self.assertEqual(port.calls, 1)
+        with self.assertRaises(TokenSearchInputError):
+            use_case.execute(SearchTokensInput(query="  "))
+        with self.assertRaises(TokenSearchInputError):
+            use_case.execute(SearchTokensInput(query="w", limit=0))
+
+    def test_catalog_tokens_filter_by_resolved_pool_addresses(self):
+        catalog = FakeCatalogPort()
+        use_case = ListExchangeNetworkTokensUseCase(catalog_port=catalog, token_index_provider=_provider())
+
+        use_case.execute(ListExchangeNetworkTokensInput(exchange_id=10, network_id=1, token_address="0xWETH"))
+        use_case.execute(ListExchangeNetworkTokensInput(exchange_id=10, network_id=9, token_address="0xweth"))
+        use_case.execute(ListExchangeNetworkTokensInput(exchange_id=10, network_id=1))
+
+        self.assertEqual(
+            catalog.calls,
+            [
+                (
+                    "tokens",
+                    {
+                        "exchange_id": 10,
+                        "network_id": 1,
+                        "pool_addresses": ["0xp1", "0xp2"],
+                        "exclude_token": "0xweth",
+                    },
+                ),
+                ("tokens", {"exchange_id": 10, "network_id": 1}),
+            ],
+        )
+
+    def test_catalog_pools_intersect_both_tokens(self):
+        catalog = FakeCatalogPort()
+        use_case = ListExchangeNetworkPoolsUseCase(catalog_port=catalog, token_index_provider=_provider())
+
+        use_case.execute(
+            ListExchangeNetworkPoolsInput(
+                exchange_id=10,
+                network_id=1,
+                token0_address="0xusdc",
+                token1_address="WETH",
+            )
+        )
+        result = use_case.execute(
+            ListExchangeNetworkPoolsInput(
+                exchange_id=10,
+                network_id=1,
+                token0_address="0xusdc",
+                token1_address="0xusdt",
+            )
+        )
+
+        self.assertEqual(
+            catalog.calls,
+            [("pools", {"exchange_id": 10, "network_id": 1, "pool_addresses": ["0xp1"]})],
+        )
+        self.assertEqual(result, [])
+
+
+if __name__ == "__main__":
+    unittest.main()